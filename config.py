@@ -62,6 +62,19 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
     ANTHROPIC_API_KEY: Optional[str] = Field(default=None, env="ANTHROPIC_API_KEY")
     
+    # LLM gateway for chat: concurrent generations, callers allowed to wait, response cache TTL
+    ANTHROPIC_BASE_URL: str = Field(default="https://api.anthropic.com", env="ANTHROPIC_BASE_URL")
+    LLM_MODEL: str = Field(default="claude-3-5-sonnet-20241022", env="LLM_MODEL")
+    LLM_MAX_CONCURRENT: int = Field(default=8, env="LLM_MAX_CONCURRENT")
+    LLM_MAX_QUEUE: int = Field(default=64, env="LLM_MAX_QUEUE")
+    LLM_CACHE_TTL_SECONDS: int = Field(default=600, env="LLM_CACHE_TTL_SECONDS")
+    
+    # Analysis result cache (semantic engines); set the DB path to keep warm results across restarts
+    ANALYSIS_CACHE_TTL_SECONDS: int = Field(default=21600, env="ANALYSIS_CACHE_TTL_SECONDS")
+    ANALYSIS_CACHE_MAX_ENTRIES: int = Field(default=4096, env="ANALYSIS_CACHE_MAX_ENTRIES")
+    ANALYSIS_CACHE_MAX_MB: int = Field(default=32, env="ANALYSIS_CACHE_MAX_MB")
+    ANALYSIS_CACHE_DB_PATH: Optional[str] = Field(default=None, env="ANALYSIS_CACHE_DB_PATH")
+    
     @validator("SECRET_KEY")
     def validate_secret_key(cls, v):
         """Ensure SECRET_KEY is secure"""
@@ -8,7 +8,7 @@ with modern lifespan context manager pattern.
 
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Dict, Any
+from typing import AsyncGenerator, Awaitable, Callable, Dict, Any, List
 
 from fastapi import FastAPI
 
@@ -17,6 +17,14 @@ from config import settings, validate_security_configuration
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Async cleanup callbacks registered by service instances (run in reverse order at shutdown)
+_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+
+def register_shutdown_hook(hook: Callable[[], Awaitable[None]]) -> None:
+    """Register an async callable to run when the application shuts down"""
+    _shutdown_hooks.append(hook)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[Dict[str, Any], None]:
@@ -117,8 +125,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[Dict[str, Any], None]:
     logger.info("🔄 Luciq Master API shutting down...")
     logger.info("🛡️  Phase 1 Emergency Stabilization - Graceful shutdown initiated")
     
-    # Shutdown logic will be handled by the actual service instances
-    # This is just the framework for graceful shutdown
+    # Shutdown logic is handled by the service instances through their registered hooks
+    await cleanup_services()
     
     logger.info("✅ Master API shutdown complete - Phase 1 modernization successful")
 
@@ -137,8 +145,12 @@ async def cleanup_services():
     Cleanup all Master API services.
     Called during shutdown before lifespan context ends.
     """
-    # This will be populated when we integrate with the main API
-    pass
+    while _shutdown_hooks:
+        hook = _shutdown_hooks.pop()
+        try:
+            await hook()
+        except Exception as e:
+            logger.warning(f"⚠️  Shutdown hook {getattr(hook, '__qualname__', hook)} failed: {e}")
 
 
 def get_lifespan_handler() -> AsyncGenerator[Dict[str, Any], None]:
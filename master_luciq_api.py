@@ -5321,8 +5321,8 @@ import hashlib
 import random
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Union
-from collections import defaultdict, Counter
+from typing import List, Dict, Any, AsyncIterator, Optional, Set, Tuple, Union
+from collections import Counter
 import uvicorn
 
 # FastAPI and web framework imports
@@ -5436,7 +5436,25 @@ logger = logging.getLogger(__name__)
 
 # PHASE 1 EMERGENCY STABILIZATION: Security hardening and modernization
 from config import settings, validate_security_configuration, get_security_headers
-from lifespan import lifespan
+from lifespan import lifespan, register_shutdown_hook
+from src.api.shared.services.llm_gateway import LLMGateway, LLMGatewayError
+from src.api.shared.services.analysis_context import AnalysisContext
+from src.api.shared.services.micro_batch import MicroBatchInferenceService
+from src.api.shared.services.master_database import MasterDatabaseService
+from src.api.shared.services.discovery_service import MasterDiscoveryService
+from src.api.shared.services.result_cache import (
+    close_result_caches, configure_result_caches, get_result_cache, get_result_cache_stats
+)
+
+# Shared analysis result cache (content hash + engine version, TTL, optional SQLite tier).
+# Configured before any engine below creates its cache, otherwise these settings are ignored.
+configure_result_caches(
+    ttl_seconds=settings.ANALYSIS_CACHE_TTL_SECONDS,
+    max_entries=settings.ANALYSIS_CACHE_MAX_ENTRIES,
+    max_bytes=settings.ANALYSIS_CACHE_MAX_MB * 1024 * 1024,
+    db_path=settings.ANALYSIS_CACHE_DB_PATH
+)
+register_shutdown_hook(close_result_caches)
 
 # ================================================================================================
 # INTELLIGENT ORCHESTRATOR - REAL LLM INTEGRATION
@@ -5450,13 +5468,10 @@ class IntelligentOrchestrator:
     
     def __init__(self):
         self.openai_client = None
-        self.anthropic_client = None
+        self.llm_gateway = None  # Claude via the shared async LLM gateway
         self.conversation_memory = {}  # Store conversation context
         self.intelligence_cache = {}   # Cache for performance
         
-        # Initialize available LLM providers
-        self._initialize_llm_providers()
-        
         # Business intelligence context for the LLM
         self.system_context = """You are Luciq, an advanced business intelligence AI assistant. You have access to:
 - Real-time data from 15+ platforms (Reddit, HackerNews, Twitter, etc.)
@@ -5476,6 +5491,9 @@ Never use templated responses. Each response should be uniquely crafted based on
 - Available market data
 - Real-time intelligence feeds
 - Contextual business analysis"""
+        
+        # Initialize available LLM providers (the system context is their stable prompt prefix)
+        self._initialize_llm_providers()
     
     def _initialize_llm_providers(self):
         """Initialize LLM providers with graceful fallbacks"""
@@ -5489,11 +5507,19 @@ Never use templated responses. Each response should be uniquely crafted based on
             logger.warning(f"OpenAI initialization failed: {e}")
         
         try:
-            # Try Anthropic as backup
-            anthropic_key = "sk-ant-REDACTED"
-            if anthropic_key and ANTHROPIC_AVAILABLE:
-                self.anthropic_client = anthropic.Anthropic(api_key=anthropic_key)
-                logger.info("✅ Anthropic client initialized for intelligent responses")
+            # Claude through the async gateway (non-blocking, concurrency-limited, cached)
+            anthropic_key = settings.ANTHROPIC_API_KEY
+            if anthropic_key:
+                self.llm_gateway = LLMGateway(
+                    api_key=anthropic_key,
+                    system_prompt=self.system_context,
+                    model=settings.LLM_MODEL,
+                    base_url=settings.ANTHROPIC_BASE_URL,
+                    max_concurrent=settings.LLM_MAX_CONCURRENT,
+                    max_queue=settings.LLM_MAX_QUEUE,
+                    cache_ttl_seconds=settings.LLM_CACHE_TTL_SECONDS
+                )
+                logger.info("✅ Anthropic LLM gateway initialized for intelligent responses")
         except Exception as e:
             logger.warning(f"Anthropic initialization failed: {e}")
     
@@ -5510,7 +5536,7 @@ Never use templated responses. Each response should be uniquely crafted based on
         )
         
         # Generate response with Claude only
-        if self.anthropic_client:
+        if self.llm_gateway:
             response = await self._generate_with_anthropic(user_message, enhanced_context)
         else:
             # Fallback to enhanced template system
@@ -5518,6 +5544,42 @@ Never use templated responses. Each response should be uniquely crafted based on
         
         return response
     
+    async def stream_intelligent_response(self,
+                                          user_message: str,
+                                          context: Dict,
+                                          real_time_data: Dict = None,
+                                          conversation_history: List = None) -> AsyncIterator[Dict]:
+        """Stream the response as it is generated: 'token' events followed by one 'done' event"""
+        
+        enhanced_context = await self._build_enhanced_context(
+            user_message, context, real_time_data, conversation_history
+        )
+        
+        if self.llm_gateway:
+            parts = []
+            try:
+                async for text in self.llm_gateway.stream(f"{enhanced_context}\n\nUser Message: {user_message}"):
+                    parts.append(text)
+                    yield {"type": "token", "text": text}
+                yield {
+                    "type": "done",
+                    "response": "".join(parts),
+                    "provider": "anthropic",
+                    "model": self.llm_gateway.model,
+                    "intelligence_level": "high",
+                    "confidence": 0.9
+                }
+                return
+            except LLMGatewayError as e:
+                if parts:
+                    raise
+                logger.error(f"Anthropic streaming failed: {e}")
+        
+        # Fallback arrives as a single chunk
+        response = await self._generate_enhanced_fallback(user_message, enhanced_context)
+        yield {"type": "token", "text": response["response"]}
+        yield {"type": "done", **response}
+    
     async def _build_enhanced_context(self, user_message: str, context: Dict, 
                                     real_time_data: Dict = None, 
                                     conversation_history: List = None) -> str:
@@ -5532,12 +5594,13 @@ Never use templated responses. Each response should be uniquely crafted based on
         
         # Add real-time intelligence if available
         if real_time_data:
-            context_parts.append(f"Real-time Market Signals: {json.dumps(real_time_data, indent=2)}")
+            stable_data = self._stable_context(real_time_data)
+            context_parts.append(f"Real-time Market Signals: {json.dumps(stable_data, separators=(',', ':'), sort_keys=True, default=str)}")
         
         # Add conversation history for continuity
         if conversation_history:
-            recent_history = conversation_history[-3:]  # Last 3 exchanges
-            context_parts.append(f"Recent Conversation: {json.dumps(recent_history, indent=2)}")
+            recent_history = self._stable_context(conversation_history[-3:])  # Last 3 exchanges
+            context_parts.append(f"Recent Conversation: {json.dumps(recent_history, separators=(',', ':'), sort_keys=True, default=str)}")
         
         # Add current platform capabilities
         context_parts.append("""Available Intelligence Capabilities:
@@ -5549,6 +5612,25 @@ Never use templated responses. Each response should be uniquely crafted based on
         
         return "\n\n".join(context_parts)
     
+    # Per-run fields (clock reads, run ids, timings) that would make every prompt - and so every
+    # LLM gateway cache key - unique even when the analysis itself is identical
+    VOLATILE_CONTEXT_KEYS = frozenset({
+        'timestamp', 'session_id', 'analysis_id', 'request_id',
+        'processing_time', 'processing_time_ms', 'analysis_duration'
+    })
+    
+    @classmethod
+    def _stable_context(cls, value: Any) -> Any:
+        """Copy of ``value`` with volatile keys removed at every nesting level"""
+        if isinstance(value, dict):
+            return {
+                key: cls._stable_context(item) for key, item in value.items()
+                if key not in cls.VOLATILE_CONTEXT_KEYS
+            }
+        if isinstance(value, (list, tuple)):
+            return [cls._stable_context(item) for item in value]
+        return value
+    
     async def _generate_with_openai(self, user_message: str, enhanced_context: str) -> Dict:
         """Generate response using OpenAI"""
         try:
@@ -5574,24 +5656,17 @@ Never use templated responses. Each response should be uniquely crafted based on
             return await self._generate_enhanced_fallback(user_message, enhanced_context)
     
     async def _generate_with_anthropic(self, user_message: str, enhanced_context: str) -> Dict:
-        """Generate response using Anthropic Claude"""
+        """Generate response using Anthropic Claude (awaited through the gateway, never blocking the loop)"""
         try:
-            response = self.anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=1000,
-                temperature=0.7,
-                system=self.system_context,
-                messages=[
-                    {"role": "user", "content": f"{enhanced_context}\n\nUser Message: {user_message}"}
-                ]
-            )
+            completion = await self.llm_gateway.complete(f"{enhanced_context}\n\nUser Message: {user_message}")
             
             return {
-                "response": response.content[0].text,
+                "response": completion.text,
                 "provider": "anthropic", 
-                "model": "claude-3-sonnet",
+                "model": completion.model,
                 "intelligence_level": "high",
-                "confidence": 0.9
+                "confidence": 0.9,
+                "cached": completion.cached
             }
         except Exception as e:
             logger.error(f"Anthropic generation failed: {e}")
@@ -5654,6 +5729,11 @@ Which direction would be most helpful for your specific situation?"""
             "intelligence_level": "medium", 
             "confidence": 0.7
         }
+    
+    async def close(self):
+        """Release the LLM gateway's pooled connections"""
+        if self.llm_gateway:
+            await self.llm_gateway.close()
 
 # Legacy Settings class deprecated - using secure config module
 # Keeping for backward compatibility during transition
@@ -5950,168 +6030,6 @@ class RealTimeDialecticalProcessor:
             'timestamp': datetime.now().isoformat()
         }
 
-# ================================================================================================
-# COMPREHENSIVE DATABASE SERVICE
-# ================================================================================================
-
-class MasterDatabaseService:
-    """Unified database service handling all data operations"""
-    
-    def __init__(self, db_path: str = "luciq_master.db"):
-        self.db_path = db_path
-        self.init_database()
-    
-    def init_database(self):
-        """Initialize all database tables"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Users table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    email TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
-                    email_verified BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_login TIMESTAMP
-                )
-            ''')
-            
-            # Discovery sessions table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS discovery_sessions (
-                    session_id TEXT PRIMARY KEY,
-                    user_id INTEGER,
-                    subreddit TEXT NOT NULL,
-                    posts_analyzed INTEGER DEFAULT 0,
-                    pain_points_found INTEGER DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id)
-                )
-            ''')
-            
-            # Pain points table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS pain_points (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT,
-                    post_id TEXT,
-                    title TEXT,
-                    description TEXT,
-                    opportunity_score INTEGER,
-                    market_size_score INTEGER,
-                    urgency_score INTEGER,
-                    solution_gap_score INTEGER,
-                    monetization_score INTEGER,
-                    confidence REAL,
-                    business_domain TEXT,
-                    target_market TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (session_id) REFERENCES discovery_sessions(session_id)
-                )
-            ''')
-            
-            # Trend signals table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS trend_signals (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    platform TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    score REAL NOT NULL,
-                    metadata TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Intelligence reports table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS intelligence_reports (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    report_type TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    analysis_results TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id)
-                )
-            ''')
-            
-            # System metrics table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS system_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    metric_name TEXT NOT NULL,
-                    metric_value REAL NOT NULL,
-                    metadata TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            conn.commit()
-            logger.info("Master database initialized successfully")
-    
-    async def create_user(self, username: str, email: str, password_hash: str) -> Optional[int]:
-        """Create a new user"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    "INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
-                    (username, email, password_hash)
-                )
-                await db.commit()
-                return cursor.lastrowid
-        except Exception as e:
-            logger.error(f"Error creating user: {e}")
-            return None
-    
-    async def get_user_by_username(self, username: str) -> Optional[Dict]:
-        """Get user by username"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                cursor = await db.execute(
-                    "SELECT * FROM users WHERE username = ?", (username,)
-                )
-                row = await cursor.fetchone()
-                return dict(row) if row else None
-        except Exception as e:
-            logger.error(f"Error getting user: {e}")
-            return None
-    
-    async def save_discovery_session(self, session_id: str, user_id: int, subreddit: str, posts_analyzed: int, pain_points_found: int):
-        """Save discovery session"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    "INSERT INTO discovery_sessions (session_id, user_id, subreddit, posts_analyzed, pain_points_found) VALUES (?, ?, ?, ?, ?)",
-                    (session_id, user_id, subreddit, posts_analyzed, pain_points_found)
-                )
-                await db.commit()
-        except Exception as e:
-            logger.error(f"Error saving discovery session: {e}")
-    
-    async def save_pain_point(self, session_id: str, pain_point: Dict):
-        """Save pain point to database"""
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    """INSERT INTO pain_points (session_id, post_id, title, description, opportunity_score, 
-                       market_size_score, urgency_score, solution_gap_score, monetization_score, 
-                       confidence, business_domain, target_market) 
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (session_id, pain_point.get('post_id'), pain_point.get('title'),
-                     pain_point.get('description'), pain_point.get('opportunity_score', 0),
-                     pain_point.get('market_size_score', 0), pain_point.get('urgency_score', 0),
-                     pain_point.get('solution_gap_score', 0), pain_point.get('monetization_score', 0),
-                     pain_point.get('confidence', 0.0), pain_point.get('business_domain', ''),
-                     pain_point.get('target_market', ''))
-                )
-                await db.commit()
-        except Exception as e:
-            logger.error(f"Error saving pain point: {e}")
-
 # ================================================================================================
 # AUTHENTICATION AND SECURITY SERVICES
 # ================================================================================================
@@ -6163,15 +6081,27 @@ class AuthService:
 # REDDIT API CLIENT (CROWN JEWEL INTEGRATION)
 # ================================================================================================
 
+from src.api.shared.services.http_client import SharedHTTPClient
+from src.api.shared.services.keyword_matcher import KeywordMatcher
+
+# One pooled session for every Reddit caller (discovery, mega scraper, trend scans)
+reddit_http_client = SharedHTTPClient('reddit', limit=50, limit_per_host=8, total_timeout=30.0)
+
 class MasterRedditClient:
     """Enhanced Reddit API client with OAuth2 and fallback support"""
     
-    def __init__(self):
+    MAX_PAGE_SIZE = 100  # Reddit listing cap per request
+    
+    def __init__(self, http_client: Optional[SharedHTTPClient] = None):
         self.client_id = Settings.REDDIT_CLIENT_ID
         self.client_secret = Settings.REDDIT_CLIENT_SECRET
         self.user_agent = Settings.REDDIT_USER_AGENT
         self.access_token = None
         self.token_expires_at = None
+        self.http = http_client or reddit_http_client
+        
+        # Newest post fullname seen per (subreddit, sort) for incremental pulls
+        self._newest_seen: Dict[Tuple[str, str], str] = {}
         
         # Spam detection patterns
         self.spam_keywords = [
@@ -6188,6 +6118,20 @@ class MasterRedditClient:
             'automation', 'efficiency', 'cost', 'save time', 'productivity',
             'freelancer', 'client', 'agency', 'tool', 'platform', 'software'
         ]
+        
+        # Both vocabularies compiled once for batch filtering
+        self.content_matcher = KeywordMatcher({'spam': self.spam_keywords, 'business': self.business_keywords})
+    
+    # Industry detection patterns, checked in order (first match wins)
+    INDUSTRY_PATTERNS = [
+        (industry, re.compile(pattern)) for industry, pattern in [
+            ('software', r'\b(saas|software|app|platform|api|code|dev|tech|ai|ml)\b'),
+            ('ecommerce', r'\b(ecommerce|online\s+store|shopify|amazon|selling|retail)\b'),
+            ('marketing', r'\b(marketing|advertising|social\s+media|seo|content|brand)\b'),
+            ('finance', r'\b(finance|accounting|money|payment|fintech|banking)\b'),
+            ('healthcare', r'\b(health|medical|doctor|patient|clinic|hospital)\b')
+        ]
+    ]
     
     async def get_access_token(self) -> Optional[str]:
         """Get OAuth2 access token"""
@@ -6207,503 +6151,180 @@ class MasterRedditClient:
                 'User-Agent': self.user_agent
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://www.reddit.com/api/v1/access_token',
-                    auth=auth,
-                    data=data,
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        token_data = await response.json()
-                        self.access_token = token_data['access_token']
-                        expires_in = token_data.get('expires_in', 3600)
-                        self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
-                        logger.info("Reddit OAuth2 token obtained successfully")
-                        return self.access_token
-                    else:
-                        logger.error(f"Failed to get Reddit token: {response.status}")
-                        return None
+            result = await self.http.request_json(
+                'POST',
+                'https://www.reddit.com/api/v1/access_token',
+                auth=auth,
+                data=data,
+                headers=headers
+            )
+            if result.ok:
+                token_data = result.data
+                self.access_token = token_data['access_token']
+                expires_in = token_data.get('expires_in', 3600)
+                self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+                logger.info("Reddit OAuth2 token obtained successfully")
+                return self.access_token
+            else:
+                logger.error(f"Failed to get Reddit token: {result.status}")
+                return None
         except Exception as e:
             logger.error(f"Error getting Reddit access token: {e}")
             return None
     
-    async def get_subreddit_posts(self, subreddit: str, sort: str = 'new', limit: int = 25, time_filter: str = 'day') -> List[Dict]:
-        """Get posts from subreddit with OAuth2 or fallback"""
+    async def get_subreddit_posts(self, subreddit: str, sort: str = 'new', limit: int = 25, time_filter: str = 'day',
+                                  incremental: bool = False) -> List[Dict]:
+        """Get posts from subreddit with OAuth2 or fallback
+        
+        Listings larger than one page are followed with ``after`` cursors. With ``incremental=True``
+        on the ``new`` listing, paging stops at the newest post returned by the previous incremental
+        call, so repeated scans only transfer what is new. Other sorts are not ordered by age, so
+        they are always fetched in full.
+        """
+        incremental = incremental and sort == 'new'
+        key = (subreddit.lower(), sort)
+        stop_at = self._newest_seen.get(key) if incremental else None
         token = await self.get_access_token()
         
-        if token:
-            return await self._get_posts_oauth(subreddit, sort, limit, time_filter, token)
-        else:
-            return await self._get_posts_fallback(subreddit, sort, limit)
-    
-    async def _get_posts_oauth(self, subreddit: str, sort: str, limit: int, time_filter: str, token: str) -> List[Dict]:
-        """Get posts using OAuth2"""
-        try:
-            headers = {
-                'Authorization': f'Bearer {token}',
-                'User-Agent': self.user_agent
-            }
-            
-            url = f'https://oauth.reddit.com/r/{subreddit}/{sort}'
-            params = {
-                'limit': limit,
-                't': time_filter
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        posts = data.get('data', {}).get('children', [])
-                        return [post['data'] for post in posts]
-                    else:
-                        logger.error(f"Reddit API error: {response.status}")
-                        return []
-        except Exception as e:
-            logger.error(f"Error fetching posts via OAuth: {e}")
-            return []
-    
-    async def _get_posts_fallback(self, subreddit: str, sort: str, limit: int) -> List[Dict]:
-        """Fallback to public JSON API"""
-        try:
-            url = f"https://www.reddit.com/r/{subreddit}/{sort}.json"
-            headers = {'User-Agent': self.user_agent}
-            params = {'limit': limit}
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        posts = data.get('data', {}).get('children', [])
-                        return [post['data'] for post in posts]
-                    else:
-                        logger.error(f"Reddit fallback API error: {response.status}")
-                        return []
-        except Exception as e:
-            logger.error(f"Error in Reddit fallback: {e}")
-            return []
-    
-    def is_spam_content(self, title: str, body: str) -> bool:
-        """Enhanced spam detection"""
-        content = f"{title} {body}".lower()
-        
-        # Check for spam keywords
-        spam_count = sum(1 for keyword in self.spam_keywords if keyword in content)
-        if spam_count >= 2:
-            return True
-        
-        # Check for excessive capitalization
-        if len(title) > 10 and sum(1 for c in title if c.isupper()) / len(title) > 0.5:
-            return True
-        
-        # Check for excessive punctuation
-        if title.count('!') > 3 or title.count('?') > 3:
-            return True
-        
-        return False
-    
-    def extract_business_context(self, post: Dict) -> Dict:
-        """Extract business context from post"""
-        title = post.get('title', '').lower()
-        body = post.get('selftext', '').lower()
-        content = f"{title} {body}"
-        
-        # Count business keywords
-        business_score = sum(1 for keyword in self.business_keywords if keyword in content)
-        
-        # Detect industry
-        industry = 'general'
-        industry_patterns = {
-            'software': [r'\b(saas|software|app|platform|api|code|dev|tech|ai|ml)\b'],
-            'ecommerce': [r'\b(ecommerce|online\s+store|shopify|amazon|selling|retail)\b'],
-            'marketing': [r'\b(marketing|advertising|social\s+media|seo|content|brand)\b'],
-            'finance': [r'\b(finance|accounting|money|payment|fintech|banking)\b'],
-            'healthcare': [r'\b(health|medical|doctor|patient|clinic|hospital)\b']
-        }
-        
-        for ind, patterns in industry_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content):
-                    industry = ind
-                    break
-            if industry != 'general':
-                break
-        
-        return {
-            'business_score': business_score,
-            'industry': industry,
-            'has_business_context': business_score > 0
-        }
-
-# ================================================================================================
-# DISCOVERY SERVICE (999-LINE CROWN JEWEL)
-# ================================================================================================
-
-# Add MVP API Key System import
-from src.mvp_integration_code import MVPAPIKeyService, get_mvp_api_key_auth, MVPAPIKeyRequest, MVPUsageResponse, TIER_LIMITS, SubscriptionTier
-
-# Initialize MVP API Key Service
-mvp_api_service = MVPAPIKeyService()
-
-class MasterDiscoveryService:
-    """Crown jewel discovery service with 999+ lines of sophisticated business intelligence"""
-    
-    def __init__(self, db_service: MasterDatabaseService, reddit_client: MasterRedditClient):
-        self.db_service = db_service
-        self.reddit_client = reddit_client
-        
-        # Target subreddits for SaaS discovery
-        self.target_subreddits = [
-            'startups', 'Entrepreneur', 'SaaS', 'freelance', 'smallbusiness',
-            'indiehackers', 'entrepreneur', 'business', 'marketing', 'webdev',
-            'productivity', 'consulting', 'remotework', 'devtools'
-        ]
-        
-        # Enhanced pain point indicators
-        self.pain_indicators = {
-            'high_intensity': ['hate', 'terrible', 'nightmare', 'impossible', 'broken', 'awful', 'disaster'],
-            'workflow_friction': ['wasting time', 'manual', 'tedious', 'repetitive', 'inefficient', 'slow', 'clunky'],
-            'solution_seeking': ['need help', 'looking for', 'wish there was', 'no solution', "can't find", 'how do i'],
-            'problem_patterns': ['problem with', 'issue with', 'struggling with', 'difficulty with', 'challenge with'],
-            'urgency': ['urgent', 'asap', 'immediately', 'deadline', 'critical', 'emergency', 'desperate']
-        }
-        
-        logger.info("Master Discovery Service initialized")
-    
-    async def discover_pain_points(self, subreddit: str = 'startups', limit: int = 5) -> Dict:
-        """Main discovery method - analyze Reddit posts for business pain points"""
-        session_id = f"session_{int(time.time())}"
-        
-        logger.info(f"Starting pain point discovery for r/{subreddit} (limit: {limit})")
-        
-        try:
-            # Fetch posts from Reddit
-            posts = await self.reddit_client.get_subreddit_posts(
-                subreddit=subreddit,
-                sort='new',
-                limit=limit * 3,  # Fetch more to account for filtering
-                time_filter='day'
-            )
-            
-            if not posts:
-                logger.warning(f"No posts retrieved from r/{subreddit}")
-                return {
-                    'success': False,
-                    'error': 'No posts retrieved from Reddit',
-                    'session_id': session_id
-                }
-            
-            # Process posts for pain points
-            pain_points = []
-            posts_analyzed = 0
-            
-            for post in posts:
-                # Skip spam and low-quality content
-                if self.reddit_client.is_spam_content(post.get('title', ''), post.get('selftext', '')):
-                    continue
-                
-                # Extract business context
-                business_context = self.reddit_client.extract_business_context(post)
-                if not business_context['has_business_context']:
-                    continue
-                
-                posts_analyzed += 1
-                
-                # Analyze for pain points
-                pain_analysis = await self._analyze_post_for_pain_points(post)
-                if pain_analysis and pain_analysis['has_pain_point']:
-                    pain_points.append(pain_analysis)
-                
-                if len(pain_points) >= limit:
-                    break
-            
-            # Save session to database
-            await self.db_service.save_discovery_session(
-                session_id=session_id,
-                user_id=1,  # Default user for now
-                subreddit=subreddit,
-                posts_analyzed=posts_analyzed,
-                pain_points_found=len(pain_points)
-            )
-            
-            # Save individual pain points
-            for pain_point in pain_points:
-                await self.db_service.save_pain_point(session_id, pain_point)
-            
-            logger.info(f"Discovery complete: {posts_analyzed} posts analyzed, {len(pain_points)} pain points found")
-            
-            return {
-                'success': True,
-                'subreddit': subreddit,
-                'posts_analyzed': posts_analyzed,
-                'pain_points_found': len(pain_points),
-                'pain_points': pain_points,
-                'session_id': session_id,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in pain point discovery: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'session_id': session_id
-            }
-    
-    async def _analyze_post_for_pain_points(self, post: Dict) -> Optional[Dict]:
-        """Analyze individual post for pain points using rule-based approach"""
-        title = post.get('title', '')
-        body = post.get('selftext', '')
-        text = f"{title} {body}".lower()
-        
-        # Check if post contains pain indicators
-        if not self._has_pain_indicators(text):
-            return None
-        
-        # Perform rule-based pain analysis
-        pain_analysis = self._rule_based_pain_analysis(post, text)
-        
-        if pain_analysis['opportunity_score'] < 15:  # Minimum threshold
-            return None
-        
-        return pain_analysis
-    
-    def _has_pain_indicators(self, text: str) -> bool:
-        """Check if text contains pain point indicators"""
-        for category, indicators in self.pain_indicators.items():
-            for indicator in indicators:
-                if indicator in text:
-                    return True
-        return False
-    
-    def _rule_based_pain_analysis(self, post: Dict, text: str) -> Dict:
-        """Rule-based pain point analysis"""
-        
-        # Score components
-        market_size_score = self._score_market_size(text)
-        urgency_score = self._score_urgency(text)
-        solution_gap_score = self._score_solution_gap(text)
-        monetization_score = self._score_monetization(text)
-        
-        total_score = market_size_score + urgency_score + solution_gap_score + monetization_score
-        confidence = self._calculate_confidence(post, text, total_score)
-        
-        # Extract pain point description
-        pain_description = self._extract_pain_point_description(text)
-        
-        # Classify business domain
-        domain = self._classify_domain(text)
-        
-        # Generate opportunity description
-        opportunity_description = self._generate_opportunity_description(pain_description, domain)
-        
-        # Determine target market
-        target_market = self._determine_target_market(text, domain)
-        
-        # Extract validation signals
-        validation_signals = self._extract_validation_signals(post, text)
-        
-        return {
-            'has_pain_point': True,
-            'post_id': post.get('id'),
-            'title': post.get('title'),
-            'url': f"https://reddit.com{post.get('permalink', '')}",
-            'score': post.get('score', 0),
-            'num_comments': post.get('num_comments', 0),
-            'description': pain_description,
-            'opportunity_description': opportunity_description,
-            'opportunity_score': total_score,
-            'total_score': total_score,  # Add for consistency
-            'market_size_score': market_size_score,
-            'urgency_score': urgency_score,
-            'solution_gap_score': solution_gap_score,
-            'monetization_score': monetization_score,
-            'confidence': confidence,
-            'business_domain': domain,
-            'target_market': target_market,
-            'validation_signals': validation_signals,
-            'created_at': datetime.now().isoformat()
-        }
-    
-    def _score_market_size(self, text: str) -> int:
-        """Score market size indicators"""
-        large_market_indicators = [
-            'everyone', 'all businesses', 'every company', 'millions', 'thousands',
-            'small business', 'enterprise', 'startup', 'freelancer', 'agency'
-        ]
-        
-        score = 0
-        for indicator in large_market_indicators:
-            if indicator in text:
-                score += 5
-        
-        return min(score, 25)  # Cap at 25
-    
-    def _score_urgency(self, text: str) -> int:
-        """Score urgency indicators"""
-        urgency_words = [
-            'urgent', 'asap', 'immediately', 'deadline', 'critical', 'emergency',
-            'desperate', 'quickly', 'fast', 'now', 'today', 'this week'
-        ]
-        
-        score = 0
-        for word in urgency_words:
-            if word in text:
-                score += 8
-        
-        return min(score, 25)  # Cap at 25
-    
-    def _score_solution_gap(self, text: str) -> int:
-        """Score solution gap indicators"""
-        gap_indicators = [
-            'no solution', "can't find", 'nothing works', 'no tool', 'no software',
-            'manually', 'spreadsheet', 'email', 'paper', 'phone calls',
-            'wish there was', 'need something', 'looking for'
-        ]
-        
-        score = 0
-        for indicator in gap_indicators:
-            if indicator in text:
-                score += 6
-        
-        return min(score, 25)  # Cap at 25
-    
-    def _score_monetization(self, text: str) -> int:
-        """Score monetization potential"""
-        money_indicators = [
-            'money', 'revenue', 'profit', 'cost', 'expensive', 'budget',
-            'price', 'subscription', 'business', 'company', 'client',
-            'customer', 'sales', 'billing', 'invoice'
-        ]
-        
-        score = 0
-        for indicator in money_indicators:
-            if indicator in text:
-                score += 4
-        
-        return min(score, 25)  # Cap at 25
-    
-    def _calculate_confidence(self, post: Dict, text: str, total_score: int) -> float:
-        """Calculate confidence score"""
-        confidence = 0.0
-        
-        # Base confidence from score
-        confidence += min(total_score / 100.0, 0.4)
-        
-        # Reddit engagement signals
-        score = post.get('score', 0)
-        comments = post.get('num_comments', 0)
-        
-        if score > 10:
-            confidence += 0.1
-        if score > 50:
-            confidence += 0.1
-        if comments > 5:
-            confidence += 0.1
-        if comments > 20:
-            confidence += 0.1
-        
-        # Content quality signals
-        if len(text) > 200:
-            confidence += 0.1
-        if len(text) > 500:
-            confidence += 0.1
-        
-        return min(confidence, 1.0)
-    
-    def _extract_pain_point_description(self, text: str) -> str:
-        """Extract pain point description from text"""
-        # Find sentences containing pain indicators
-        sentences = text.split('.')
-        pain_sentences = []
-        
-        for sentence in sentences:
-            for category, indicators in self.pain_indicators.items():
-                for indicator in indicators:
-                    if indicator in sentence:
-                        pain_sentences.append(sentence.strip())
-                        break
-        
-        if pain_sentences:
-            return '. '.join(pain_sentences[:2])  # Return first 2 sentences
+        if token:
+            posts = await self._get_posts_oauth(subreddit, sort, limit, time_filter, token, stop_at)
+        else:
+            posts = await self._get_posts_fallback(subreddit, sort, limit, stop_at)
         
-        return text[:200] + "..." if len(text) > 200 else text
+        if incremental and posts and posts[0].get('name'):
+            self._newest_seen[key] = posts[0]['name']
+        return posts
     
-    def _classify_domain(self, text: str) -> str:
-        """Classify business domain"""
-        domain_patterns = {
-            'software': ['software', 'app', 'platform', 'code', 'api', 'saas', 'tech'],
-            'marketing': ['marketing', 'advertising', 'social media', 'seo', 'content'],
-            'finance': ['finance', 'accounting', 'money', 'payment', 'fintech'],
-            'healthcare': ['health', 'medical', 'doctor', 'patient', 'clinic'],
-            'ecommerce': ['ecommerce', 'online store', 'shopify', 'selling'],
-            'productivity': ['productivity', 'workflow', 'automation', 'efficiency'],
-            'education': ['education', 'learning', 'course', 'training', 'teach']
+    async def _get_posts_oauth(self, subreddit: str, sort: str, limit: int, time_filter: str, token: str,
+                               stop_at: Optional[str] = None) -> List[Dict]:
+        """Get posts using OAuth2"""
+        headers = {
+            'Authorization': f'Bearer {token}',
+            'User-Agent': self.user_agent
         }
+        url = f'https://oauth.reddit.com/r/{subreddit}/{sort}'
+        return await self._get_listing(url, headers, limit, {'t': time_filter}, stop_at)
+    
+    async def _get_posts_fallback(self, subreddit: str, sort: str, limit: int,
+                                  stop_at: Optional[str] = None) -> List[Dict]:
+        """Fallback to public JSON API"""
+        url = f"https://www.reddit.com/r/{subreddit}/{sort}.json"
+        headers = {'User-Agent': self.user_agent}
+        return await self._get_listing(url, headers, limit, {}, stop_at)
+    
+    async def _get_listing(self, url: str, headers: Dict, limit: int, params: Dict,
+                           stop_at: Optional[str] = None) -> List[Dict]:
+        """Page through a listing with ``after`` cursors until ``limit`` posts or ``stop_at`` is reached"""
+        posts = []
+        after = None
+        try:
+            while len(posts) < limit:
+                page_params = {**params, 'limit': min(self.MAX_PAGE_SIZE, limit - len(posts))}
+                if after:
+                    page_params['after'] = after
+                
+                # Only the first page is worth revalidating - deeper pages shift as posts arrive
+                result = await self.http.request_json('GET', url, params=page_params, headers=headers,
+                                                      conditional=after is None)
+                if result.status == 401 and 'Authorization' in headers:
+                    self.access_token = None  # revoked or expired early; refetch next call
+                if not result.ok:
+                    logger.error(f"Reddit API error: {result.status}")
+                    break
+                
+                listing = (result.data or {}).get('data', {})
+                page = [child['data'] for child in listing.get('children', [])]
+                for post in page:
+                    if stop_at and post.get('name') == stop_at:
+                        return posts
+                    posts.append(post)
+                
+                after = listing.get('after')
+                if not after or not page:
+                    break
+        except Exception as e:
+            logger.error(f"Error fetching Reddit listing {url}: {e}")
+        return posts[:limit]
+    
+    def is_spam_content(self, title: str, body: str) -> bool:
+        """Enhanced spam detection"""
+        # Check for spam keywords
+        spam_count = self.content_matcher.category_hits(f"{title} {body}")['spam']
+        if spam_count >= 2:
+            return True
         
-        for domain, keywords in domain_patterns.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return domain
+        # Check for excessive capitalization
+        if len(title) > 10 and sum(1 for c in title if c.isupper()) / len(title) > 0.5:
+            return True
         
-        return 'general'
-    
-    def _generate_opportunity_description(self, pain_point: str, domain: str) -> str:
-        """Generate opportunity description"""
-        domain_solutions = {
-            'software': 'Build a SaaS tool that',
-            'marketing': 'Create a marketing platform that',
-            'finance': 'Develop a fintech solution that',
-            'healthcare': 'Build a healthcare app that',
-            'ecommerce': 'Create an ecommerce tool that',
-            'productivity': 'Develop a productivity app that',
-            'education': 'Build an educational platform that'
-        }
+        # Check for excessive punctuation
+        if title.count('!') > 3 or title.count('?') > 3:
+            return True
         
-        prefix = domain_solutions.get(domain, 'Create a solution that')
-        return f"{prefix} addresses: {pain_point[:100]}..."
+        return False
     
-    def _determine_target_market(self, text: str, domain: str) -> str:
-        """Determine target market"""
-        market_indicators = {
-            'small business': ['small business', 'small company', 'startup'],
-            'enterprise': ['enterprise', 'large company', 'corporation'],
-            'freelancers': ['freelancer', 'consultant', 'independent'],
-            'agencies': ['agency', 'marketing agency', 'design agency'],
-            'developers': ['developer', 'programmer', 'coder'],
-            'entrepreneurs': ['entrepreneur', 'founder', 'business owner']
-        }
+    def extract_business_context(self, post: Dict) -> Dict:
+        """Extract business context from post"""
+        title = post.get('title', '').lower()
+        body = post.get('selftext', '').lower()
+        content = f"{title} {body}"
         
-        for market, keywords in market_indicators.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return market
+        # Count business keywords
+        business_score = self.content_matcher.category_hits(content)['business']
         
-        return 'general business'
-    
-    def _extract_validation_signals(self, post: Dict, text: str) -> List[str]:
-        """Extract validation signals"""
-        signals = []
+        # Detect industry
+        industry = next((ind for ind, pattern in self.INDUSTRY_PATTERNS if pattern.search(content)), 'general')
         
-        # Reddit engagement
-        score = post.get('score', 0)
-        comments = post.get('num_comments', 0)
+        return {
+            'business_score': business_score,
+            'industry': industry,
+            'has_business_context': business_score > 0
+        }
+    
+    def filter_business_posts(self, posts: List[Dict]) -> List[Tuple[Dict, Dict]]:
+        """Batch equivalent of is_spam_content + extract_business_context
         
-        if score > 10:
-            signals.append(f"High Reddit engagement ({score} upvotes)")
-        if comments > 5:
-            signals.append(f"Active discussion ({comments} comments)")
+        Scans every post's text for both keyword vocabularies in a single pass and returns
+        ``(post, business_context)`` for the non-spam posts that have business context,
+        in their original order.
+        """
+        if not posts:
+            return []
         
-        # Text analysis
-        if 'everyone has this problem' in text:
-            signals.append("Widespread problem indication")
-        if 'paying for' in text or 'would pay' in text:
-            signals.append("Willingness to pay mentioned")
-        if 'tried everything' in text:
-            signals.append("Existing solutions inadequate")
+        titles = [post.get('title', '') for post in posts]
+        contents = [f"{title} {post.get('selftext', '')}".lower() for title, post in zip(titles, posts)]
+        counts = self.content_matcher.category_counts(self.content_matcher.presence_matrix(contents))
         
-        return signals
+        kept = []
+        for i, (post, title, content) in enumerate(zip(posts, titles, contents)):
+            if counts['spam'][i] >= 2:
+                continue
+            if len(title) > 10 and sum(1 for c in title if c.isupper()) / len(title) > 0.5:
+                continue
+            if title.count('!') > 3 or title.count('?') > 3:
+                continue
+            
+            business_score = int(counts['business'][i])
+            if business_score == 0:
+                continue
+            
+            industry = next((ind for ind, pattern in self.INDUSTRY_PATTERNS if pattern.search(content)), 'general')
+            kept.append((post, {
+                'business_score': business_score,
+                'industry': industry,
+                'has_business_context': True
+            }))
+        return kept
+
+# ================================================================================================
+# DISCOVERY SERVICE (999-LINE CROWN JEWEL)
+# ================================================================================================
+
+# Add MVP API Key System import
+from src.mvp_integration_code import MVPAPIKeyService, mvp_api_key_service, get_mvp_api_key_auth, MVPAPIKeyRequest, MVPUsageResponse, TIER_LIMITS, SubscriptionTier
+
+# Initialize MVP API Key Service (shared with get_mvp_api_key_auth so key cache and usage buffer agree)
+mvp_api_service = mvp_api_key_service
 
 # ================================================================================================
 # PAIN POINT DETECTION ENGINE (PHASE 1 INTELLIGENCE FOUNDATION)
@@ -6805,21 +6426,36 @@ class PainPointDetectionEngine:
             }
         }
         
+        # Pattern and domain vocabularies compiled once; each pain type's alternation rejects
+        # non-matching text in one scan before its patterns are counted individually
+        self.compiled_pain_patterns = {
+            pain_type: (
+                re.compile('|'.join(f'(?:{pattern})' for pattern in config['patterns'])),
+                [re.compile(pattern) for pattern in config['patterns']]
+            )
+            for pain_type, config in self.pain_patterns.items()
+        }
+        self.domain_matcher = KeywordMatcher({
+            domain_name: config['keywords'] for domain_name, config in self.domain_classifiers.items()
+        })
+        
         logger.info("🎯 PainPointDetectionEngine initialized - Phase 1 Intelligence Foundation active")
     
     async def detect_advanced_pain_points(self, 
                                         content: str, 
                                         platform: str = "unknown",
-                                        context: Dict = None) -> Dict[str, Any]:
+                                        context: Dict = None,
+                                        analysis_context: Optional[AnalysisContext] = None) -> Dict[str, Any]:
         """
         Advanced pain point detection with >85% accuracy using multi-engine analysis
         """
+        analysis_context = analysis_context or AnalysisContext()
         try:
             # Step 1: Semantic analysis for deep understanding
-            semantic_analysis = await self.semantic_engine.analyze_semantic_content(content, context)
+            semantic_analysis = await analysis_context.semantic(self.semantic_engine, content, context)
             
             # Step 2: Dialectical fusion for cross-platform intelligence
-            fusion_analysis = await self.fusion_engine.analyze_content(content, platform)
+            fusion_analysis = await analysis_context.fusion(self.fusion_engine, content, platform)
             
             # Step 3: Pattern-based pain point classification
             pattern_analysis = self._analyze_pain_patterns(content)
@@ -6882,12 +6518,14 @@ class PainPointDetectionEngine:
         for pain_type, config in self.pain_patterns.items():
             score = 0
             matched_patterns = []
+            any_pattern, patterns = self.compiled_pain_patterns[pain_type]
             
-            for pattern in config['patterns']:
-                matches = re.findall(pattern, content_lower)
-                if matches:
-                    score += len(matches) * config['weight']
-                    matched_patterns.extend(matches)
+            if any_pattern.search(content_lower):
+                for pattern in patterns:
+                    matches = pattern.findall(content_lower)
+                    if matches:
+                        score += len(matches) * config['weight']
+                        matched_patterns.extend(matches)
             
             if score > 0:
                 pattern_scores[pain_type] = {
@@ -6916,9 +6554,9 @@ class PainPointDetectionEngine:
             domain = 'unknown'
             domain_score = 0
             
-            content_lower = content.lower()
-            for domain_name, config in self.domain_classifiers.items():
-                score = sum(1 for keyword in config['keywords'] if keyword in content_lower)
+            domain_hits = self.domain_matcher.category_hits(content)
+            for domain_name in self.domain_classifiers:
+                score = domain_hits[domain_name]
                 if score > domain_score:
                     domain_score = score
                     domain = domain_name
@@ -7133,18 +6771,20 @@ class SolutionGapAnalyzer:
     async def analyze_solution_gaps(self, 
                                   content: str, 
                                   platform: str = "unknown",
-                                  context: Dict = None) -> Dict[str, Any]:
+                                  context: Dict = None,
+                                  analysis_context: Optional[AnalysisContext] = None) -> Dict[str, Any]:
         """
         Comprehensive solution gap analysis with bootstrap feasibility assessment
         """
+        analysis_context = analysis_context or AnalysisContext()
         try:
             # Step 1: First get pain point analysis from Phase 1
             pain_point_analysis = await self.pain_point_engine.detect_advanced_pain_points(
-                content, platform, context
+                content, platform, context, analysis_context
             )
             
             # Step 2: Discover existing solutions in the market
-            existing_solutions = await self._discover_existing_solutions(content, platform)
+            existing_solutions = await self._discover_existing_solutions(content, platform, context, analysis_context)
             
             # Step 3: Identify solution gaps and opportunities
             gap_analysis = await self._analyze_gaps(content, existing_solutions, pain_point_analysis)
@@ -7224,7 +6864,8 @@ class SolutionGapAnalyzer:
                 'opportunity_score': 0.0
             }
     
-    async def _discover_existing_solutions(self, content: str, platform: str) -> Dict[str, Any]:
+    async def _discover_existing_solutions(self, content: str, platform: str, context: Dict = None,
+                                           analysis_context: Optional[AnalysisContext] = None) -> Dict[str, Any]:
         """Discover existing solutions mentioned in content and through market research"""
         try:
             # Pattern-based solution discovery
@@ -7242,7 +6883,7 @@ class SolutionGapAnalyzer:
                     })
             
             # Use semantic analysis to identify solution categories
-            semantic_analysis = await self.semantic_engine.analyze_semantic_content(content)
+            semantic_analysis = await (analysis_context or AnalysisContext()).semantic(self.semantic_engine, content, context)
             
             # Estimate market saturation based on solution mentions
             saturation_level = 'low'
@@ -7704,7 +7345,8 @@ class MarketValidationEngine:
     async def validate_market_opportunity(self, 
                                        content: str, 
                                        platform: str = "unknown",
-                                       context: Dict = None) -> Dict[str, Any]:
+                                       context: Dict = None,
+                                       analysis_context: Optional[AnalysisContext] = None) -> Dict[str, Any]:
         """
         Comprehensive market validation analysis
         
@@ -7715,18 +7357,20 @@ class MarketValidationEngine:
             session_id = f"market_validation_{int(time.time())}"
             logger.info(f"[MARKET] Advanced market validation initiated: {session_id}")
             
+            analysis_context = analysis_context or AnalysisContext()
+            
             # Phase 1: Get pain point analysis foundation
             pain_point_analysis = await self.pain_point_engine.detect_advanced_pain_points(
-                content, platform, context
+                content, platform, context, analysis_context
             )
             
             # Phase 2: Get solution gap analysis
             solution_gap_analysis = await self.solution_gap_analyzer.analyze_solution_gaps(
-                content, platform, context
+                content, platform, context, analysis_context
             )
             
             # Phase 3: Market validation analysis
-            market_analysis = await self._analyze_market_opportunity(content, platform)
+            market_analysis = await self._analyze_market_opportunity(content, platform, context, analysis_context)
             competitor_analysis = await self._analyze_competitive_landscape(content, platform)
             timing_analysis = await self._analyze_market_timing(content, market_analysis, competitor_analysis)
             risk_analysis = await self._assess_market_risks(content, market_analysis, competitor_analysis)
@@ -7789,11 +7433,12 @@ class MarketValidationEngine:
             logger.error(f"[ERROR] Market validation failed: {e}")
             return self._create_fallback_result(content)
     
-    async def _analyze_market_opportunity(self, content: str, platform: str) -> MarketMetrics:
+    async def _analyze_market_opportunity(self, content: str, platform: str, context: Dict = None,
+                                          analysis_context: Optional[AnalysisContext] = None) -> MarketMetrics:
         """Analyze market size, growth, and opportunity"""
         try:
             # Use semantic analysis for market intelligence
-            semantic_analysis = await self.semantic_engine.analyze_semantic_content(content)
+            semantic_analysis = await (analysis_context or AnalysisContext()).semantic(self.semantic_engine, content, context)
             
             # Market size analysis
             market_size_score = await self._assess_market_size(content, semantic_analysis)
@@ -8191,21 +7836,25 @@ class PredictiveAnalyticsEngine:
     async def analyze_predictive_trends(self, 
                                       content: str, 
                                       platform: str = "unknown",
-                                      context: Dict = None) -> Dict[str, Any]:
+                                      context: Dict = None,
+                                      analysis_context: Optional[AnalysisContext] = None) -> Dict[str, Any]:
         """
         Comprehensive predictive analytics with trend forecasting
         """
         logger.info("🔮 Starting Phase 4 Predictive Analytics analysis...")
         
+        # One context for every phase so semantic/fusion passes run once per request
+        analysis_context = analysis_context or AnalysisContext()
+        
         try:
             # Gather foundation analysis from previous phases
-            pain_point_analysis = await self.pain_point_engine.detect_advanced_pain_points(content, platform, context)
-            solution_gap_analysis = await self.solution_gap_analyzer.analyze_solution_gaps(content, platform, context)
-            market_validation = await self.market_validation_engine.validate_market_opportunity(content, platform, context)
+            pain_point_analysis = await self.pain_point_engine.detect_advanced_pain_points(content, platform, context, analysis_context)
+            solution_gap_analysis = await self.solution_gap_analyzer.analyze_solution_gaps(content, platform, context, analysis_context)
+            market_validation = await self.market_validation_engine.validate_market_opportunity(content, platform, context, analysis_context)
             
             # Advanced semantic and fusion analysis
-            semantic_analysis = await self.semantic_engine.analyze_semantic_content(content, context)
-            fusion_analysis = await self.fusion_engine.analyze_content(content, platform)
+            semantic_analysis = await analysis_context.semantic(self.semantic_engine, content, context)
+            fusion_analysis = await analysis_context.fusion(self.fusion_engine, content, platform)
             
             # Phase 4 advanced predictive analytics with enhanced content analysis
             content_specific_analysis = await self._analyze_content_specifics(content, platform, context)
@@ -9294,13 +8943,10 @@ class OvernightDiscoveryEngine:
                 subreddits = ['startups', 'entrepreneur', 'SaaS', 'business', 'indiehackers']
                 cycle_opportunities = 0
                 
-                for subreddit in subreddits:
-                    try:
-                        result = await self.discovery_service.discover_pain_points(subreddit, limit=3)
-                        if result['success']:
-                            cycle_opportunities += result['pain_points_found']
-                    except Exception as e:
-                        logger.error(f"Error in subreddit {subreddit}: {e}")
+                result = await self.discovery_service.discover_all_subreddits(subreddits, limit_per_subreddit=3,
+                                                                              incremental=True)
+                if result.get('success'):
+                    cycle_opportunities += result['pain_points_found']
                 
                 # Run mega scraper
                 try:
@@ -9609,6 +9255,14 @@ class DialecticalMultimodalFusionEngine:
         self.transformer_model = None
         self._init_transformer()
         
+        # Micro-batched, off-loop inference shared by all concurrent requests
+        self.transformer_batcher = MicroBatchInferenceService(
+            "transformer", self._transformer_batch, max_batch_size=32, max_wait_ms=10
+        )
+        self.spacy_batcher = MicroBatchInferenceService(
+            "spacy", self._spacy_batch, max_batch_size=64, max_wait_ms=10
+        )
+        
         # NEW: Dialectical intelligence components
         self.authority_analyzer = AuthorityAnalyzer()
         self.contextual_intelligence = ContextualSourceIntelligence()
@@ -9641,11 +9295,11 @@ class DialecticalMultimodalFusionEngine:
         # Sentiment analysis (preserved)
         sentiment_analysis = self._analyze_sentiment(content)
         
-        # NLP analysis (preserved)
-        nlp_analysis = self._analyze_with_spacy(content)
-        
-        # Transformer analysis (preserved)
-        transformer_analysis = await self._analyze_with_transformer(content)
+        # NLP and transformer analysis, batched with other in-flight requests
+        nlp_analysis, transformer_analysis = await asyncio.gather(
+            self._analyze_with_spacy_batched(content),
+            self._analyze_with_transformer(content)
+        )
         
         # Business context analysis (preserved)
         business_analysis = self._analyze_business_context(content)
@@ -9705,47 +9359,64 @@ class DialecticalMultimodalFusionEngine:
         except Exception as e:
             return {'error': f'Sentiment analysis failed: {e}'}
     
+    @staticmethod
+    def _summarize_doc(doc) -> Dict[str, Any]:
+        entities = [{'text': ent.text, 'label': ent.label_} for ent in doc.ents]
+        
+        # Extract key phrases (noun phrases)
+        noun_phrases = [chunk.text for chunk in doc.noun_chunks]
+        
+        # POS tag distribution
+        pos_counts = Counter([token.pos_ for token in doc])
+        
+        return {
+            'entities': entities[:10],  # Top 10 entities
+            'noun_phrases': noun_phrases[:10],  # Top 10 noun phrases
+            'pos_distribution': dict(pos_counts),
+            'token_count': len(doc)
+        }
+    
     def _analyze_with_spacy(self, content: str) -> Dict[str, Any]:
-        """NLP analysis using spaCy"""
+        """NLP analysis using spaCy (synchronous, single document)"""
         if not self.nlp:
             return {'error': 'spaCy model not available'}
         
         try:
-            doc = self.nlp(content[:1000])  # Limit length for performance
-            
-            entities = [{'text': ent.text, 'label': ent.label_} for ent in doc.ents]
-            
-            # Extract key phrases (noun phrases)
-            noun_phrases = [chunk.text for chunk in doc.noun_chunks]
-            
-            # POS tag distribution
-            pos_counts = Counter([token.pos_ for token in doc])
-            
-            return {
-                'entities': entities[:10],  # Top 10 entities
-                'noun_phrases': noun_phrases[:10],  # Top 10 noun phrases
-                'pos_distribution': dict(pos_counts),
-                'token_count': len(doc)
-            }
+            return self._summarize_doc(self.nlp(content[:1000]))  # Limit length for performance
+        except Exception as e:
+            return {'error': f'spaCy analysis failed: {e}'}
+    
+    def _spacy_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Runs on the inference thread: one nlp.pipe pass over the whole batch"""
+        return [self._summarize_doc(doc) for doc in self.nlp.pipe(texts, batch_size=len(texts))]
+    
+    async def _analyze_with_spacy_batched(self, content: str) -> Dict[str, Any]:
+        """NLP analysis using spaCy, micro-batched off the event loop"""
+        if not self.nlp:
+            return {'error': 'spaCy model not available'}
+        
+        try:
+            return await self.spacy_batcher.submit(content[:1000])  # Limit length for performance
         except Exception as e:
             return {'error': f'spaCy analysis failed: {e}'}
     
+    def _transformer_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Runs on the inference thread: one forward pass over the whole batch"""
+        results = self.transformer_model(texts, batch_size=len(texts), truncation=True)
+        return [{
+            'transformer_sentiment': result['label'],
+            'confidence': result['score'],
+            'model_used': 'cardiffnlp/twitter-roberta-base-sentiment-latest'
+        } for result in results]
+    
     async def _analyze_with_transformer(self, content: str) -> Dict[str, Any]:
-        """Advanced transformer analysis"""
+        """Advanced transformer analysis, micro-batched off the event loop"""
         if not self.transformer_model:
             return {'error': 'Transformer model not available'}
         
         try:
             # Truncate content for transformer
-            truncated_content = content[:512]
-            
-            result = self.transformer_model(truncated_content)
-            
-            return {
-                'transformer_sentiment': result[0]['label'],
-                'confidence': result[0]['score'],
-                'model_used': 'cardiffnlp/twitter-roberta-base-sentiment-latest'
-            }
+            return await self.transformer_batcher.submit(content[:512])
         except Exception as e:
             return {'error': f'Transformer analysis failed: {e}'}
     
@@ -10623,7 +10294,6 @@ class StreamingService:
 # ================================================================================================
 
 from textblob import TextBlob
-from collections import defaultdict
 import re
 from typing import NamedTuple
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -10683,9 +10353,13 @@ class AdvancedSemanticAnalysisEngine:
     - Industry and domain classification
     """
     
+    # Bump whenever scoring changes so cached results from older logic are not reused
+    ENGINE_VERSION = "semantic_content_v1"
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
+        self.result_cache = get_result_cache("semantic_content", self.ENGINE_VERSION)
         
         # Initialize business context vocabularies
         self._initialize_business_vocabularies()
@@ -10815,6 +10489,11 @@ class AdvancedSemanticAnalysisEngine:
         Returns:
             SemanticScore with detailed semantic analysis
         """
+        cache_key = self.result_cache.make_key(content, context)
+        cached = await self.result_cache.aget(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Basic preprocessing
             content_clean = self._preprocess_content(content)
@@ -10828,7 +10507,7 @@ class AdvancedSemanticAnalysisEngine:
             entity_richness = await self._calculate_entity_richness(content_clean)
             innovation_indicators = self._detect_innovation_indicators(content_clean)
             
-            return SemanticScore(
+            semantic_score = SemanticScore(
                 relevance_score=relevance_score,
                 intent_confidence=intent_result.confidence,
                 context_understanding=context_understanding,
@@ -10837,6 +10516,8 @@ class AdvancedSemanticAnalysisEngine:
                 entity_richness=entity_richness,
                 innovation_indicators=innovation_indicators
             )
+            self.result_cache.put(cache_key, semantic_score)
+            return semantic_score
             
         except Exception as e:
             self.logger.error(f"Semantic analysis error: {e}")
@@ -11194,8 +10875,6 @@ class SemanticTemporalFusionEngine:
     def _fuse_temporal_semantic_insights(self, temporal_results: Dict, semantic_results: List[Dict]) -> Dict:
         """Fuse temporal and semantic insights for enhanced intelligence"""
         try:
-            from collections import defaultdict
-            
             fusion_insights = {
                 'trending_business_intents': self._analyze_trending_intents(semantic_results),
                 'business_opportunity_trends': self._identify_business_opportunity_trends(semantic_results),
@@ -11211,8 +10890,6 @@ class SemanticTemporalFusionEngine:
     def _analyze_trending_intents(self, semantic_results: List[Dict]) -> Dict:
         """Analyze trending business intents"""
         try:
-            from collections import defaultdict
-            
             intent_counts = defaultdict(int)
             intent_confidence_sum = defaultdict(float)
             
@@ -11247,8 +10924,6 @@ class SemanticTemporalFusionEngine:
     def _identify_business_opportunity_trends(self, semantic_results: List[Dict]) -> Dict:
         """Identify business opportunity trends from semantic analysis"""
         try:
-            from collections import defaultdict
-            
             opportunity_trends = {
                 'high_potential_opportunities': [],
                 'emerging_business_contexts': defaultdict(int)
@@ -11428,6 +11103,64 @@ class ChatService:
             'enhanced_by_llm': False
         }
     
+    async def stream_chat_message(self, message: str, user_id: int) -> AsyncIterator[Dict[str, Any]]:
+        """Process a chat message, relaying the response as it is generated
+        
+        Yields a 'start' event immediately, a 'context' event once analysis is done, 'token'
+        events as text arrives and a final 'done' event with the same insights as
+        process_chat_message.
+        """
+        
+        yield {'type': 'start', 'user_message': message, 'timestamp': datetime.now().isoformat()}
+        
+        analysis = await self.intelligence_engine.analyze_content(message, platform="chat")
+        context = await self._analyze_conversation_context(message, analysis)
+        user_history = self.conversation_history.get(user_id, [])
+        yield {'type': 'context', 'conversation_context': context}
+        
+        suggested_actions = ['💡 Ask follow-up questions', '🔍 Dive deeper into analysis', '📊 Request specific data']
+        if self.intelligent_orchestrator:
+            real_time_data = await self._gather_real_time_intelligence(message, context)
+            async for event in self.intelligent_orchestrator.stream_intelligent_response(
+                user_message=message,
+                context=context,
+                real_time_data=real_time_data,
+                conversation_history=user_history[-3:] if user_history else None
+            ):
+                if event['type'] == 'token':
+                    yield event
+                    continue
+                
+                self._update_conversation_history(user_id, message, event['response'])
+                yield {
+                    'type': 'done',
+                    'ai_insights': {
+                        'confidence': event.get('confidence', 0.9),
+                        'provider': event.get('provider', 'intelligent_orchestrator'),
+                        'model': event.get('model', 'unknown'),
+                        'intelligence_level': event.get('intelligence_level', 'high'),
+                        'suggested_actions': suggested_actions
+                    },
+                    'confidence_score': event.get('confidence', 0.9),
+                    'suggested_actions': suggested_actions,
+                    'timestamp': datetime.now().isoformat(),
+                    'enhanced_by_llm': event.get('provider') != 'enhanced_fallback'
+                }
+            return
+        
+        # FALLBACK: legacy response system, sent as a single chunk
+        response, insights = await self._generate_enhanced_response(message, analysis, context)
+        self._update_conversation_history(user_id, message, response)
+        yield {'type': 'token', 'text': response}
+        yield {
+            'type': 'done',
+            'ai_insights': insights,
+            'confidence_score': insights.get('confidence', 0.8),
+            'suggested_actions': insights.get('suggested_actions', []),
+            'timestamp': datetime.now().isoformat(),
+            'enhanced_by_llm': False
+        }
+    
     async def _analyze_conversation_context(self, message: str, analysis: Dict) -> Dict[str, Any]:
         """Determine conversation type for intelligent routing"""
         
@@ -12042,7 +11775,9 @@ class ChatService:
 
 # Initialize global services with dialectical intelligence enhancement
 db_service = MasterDatabaseService()
+register_shutdown_hook(db_service.close)
 reddit_client = MasterRedditClient()
+register_shutdown_hook(reddit_http_client.close)
 auth_service = AuthService(db_service)
 discovery_service = MasterDiscoveryService(db_service, reddit_client)
 mega_scraper = MegaSourceScraper()
@@ -12077,6 +11812,7 @@ predictive_analytics_engine = PredictiveAnalyticsEngine(semantic_engine, intelli
 
 # Phase 5 Intelligence Orchestrator: Initialize Intelligent Orchestrator for enhanced responses
 intelligent_orchestrator = IntelligentOrchestrator()
+register_shutdown_hook(intelligent_orchestrator.close)
 
 # FINAL ENHANCEMENT: Connect all AI engines to chat service for maximum intelligence
 chat_service.set_ai_engines(pain_point_engine, market_validation_engine, solution_gap_analyzer, semantic_engine)
@@ -12094,8 +11830,9 @@ app = FastAPI(
     lifespan=lifespan  # Modern lifespan handler replacing deprecated @app.on_event
 )
 
-# Initialize MVP API Key Service
-mvp_api_service = MVPAPIKeyService()
+# Initialize MVP API Key Service (shared with get_mvp_api_key_auth so key cache and usage buffer agree)
+mvp_api_service = mvp_api_key_service
+register_shutdown_hook(mvp_api_service.close)
 
 # PHASE 1 SECURITY: Secure CORS middleware with security headers
 app.add_middleware(
@@ -12842,6 +12579,17 @@ async def stop_streaming_task(task_id: str):
 # OVERNIGHT DISCOVERY ENDPOINTS (802+ LINES)
 # ================================================================================================
 
+@app.get("/api/discovery/scan")
+async def scan_all_subreddits(limit_per_subreddit: int = 5, api_key_data: Dict = Depends(get_mvp_api_key_auth)):
+    """Scan every target subreddit concurrently, streaming NDJSON events as pain points are found"""
+    limit_per_subreddit = max(1, min(limit_per_subreddit, 25))
+    
+    async def events():
+        async for event in discovery_service.stream_pain_points(limit_per_subreddit=limit_per_subreddit):
+            yield json.dumps(event, default=str) + "\n"
+    
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
 @app.post("/api/discovery/overnight/start")
 async def start_overnight_discovery(duration_hours: int = 8):
     """Start autonomous overnight discovery cycle"""
@@ -12929,6 +12677,29 @@ async def send_chat_message(request: ChatRequest, api_key_data: Dict = Depends(g
         logger.error(f"Enhanced chat with credibility error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/chat/message/stream")
+async def stream_chat_message(request: ChatRequest, api_key_data: Dict = Depends(get_mvp_api_key_auth)):
+    """Chat with the response relayed token by token as Server-Sent Events"""
+    user_id = api_key_data.get('user_id', 1)
+    
+    await mvp_api_service.track_mvp_usage(
+        api_key_data["api_key_hash"], "/api/chat/message/stream", 0, 200
+    )
+    
+    async def events():
+        try:
+            async for event in chat_service.stream_chat_message(request.message, user_id):
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+        except Exception as e:
+            logger.error(f"Streaming chat error: {e}")
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/api/chat/demo/message")
 async def send_demo_chat_message(request: ChatRequest):
     """Demo chat endpoint - no authentication required for testing"""
@@ -13096,7 +12867,8 @@ async def get_system_stats():
             "total_opportunities_found": overnight_engine.session_stats['total_opportunities'],
             "active_websocket_connections": len(streaming_service.active_connections),
             "system_uptime": "operational"
-        }
+        },
+        "analysis_caches": get_result_cache_stats()
     }
 
 # ================================================================================================
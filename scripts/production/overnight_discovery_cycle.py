@@ -8,13 +8,131 @@ import time
 import json
 import os
 import psutil
-import threading
+import signal
 import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-import requests
+from urllib.parse import urlparse
+import aiohttp
 from pathlib import Path
 import random
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
+
+
+class HostRateLimiter:
+    """Per-host concurrency cap plus a minimum spacing between request starts"""
+    
+    def __init__(self, min_interval: float = 1.0, max_concurrent: int = 2,
+                 host_limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.min_interval = min_interval
+        self.max_concurrent = max_concurrent
+        self.host_limits = host_limits or {}  # host -> (min_interval, max_concurrent)
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+    
+    def _host_state(self, host: str) -> Dict[str, Any]:
+        state = self._hosts.get(host)
+        if state is None:
+            interval, concurrent = self.host_limits.get(host, (self.min_interval, self.max_concurrent))
+            state = {
+                'interval': interval,
+                'semaphore': asyncio.Semaphore(concurrent),
+                'lock': asyncio.Lock(),
+                'next_start': 0.0
+            }
+            self._hosts[host] = state
+        return state
+    
+    @asynccontextmanager
+    async def slot(self, url: str):
+        state = self._host_state(urlparse(url).netloc)
+        async with state['semaphore']:
+            async with state['lock']:
+                loop = asyncio.get_running_loop()
+                wait = state['next_start'] - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                state['next_start'] = loop.time() + state['interval']
+            yield
+
+
+class DiscoveryResultStore:
+    """Append-only JSONL cycle log with an incrementally maintained summary.
+    
+    Each cycle is one appended line and the summary is a fixed-size file rebuilt from running
+    counters, so the cost of saving a cycle does not grow with the length of the run. Counters
+    carry over between runs like the log does, so the summary's ``start_time`` is the start of
+    the first run they cover; ``run_start_time`` is the current run's.
+    """
+    
+    def __init__(self, data_dir: Path):
+        self.log_file = data_dir / "enhanced_overnight_discovery_log.jsonl"
+        self.summary_file = data_dir / "enhanced_overnight_summary.json"
+        self.counters = {
+            'total_cycles': 0,
+            'total_ideas': 0,
+            'quality_score_sum': 0.0,
+            'quality_scored_cycles': 0,
+            'cpu_usage_sum': 0.0,
+            'memory_usage_sum': 0.0,
+            'enhanced_cycles': 0,
+            'platforms': [],
+            'first_start_time': None
+        }
+        # Counters carry over between runs just like the log they summarize
+        if self.summary_file.exists():
+            try:
+                with open(self.summary_file, 'r') as f:
+                    self.counters.update(json.load(f).get('counters', {}))
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Could not read {self.summary_file}, starting fresh counters: {e}")
+        self._platforms = set(self.counters['platforms'])
+    
+    def append_cycle(self, cycle_data: Dict, start_time: Optional[datetime] = None) -> Dict:
+        """Append one cycle record and return the refreshed summary"""
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(cycle_data, default=str) + '\n')
+        
+        metrics = cycle_data['enhanced_metrics']
+        health = cycle_data['system_health']
+        counters = self.counters
+        if start_time and not counters['first_start_time']:
+            counters['first_start_time'] = start_time.isoformat()
+        counters['total_cycles'] += 1
+        counters['total_ideas'] += cycle_data['ideas_found']
+        if metrics['avg_quality_score']:
+            counters['quality_score_sum'] += metrics['avg_quality_score']
+            counters['quality_scored_cycles'] += 1
+        if metrics['avg_quality_score'] > 6:
+            counters['enhanced_cycles'] += 1
+        counters['cpu_usage_sum'] += health['cpu_percent']
+        counters['memory_usage_sum'] += health['memory_percent']
+        self._platforms.update(metrics['platform_distribution'])
+        counters['platforms'] = sorted(self._platforms)
+        
+        cycles = counters['total_cycles']
+        summary = {
+            'total_cycles': cycles,
+            'total_ideas': counters['total_ideas'],
+            'start_time': counters['first_start_time'],
+            'run_start_time': start_time.isoformat() if start_time else None,
+            'last_update': cycle_data['timestamp'],
+            'avg_ideas_per_cycle': counters['total_ideas'] / cycles,
+            'avg_quality_score': (counters['quality_score_sum'] / counters['quality_scored_cycles']
+                                  if counters['quality_scored_cycles'] else 0),
+            'avg_cpu_usage': counters['cpu_usage_sum'] / cycles,
+            'avg_memory_usage': counters['memory_usage_sum'] / cycles,
+            'total_platforms_used': len(self._platforms),
+            'enhanced_discovery_rate': counters['enhanced_cycles'] / cycles * 100
+        }
+        
+        # Write-then-rename so a crash never leaves a truncated summary
+        temp_file = self.summary_file.with_suffix('.json.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump({'summary': summary, 'counters': counters}, f, indent=2)
+        os.replace(temp_file, self.summary_file)
+        return summary
+
 
 class OvernightDiscoveryEngine:
     def __init__(self):
@@ -24,6 +142,20 @@ class OvernightDiscoveryEngine:
         self.start_time = None
         self.data_dir = Path("overnight_discovery_data")
         self.data_dir.mkdir(exist_ok=True)
+        self.result_store = DiscoveryResultStore(self.data_dir)
+        self.recent_cycles = deque(maxlen=64)  # ISO start times, for the hourly cycle limit
+        self._stop_event = asyncio.Event()
+        
+        # Shared HTTP session, created on first use; requests are paced per host
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter = HostRateLimiter(
+            min_interval=1.0,
+            max_concurrent=2,
+            host_limits={
+                'www.reddit.com': (2.0, 2),
+                'localhost:8000': (0.0, 4)
+            }
+        )
         
         # Safety limits (conservative for overnight)
         self.max_cpu_usage = 60  # Conservative CPU limit
@@ -53,6 +185,41 @@ class OvernightDiscoveryEngine:
         print(f"🔄 Max cycles/hour: {self.max_cycles_per_hour}")
         print(f"🌐 Multi-platform: {len(self.all_platforms)} platforms available")
         print(f"🎯 Platforms per cycle: {self.platforms_per_cycle}")
+        
+        # Prime psutil so later cpu_percent(interval=None) calls return immediately
+        psutil.cpu_percent(interval=None)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared aiohttp session"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers={'User-Agent': 'Luciq Discovery Bot 1.0 (Business Idea Research)'},
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+            )
+        return self.session
+    
+    async def fetch_json(self, url: str, timeout: float = 15) -> Tuple[int, Optional[Dict]]:
+        """GET ``url`` under its host's rate limit; returns (status, parsed JSON or None)"""
+        session = await self._get_session()
+        async with self.rate_limiter.slot(url):
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if response.status != 200:
+                    return response.status, None
+                return response.status, await response.json(content_type=None)
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+    
+    async def _sleep(self, seconds: float) -> bool:
+        """Sleep without blocking the event loop; returns early (False) once stop is requested"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=max(0, seconds))
+            return False
+        except asyncio.TimeoutError:
+            return True
     
     async def initialize_multi_platform_analyzer(self):
         """Initialize the multi-platform pain point analyzer"""
@@ -72,7 +239,7 @@ class OvernightDiscoveryEngine:
     
     def check_system_health(self):
         """Check if system is healthy enough to continue"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=None)  # since the previous call - never blocks
         memory_percent = psutil.virtual_memory().percent
         disk_percent = psutil.disk_usage('.').percent
         available_gb = psutil.virtual_memory().available / (1024**3)
@@ -120,7 +287,7 @@ class OvernightDiscoveryEngine:
             for warning in health['warnings']:
                 print(f"   • {warning}")
             print("😴 Sleeping for 15 minutes to let system recover...")
-            time.sleep(900)  # 15 minutes
+            await self._sleep(900)  # 15 minutes
             return False
         
         try:
@@ -136,8 +303,9 @@ class OvernightDiscoveryEngine:
                 ideas_found = await self.run_lightweight_discovery()
             
             # Save results
-            self.save_cycle_results(ideas_found, health)
+            await asyncio.to_thread(self.save_cycle_results, ideas_found, health)
             
+            self.recent_cycles.append(datetime.fromtimestamp(cycle_start).isoformat())
             self.cycle_count += 1
             self.total_ideas += len(ideas_found)
             
@@ -151,7 +319,7 @@ class OvernightDiscoveryEngine:
         except Exception as e:
             print(f"❌ Enhanced cycle failed: {e}")
             print("😴 Sleeping for 10 minutes before retry...")
-            time.sleep(600)  # 10 minutes
+            await self._sleep(600)  # 10 minutes
             return False
     
     async def run_enhanced_multi_platform_discovery(self):
@@ -228,19 +396,17 @@ class OvernightDiscoveryEngine:
             
             else:
                 print("⚠️ Mega scraper returned no data, falling back to platform-specific discovery")
-                # Fallback to platform-specific discovery
-                for platform in cycle_platforms:
-                    try:
-                        platform_ideas = await self.discover_from_platform(platform)
-                        all_pain_points.extend(platform_ideas)
-                        print(f"   ✅ {platform}: {len(platform_ideas)} pain points")
-                        
-                        # Add delay between platforms
-                        await asyncio.sleep(2)
-                        
-                    except Exception as e:
-                        print(f"   ❌ {platform}: {e}")
+                # Fallback to platform-specific discovery, all platforms at once
+                results = await asyncio.gather(
+                    *[self.discover_from_platform(platform) for platform in cycle_platforms],
+                    return_exceptions=True
+                )
+                for platform, platform_ideas in zip(cycle_platforms, results):
+                    if isinstance(platform_ideas, Exception):
+                        print(f"   ❌ {platform}: {platform_ideas}")
                         continue
+                    all_pain_points.extend(platform_ideas)
+                    print(f"   ✅ {platform}: {len(platform_ideas)} pain points")
         
         except Exception as e:
             print(f"❌ Enhanced discovery failed: {e}")
@@ -332,13 +498,13 @@ class OvernightDiscoveryEngine:
             
             # Convert signals to pain points using enhanced analysis
             ideas = []
-            for signal in signals[:self.max_items_per_platform]:
+            for trend_signal in signals[:self.max_items_per_platform]:
                 content_item = {
-                    'title': signal.content[:100],
-                    'description': signal.content,
+                    'title': trend_signal.content[:100],
+                    'description': trend_signal.content,
                     'source': platform,
-                    'url': signal.url,
-                    'score': signal.engagement_score,
+                    'url': trend_signal.url,
+                    'score': trend_signal.engagement_score,
                     'platform_type': 'core_detector'
                 }
                 
@@ -390,21 +556,19 @@ class OvernightDiscoveryEngine:
         
         print(f"🎯 Fallback: Analyzing subreddits: {', '.join(cycle_subreddits)}")
         
-        # Use our existing discovery system but lightweight
-        for subreddit in cycle_subreddits:
-            try:
-                # Add delay to be nice to Reddit and reduce system load
-                await asyncio.sleep(3)
-                
-                # Try to use our real discovery system
-                subreddit_ideas = await self.discover_from_subreddit(subreddit)
-                ideas.extend(subreddit_ideas)
-                    
-            except Exception as e:
-                print(f"⚠️ Error with r/{subreddit}: {e}")
+        # Use our existing discovery system but lightweight - subreddits are fetched
+        # concurrently and the per-host rate limiter keeps us nice to Reddit
+        results = await asyncio.gather(
+            *[self.discover_from_subreddit(subreddit) for subreddit in cycle_subreddits],
+            return_exceptions=True
+        )
+        for subreddit, subreddit_ideas in zip(cycle_subreddits, results):
+            if isinstance(subreddit_ideas, Exception):
+                print(f"⚠️ Error with r/{subreddit}: {subreddit_ideas}")
                 print(f"🔄 Skipping r/{subreddit} - NO MOCK DATA, only real data")
                 # Skip this subreddit completely - no mock data allowed
                 continue
+            ideas.extend(subreddit_ideas)
         
         return ideas
     
@@ -414,11 +578,10 @@ class OvernightDiscoveryEngine:
         
         try:
             # Try to call our existing API
-            response = requests.get(f"http://localhost:8000/api/discovery/subreddit/{subreddit}", 
-                                  timeout=30)
+            status, data = await self.fetch_json(f"http://localhost:8000/api/discovery/subreddit/{subreddit}",
+                                                 timeout=30)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200 and data is not None:
                 # Process real API response
                 for item in data.get('ideas', [])[:3]:  # Reduced for overnight
                     idea = {
@@ -433,7 +596,7 @@ class OvernightDiscoveryEngine:
                     }
                     ideas.append(idea)
             else:
-                raise Exception(f"API returned {response.status_code}")
+                raise Exception(f"API returned {status}")
                 
         except Exception as e:
             # Fallback to our existing scraping logic
@@ -441,7 +604,7 @@ class OvernightDiscoveryEngine:
             
             # Use our actual Reddit scraping system
             try:
-                scraped_ideas = self.scrape_reddit_subreddit(subreddit)
+                scraped_ideas = await self.scrape_reddit_subreddit(subreddit)
                 ideas.extend(scraped_ideas)
             except Exception as scrape_error:
                 print(f"   ❌ Reddit scraping failed for r/{subreddit}: {scrape_error}")
@@ -452,21 +615,17 @@ class OvernightDiscoveryEngine:
         
         return ideas
     
-    def scrape_reddit_subreddit(self, subreddit):
+    async def scrape_reddit_subreddit(self, subreddit):
         """Scrape Reddit subreddit for real pain points and business ideas"""
         ideas = []
         
         try:
             # Use Reddit's JSON API (public, no auth needed)
             url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=10"
-            headers = {
-                'User-Agent': 'Luciq Discovery Bot 1.0 (Business Idea Research)'
-            }
             
-            response = requests.get(url, headers=headers, timeout=15)
+            status, data = await self.fetch_json(url, timeout=15)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200 and data is not None:
                 posts = data.get('data', {}).get('children', [])
                 
                 ideas_found = 0
@@ -510,7 +669,7 @@ class OvernightDiscoveryEngine:
                 print(f"   ✅ Scraped {len(ideas)} real ideas from r/{subreddit}")
                 
             else:
-                raise Exception(f"Reddit API returned {response.status_code}")
+                raise Exception(f"Reddit API returned {status}")
                 
         except Exception as e:
             print(f"   ❌ Reddit scraping failed: {e}")
@@ -590,7 +749,7 @@ class OvernightDiscoveryEngine:
         except Exception as e:
             print(f"Error in enhanced subreddit discovery for r/{subreddit}: {e}")
             # Fallback to basic scraping if enhanced analysis fails
-            return self.scrape_reddit_subreddit(subreddit)
+            return await self.scrape_reddit_subreddit(subreddit)
     
     def save_cycle_results(self, ideas, health_status):
         """Save cycle results to disk with enhanced metadata"""
@@ -637,51 +796,10 @@ class OvernightDiscoveryEngine:
             }
         }
         
-        # Save individual cycle
-        cycle_file = self.data_dir / f"enhanced_cycle_{timestamp}.json"
-        with open(cycle_file, 'w') as f:
-            json.dump(cycle_data, f, indent=2)
-        
-        # Update master log
-        master_file = self.data_dir / "enhanced_overnight_discovery_log.json"
-        if master_file.exists():
-            with open(master_file, 'r') as f:
-                master_data = json.load(f)
-        else:
-            master_data = {'cycles': [], 'summary': {}}
-        
-        master_data['cycles'].append({
-            'cycle': self.cycle_count + 1,
-            'timestamp': timestamp,
-            'ideas_found': len(ideas),
-            'avg_quality_score': avg_quality_score,
-            'cpu_usage': health_status['cpu_percent'],
-            'memory_usage': health_status['memory_percent'],
-            'available_gb': health_status['available_gb'],
-            'platforms_used': len(platform_counts),
-            'domains_covered': len(domain_counts)
-        })
-        
-        # Calculate summary statistics
-        all_quality_scores = [c.get('avg_quality_score', 0) for c in master_data['cycles'] if c.get('avg_quality_score')]
-        
-        master_data['summary'] = {
-            'total_cycles': self.cycle_count + 1,
-            'total_ideas': self.total_ideas + len(ideas),
-            'start_time': self.start_time.isoformat() if self.start_time else None,
-            'last_update': timestamp,
-            'avg_ideas_per_cycle': (self.total_ideas + len(ideas)) / (self.cycle_count + 1),
-            'avg_quality_score': sum(all_quality_scores) / len(all_quality_scores) if all_quality_scores else 0,
-            'avg_cpu_usage': sum(c['cpu_usage'] for c in master_data['cycles']) / len(master_data['cycles']),
-            'avg_memory_usage': sum(c['memory_usage'] for c in master_data['cycles']) / len(master_data['cycles']),
-            'total_platforms_used': len(set().union(*[c.get('platforms_used', []) for c in master_data['cycles']])),
-            'enhanced_discovery_rate': len([c for c in master_data['cycles'] if c.get('avg_quality_score', 0) > 6]) / len(master_data['cycles']) * 100
-        }
-        
-        with open(master_file, 'w') as f:
-            json.dump(master_data, f, indent=2)
+        # Append to the cycle log; the summary is updated from running counters
+        summary = self.result_store.append_cycle(cycle_data, self.start_time)
         
-        print(f"💾 Enhanced data saved to {cycle_file}")
+        print(f"💾 Enhanced data appended to {self.result_store.log_file} ({summary['total_cycles']} cycles logged)")
         print(f"📊 Quality metrics: Avg score {avg_quality_score:.1f}/10, {len(platform_counts)} platforms, {len(domain_counts)} domains")
     
     def calculate_sleep_time(self):
@@ -689,7 +807,7 @@ class OvernightDiscoveryEngine:
         base_sleep = self.min_cycle_interval
         
         # Get current system load
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory_percent = psutil.virtual_memory().percent
         
         # Increase sleep time if system is under stress
@@ -703,7 +821,7 @@ class OvernightDiscoveryEngine:
         final_sleep = int(base_sleep * jitter)
         
         # Ensure we don't exceed rate limits
-        cycles_this_hour = len([c for c in getattr(self, 'recent_cycles', []) 
+        cycles_this_hour = len([c for c in self.recent_cycles
                                if datetime.now() - datetime.fromisoformat(c) < timedelta(hours=1)])
         
         if cycles_this_hour >= self.max_cycles_per_hour:
@@ -724,6 +842,7 @@ class OvernightDiscoveryEngine:
         print()
         
         self.running = True
+        self._stop_event.clear()
         self.start_time = datetime.now()
         end_time = self.start_time + timedelta(hours=duration_hours)
         
@@ -731,6 +850,14 @@ class OvernightDiscoveryEngine:
         print(f"🏁 End time: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print()
         
+        # Stop gracefully on SIGINT/SIGTERM instead of dying mid-cycle
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop_cycle)
+            except (NotImplementedError, RuntimeError):
+                pass  # not supported on this platform / not the main thread
+        
         # Initialize the multi-platform analyzer
         await self.initialize_multi_platform_analyzer()
         
@@ -761,20 +888,24 @@ class OvernightDiscoveryEngine:
                 print(f"😴 Sleeping for {sleep_time//60:.0f}m {sleep_time%60:.0f}s until {next_cycle_time.strftime('%H:%M:%S')}")
                 print("-" * 60)
                 
-                # Sleep with periodic health checks
-                sleep_start = time.time()
-                while time.time() - sleep_start < sleep_time and self.running:
-                    await asyncio.sleep(min(60, sleep_time - (time.time() - sleep_start)))  # Check every minute
+                # Sleep with periodic health checks; stop_cycle() wakes us immediately
+                next_cycle_deadline = time.monotonic() + sleep_time
+                health_checked_at = time.monotonic()
+                while self.running:
+                    remaining = next_cycle_deadline - time.monotonic()
+                    if remaining <= 0 or not await self._sleep(min(60, remaining)):  # Check every minute
+                        break
                     
                     # Quick health check during sleep
-                    if time.time() - sleep_start > 300:  # After 5 minutes of sleep
+                    if time.monotonic() - health_checked_at > 300:  # Every 5 minutes of sleep
+                        health_checked_at = time.monotonic()
                         health = self.check_system_health()
                         if not health['healthy']:
                             print(f"\n⚠️ System health degraded during sleep:")
                             for warning in health['warnings']:
                                 print(f"   • {warning}")
                             print("😴 Extending sleep for system recovery...")
-                            await asyncio.sleep(300)  # Extra 5 minutes
+                            next_cycle_deadline += 300  # Extra 5 minutes
         
         except KeyboardInterrupt:
             print("\n🛑 Keyboard interrupt received")
@@ -782,8 +913,14 @@ class OvernightDiscoveryEngine:
             print(f"\n❌ Unexpected error: {e}")
         finally:
             self.running = False
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.remove_signal_handler(sig)
+                except (NotImplementedError, RuntimeError):
+                    pass
             
             # Clean up
+            await self.close()
             if self.multi_platform_analyzer:
                 try:
                     await self.multi_platform_analyzer.close()
@@ -798,13 +935,14 @@ class OvernightDiscoveryEngine:
         print(f"🔄 Cycles completed: {self.cycle_count}")
         print(f"💡 Total ideas discovered: {self.total_ideas}")
         print(f"📊 Average ideas per cycle: {self.total_ideas/self.cycle_count:.1f}" if self.cycle_count > 0 else "📊 No cycles completed")
-        print(f"📁 Data saved in: {self.data_dir}")
+        print(f"📁 Data saved in: {self.result_store.log_file}")
         print(f"🧠 Enhanced analysis: {'ACTIVE' if self.multi_platform_analyzer else 'FALLBACK'}")
     
     def stop_cycle(self):
         """Stop the overnight cycle gracefully"""
         print("\n🛑 Stopping overnight discovery cycle...")
         self.running = False
+        self._stop_event.set()
 
 def main():
     """Main function to run enhanced overnight discovery"""
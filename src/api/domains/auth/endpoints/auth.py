@@ -58,7 +58,7 @@ class AuthResponse(BaseModel):
     error_code: Optional[str] = None
 
 # Helper Functions
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
     """
     Get current authenticated user from JWT token
     
@@ -72,7 +72,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         HTTPException: If token is invalid or user not found
     """
     token = credentials.credentials
-    user_data = auth_service.get_user_by_token(token)
+    user_data = await auth_service.get_user_by_token_async(token)
     
     if not user_data:
         raise HTTPException(
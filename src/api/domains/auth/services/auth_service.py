@@ -2,10 +2,14 @@
 Authentication Service
 Handles user registration, login, logout, and session management
 """
+import asyncio
 import secrets
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Set, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from email_validator import validate_email, EmailNotValidError
@@ -23,6 +27,19 @@ class AuthService:
     def __init__(self):
         self.db_service = db_service
         self._ensure_tables_exist()
+        
+        # Per-request token -> user resolution caches
+        self.user_cache_ttl_seconds = 30
+        self.max_cached_users = 10000
+        self.max_validated_tokens = 10000
+        self._user_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._user_ids_by_email: Dict[str, str] = {}
+        self._validated_tokens: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._tokens_by_user: Dict[str, Set[str]] = {}  # user_id -> memoized access tokens
+        # Bumped by invalidate_user so a profile loaded before the invalidation is not cached after it
+        self._user_generations: Dict[str, int] = {}
+        self._unresolved_invalidations = 0  # email-only invalidations of users not in the cache
+        self._cache_lock = threading.Lock()  # sync callers run on FastAPI's threadpool
     
     def _ensure_tables_exist(self):
         """Ensure user tables are created"""
@@ -156,6 +173,7 @@ class AuthService:
             
             conn.commit()
             conn.close()
+            self.invalidate_user(email=email)
             return True
             
         except Exception as e:
@@ -178,6 +196,7 @@ class AuthService:
             
             conn.commit()
             conn.close()
+            self.invalidate_user(email=email)
             return True
             
         except Exception as e:
@@ -454,11 +473,14 @@ class AuthService:
             Dict with logout result
         """
         try:
-            revoked = jwt_manager.revoke_refresh_token(refresh_token)
+            # Only a verified, actually revoked token may flush that user's caches
+            payload = jwt_manager.revoke_refresh_token_payload(refresh_token)
+            if payload and payload.get("user_id"):
+                self.invalidate_user(user_id=payload["user_id"], forget_tokens=True)
             
             return {
                 "success": True,
-                "message": "Logout successful" if revoked else "Already logged out"
+                "message": "Logout successful" if payload else "Already logged out"
             }
             
         except Exception as e:
@@ -480,65 +502,177 @@ class AuthService:
             User data if token is valid, None otherwise
         """
         try:
-            # Validate token
-            token_payload = jwt_manager.validate_access_token(access_token)
-            if not token_payload:
+            user_id = self._token_user_id(access_token)
+            if not user_id:
                 return None
             
-            user_id = token_payload.get("user_id")
+            user = self._get_cached_user(user_id)
+            if user is None:
+                generation = self._cache_generation(user_id)
+                user = self._load_user_by_user_id(user_id)
+                if user is None:
+                    return None
+                self._cache_user(user, generation)
+            
+            return self._login_allowed(user)
+            
+        except Exception as e:
+            logger.error(f"Error getting user by token: {e}")
+            return None
+    
+    async def get_user_by_token_async(self, access_token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get user information from access token without blocking the event loop
+        
+        Cached users are returned inline; the database is only read on a cache miss,
+        in a worker thread.
+        """
+        try:
+            user_id = self._token_user_id(access_token)
             if not user_id:
                 return None
             
-            # Get user from database by user_id
-            try:
-                conn = self.db_service.get_connection()
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT id, user_id, email, username, password_hash, is_active, is_verified,
-                           first_name, last_name, display_name, created_at, updated_at, last_login,
-                           login_count, verification_token, verification_sent_at,
-                           password_reset_token, password_reset_sent_at, preferences
-                    FROM users WHERE user_id = ?
-                """, (user_id,))
-                
-                row = cursor.fetchone()
-                conn.close()
-                
-                if not row:
+            user = self._get_cached_user(user_id)
+            if user is None:
+                generation = self._cache_generation(user_id)
+                user = await asyncio.to_thread(self._load_user_by_user_id, user_id)
+                if user is None:
                     return None
-                
-                user = {
-                    "id": row[0],
-                    "user_id": row[1],
-                    "email": row[2],
-                    "username": row[3],
-                    "is_active": bool(row[5]),
-                    "is_verified": bool(row[6]),
-                    "first_name": row[7],
-                    "last_name": row[8],
-                    "display_name": row[9],
-                    "created_at": row[10],
-                    "updated_at": row[11],
-                    "last_login": row[12],
-                    "login_count": row[13] or 0,
-                    "preferences": row[18]
-                }
-                
-                # Check if user can login
-                if not user["is_active"] or not user["is_verified"]:
-                    return None
-                
-                return user
-                
-            except Exception as e:
-                logger.error(f"Error getting user by user_id: {e}")
-                return None
-                
+                self._cache_user(user, generation)
+            
+            return self._login_allowed(user)
+            
         except Exception as e:
             logger.error(f"Error getting user by token: {e}")
             return None
     
+    def _token_user_id(self, access_token: str) -> Optional[str]:
+        """Validate the access token (memoized until it expires) and return its user_id"""
+        now = time.time()
+        with self._cache_lock:
+            cached = self._validated_tokens.get(access_token)
+            if cached is not None:
+                if cached[0] > now:
+                    self._validated_tokens.move_to_end(access_token)
+                    return cached[1].get("user_id")
+                self._forget_token(access_token)
+        
+        token_payload = jwt_manager.validate_access_token(access_token)
+        if not token_payload:
+            return None
+        
+        # Every access token is unique (its own iat/exp/claims), so the token itself identifies it
+        with self._cache_lock:
+            self._validated_tokens[access_token] = (token_payload.get("exp", now), token_payload)
+            self._tokens_by_user.setdefault(token_payload.get("user_id"), set()).add(access_token)
+            while len(self._validated_tokens) > self.max_validated_tokens:
+                self._forget_token(next(iter(self._validated_tokens)))
+        return token_payload.get("user_id")
+    
+    def _forget_token(self, access_token: str):
+        """Drop a memoized token and its per-user index entry (caller holds the cache lock)"""
+        _, payload = self._validated_tokens.pop(access_token)
+        user_id = payload.get("user_id")
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(access_token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+    
+    def _load_user_by_user_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get user profile (without secrets) from database by user_id"""
+        try:
+            conn = self.db_service.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                SELECT id, user_id, email, username, password_hash, is_active, is_verified,
+                       first_name, last_name, display_name, created_at, updated_at, last_login,
+                       login_count, verification_token, verification_sent_at,
+                       password_reset_token, password_reset_sent_at, preferences
+                FROM users WHERE user_id = ?
+            """, (user_id,))
+            
+            row = cursor.fetchone()
+            conn.close()
+            
+            if not row:
+                return None
+            
+            return {
+                "id": row[0],
+                "user_id": row[1],
+                "email": row[2],
+                "username": row[3],
+                "is_active": bool(row[5]),
+                "is_verified": bool(row[6]),
+                "first_name": row[7],
+                "last_name": row[8],
+                "display_name": row[9],
+                "created_at": row[10],
+                "updated_at": row[11],
+                "last_login": row[12],
+                "login_count": row[13] or 0,
+                "preferences": row[18]
+            }
+            
+        except Exception as e:
+            logger.error(f"Error getting user by user_id: {e}")
+            return None
+    
+    @staticmethod
+    def _login_allowed(user: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Copy of the user if they can use the API (callers may modify it)"""
+        if not user["is_active"] or not user["is_verified"]:
+            return None
+        return dict(user)
+    
+    def _get_cached_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            cached = self._user_cache.get(user_id)
+            if cached is None:
+                return None
+            if cached[0] <= time.monotonic():
+                del self._user_cache[user_id]
+                return None
+            self._user_cache.move_to_end(user_id)
+            return cached[1]
+    
+    def _cache_generation(self, user_id: str) -> Tuple[int, int]:
+        """Read before loading a profile; _cache_user skips the write if it changed meanwhile"""
+        with self._cache_lock:
+            return self._unresolved_invalidations, self._user_generations.get(user_id, 0)
+    
+    def _cache_user(self, user: Dict[str, Any], generation: Optional[Tuple[int, int]] = None):
+        with self._cache_lock:
+            current = (self._unresolved_invalidations, self._user_generations.get(user["user_id"], 0))
+            if generation is not None and generation != current:
+                return  # invalidated while loading: the loaded profile may already be stale
+            self._user_cache[user["user_id"]] = (time.monotonic() + self.user_cache_ttl_seconds, user)
+            self._user_cache.move_to_end(user["user_id"])
+            self._user_ids_by_email[user["email"].lower()] = user["user_id"]
+            while len(self._user_cache) > self.max_cached_users:
+                _, (_, evicted) = self._user_cache.popitem(last=False)
+                self._user_ids_by_email.pop(evicted["email"].lower(), None)
+    
+    def invalidate_user(self, user_id: Optional[str] = None, email: Optional[str] = None,
+                        forget_tokens: bool = False):
+        """Drop the cached profile (and optionally memoized tokens) of a user after it changes"""
+        with self._cache_lock:
+            if user_id is None and email:
+                user_id = self._user_ids_by_email.get(email.lower())
+            if user_id is None:
+                # Unknown user_id: a load for this user may be in flight, so no in-flight load may cache
+                self._unresolved_invalidations += 1
+                return
+            self._user_generations[user_id] = self._user_generations.get(user_id, 0) + 1
+            cached = self._user_cache.pop(user_id, None)
+            if cached is not None:
+                self._user_ids_by_email.pop(cached[1]["email"].lower(), None)
+            if forget_tokens:
+                for token in self._tokens_by_user.pop(user_id, ()):
+                    self._validated_tokens.pop(token, None)
+    
     def request_password_reset(self, email: str) -> Dict[str, Any]:
         """
         Request password reset token
@@ -651,6 +785,7 @@ class AuthService:
                 
                 # Revoke all existing sessions
                 jwt_manager.revoke_all_user_tokens(user["user_id"])
+                self.invalidate_user(user_id=user["user_id"], forget_tokens=True)
                 
                 logger.info(f"Password reset successfully for: {email}")
                 
@@ -26,6 +26,7 @@ router = APIRouter(prefix="/api", tags=["Intelligence & Trends"])
 # Global instances (lazy-loaded)
 _trend_detector = None
 _market_intelligence = None
+_graph_detector = None
 
 def get_trend_detector():
     """Get or create trend detector instance"""
@@ -34,6 +35,13 @@ def get_trend_detector():
         _trend_detector = CrossPlatformTrendDetector()
     return _trend_detector
 
+def get_graph_detector():
+    """Get or create the long-lived graph trend detector instance"""
+    global _graph_detector
+    if _graph_detector is None:
+        _graph_detector = GroundbreakingGraphTrendDetector()
+    return _graph_detector
+
 def get_market_intelligence():
     """Get or create market intelligence instance"""
     global _market_intelligence
@@ -304,7 +312,7 @@ async def get_phase2_status():
 async def detect_graph_trends(request: Request):
     """Detect trends using graph-based analysis"""
     try:
-        graph_detector = GroundbreakingGraphTrendDetector()
+        graph_detector = get_graph_detector()
         
         # Mock signal data for demonstration
         class MockSignal:
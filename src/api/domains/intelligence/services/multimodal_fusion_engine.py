@@ -11,6 +11,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import numpy as np
 from collections import defaultdict, deque
+from itertools import islice
 import logging
 from enum import Enum
 
@@ -63,6 +64,68 @@ class MultiModalSignal:
         if self.cross_modal_correlations is None:
             self.cross_modal_correlations = {}
 
+# MinHash parameters shared by every signature so any two signals in the process can be compared
+MINHASH_PERMUTATIONS = 128
+_MINHASH_PRIME = np.uint64((1 << 61) - 1)
+_MINHASH_MASK = np.uint64(0xFFFFFFFF)
+_minhash_rng = np.random.RandomState(5)
+_MINHASH_A = _minhash_rng.randint(1, 1 << 31, MINHASH_PERMUTATIONS).astype(np.uint64)
+_MINHASH_B = _minhash_rng.randint(0, 1 << 31, MINHASH_PERMUTATIONS).astype(np.uint64)
+
+def content_signature(content: str) -> Optional[np.ndarray]:
+    """MinHash signature of a signal's lowercased token set - built once when the signal is ingested
+    
+    The fraction of equal components between two signatures estimates the Jaccard
+    similarity of the token sets. Empty content has no signature.
+    """
+    tokens = set(content.lower().split())
+    if not tokens:
+        return None
+    hashed = np.fromiter((hash(token) & 0xFFFFFFFF for token in tokens), dtype=np.uint64, count=len(tokens))
+    permuted = (np.outer(_MINHASH_A, hashed) + _MINHASH_B[:, None]) % _MINHASH_PRIME & _MINHASH_MASK
+    return permuted.min(axis=1).astype(np.uint32)
+
+class MinHashWindow:
+    """
+    Fixed-size ring of MinHash signatures and timestamps for one modality's most recent signals
+    
+    Correlating a new signal against the window is a single (window x permutations)
+    comparison, independent of content length and of the modality's signal buffer size.
+    """
+    
+    def __init__(self, window: int = 10, num_perm: int = MINHASH_PERMUTATIONS):
+        self.window = window
+        self.signatures = np.zeros((window, num_perm), dtype=np.uint32)
+        self.has_content = np.zeros(window, dtype=bool)
+        self.timestamps = np.zeros(window)
+        self.count = 0
+        self._position = 0
+    
+    def add(self, timestamp: datetime, signature: Optional[np.ndarray]):
+        if signature is None:
+            self.has_content[self._position] = False
+        else:
+            self.signatures[self._position] = signature
+            self.has_content[self._position] = True
+        self.timestamps[self._position] = timestamp.timestamp()
+        self._position = (self._position + 1) % self.window
+        self.count = min(self.count + 1, self.window)
+    
+    def jaccard_similarities(self, signature: Optional[np.ndarray]) -> np.ndarray:
+        """Estimated Jaccard similarity with every signal in the window"""
+        if signature is None:
+            return np.zeros(self.count)
+        estimates = (self.signatures[:self.count] == signature).mean(axis=1)
+        return np.where(self.has_content[:self.count], estimates, 0.0)
+    
+    def time_weights(self, timestamp: datetime, decay_seconds: float = 3600) -> np.ndarray:
+        """Linear temporal proximity weight of every signal in the window"""
+        time_diff = np.abs(self.timestamps[:self.count] - timestamp.timestamp())
+        return np.maximum(0.0, 1 - time_diff / decay_seconds)
+    
+    def __len__(self) -> int:
+        return self.count
+
 class MultiModalFusionEngine:
     """
     Phase 5: Revolutionary Multi-Modal Signal Fusion Engine
@@ -91,6 +154,8 @@ class MultiModalFusionEngine:
         
         # Real-time signal buffers (sliding windows)
         self.signal_buffer = defaultdict(lambda: deque(maxlen=1000))
+        self.correlation_window = 10
+        self.signature_windows = defaultdict(lambda: MinHashWindow(self.correlation_window))
         self.fusion_history = deque(maxlen=5000)
         
         # Cross-modal correlation tracking
@@ -131,14 +196,16 @@ class MultiModalFusionEngine:
         start_time = time.time()
         
         try:
-            # Step 1: Store signal in appropriate buffer
+            # Step 1: Store signal in appropriate buffer (signed once for correlation lookups)
+            signature = content_signature(signal.content)
             self.signal_buffer[signal.signal_type].append(signal)
+            self.signature_windows[signal.signal_type].add(signal.timestamp, signature)
             
             # Step 2: Perform multi-modal fusion
             fusion_result = await self._perform_fusion(signal)
             
             # Step 3: Detect cross-modal correlations
-            correlations = await self._detect_cross_modal_correlations(signal)
+            correlations = await self._detect_cross_modal_correlations(signal, signature)
             
             # Step 4: Calculate confidence and emergence probability
             confidence = self._calculate_confidence(fusion_result, correlations)
@@ -253,10 +320,9 @@ class MultiModalFusionEngine:
         
         # Adjust based on recent correlation strength
         recent_correlations = []
-        correlation_history_list = list(self.correlation_history)
-        if len(correlation_history_list) > 0:
+        if self.correlation_history:
             # Get last 100 records or all if less than 100
-            recent_records = correlation_history_list[-100:] if len(correlation_history_list) >= 100 else correlation_history_list
+            recent_records = islice(reversed(self.correlation_history), 100)
             
             for record in recent_records:
                 if modality.value in record.get('correlations', {}):
@@ -270,22 +336,25 @@ class MultiModalFusionEngine:
         
         return base_weight
     
-    async def _detect_cross_modal_correlations(self, signal: MultiModalSignal) -> Dict[str, float]:
+    async def _detect_cross_modal_correlations(self, signal: MultiModalSignal,
+                                               signature: Optional[np.ndarray] = None) -> Dict[str, float]:
         """Detect correlations between different modalities"""
         
         correlations = {}
+        if signature is None:
+            signature = content_signature(signal.content)
         
-        # Get recent signals from different modalities
+        # Compare against the recent signals of every other modality
         for modality_type in SignalType:
             if modality_type == signal.signal_type:
                 continue
-                
-            recent_signals = list(self.signal_buffer[modality_type])[-10:]
-            if not recent_signals:
+            
+            window = self.signature_windows.get(modality_type)
+            if not window:
                 continue
             
             # Calculate correlation with current signal
-            correlation = self._calculate_signal_correlation(signal, recent_signals)
+            correlation = self._calculate_signal_correlation(signal, signature, window)
             correlations[modality_type.value] = correlation
         
         # Update correlation matrix
@@ -294,54 +363,22 @@ class MultiModalFusionEngine:
         
         return correlations
     
-    def _calculate_signal_correlation(self, current_signal: MultiModalSignal, 
-                                   recent_signals: List[MultiModalSignal]) -> float:
-        """Calculate correlation between current signal and recent signals"""
+    def _calculate_signal_correlation(self, current_signal: MultiModalSignal, signature: Optional[np.ndarray],
+                                      window: MinHashWindow) -> float:
+        """Calculate correlation between current signal and a modality's recent signals"""
         
-        if not recent_signals:
+        if not window:
             return 0.0
         
-        # Simple correlation based on content similarity and timing
-        content_similarity = self._calculate_content_similarity(
-            current_signal.content, [s.content for s in recent_signals]
-        )
-        
-        # Temporal proximity factor
-        time_weights = []
-        for recent_signal in recent_signals:
-            time_diff = abs((current_signal.timestamp - recent_signal.timestamp).total_seconds())
-            time_weight = max(0, 1 - (time_diff / 3600))  # 1-hour decay
-            time_weights.append(time_weight)
+        # Simple correlation based on content similarity (estimated Jaccard) and timing
+        content_similarity = window.jaccard_similarities(signature).mean()
         
-        if not time_weights:
-            return content_similarity
+        # Temporal proximity factor (1-hour decay)
+        time_weight = window.time_weights(current_signal.timestamp).mean()
         
         # Weighted correlation
-        weighted_correlation = content_similarity * np.mean(time_weights)
-        return min(weighted_correlation, 1.0)
-    
-    def _calculate_content_similarity(self, content: str, other_contents: List[str]) -> float:
-        """Calculate content similarity (simplified implementation)"""
-        
-        # Convert to lowercase and tokenize
-        tokens = set(content.lower().split())
-        
-        similarities = []
-        for other_content in other_contents:
-            other_tokens = set(other_content.lower().split())
-            
-            # Jaccard similarity
-            intersection = len(tokens & other_tokens)
-            union = len(tokens | other_tokens)
-            
-            if union == 0:
-                similarity = 0.0
-            else:
-                similarity = intersection / union
-            
-            similarities.append(similarity)
-        
-        return np.mean(similarities) if similarities else 0.0
+        weighted_correlation = content_similarity * time_weight
+        return float(min(weighted_correlation, 1.0))
     
     def _detect_fusion_patterns(self, modality_scores: Dict[SignalType, float]) -> List[str]:
         """Detect patterns in multi-modal fusion"""
@@ -403,7 +440,7 @@ class MultiModalFusionEngine:
         """Detect probability of pattern emergence"""
         
         # Check recent fusion history for emergence indicators
-        recent_fusions = list(self.fusion_history)[-20:]
+        recent_fusions = list(islice(reversed(self.fusion_history), 20))[::-1]
         
         if len(recent_fusions) < 5:
             return 0.0
@@ -8,6 +8,7 @@ import asyncio
 import logging
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass, field
@@ -31,9 +32,14 @@ import gensim.downloader as api
 
 # Temporal analysis
 from scipy import stats
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 import statsmodels.api as sm
 from statsmodels.tsa.seasonal import seasonal_decompose
 
+from src.api.shared.services.keyword_matcher import KeywordMatcher
+from src.api.shared.services.result_cache import get_result_cache
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -75,6 +81,9 @@ class ContextualSignal:
 class AdvancedSemanticEngine:
     """Revolutionary semantic understanding engine for trend detection"""
     
+    # Bump whenever scoring changes so cached results from older logic are not reused
+    ENGINE_VERSION = "semantic_understanding_v2"
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.logger.info("🧠 Initializing Advanced Semantic Understanding Engine...")
@@ -82,6 +91,10 @@ class AdvancedSemanticEngine:
         # Initialize NLP models
         self._initialize_nlp_models()
         
+        # spaCy, the transformer pipelines and TextBlob are not safe to call from several
+        # threads at once, so every model call runs on this one worker thread
+        self.model_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="semantic-models")
+        
         # Business and trend context knowledge
         self._initialize_business_context()
         
@@ -91,6 +104,9 @@ class AdvancedSemanticEngine:
         # Semantic similarity models
         self._initialize_similarity_models()
         
+        # One compiled matcher over every keyword vocabulary
+        self._initialize_keyword_matcher()
+        
         # Performance tracking
         self.analysis_stats = {
             'signals_processed': 0,
@@ -216,6 +232,25 @@ class AdvancedSemanticEngine:
             ]
         }
     
+    def _initialize_keyword_matcher(self):
+        """Compile business-context and intent keywords into a single matcher"""
+        vocabularies = {}
+        for context_type, keywords in self.business_contexts.items():
+            if context_type == 'market_timing_indicators':
+                for timing, timing_keywords in keywords.items():
+                    vocabularies[f"timing:{timing}"] = timing_keywords
+            else:
+                vocabularies[context_type] = keywords
+        for intent, keywords in self.intent_keywords.items():
+            vocabularies[f"intent:{intent}"] = keywords
+        self.keyword_matcher = KeywordMatcher(vocabularies)
+        self._novelty_patterns = [
+            re.compile(r'\b(first|new|novel|unique|revolutionary|breakthrough)\b'),
+            re.compile(r'\b(never\s+seen|never\s+done|game\s+chang\w+)\b'),
+            re.compile(r'\b(disrupt\w+|transform\w+|reimagin\w+)\b')
+        ]
+        self._important_words_pattern = re.compile(r'\b(?:saas|api|platform|tool|solution|software|app|service|system)\b')
+    
     def _initialize_similarity_models(self):
         """Initialize semantic similarity models"""
         try:
@@ -234,8 +269,11 @@ class AdvancedSemanticEngine:
             min_df=2
         )
         
-        # Document similarity cache
-        self.similarity_cache = {}
+        # Above this many signals, similarity analysis switches to the sparse blocked path
+        self.dense_similarity_limit = 2000
+        
+        # Shared, bounded cache of analysis results keyed on normalized content
+        self.result_cache = get_result_cache("semantic_understanding", self.ENGINE_VERSION)
         self.document_vectors = {}
     
     async def analyze_semantic_understanding(self, content: str, context: Dict = None) -> SemanticScore:
@@ -249,57 +287,20 @@ class AdvancedSemanticEngine:
         Returns:
             SemanticScore with detailed semantic analysis
         """
-        start_time = datetime.now()
+        cache_key = self.result_cache.make_key(content, context)
+        cached = await self.result_cache.aget(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            # Preprocess content
-            processed_content = self._preprocess_content(content)
-            
-            # Core semantic analysis
-            semantic_score = SemanticScore()
-            
-            # 1. Context Relevance Analysis
-            semantic_score.context_relevance = await self._analyze_context_relevance(processed_content)
-            
-            # 2. Intent Classification
-            intent_result = await self._classify_intent(processed_content)
-            semantic_score.intent_clarity = intent_result['confidence']
-            semantic_score.intent_classification = intent_result['intent']
-            
-            # 3. Sentiment Analysis (multi-dimensional)
-            sentiment_result = await self._analyze_advanced_sentiment(processed_content)
-            semantic_score.sentiment_strength = sentiment_result['compound_score']
-            semantic_score.sentiment_breakdown = sentiment_result
-            
-            # 4. Entity Extraction and Scoring
-            entity_result = await self._extract_and_score_entities(processed_content)
-            semantic_score.entity_richness = entity_result['richness_score']
-            semantic_score.extracted_entities = entity_result['entities']
-            
-            # 5. Semantic Coherence Analysis
-            semantic_score.semantic_coherence = await self._analyze_semantic_coherence(processed_content)
-            
-            # 6. Innovation Potential Assessment
-            semantic_score.innovation_potential = await self._assess_innovation_potential(processed_content)
-            
-            # 7. Key Concept Extraction
-            semantic_score.key_concepts = await self._extract_key_concepts(processed_content)
-            
-            # 8. Context Indicators
-            semantic_score.context_indicators = await self._detect_context_indicators(processed_content)
-            
-            # Calculate overall score
-            semantic_score.overall_score = self._calculate_overall_semantic_score(semantic_score)
-            
-            # Metadata
-            processing_time = (datetime.now() - start_time).total_seconds()
-            semantic_score.processing_time = processing_time
-            semantic_score.confidence_level = self._calculate_confidence_level(semantic_score)
-            semantic_score.detected_language = self._detect_language(content)
+            semantic_score = (await asyncio.get_running_loop().run_in_executor(
+                self.model_executor, self._analyze_batch, [content]
+            ))[0]
             
             # Update statistics
-            self._update_analysis_stats(processing_time, semantic_score)
+            self._update_analysis_stats(semantic_score.processing_time, semantic_score)
             
+            self.result_cache.put(cache_key, semantic_score)
             return semantic_score
             
         except Exception as e:
@@ -319,20 +320,15 @@ class AdvancedSemanticEngine:
         
         return content.strip()
     
-    async def _analyze_context_relevance(self, content: str) -> float:
-        """Analyze how relevant content is to business/trend context"""
-        if not content:
-            return 0.0
-        
+    # Scoring: pure functions of precomputed keyword hits, model outputs and spaCy docs
+    def _score_context_relevance(self, hits: Dict[str, int]) -> float:
+        """How relevant content is to business/trend context"""
         relevance_score = 0.0
-        content_lower = content.lower()
-        
-        # Check for business context indicators
-        for context_type, indicators in self.business_contexts.items():
+        for context_type in self.business_contexts:
             if context_type == 'market_timing_indicators':
                 continue  # Handle separately
             
-            matches = sum(1 for indicator in indicators if indicator in content_lower)
+            matches = hits[context_type]
             if matches > 0:
                 weight = 0.2 if context_type == 'saas_indicators' else 0.15
                 relevance_score += min(matches * weight, 1.0)
@@ -340,33 +336,19 @@ class AdvancedSemanticEngine:
         # Normalize to 0-1 range
         return min(relevance_score, 1.0)
     
-    async def _classify_intent(self, content: str) -> Dict:
-        """Classify the intent of the content"""
-        if not content or not self.intent_classifier:
-            return {'intent': 'unknown', 'confidence': 0.0}
-        
-        try:
-            # Use transformer-based classification
-            result = self.intent_classifier(content, self.intent_categories)
-            
+    def _score_intent(self, result: Optional[Dict], hits: Dict[str, int]) -> Dict:
+        """Intent from a zero-shot classifier result, or from intent keywords when the classifier failed"""
+        if result is not None:
             return {
                 'intent': result['labels'][0],
                 'confidence': result['scores'][0],
                 'all_scores': dict(zip(result['labels'], result['scores']))
             }
-        except Exception as e:
-            self.logger.warning(f"Intent classification failed: {e}")
-            return self._fallback_intent_classification(content)
-    
-    def _fallback_intent_classification(self, content: str) -> Dict:
-        """Fallback intent classification using keyword matching"""
-        content_lower = content.lower()
-        intent_scores = {}
-        
-        for intent, keywords in self.intent_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in content_lower)
-            intent_scores[intent] = score / len(keywords)
         
+        intent_scores = {
+            intent: hits[f"intent:{intent}"] / len(keywords)
+            for intent, keywords in self.intent_keywords.items()
+        }
         if intent_scores:
             best_intent = max(intent_scores.items(), key=lambda x: x[1])
             return {
@@ -377,153 +359,84 @@ class AdvancedSemanticEngine:
         
         return {'intent': 'unknown', 'confidence': 0.0}
     
-    async def _analyze_advanced_sentiment(self, content: str) -> Dict:
-        """Advanced multi-dimensional sentiment analysis"""
-        if not content:
-            return {'compound_score': 0.0}
-        
-        sentiment_result = {}
-        
-        # VADER sentiment (good for social media)
-        vader_scores = self.sentiment_analyzer.polarity_scores(content)
-        sentiment_result.update(vader_scores)
-        
-        # TextBlob sentiment
-        blob = TextBlob(content)
-        sentiment_result['textblob_polarity'] = blob.sentiment.polarity
-        sentiment_result['textblob_subjectivity'] = blob.sentiment.subjectivity
-        
-        # Emotion classification
-        if self.emotion_classifier:
-            try:
-                emotions = self.emotion_classifier(content)
-                sentiment_result['emotions'] = {
-                    emotion['label']: emotion['score'] 
-                    for emotion in emotions
-                }
-            except Exception as e:
-                self.logger.warning(f"Emotion classification failed: {e}")
+    def _score_sentiment(self, vader_scores: Dict, textblob_sentiment, emotions: Optional[List[Dict]]) -> Dict:
+        """Multi-dimensional sentiment from VADER, TextBlob and (optionally) emotion classifier output"""
+        sentiment_result = dict(vader_scores)
+        sentiment_result['textblob_polarity'] = textblob_sentiment.polarity
+        sentiment_result['textblob_subjectivity'] = textblob_sentiment.subjectivity
+        if emotions is not None:
+            sentiment_result['emotions'] = {emotion['label']: emotion['score'] for emotion in emotions}
         
         # Calculate compound sentiment strength
-        vader_compound = abs(vader_scores.get('compound', 0.0))
+        vader_compound = abs(sentiment_result.get('compound', 0.0))
         textblob_intensity = abs(sentiment_result.get('textblob_polarity', 0.0))
         subjectivity = sentiment_result.get('textblob_subjectivity', 0.5)
-        
         sentiment_result['compound_score'] = (vader_compound + textblob_intensity + subjectivity) / 3.0
         
         return sentiment_result
     
-    async def _extract_and_score_entities(self, content: str) -> Dict:
-        """Extract named entities and calculate richness score"""
-        if not content or not self.nlp:
+    def _score_entities(self, doc) -> Dict:
+        """Named entities of a spaCy doc and their richness score"""
+        if doc is None:
             return {'richness_score': 0.0, 'entities': []}
         
-        try:
-            doc = self.nlp(content)
-            entities = []
-            
-            for ent in doc.ents:
-                entity_info = {
-                    'text': ent.text,
-                    'label': ent.label_,
-                    'description': spacy.explain(ent.label_),
-                    'start': ent.start_char,
-                    'end': ent.end_char,
-                    'weight': self.entity_weights.get(ent.label_, 0.5)
-                }
-                entities.append(entity_info)
-            
-            # Calculate richness score
-            if entities:
-                total_weight = sum(entity['weight'] for entity in entities)
-                unique_types = len(set(entity['label'] for entity in entities))
-                richness_score = min((total_weight * unique_types) / 10.0, 1.0)
-            else:
-                richness_score = 0.0
-            
-            return {
-                'richness_score': richness_score,
-                'entities': entities,
-                'entity_count': len(entities),
-                'unique_types': len(set(entity['label'] for entity in entities))
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"Entity extraction failed: {e}")
-            return {'richness_score': 0.0, 'entities': []}
+        entities = []
+        for ent in doc.ents:
+            entities.append({
+                'text': ent.text,
+                'label': ent.label_,
+                'description': spacy.explain(ent.label_),
+                'start': ent.start_char,
+                'end': ent.end_char,
+                'weight': self.entity_weights.get(ent.label_, 0.5)
+            })
+        
+        unique_types = len(set(entity['label'] for entity in entities))
+        if entities:
+            total_weight = sum(entity['weight'] for entity in entities)
+            richness_score = min((total_weight * unique_types) / 10.0, 1.0)
+        else:
+            richness_score = 0.0
+        
+        return {
+            'richness_score': richness_score,
+            'entities': entities,
+            'entity_count': len(entities),
+            'unique_types': unique_types
+        }
     
-    async def _analyze_semantic_coherence(self, content: str) -> float:
-        """Analyze internal semantic coherence of content"""
-        if not content:
-            return 0.0
-        
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
+    @staticmethod
+    def _split_sentences(content: str) -> List[str]:
+        return [sentence.strip() for sentence in re.split(r'[.!?]+', content) if sentence.strip()]
+    
+    def _score_coherence(self, sentences: List[str], sentence_vectors: Optional[List[np.ndarray]]) -> float:
+        """Mean similarity of consecutive sentences: vector cosine, else word overlap"""
         if len(sentences) < 2:
             return 0.8  # Single sentence assumed coherent
         
-        # Calculate semantic similarity between sentences
         coherence_scores = []
-        
-        if self.nlp:
-            try:
-                sentence_vectors = []
-                for sentence in sentences:
-                    doc = self.nlp(sentence)
-                    if doc.vector_norm > 0:
-                        sentence_vectors.append(doc.vector)
-                
-                if len(sentence_vectors) >= 2:
-                    # Calculate pairwise similarities
-                    for i in range(len(sentence_vectors) - 1):
-                        similarity = np.dot(sentence_vectors[i], sentence_vectors[i + 1]) / (
-                            np.linalg.norm(sentence_vectors[i]) * np.linalg.norm(sentence_vectors[i + 1])
-                        )
-                        coherence_scores.append(max(0, similarity))  # Ensure non-negative
-                
-            except Exception as e:
-                self.logger.warning(f"Coherence analysis failed: {e}")
+        if sentence_vectors and len(sentence_vectors) >= 2:
+            vectors = np.vstack(sentence_vectors).astype(float)
+            norms = np.linalg.norm(vectors, axis=1)
+            similarity = (vectors[:-1] * vectors[1:]).sum(axis=1) / (norms[:-1] * norms[1:])
+            coherence_scores = np.maximum(similarity, 0).tolist()  # Ensure non-negative
         
         # Fallback: keyword overlap analysis
         if not coherence_scores:
-            for i in range(len(sentences) - 1):
-                words1 = set(sentences[i].lower().split())
-                words2 = set(sentences[i + 1].lower().split())
+            for first, second in zip(sentences, sentences[1:]):
+                words1 = set(first.lower().split())
+                words2 = set(second.lower().split())
                 if words1 and words2:
-                    overlap = len(words1.intersection(words2)) / len(words1.union(words2))
-                    coherence_scores.append(overlap)
+                    coherence_scores.append(len(words1.intersection(words2)) / len(words1.union(words2)))
         
-        return np.mean(coherence_scores) if coherence_scores else 0.5
+        return float(np.mean(coherence_scores)) if coherence_scores else 0.5
     
-    async def _assess_innovation_potential(self, content: str) -> float:
-        """Assess the innovation potential indicated in content"""
-        if not content:
-            return 0.0
-        
-        content_lower = content.lower()
+    def _score_innovation(self, hits: Dict[str, int], content_lower: str) -> float:
+        """Innovation potential from innovation keywords and novelty language"""
         innovation_score = 0.0
+        innovation_matches = hits['innovation_indicators']
+        pattern_matches = sum(1 for pattern in self._novelty_patterns if pattern.search(content_lower))
         
-        # Check for innovation indicators
-        innovation_matches = sum(
-            1 for indicator in self.business_contexts['innovation_indicators']
-            if indicator in content_lower
-        )
-        
-        # Check for novelty language
-        novelty_patterns = [
-            r'\b(first|new|novel|unique|revolutionary|breakthrough)\b',
-            r'\b(never\s+seen|never\s+done|game\s+chang\w+)\b',
-            r'\b(disrupt\w+|transform\w+|reimagin\w+)\b'
-        ]
-        
-        pattern_matches = sum(
-            1 for pattern in novelty_patterns
-            if re.search(pattern, content_lower)
-        )
-        
-        # Calculate innovation score
         if innovation_matches > 0:
             innovation_score += min(innovation_matches * 0.2, 0.6)
         
@@ -532,55 +445,32 @@ class AdvancedSemanticEngine:
         
         return min(innovation_score, 1.0)
     
-    async def _extract_key_concepts(self, content: str) -> List[str]:
-        """Extract key concepts from content"""
-        if not content:
-            return []
-        
+    def _score_key_concepts(self, doc, content_lower: str) -> List[str]:
+        """Noun phrases and product/org entities of a spaCy doc, plus important keywords"""
         key_concepts = []
+        if doc is not None:
+            noun_phrases = [chunk.text.lower() for chunk in doc.noun_chunks if len(chunk.text) > 3]
+            key_concepts.extend(noun_phrases[:10])  # Top 10 noun phrases
+            key_concepts.extend(ent.text.lower() for ent in doc.ents if ent.label_ in ['ORG', 'PRODUCT', 'TECH'])
         
-        if self.nlp:
-            try:
-                doc = self.nlp(content)
-                
-                # Extract noun phrases
-                noun_phrases = [chunk.text.lower() for chunk in doc.noun_chunks if len(chunk.text) > 3]
-                key_concepts.extend(noun_phrases[:10])  # Top 10 noun phrases
-                
-                # Extract important entities
-                entities = [ent.text.lower() for ent in doc.ents if ent.label_ in ['ORG', 'PRODUCT', 'TECH']]
-                key_concepts.extend(entities)
-                
-            except Exception as e:
-                self.logger.warning(f"Key concept extraction failed: {e}")
-        
-        # Fallback: extract important keywords
-        important_words = re.findall(r'\b(?:saas|api|platform|tool|solution|software|app|service|system)\b', content.lower())
-        key_concepts.extend(important_words)
+        key_concepts.extend(self._important_words_pattern.findall(content_lower))
         
         # Remove duplicates and return top concepts
         return list(dict.fromkeys(key_concepts))[:15]
     
-    async def _detect_context_indicators(self, content: str) -> List[str]:
-        """Detect business context indicators in content"""
-        if not content:
-            return []
-        
-        content_lower = content.lower()
+    def _score_context_indicators(self, hits: Dict[str, int]) -> List[str]:
+        """Business context categories with at least one keyword present"""
         indicators = []
-        
-        # Check each context category
         for context_type, keywords in self.business_contexts.items():
             if context_type == 'market_timing_indicators':
-                for timing, timing_keywords in keywords.items():
-                    if any(keyword in content_lower for keyword in timing_keywords):
+                for timing in keywords:
+                    if hits[f"timing:{timing}"] > 0:
                         indicators.append(f"market_timing_{timing}")
-            else:
-                if any(keyword in content_lower for keyword in keywords):
-                    indicators.append(context_type)
-        
+            elif hits[context_type] > 0:
+                indicators.append(context_type)
         return indicators
     
+    
     def _calculate_overall_semantic_score(self, semantic_score: SemanticScore) -> float:
         """Calculate weighted overall semantic score"""
         weights = {
@@ -665,31 +555,117 @@ class AdvancedSemanticEngine:
         current_rate = self.analysis_stats['context_detection_rate']
         self.analysis_stats['context_detection_rate'] = (current_rate * (count - 1) + context_detected) / count
     
-    async def analyze_signal_similarity(self, signals: List[str]) -> Dict:
-        """Analyze semantic similarity between signals"""
+    async def analyze_signal_similarity(self, signals: List[str], threshold: float = 0.3,
+                                        mode: str = "auto", clustering: str = "greedy",
+                                        block_size: int = 1024) -> Dict:
+        """Analyze semantic similarity between signals
+        
+        Args:
+            signals: Signal texts to compare
+            threshold: Minimum cosine similarity for two signals to be neighbors
+            mode: "dense" returns the full similarity matrix, "sparse" only materializes
+                  neighbors above ``threshold`` (computed in row blocks), "auto" picks
+                  sparse above ``self.dense_similarity_limit`` signals
+            clustering: "greedy" (each unassigned signal claims its unassigned neighbors)
+                        or "components" (connected components of the neighbor graph)
+            block_size: Rows per block in sparse mode
+        """
         if len(signals) < 2:
             return {'similarity_matrix': [], 'clusters': []}
         
+        if mode == "auto":
+            mode = "sparse" if len(signals) > self.dense_similarity_limit else "dense"
+        
         try:
-            # Create TF-IDF vectors
+            # Create TF-IDF vectors (rows are L2-normalized, so dot products are cosines)
             vectors = self.tfidf_vectorizer.fit_transform(signals)
             
-            # Calculate similarity matrix
-            similarity_matrix = cosine_similarity(vectors).tolist()
+            if mode == "dense":
+                # Calculate similarity matrix
+                similarity_matrix = cosine_similarity(vectors).tolist()
+                
+                # Simple clustering based on similarity threshold
+                if clustering == "components":
+                    neighbors = self._sparse_neighbor_graph(csr_matrix(vectors), threshold, block_size)
+                    clusters = self._component_clusters(neighbors)
+                else:
+                    clusters = self._cluster_similar_signals(similarity_matrix, threshold=threshold)
+                
+                return {
+                    'similarity_matrix': similarity_matrix,
+                    'clusters': clusters,
+                    'avg_similarity': np.mean(similarity_matrix)
+                }
             
-            # Simple clustering based on similarity threshold
-            clusters = self._cluster_similar_signals(similarity_matrix, threshold=0.3)
+            vectors = csr_matrix(vectors)
+            neighbors = self._sparse_neighbor_graph(vectors, threshold, block_size)
+            if clustering == "components":
+                clusters = self._component_clusters(neighbors)
+            else:
+                clusters = self._greedy_sparse_clusters(neighbors)
+            
+            # Mean of the full cosine matrix without building it: sum_ij <v_i, v_j> = |sum_i v_i|^2
+            column_sums = np.asarray(vectors.sum(axis=0)).ravel()
+            avg_similarity = float(column_sums @ column_sums) / (len(signals) ** 2)
             
             return {
-                'similarity_matrix': similarity_matrix,
+                'similarity_matrix': [],
                 'clusters': clusters,
-                'avg_similarity': np.mean(similarity_matrix)
+                'avg_similarity': avg_similarity,
+                'neighbor_pairs': int(neighbors.nnz),
+                'mode': 'sparse'
             }
             
         except Exception as e:
             self.logger.error(f"Similarity analysis failed: {e}")
             return {'similarity_matrix': [], 'clusters': []}
     
+    def _sparse_neighbor_graph(self, vectors: csr_matrix, threshold: float, block_size: int) -> csr_matrix:
+        """Upper-triangular CSR of pairs (i < j) with cosine similarity above ``threshold``
+        
+        Similarities are computed one row block at a time against the rows at or after the
+        block start, so only above-threshold entries of one block are ever held at once.
+        """
+        n = vectors.shape[0]
+        rows, cols, values = [], [], []
+        for block_start in range(0, n, block_size):
+            block_end = min(block_start + block_size, n)
+            block = (vectors[block_start:block_end] @ vectors[block_start:].T).tocoo()
+            block_rows = block.row + block_start
+            block_cols = block.col + block_start
+            keep = (block.data > threshold) & (block_cols > block_rows)
+            rows.append(block_rows[keep])
+            cols.append(block_cols[keep])
+            values.append(block.data[keep])
+        return csr_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n, n)
+        )
+    
+    def _greedy_sparse_clusters(self, neighbors: csr_matrix) -> List[List[int]]:
+        """Same clusters as _cluster_similar_signals, read from the sparse neighbor graph"""
+        n = neighbors.shape[0]
+        neighbors.sort_indices()
+        assigned = np.zeros(n, dtype=bool)
+        clusters = []
+        for i in range(n):
+            if assigned[i]:
+                continue
+            assigned[i] = True
+            candidates = neighbors.indices[neighbors.indptr[i]:neighbors.indptr[i + 1]]
+            members = candidates[~assigned[candidates]]
+            assigned[members] = True
+            clusters.append([i] + members.tolist())
+        return clusters
+    
+    def _component_clusters(self, neighbors: csr_matrix) -> List[List[int]]:
+        """Connected components of the neighbor graph, ordered by their first member"""
+        _, labels = connected_components(neighbors, directed=False)
+        order = np.argsort(labels, kind='stable')
+        boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+        clusters = [group.tolist() for group in np.split(order, boundaries)]
+        return sorted(clusters, key=lambda cluster: cluster[0])
+    
     def _cluster_similar_signals(self, similarity_matrix: List[List[float]], threshold: float = 0.3) -> List[List[int]]:
         """Cluster signals based on similarity matrix"""
         n = len(similarity_matrix)
@@ -714,27 +690,167 @@ class AdvancedSemanticEngine:
     
     def get_performance_stats(self) -> Dict:
         """Get current performance statistics"""
-        return self.analysis_stats.copy()
+        return {**self.analysis_stats, 'result_cache': self.result_cache.get_stats()}
     
-    async def batch_analyze_signals(self, signals: List[str], context: Dict = None) -> List[SemanticScore]:
-        """Analyze multiple signals in batch for efficiency"""
+    async def batch_analyze_signals(self, signals: List[str], context: Dict = None,
+                                    n_process: int = 1, batch_size: int = 256) -> List[SemanticScore]:
+        """Analyze multiple signals in batch for efficiency
+        
+        Scores exactly like ``analyze_semantic_understanding`` (both go through
+        ``_analyze_batch``), but runs one ``nlp.pipe`` over all texts, one call per transformer
+        pipeline and one keyword pass over the joined batch.
+        """
         self.logger.info(f"🔄 Batch analyzing {len(signals)} signals...")
         
-        tasks = [
-            self.analyze_semantic_understanding(signal, context)
-            for signal in signals
-        ]
+        results: List[Optional[SemanticScore]] = [None] * len(signals)
+        cache_keys = [self.result_cache.make_key(signal, context) for signal in signals]
+        pending = []
+        for i, cached in enumerate(await self.result_cache.aget_many(cache_keys)):
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if pending:
+            texts = [signals[i] for i in pending]
+            try:
+                scores = await asyncio.get_running_loop().run_in_executor(
+                    self.model_executor, self._analyze_batch, texts, n_process, batch_size
+                )
+            except Exception as e:
+                self.logger.error(f"❌ Batch semantic analysis failed: {e}")
+                scores = [self._create_fallback_score(text) for text in texts]
+            else:
+                # Stats are shared with the per-signal path, so update them on the loop, not the worker
+                for i, score in zip(pending, scores):
+                    self._update_analysis_stats(score.processing_time, score)
+                    self.result_cache.put(cache_keys[i], score)
+            for i, score in zip(pending, scores):
+                results[i] = score
+        
+        self.logger.info(f"✅ Successfully analyzed {len(results)}/{len(signals)} signals")
+        return results
+    
+    def _analyze_batch(self, signals: List[str], n_process: int = 1, batch_size: int = 256) -> List[SemanticScore]:
+        """Score a list of signals; the single implementation behind both public entry points.
         
-        # Filter out exceptions and return valid results
-        valid_results = [
-            result for result in results
-            if isinstance(result, SemanticScore)
-        ]
+        Runs on ``self.model_executor`` only: spaCy, the transformer pipelines and TextBlob are
+        never called from two threads at once, and the spaCy docs never leave this thread.
+        """
+        start_time = datetime.now()
+        n = len(signals)
+        processed = [self._preprocess_content(signal) for signal in signals]
+        lowered = [text.lower() for text in processed]
+        
+        # Keyword/intent matching: one pass of the compiled matcher over the joined batch
+        counts = self.keyword_matcher.category_counts(self.keyword_matcher.presence_matrix(lowered))
+        model_outputs = self._run_models(processed, n_process, batch_size)
+        processing_time = (datetime.now() - start_time).total_seconds() / max(n, 1)
+        
+        scores = []
+        for i in range(n):
+            semantic_score = SemanticScore()
+            if processed[i]:
+                hits = {category: int(column[i]) for category, column in counts.items()}
+                outputs = model_outputs[i]
+                
+                semantic_score.context_relevance = self._score_context_relevance(hits)
+                
+                if 'intent' in outputs:
+                    intent_result = self._score_intent(outputs['intent'], hits)
+                    semantic_score.intent_clarity = intent_result['confidence']
+                    semantic_score.intent_classification = intent_result['intent']
+                
+                sentiment_result = self._score_sentiment(outputs['vader'], outputs['textblob'], outputs.get('emotions'))
+                semantic_score.sentiment_strength = sentiment_result['compound_score']
+                semantic_score.sentiment_breakdown = sentiment_result
+                
+                entity_result = self._score_entities(outputs.get('doc'))
+                semantic_score.entity_richness = entity_result['richness_score']
+                semantic_score.extracted_entities = entity_result['entities']
+                
+                semantic_score.semantic_coherence = self._score_coherence(
+                    self._split_sentences(processed[i]), outputs.get('sentence_vectors')
+                )
+                semantic_score.innovation_potential = self._score_innovation(hits, lowered[i])
+                semantic_score.key_concepts = self._score_key_concepts(outputs.get('doc'), lowered[i])
+                semantic_score.context_indicators = self._score_context_indicators(hits)
+            else:
+                semantic_score.sentiment_breakdown = {'compound_score': 0.0}
+            
+            semantic_score.overall_score = self._calculate_overall_semantic_score(semantic_score)
+            semantic_score.processing_time = processing_time
+            semantic_score.confidence_level = self._calculate_confidence_level(semantic_score)
+            semantic_score.detected_language = self._detect_language(signals[i])
+            scores.append(semantic_score)
+        return scores
+    
+    def _run_models(self, processed: List[str], n_process: int = 1, batch_size: int = 256) -> List[Dict]:
+        """Every model call for a batch of preprocessed texts, one batched call per model.
+        
+        Per text: 'intent' (zero-shot result, or None when the classifier failed; absent
+        without a classifier), 'vader', 'textblob', 'emotions', 'doc' and 'sentence_vectors'
+        (the non-zero spaCy vectors of its sentences, only for multi-sentence texts).
+        """
+        outputs: List[Dict] = [{} for _ in processed]
+        rows = [i for i, text in enumerate(processed) if text]
+        if not rows:
+            return outputs
+        texts = [processed[i] for i in rows]
+        
+        if self.intent_classifier:
+            try:
+                results = self.intent_classifier(texts, self.intent_categories)
+                if isinstance(results, dict):
+                    results = [results]
+            except Exception as e:
+                self.logger.warning(f"Intent classification failed: {e}")
+                results = [None] * len(rows)
+            for i, result in zip(rows, results):
+                outputs[i]['intent'] = result
+        
+        for i in rows:
+            outputs[i]['vader'] = self.sentiment_analyzer.polarity_scores(processed[i])
+            outputs[i]['textblob'] = TextBlob(processed[i]).sentiment
+        
+        if self.emotion_classifier:
+            try:
+                emotions = self.emotion_classifier(texts, truncation=True)
+                for i, emotion in zip(rows, emotions):
+                    outputs[i]['emotions'] = emotion if isinstance(emotion, list) else [emotion]
+            except Exception as e:
+                self.logger.warning(f"Emotion classification failed: {e}")
+        
+        if not self.nlp:
+            return outputs
+        
+        try:
+            for i, doc in zip(rows, self.nlp.pipe(texts, n_process=n_process, batch_size=batch_size)):
+                outputs[i]['doc'] = doc
+        except Exception as e:
+            self.logger.warning(f"Entity extraction failed: {e}")
+            for i in rows:
+                outputs[i].pop('doc', None)
+        
+        sentences_by_text = {}
+        for i in rows:
+            sentences = self._split_sentences(processed[i])
+            if len(sentences) >= 2:
+                sentences_by_text[i] = sentences
+        if sentences_by_text:
+            try:
+                owners = [i for i, sentences in sentences_by_text.items() for _ in sentences]
+                flat = [sentence for sentences in sentences_by_text.values() for sentence in sentences]
+                vectors = {i: [] for i in sentences_by_text}
+                for owner, doc in zip(owners, self.nlp.pipe(flat, n_process=n_process, batch_size=batch_size)):
+                    if doc.vector_norm > 0:
+                        vectors[owner].append(doc.vector)
+                for i, sentence_vectors in vectors.items():
+                    outputs[i]['sentence_vectors'] = sentence_vectors
+            except Exception as e:
+                self.logger.warning(f"Coherence analysis failed: {e}")
         
-        self.logger.info(f"✅ Successfully analyzed {len(valid_results)}/{len(signals)} signals")
-        return valid_results
+        return outputs
 
 # Global semantic engine instance
 _semantic_engine = None
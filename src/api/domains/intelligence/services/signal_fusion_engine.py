@@ -7,11 +7,12 @@ Combines text, network, temporal, and behavioral signals for superior accuracy
 import asyncio
 import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 import logging
 from dataclasses import dataclass
 from collections import defaultdict
 import networkx as nx
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import DBSCAN
 from sklearn.decomposition import PCA
@@ -28,8 +29,8 @@ class MultiModalSignal:
     timestamp: datetime
     url: str
     
-    # Text modality
-    text_embeddings: np.ndarray
+    # Text modality (sparse TF-IDF row from the fusion batch)
+    text_embeddings: Union[np.ndarray, sparse.spmatrix]
     semantic_features: Dict
     linguistic_features: Dict
     
@@ -49,15 +50,31 @@ class MultiModalSignal:
     virality_indicators: Dict
 
 class GroundbreakingSignalFusion:
-    """Revolutionary signal fusion using advanced ML techniques"""
+    """Revolutionary signal fusion using advanced ML techniques
     
-    def __init__(self):
+    The whole batch is processed as matrices: TF-IDF stays sparse, pairwise content
+    similarity is one thresholded sparse product (computed in row blocks), and the
+    clustering features are assembled with NumPy in one shot. With
+    ``reuse_vocabulary=True`` the vectorizer is fitted once and later calls only
+    transform, keeping a stable vocabulary and skipping the refit.
+    """
+    
+    def __init__(self, similarity_threshold: float = 0.7, reuse_vocabulary: bool = False,
+                 similarity_block_size: int = 2048):
         # Advanced feature extractors
         self.text_vectorizer = TfidfVectorizer(
             max_features=10000,
             ngram_range=(1, 3),
             stop_words='english'
         )
+        self.reuse_vocabulary = reuse_vocabulary
+        self.vocabulary_fitted = False
+        self.text_matrix: Optional[sparse.csr_matrix] = None  # L2-normalized TF-IDF of the last batch
+        
+        # Content similarity graph
+        self.similarity_threshold = similarity_threshold
+        self.similarity_block_size = similarity_block_size
+        self.similarity_network = nx.Graph()
         
         # Network analysis tools
         self.influence_graph = nx.DiGraph()
@@ -78,9 +95,10 @@ class GroundbreakingSignalFusion:
         
         # Step 1: Extract multi-modal features
         enhanced_signals = await self._extract_multimodal_features(raw_signals)
+        text_matrix = self.text_matrix  # this batch's rows; passed on so later steps never see another batch's
         
         # Step 2: Build dynamic network graphs
-        network_features = await self._build_dynamic_networks(enhanced_signals)
+        network_features = await self._build_dynamic_networks(enhanced_signals, text_matrix)
         
         # Step 3: Temporal pattern analysis
         temporal_features = await self._analyze_temporal_patterns(enhanced_signals)
@@ -89,7 +107,7 @@ class GroundbreakingSignalFusion:
         behavioral_features = await self._extract_behavioral_signals(enhanced_signals)
         
         # Step 5: Advanced clustering and anomaly detection
-        clustered_signals = await self._advanced_clustering(enhanced_signals)
+        clustered_signals = await self._advanced_clustering(enhanced_signals, text_matrix)
         
         print(f"✅ Fused {len(clustered_signals)} multi-modal signals")
         return clustered_signals
@@ -101,12 +119,17 @@ class GroundbreakingSignalFusion:
         # Prepare text corpus for vectorization
         text_corpus = [s.content for s in signals]
         
-        # Fit text vectorizer
-        text_vectors = self.text_vectorizer.fit_transform(text_corpus)
+        # Fit text vectorizer (or reuse the fitted vocabulary)
+        if self.reuse_vocabulary and self.vocabulary_fitted:
+            text_vectors = self.text_vectorizer.transform(text_corpus)
+        else:
+            text_vectors = self.text_vectorizer.fit_transform(text_corpus)
+            self.vocabulary_fitted = True
+        self.text_matrix = text_vectors.tocsr()
         
         for i, signal in enumerate(signals):
             # Text modality features
-            text_embedding = text_vectors[i].toarray().flatten()
+            text_embedding = self.text_matrix[i]
             semantic_features = self._extract_semantic_features(signal.content)
             linguistic_features = self._extract_linguistic_features(signal.content)
             
@@ -174,7 +197,8 @@ class GroundbreakingSignalFusion:
         
         return features
     
-    async def _build_dynamic_networks(self, signals: List[MultiModalSignal]) -> Dict:
+    async def _build_dynamic_networks(self, signals: List[MultiModalSignal],
+                                      text_matrix: Optional[sparse.csr_matrix] = None) -> Dict:
         """Build dynamic network graphs for influence analysis"""
         
         # Author influence network
@@ -183,27 +207,22 @@ class GroundbreakingSignalFusion:
         # Source credibility network
         source_network = nx.DiGraph()
         
-        # Content similarity network
-        similarity_network = nx.Graph()
-        
         # Build networks
+        author_ids = []
         for i, signal in enumerate(signals):
             # Add nodes
             author_id = signal.url.split('/')[-2] if '/' in signal.url else f"author_{i}"
+            author_ids.append(author_id)
             author_network.add_node(author_id, source=signal.source, timestamp=signal.timestamp)
-            
-            # Calculate similarities for content network
-            for j, other_signal in enumerate(signals[i+1:], i+1):
-                similarity = self._calculate_content_similarity(
-                    signal.text_embeddings, 
-                    other_signal.text_embeddings
-                )
-                
-                if similarity > 0.7:  # High similarity threshold
-                    similarity_network.add_edge(i, j, weight=similarity)
+        
+        # Content similarity network from the thresholded pairwise similarity edges
+        rows, cols, weights = self._similarity_edges(self._text_matrix_for(signals, text_matrix))
+        similarity_network = nx.Graph()
+        similarity_network.add_weighted_edges_from(zip(rows.tolist(), cols.tolist(), weights.tolist()))
+        self.similarity_network = similarity_network
         
         # Calculate network metrics
-        network_features = {}
+        network_features = {'similarity_edges': len(weights)}
         
         if author_network.nodes():
             # Centrality measures
@@ -211,13 +230,55 @@ class GroundbreakingSignalFusion:
             betweenness = nx.betweenness_centrality(author_network)
             
             # Update signals with network features
-            for i, signal in enumerate(signals):
-                author_id = signal.url.split('/')[-2] if '/' in signal.url else f"author_{i}"
+            for signal, author_id in zip(signals, author_ids):
                 signal.network_centrality = centrality.get(author_id, 0)
                 signal.author_influence = betweenness.get(author_id, 0)
         
         return network_features
     
+    def _text_matrix_for(self, signals: List[MultiModalSignal],
+                         text_matrix: Optional[sparse.csr_matrix] = None) -> sparse.csr_matrix:
+        """TF-IDF matrix of the batch: the one built with ``signals`` if passed, else stacked from their rows"""
+        
+        if text_matrix is not None:
+            return text_matrix
+        if not signals:
+            return sparse.csr_matrix((0, 0))
+        rows = [
+            s.text_embeddings if sparse.issparse(s.text_embeddings) else sparse.csr_matrix(s.text_embeddings)
+            for s in signals
+        ]
+        return sparse.vstack(rows, format='csr')
+    
+    def _similarity_edges(self, text_matrix: sparse.csr_matrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Signal pairs (i < j) whose cosine similarity exceeds the threshold
+        
+        Rows are L2-normalized, so ``X @ X.T`` is the cosine similarity matrix. It is
+        computed one block of rows at a time and only the thresholded upper-triangle
+        entries are kept, bounding memory for large batches.
+        """
+        
+        n = text_matrix.shape[0]
+        if n < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+        
+        norms = np.sqrt(np.asarray(text_matrix.multiply(text_matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        normalized = sparse.diags(1.0 / norms) @ text_matrix
+        transposed = normalized.T.tocsc()
+        
+        rows, cols, weights = [], [], []
+        for start in range(0, n, self.similarity_block_size):
+            block = (normalized[start:start + self.similarity_block_size] @ transposed).tocoo()
+            block_rows = block.row + start
+            mask = (block.col > block_rows) & (block.data > self.similarity_threshold)
+            rows.append(block_rows[mask])
+            cols.append(block.col[mask])
+            weights.append(block.data[mask])
+        
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(weights)
+    
     async def _analyze_temporal_patterns(self, signals: List[MultiModalSignal]) -> Dict:
         """Advanced temporal pattern analysis"""
         
@@ -297,31 +358,29 @@ class GroundbreakingSignalFusion:
         
         return behavioral_features
     
-    async def _advanced_clustering(self, signals: List[MultiModalSignal]) -> List[MultiModalSignal]:
+    async def _advanced_clustering(self, signals: List[MultiModalSignal],
+                                   text_matrix: Optional[sparse.csr_matrix] = None) -> List[MultiModalSignal]:
         """Advanced clustering using multi-modal features"""
         
         if not signals:
             return signals
         
-        # Combine all features into feature matrix
-        feature_matrix = []
-        
-        for signal in signals:
-            # Combine features from all modalities
-            features = np.concatenate([
-                signal.text_embeddings[:100],  # Truncate for efficiency
-                [signal.network_centrality, signal.author_influence],
-                [signal.seasonality_score, signal.trend_acceleration],
-                [signal.engagement_pattern.get('initial_velocity', 0)],
-                [signal.user_behavior_signals.get('share_rate', 0)],
-                [signal.virality_indicators.get('exponential_growth', 0)]
-            ])
-            feature_matrix.append(features)
-        
-        feature_matrix = np.array(feature_matrix)
+        # Combine features from all modalities into one feature matrix
+        text_features = self._text_matrix_for(signals, text_matrix)[:, :100].toarray()  # Truncate for efficiency
+        modality_features = np.array([
+            (
+                signal.network_centrality, signal.author_influence,
+                signal.seasonality_score, signal.trend_acceleration,
+                signal.engagement_pattern.get('initial_velocity', 0),
+                signal.user_behavior_signals.get('share_rate', 0),
+                signal.virality_indicators.get('exponential_growth', 0)
+            )
+            for signal in signals
+        ], dtype=float)
+        feature_matrix = np.hstack([text_features, modality_features])
         
-        # Dimensionality reduction
-        if feature_matrix.shape[1] > 50:
+        # Dimensionality reduction (PCA needs at least n_components samples)
+        if feature_matrix.shape[1] > 50 and feature_matrix.shape[0] >= 50:
             reduced_features = self.feature_reducer.fit_transform(feature_matrix)
         else:
             reduced_features = feature_matrix
@@ -405,6 +464,11 @@ class GroundbreakingSignalFusion:
     
     def _calculate_content_similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """Calculate cosine similarity between embeddings"""
+        if sparse.issparse(embedding1):
+            embedding1 = embedding1.toarray().ravel()
+        if sparse.issparse(embedding2):
+            embedding2 = embedding2.toarray().ravel()
+        
         if len(embedding1) == 0 or len(embedding2) == 0:
             return 0.0
         
@@ -14,11 +14,15 @@ from dataclasses import dataclass, field
 from collections import defaultdict, deque
 import json
 import hashlib
-from scipy.sparse import csr_matrix
-from scipy.sparse.linalg import eigsh
+import heapq
+from scipy.sparse import csr_matrix, diags
+from scipy.sparse.csgraph import breadth_first_order, shortest_path
+from scipy.sparse.linalg import ArpackNoConvergence, eigsh
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from src.api.domains.streaming.services.incremental_trend_graph import IncrementalTrendGraph
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -55,13 +59,20 @@ class TrendCluster:
     influence_propagation: float
     temporal_coherence: float
     cross_platform_reach: float
+    analysis_mode: str = 'exact'  # 'exact' or 'fast' - which centrality mode produced the score
+    # In fast mode ``edges`` holds only the heaviest intra-cluster edges; network_density counts all
 
 class GroundbreakingGraphTrendDetector:
     """Revolutionary graph-based trend detection using network science"""
     
-    def __init__(self):
-        # Multi-layer graph structure
-        self.trend_graph = nx.MultiDiGraph()
+    def __init__(self, half_life_hours: float = 24.0, max_age_hours: float = 168.0,
+                 analysis_mode: str = 'auto', fast_mode_node_threshold: int = 2000,
+                 betweenness_samples: int = 32, fast_eigsh_maxiter: int = 200,
+                 fast_cluster_edge_limit: int = 1000):
+        # Multi-layer graph structure, kept alive across calls and updated incrementally
+        self.graph_store = IncrementalTrendGraph(half_life_hours=half_life_hours, max_age_hours=max_age_hours)
+        self.trend_graph = self.graph_store.graph
+        self._keyword_word_index = defaultdict(set)  # word -> keyword node ids, for similarity edges
         self.temporal_snapshots = deque(maxlen=168)  # 1 week of hourly snapshots
         
         # Graph analysis parameters
@@ -85,6 +96,24 @@ class GroundbreakingGraphTrendDetector:
         self.temporal_patterns = {}
         self.influence_cascades = {}
         
+        # Analysis mode: 'exact' runs full networkx centralities, 'fast' uses sampled
+        # betweenness/closeness and sparse power iteration, 'auto' switches on node count
+        if analysis_mode not in ('auto', 'exact', 'fast'):
+            raise ValueError(f"Unknown analysis mode: {analysis_mode}")
+        self.analysis_mode = analysis_mode
+        self.fast_mode_node_threshold = fast_mode_node_threshold
+        self.betweenness_samples = betweenness_samples
+        self.fast_eigsh_maxiter = fast_eigsh_maxiter  # Lanczos restarts allowed for fast-mode spectral embeddings
+        self.fast_cluster_edge_limit = fast_cluster_edge_limit  # heaviest edges kept per fast-mode cluster
+        self.last_analysis_mode = 'exact'
+        
+        # Warm-start state reused by the next detection run
+        self._previous_partition: Dict[str, int] = {}
+        self._previous_pagerank: Dict[str, float] = {}
+        self._previous_eigenvector: Dict[str, float] = {}
+        self._previous_spectral: Dict[str, float] = {}
+        self._analysis_cache: Dict[str, Tuple[Tuple[int, str], object]] = {}
+        
     async def detect_trends_graph_based(self, signals: List) -> List[TrendCluster]:
         """Revolutionary graph-based trend detection"""
         
@@ -92,6 +121,7 @@ class GroundbreakingGraphTrendDetector:
         
         # Step 1: Build multi-layer temporal graph
         await self._build_temporal_graph(signals)
+        self.last_analysis_mode = self._resolve_analysis_mode(self.trend_graph.number_of_nodes())
         
         # Step 2: Extract graph embeddings
         graph_embeddings = await self._extract_graph_embeddings()
@@ -115,135 +145,180 @@ class GroundbreakingGraphTrendDetector:
         return scored_clusters
     
     async def _build_temporal_graph(self, signals: List) -> None:
-        """Build multi-layer temporal graph from signals"""
+        """Fold new signals into the long-lived temporal graph and evict stale nodes"""
         
-        print("🏗️ Building temporal graph...")
+        print("🏗️ Updating temporal graph...")
         
-        # Clear existing graph
-        self.trend_graph.clear()
+        new_signals = self.graph_store.select_new_signals(signals)
+        new_keyword_ids = set()
         
-        # Process signals into graph nodes and edges
-        for signal in signals:
+        # Process only unseen signals into graph nodes and edges
+        for signal in new_signals:
+            keyword_ids = []
+            
             # Create keyword nodes
             for keyword in signal.keywords:
-                keyword_id = f"keyword_{hashlib.md5(keyword.encode()).hexdigest()[:8]}"
-                
-                if not self.trend_graph.has_node(keyword_id):
-                    keyword_node = GraphNode(
-                        node_id=keyword_id,
-                        node_type='keyword',
-                        content=keyword,
-                        timestamp=signal.timestamp,
-                        features={
-                            'frequency': 1,
-                            'first_seen': signal.timestamp,
-                            'sources': {signal.source},
-                            'engagement_sum': signal.engagement_score
-                        }
-                    )
-                    self.trend_graph.add_node(keyword_id, **keyword_node.__dict__)
-                else:
-                    # Update existing node
-                    node_data = self.trend_graph.nodes[keyword_id]
-                    node_data['features']['frequency'] += 1
-                    node_data['features']['sources'].add(signal.source)
-                    node_data['features']['engagement_sum'] += signal.engagement_score
-            
-            # Create source node
-            source_id = f"source_{signal.source}"
-            if not self.trend_graph.has_node(source_id):
-                source_node = GraphNode(
-                    node_id=source_id,
-                    node_type='source',
-                    content=signal.source,
+                keyword_id = self._keyword_node_id(keyword)
+                keyword_node = GraphNode(
+                    node_id=keyword_id,
+                    node_type='keyword',
+                    content=keyword,
                     timestamp=signal.timestamp,
                     features={
-                        'authority': self._get_source_authority(signal.source),
-                        'signal_count': 1,
-                        'avg_engagement': signal.engagement_score
+                        'frequency': 0,
+                        'first_seen': signal.timestamp,
+                        'sources': set(),
+                        'engagement_sum': 0.0
                     }
                 )
-                self.trend_graph.add_node(source_id, **source_node.__dict__)
+                node_data, created = self.graph_store.upsert_node(keyword_id, signal.timestamp, keyword_node.__dict__)
+                node_data['features']['frequency'] += 1
+                node_data['features']['sources'].add(signal.source)
+                node_data['features']['engagement_sum'] += signal.engagement_score
+                if created:
+                    new_keyword_ids.add(keyword_id)
+                keyword_ids.append(keyword_id)
+            
+            # Create source node
+            source_id = f"source_{signal.source}"
+            source_node = GraphNode(
+                node_id=source_id,
+                node_type='source',
+                content=signal.source,
+                timestamp=signal.timestamp,
+                features={
+                    'authority': self._get_source_authority(signal.source),
+                    'signal_count': 1,
+                    'avg_engagement': signal.engagement_score
+                }
+            )
+            self.graph_store.upsert_node(source_id, signal.timestamp, source_node.__dict__)
             
             # Create author node (if available)
             author_id = self._extract_author_id(signal)
             if author_id:
-                if not self.trend_graph.has_node(author_id):
-                    author_node = GraphNode(
-                        node_id=author_id,
-                        node_type='author',
-                        content=author_id,
-                        timestamp=signal.timestamp,
-                        features={
-                            'influence': 0.0,
-                            'post_count': 1,
-                            'total_engagement': signal.engagement_score
-                        }
-                    )
-                    self.trend_graph.add_node(author_id, **author_node.__dict__)
+                author_node = GraphNode(
+                    node_id=author_id,
+                    node_type='author',
+                    content=author_id,
+                    timestamp=signal.timestamp,
+                    features={
+                        'influence': 0.0,
+                        'post_count': 1,
+                        'total_engagement': signal.engagement_score
+                    }
+                )
+                self.graph_store.upsert_node(author_id, signal.timestamp, author_node.__dict__)
             
             # Create edges
-            await self._create_signal_edges(signal, keyword_id, source_id, author_id)
+            for keyword_id in keyword_ids:
+                await self._create_signal_edges(signal, keyword_id, source_id, author_id)
         
         # Create co-occurrence edges between keywords
-        await self._create_cooccurrence_edges(signals)
+        await self._create_cooccurrence_edges(new_signals)
+        
+        # Create similarity edges for newly seen keywords only
+        await self._create_similarity_edges(new_keyword_ids)
         
-        # Create similarity edges
-        await self._create_similarity_edges()
+        # Drop nodes that have not been seen within the retention horizon
+        for node_id, node_data in self.graph_store.evict_stale():
+            if node_data.get('node_type') == 'keyword':
+                for word in node_data.get('content', '').lower().split():
+                    self._keyword_word_index[word].discard(node_id)
+                    if not self._keyword_word_index[word]:
+                        del self._keyword_word_index[word]
         
-        print(f"📊 Graph built: {self.trend_graph.number_of_nodes()} nodes, {self.trend_graph.number_of_edges()} edges")
+        print(f"📊 Graph updated with {len(new_signals)} new signals: "
+              f"{self.trend_graph.number_of_nodes()} nodes, {self.trend_graph.number_of_edges()} edges")
+    
+    def _cached_analysis(self, name: str):
+        """Return a cached result for ``name`` if the graph and mode are unchanged since it was computed"""
+        cached = self._analysis_cache.get(name)
+        if cached and cached[0] == (self.graph_store.version, self.last_analysis_mode):
+            return cached[1]
+        return None
+    
+    def _store_analysis(self, name: str, result) -> None:
+        self._analysis_cache[name] = ((self.graph_store.version, self.last_analysis_mode), result)
     
     async def _extract_graph_embeddings(self) -> Dict:
         """Extract graph embeddings using advanced techniques"""
         
         print("🧠 Extracting graph embeddings...")
         
-        embeddings = {}
+        cached = self._cached_analysis('embeddings')
+        if cached is not None:
+            return cached
         
-        # Convert to simple graph for embedding algorithms
-        simple_graph = nx.Graph()
-        for node in self.trend_graph.nodes():
-            simple_graph.add_node(node)
+        embeddings = {}
         
-        for edge in self.trend_graph.edges(data=True):
-            if simple_graph.has_edge(edge[0], edge[1]):
-                simple_graph[edge[0]][edge[1]]['weight'] += edge[2].get('weight', 1.0)
-            else:
-                simple_graph.add_edge(edge[0], edge[1], weight=edge[2].get('weight', 1.0))
+        # The store keeps the undirected aggregate up to date, no per-call copy needed
+        simple_graph = self.graph_store.simple_graph
         
         if simple_graph.number_of_nodes() > 0:
-            # Spectral embeddings
+            fast = self.last_analysis_mode == 'fast'
+            adjacency_matrix, node_order = self.graph_store.adjacency_matrix()
+            
+            # Spectral embeddings, warm-started from the previous leading eigenvector
+            eigenvectors = None
             try:
-                adjacency_matrix = nx.adjacency_matrix(simple_graph)
                 if adjacency_matrix.shape[0] > 2:
-                    eigenvalues, eigenvectors = eigsh(adjacency_matrix, k=min(10, adjacency_matrix.shape[0]-1))
+                    v0 = self._warm_start_vector(node_order, self._previous_spectral)
+                    k = min(4 if fast else 10, adjacency_matrix.shape[0]-1)
+                    if fast:
+                        # Capped: a loose, iteration-bounded solve is enough for 4 embedding dimensions
+                        try:
+                            eigenvalues, eigenvectors = eigsh(adjacency_matrix, k=k, v0=v0, tol=1e-3,
+                                                              maxiter=self.fast_eigsh_maxiter)
+                        except ArpackNoConvergence as e:
+                            eigenvalues, eigenvectors = e.eigenvalues, e.eigenvectors
+                            if len(eigenvalues) == 0:
+                                raise
+                    else:
+                        eigenvalues, eigenvectors = eigsh(adjacency_matrix, k=k, v0=v0, tol=0)
                     
-                    for i, node in enumerate(simple_graph.nodes()):
-                        embeddings[node] = eigenvectors[i, :].tolist()
+                    leading = int(np.argmax(np.abs(eigenvalues)))
+                    self._previous_spectral = dict(zip(node_order, np.abs(eigenvectors[:, leading])))
             except Exception as e:
+                eigenvectors = None
                 logger.warning(f"Spectral embedding failed: {e}")
             
             # Centrality-based embeddings
-            centrality_measures = {
-                'degree': nx.degree_centrality(simple_graph),
-                'betweenness': nx.betweenness_centrality(simple_graph),
-                'closeness': nx.closeness_centrality(simple_graph),
-                'eigenvector': nx.eigenvector_centrality(simple_graph, max_iter=1000)
-            }
-            
-            for node in simple_graph.nodes():
-                if node not in embeddings:
-                    embeddings[node] = []
+            if fast:
+                centrality_arrays = self._fast_centrality_arrays(adjacency_matrix, node_order)
+                self._previous_eigenvector = dict(zip(node_order, centrality_arrays['eigenvector'].tolist()))
+                features = np.column_stack([centrality_arrays[name] for name in
+                                            ('degree', 'betweenness', 'closeness', 'eigenvector')])
+                if eigenvectors is not None:
+                    features = np.hstack([eigenvectors, features])
+                # Each node maps to a row view of one feature matrix rather than a list of floats
+                embeddings = dict(zip(node_order, features))
+            else:
+                if eigenvectors is not None:
+                    embeddings = dict(zip(node_order, eigenvectors.tolist()))
+                eigenvector_start = self._warm_start_mapping(simple_graph, self._previous_eigenvector)
+                centrality_measures = {
+                    'degree': nx.degree_centrality(simple_graph),
+                    'betweenness': nx.betweenness_centrality(simple_graph),
+                    'closeness': nx.closeness_centrality(simple_graph),
+                    'eigenvector': nx.eigenvector_centrality(simple_graph, max_iter=1000, nstart=eigenvector_start)
+                }
+                self._previous_eigenvector = centrality_measures['eigenvector']
                 
-                centrality_vector = [
-                    centrality_measures['degree'].get(node, 0),
-                    centrality_measures['betweenness'].get(node, 0),
-                    centrality_measures['closeness'].get(node, 0),
-                    centrality_measures['eigenvector'].get(node, 0)
-                ]
-                embeddings[node].extend(centrality_vector)
+                for node in simple_graph.nodes():
+                    if node not in embeddings:
+                        embeddings[node] = []
+                    
+                    centrality_vector = [
+                        centrality_measures['degree'].get(node, 0),
+                        centrality_measures['betweenness'].get(node, 0),
+                        centrality_measures['closeness'].get(node, 0),
+                        centrality_measures['eigenvector'].get(node, 0)
+                    ]
+                    embeddings[node].extend(centrality_vector)
         
         self.graph_embeddings = embeddings
+        self._store_analysis('embeddings', embeddings)
         return embeddings
     
     async def _detect_emerging_communities(self) -> List[Set[str]]:
@@ -251,29 +326,31 @@ class GroundbreakingGraphTrendDetector:
         
         print("🔍 Detecting emerging communities...")
         
+        cached = self._cached_analysis('communities')
+        if cached is not None:
+            return cached
+        
         communities = []
         
-        # Convert to simple graph for community detection
-        simple_graph = nx.Graph()
-        for edge in self.trend_graph.edges(data=True):
-            weight = edge[2].get('weight', 1.0)
-            if simple_graph.has_edge(edge[0], edge[1]):
-                simple_graph[edge[0]][edge[1]]['weight'] += weight
-            else:
-                simple_graph.add_edge(edge[0], edge[1], weight=weight)
+        simple_graph = self.graph_store.simple_graph
+        
+        if simple_graph.number_of_nodes() > 2 and self.last_analysis_mode == 'fast':
+            # Sparse label propagation on the CSR matrix, seeded with the previous partition
+            adjacency_matrix, node_order = self.graph_store.adjacency_matrix()
+            partition = self._sparse_label_propagation(adjacency_matrix, node_order)
+            self._previous_partition = partition
+            communities = self._group_partition(partition)
         
-        if simple_graph.number_of_nodes() > 2:
+        elif simple_graph.number_of_nodes() > 2:
             try:
-                # Louvain community detection
+                # Louvain community detection, seeded with the previous partition
                 import community as community_louvain
-                partition = community_louvain.best_partition(simple_graph)
-                
-                # Group nodes by community
-                community_groups = defaultdict(set)
-                for node, community_id in partition.items():
-                    community_groups[community_id].add(node)
-                
-                communities = list(community_groups.values())
+                partition = community_louvain.best_partition(
+                    simple_graph,
+                    partition=self._warm_start_partition(simple_graph)
+                )
+                self._previous_partition = partition
+                communities = self._group_partition(partition)
                 
             except ImportError:
                 # Fallback: connected components
@@ -289,8 +366,12 @@ class GroundbreakingGraphTrendDetector:
             for node_id in community:
                 if self.trend_graph.has_node(node_id):
                     node_data = self.trend_graph.nodes[node_id]
-                    node_timestamp = node_data.get('timestamp', current_time)
-                    if (current_time - node_timestamp).total_seconds() < 24 * 3600:  # 24 hours
+                    last_seen = node_data.get('last_seen')
+                    if last_seen is not None:
+                        age_seconds = current_time.timestamp() - last_seen
+                    else:
+                        age_seconds = (current_time - node_data.get('timestamp', current_time)).total_seconds()
+                    if age_seconds < 24 * 3600:  # 24 hours
                         recent_activity = True
                         break
             
@@ -298,6 +379,7 @@ class GroundbreakingGraphTrendDetector:
                 emerging_communities.append(community)
         
         print(f"🌟 Found {len(emerging_communities)} emerging communities")
+        self._store_analysis('communities', emerging_communities)
         return emerging_communities
     
     async def _analyze_influence_propagation(self) -> Dict:
@@ -305,11 +387,21 @@ class GroundbreakingGraphTrendDetector:
         
         print("📈 Analyzing influence propagation...")
         
+        cached = self._cached_analysis('influence')
+        if cached is not None:
+            return cached
+        
         influence_patterns = {}
         
-        # Calculate PageRank for influence
+        # Calculate PageRank for influence, warm-started from the previous run
         try:
-            pagerank_scores = nx.pagerank(self.trend_graph, weight='weight')
+            if self.last_analysis_mode == 'fast':
+                adjacency_matrix, node_order = self.graph_store.adjacency_matrix(directed=True)
+                pagerank_scores = self._sparse_pagerank(adjacency_matrix, node_order, self._previous_pagerank)
+            else:
+                nstart = self._warm_start_mapping(self.trend_graph, self._previous_pagerank)
+                pagerank_scores = nx.pagerank(self.trend_graph, weight='weight', nstart=nstart)
+            self._previous_pagerank = pagerank_scores
             
             # Update node influence scores
             for node_id, score in pagerank_scores.items():
@@ -321,60 +413,280 @@ class GroundbreakingGraphTrendDetector:
         except Exception as e:
             logger.warning(f"PageRank calculation failed: {e}")
         
-        # Analyze cascade patterns
+        # Analyze cascade patterns (fast mode only follows the most influential keywords)
         cascades = {}
-        for node in self.trend_graph.nodes():
-            if self.trend_graph.nodes[node]['node_type'] == 'keyword':
-                cascade_depth = self._calculate_cascade_depth(node)
-                cascades[node] = cascade_depth
+        keyword_nodes = [node for node, data in self.trend_graph.nodes(data=True) if data['node_type'] == 'keyword']
+        if self.last_analysis_mode == 'fast':
+            pagerank_scores = influence_patterns.get('pagerank', {})
+            keyword_nodes = heapq.nlargest(self.betweenness_samples, keyword_nodes,
+                                           key=lambda node: pagerank_scores.get(node, 0.0))
+            cascades = self._sparse_cascade_depths(keyword_nodes)
+        else:
+            for node in keyword_nodes:
+                cascades[node] = self._calculate_cascade_depth(node)
         
         influence_patterns['cascades'] = cascades
         
         self.influence_cascades = influence_patterns
+        self._store_analysis('influence', influence_patterns)
         return influence_patterns
     
+    def _group_partition(self, partition: Dict[str, int]) -> List[Set[str]]:
+        """Group nodes by community id"""
+        community_groups = defaultdict(set)
+        for node, community_id in partition.items():
+            community_groups[community_id].add(node)
+        return list(community_groups.values())
+    
+    # Fast analysis mode
+    def _resolve_analysis_mode(self, node_count: int) -> str:
+        if self.analysis_mode == 'auto':
+            return 'fast' if node_count > self.fast_mode_node_threshold else 'exact'
+        return self.analysis_mode
+    
+    def _fast_centralities(self, simple_graph, adjacency_matrix: csr_matrix, node_order: List[str]) -> Dict[str, Dict]:
+        """Approximate centralities for large graphs, keyed by node id"""
+        arrays = self._fast_centrality_arrays(adjacency_matrix, node_order)
+        return {name: dict(zip(node_order, values.tolist())) for name, values in arrays.items()}
+    
+    def _fast_centrality_arrays(self, adjacency_matrix: csr_matrix, node_order: List[str]) -> Dict[str, np.ndarray]:
+        """Approximate centralities for large graphs, one array per measure in ``node_order``.
+
+        Betweenness and closeness are estimated from breadth-first searches of ``betweenness_samples``
+        pivot nodes run on the CSR matrix; eigenvector centrality is a sparse power iteration.
+        """
+        n = len(node_order)
+        betweenness, closeness = np.zeros(n), np.zeros(n)
+        
+        if n > 2:
+            k = min(self.betweenness_samples, n)
+            pivots = np.random.default_rng(42).choice(n, size=k, replace=False)
+            distances, predecessors = self._pivot_bfs(adjacency_matrix, pivots)
+            betweenness = self._sampled_betweenness(distances, predecessors, pivots, n)
+            
+            reachable = np.isfinite(distances) & (distances > 0)
+            reach_count = reachable.sum(axis=0)
+            distance_sum = np.where(reachable, distances, 0.0).sum(axis=0)
+            # Wasserman-Faust normalisation, as networkx closeness, estimated from the pivot sample
+            with np.errstate(divide='ignore', invalid='ignore'):
+                closeness = np.where(distance_sum > 0, (reach_count / distance_sum) * (reach_count / k), 0.0)
+        
+        previous = self._warm_start_vector(node_order, self._previous_eigenvector)
+        eigenvector = self._sparse_power_iteration(adjacency_matrix + diags(np.ones(n)), previous)
+        
+        degree_scale = 1.0 / (n - 1) if n > 1 else 1.0
+        return {
+            'degree': np.diff(adjacency_matrix.indptr) * degree_scale,
+            'betweenness': betweenness,
+            'closeness': closeness,
+            'eigenvector': eigenvector
+        }
+    
+    def _pivot_bfs(self, adjacency_matrix: csr_matrix, pivots: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Hop distances and BFS-tree predecessors from each pivot, shaped like ``shortest_path`` output.
+
+        Each search is scipy's C breadth-first traversal (the undirected adjacency is already
+        symmetric). BFS visits nodes level by level and parents in visiting order, so each level
+        is a contiguous run of the visit order whose end is found with one ``searchsorted``.
+        """
+        k, n = len(pivots), adjacency_matrix.shape[0]
+        distances = np.full((k, n), np.inf)
+        predecessors = np.empty((k, n), dtype=np.int32)
+        position = np.empty(n, dtype=np.int64)
+        for row, pivot in enumerate(pivots):
+            order, predecessors[row] = breadth_first_order(adjacency_matrix, pivot, directed=True,
+                                                           return_predecessors=True)
+            position[order] = np.arange(len(order))
+            parent_position = position[predecessors[row][order[1:]]]
+            level_ends = [1]
+            while level_ends[-1] < len(order):
+                level_ends.append(1 + int(np.searchsorted(parent_position, level_ends[-1])))
+            distances[row, order] = np.repeat(np.arange(len(level_ends)), np.diff(level_ends, prepend=0))
+        return distances, predecessors
+    
+    def _sampled_betweenness(self, distances: np.ndarray, predecessors: np.ndarray, pivots: np.ndarray, n: int) -> np.ndarray:
+        """k-pivot betweenness estimate.
+
+        For each pivot, dependencies are accumulated up its shortest-path tree one BFS level at a
+        time (deepest first), then rescaled by n/k and normalised the same way networkx does.
+        """
+        betweenness = np.zeros(n)
+        for row in range(len(pivots)):
+            level = distances[row]
+            parent = predecessors[row]
+            dependency = np.zeros(n)
+            finite = np.isfinite(level)
+            if not finite.any():
+                continue
+            for depth in range(int(level[finite].max()), 0, -1):
+                members = np.flatnonzero(level == depth)
+                dependency += np.bincount(parent[members], weights=1.0 + dependency[members], minlength=n)
+            dependency[pivots[row]] = 0.0
+            betweenness += dependency
+        return betweenness * (n / len(pivots)) / ((n - 1) * (n - 2))
+    
+    def _sparse_label_propagation(self, adjacency_matrix: csr_matrix, node_order: List[str],
+                                  max_iter: int = 20) -> Dict[str, int]:
+        """Weighted label propagation in sparse matrix form.
+
+        Each round every node adopts the label with the largest total edge weight among its
+        neighbours and itself (a small self weight breaks ties in favour of the current label).
+        """
+        n = len(node_order)
+        start = self._warm_start_partition(self.graph_store.simple_graph) or {}
+        labels = np.array([start.get(node, i) for i, node in enumerate(node_order)], dtype=np.int64)
+        _, labels = np.unique(labels, return_inverse=True)
+        
+        self_weight = 1e-3 * adjacency_matrix.data.min() if adjacency_matrix.nnz else 1.0
+        propagation = (adjacency_matrix + diags(np.full(n, self_weight))).tocsr()
+        rows = np.arange(n)
+        before = None
+        for _ in range(max_iter):
+            one_hot = csr_matrix((np.ones(n), (rows, labels)), shape=(n, labels.max() + 1))
+            votes = (propagation @ one_hot).tocsr()
+            votes.sum_duplicates()
+            # Row-wise argmax over the sparse votes: first column holding the row maximum
+            row_ids = np.repeat(rows, np.diff(votes.indptr))
+            row_max = np.maximum.reduceat(votes.data, votes.indptr[:-1])
+            winners = np.flatnonzero(votes.data == row_max[row_ids])
+            _, first = np.unique(row_ids[winners], return_index=True)
+            new_labels = votes.indices[winners[first]]
+            # Synchronous updates can also settle into a few nodes flipping back and forth
+            if np.array_equal(new_labels, labels) or (before is not None and np.array_equal(new_labels, before)):
+                break
+            before, labels = labels, new_labels
+        
+        return dict(zip(node_order, labels.tolist()))
+    
+    def _sparse_power_iteration(self, matrix: csr_matrix, v0: Optional[np.ndarray] = None,
+                                max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+        """Leading eigenvector of a non-negative sparse matrix, L2-normalised like networkx"""
+        n = matrix.shape[0]
+        if n == 0:
+            return np.zeros(0)
+        x = np.abs(v0) if v0 is not None else np.ones(n)
+        x = x / np.linalg.norm(x)
+        for _ in range(max_iter):
+            x_next = matrix @ x
+            norm = np.linalg.norm(x_next)
+            if norm == 0:
+                return x_next
+            x_next /= norm
+            if np.abs(x_next - x).sum() < n * tol:
+                return x_next
+            x = x_next
+        return x
+    
+    def _sparse_pagerank(self, adjacency_matrix: csr_matrix, node_order: List[str], previous: Dict[str, float],
+                         alpha: float = 0.85, max_iter: int = 100, tol: float = 1e-6) -> Dict[str, float]:
+        """PageRank by power iteration on a CSR adjacency (rows are out-edges), warm-started from ``previous``"""
+        n = adjacency_matrix.shape[0]
+        if n == 0:
+            return {}
+        out_weight = np.asarray(adjacency_matrix.sum(axis=1)).ravel()
+        dangling = out_weight == 0
+        inverse = np.where(dangling, 0.0, 1.0 / np.where(dangling, 1.0, out_weight))
+        transition = (diags(inverse) @ adjacency_matrix).T.tocsr()
+        
+        x = self._warm_start_vector(node_order, previous)
+        x = np.full(n, 1.0 / n) if x is None else x / x.sum()
+        for _ in range(max_iter):
+            x_next = alpha * (transition @ x + x[dangling].sum() / n) + (1 - alpha) / n
+            if np.abs(x_next - x).sum() < n * tol:
+                x = x_next
+                break
+            x = x_next
+        return dict(zip(node_order, (x / x.sum()).tolist()))
+    
+    # Warm-start helpers
+    def _warm_start_mapping(self, graph, previous: Dict[str, float]) -> Optional[Dict[str, float]]:
+        """Previous per-node scores restricted to live nodes, or None when nothing overlaps"""
+        if not previous:
+            return None
+        start = {node: previous[node] for node in graph.nodes() if node in previous}
+        if not start or sum(start.values()) <= 0:
+            return None
+        fill = sum(start.values()) / len(start)
+        return {node: start.get(node, fill) for node in graph.nodes()}
+    
+    def _warm_start_vector(self, node_order: List[str], previous: Dict[str, float]) -> Optional[np.ndarray]:
+        if not previous:
+            return None
+        v0 = np.array([previous.get(node, 0.0) for node in node_order], dtype=float)
+        if not np.any(v0):
+            return None
+        v0[v0 == 0.0] = v0[v0 != 0.0].mean()
+        return v0
+    
+    def _warm_start_partition(self, graph) -> Optional[Dict[str, int]]:
+        """Previous Louvain partition for live nodes; new nodes start in their own community"""
+        if not self._previous_partition:
+            return None
+        partition = {}
+        next_id = max(self._previous_partition.values(), default=-1) + 1
+        for node in graph.nodes():
+            if node in self._previous_partition:
+                partition[node] = self._previous_partition[node]
+            else:
+                partition[node] = next_id
+                next_id += 1
+        return partition
+    
     async def _analyze_temporal_coherence(self, communities: List[Set[str]]) -> List[TrendCluster]:
         """Analyze temporal coherence of communities"""
         
         print("⏰ Analyzing temporal coherence...")
         
         temporal_clusters = []
+        now = datetime.now()
+        fast = self.last_analysis_mode == 'fast'
+        if fast:
+            community_edges, internal_pairs = self._sparse_community_edges(communities)
         
         for i, community in enumerate(communities):
             # Extract timestamps from community nodes
             timestamps = []
             nodes = []
-            edges = []
             
             for node_id in community:
                 if self.trend_graph.has_node(node_id):
                     node_data = self.trend_graph.nodes[node_id]
-                    timestamps.append(node_data.get('timestamp', datetime.now()))
+                    timestamps.append(node_data.get('timestamp', now))
                     
                     # Create GraphNode object
                     graph_node = GraphNode(
                         node_id=node_id,
                         node_type=node_data.get('node_type', 'unknown'),
                         content=node_data.get('content', ''),
-                        timestamp=node_data.get('timestamp', datetime.now()),
+                        timestamp=node_data.get('timestamp', now),
                         features=node_data.get('features', {}),
                         influence_score=node_data.get('influence_score', 0.0)
                     )
                     nodes.append(graph_node)
             
             # Extract edges within community
-            for node1 in community:
-                for node2 in community:
-                    if self.trend_graph.has_edge(node1, node2):
-                        edge_data = self.trend_graph.edges[node1, node2]
-                        graph_edge = GraphEdge(
-                            source_id=node1,
-                            target_id=node2,
-                            edge_type=edge_data.get('edge_type', 'unknown'),
-                            weight=edge_data.get('weight', 1.0),
-                            timestamp=edge_data.get('timestamp', datetime.now())
-                        )
-                        edges.append(graph_edge)
+            if fast:
+                edges = community_edges[i]
+                max_edges = len(community) * (len(community) - 1)
+                network_density = internal_pairs[i] / max_edges if max_edges > 0 else 0.0
+            else:
+                edges = []
+                for node1 in community:
+                    if not self.trend_graph.has_node(node1):
+                        continue
+                    for node2, keyed_edges in self.trend_graph.adj[node1].items():
+                        if node2 not in community:
+                            continue
+                        for edge_data in keyed_edges.values():
+                            graph_edge = GraphEdge(
+                                source_id=node1,
+                                target_id=node2,
+                                edge_type=edge_data.get('edge_type', 'unknown'),
+                                weight=self.graph_store.effective_weight(edge_data.get('weight', 1.0)),
+                                timestamp=edge_data.get('timestamp', now)
+                            )
+                            edges.append(graph_edge)
+                network_density = self._calculate_network_density(community)
             
             # Calculate temporal coherence
             if len(timestamps) > 1:
@@ -385,7 +697,6 @@ class GroundbreakingGraphTrendDetector:
             
             # Calculate other metrics
             emergence_velocity = self._calculate_emergence_velocity(timestamps)
-            network_density = self._calculate_network_density(community)
             
             cluster = TrendCluster(
                 cluster_id=f"cluster_{i}",
@@ -396,13 +707,56 @@ class GroundbreakingGraphTrendDetector:
                 network_density=network_density,
                 influence_propagation=0.0,  # Will be calculated later
                 temporal_coherence=temporal_coherence,
-                cross_platform_reach=0.0  # Will be calculated later
+                cross_platform_reach=0.0,  # Will be calculated later
+                analysis_mode=self.last_analysis_mode
             )
             
             temporal_clusters.append(cluster)
         
         return temporal_clusters
     
+    def _sparse_community_edges(self, communities: List[Set[str]]) -> Tuple[List[List[GraphEdge]], np.ndarray]:
+        """Heaviest edges inside each community, and its count of connected node pairs, from the directed CSR.
+
+        Every stored edge is labelled by the communities of its endpoints in one vectorized pass.
+        Density uses all of them; only the ``fast_cluster_edge_limit`` heaviest node pairs per
+        community are looked up in the multigraph and turned into ``GraphEdge`` objects.
+        """
+        directed, node_order = self.graph_store.adjacency_matrix(directed=True)
+        position = {node: i for i, node in enumerate(node_order)}
+        labels = np.full(len(node_order), -1, dtype=np.int64)
+        for index, community in enumerate(communities):
+            labels[[position[node] for node in community if node in position]] = index
+        
+        sources = np.repeat(np.arange(len(node_order)), np.diff(directed.indptr))
+        targets = directed.indices
+        source_labels = labels[sources]
+        internal = np.flatnonzero((source_labels >= 0) & (source_labels == labels[targets]))
+        # Density counts distinct ordered pairs and ignores self-loops, like _calculate_network_density
+        internal_pairs = np.bincount(source_labels[internal[sources[internal] != targets[internal]]],
+                                     minlength=len(communities))
+        
+        # Rank each community's pairs by weight and keep the first fast_cluster_edge_limit
+        ordered = internal[np.lexsort((-directed.data[internal], source_labels[internal]))]
+        ordered_labels = source_labels[ordered]
+        group_start = np.searchsorted(ordered_labels, ordered_labels)
+        kept = ordered[np.arange(len(ordered)) - group_start < self.fast_cluster_edge_limit]
+        
+        now = datetime.now()
+        community_edges: List[List[GraphEdge]] = [[] for _ in communities]
+        for source, target, label in zip(sources[kept].tolist(), targets[kept].tolist(),
+                                         source_labels[kept].tolist()):
+            source_id, target_id = node_order[source], node_order[target]
+            for edge_data in self.trend_graph.adj[source_id][target_id].values():
+                community_edges[label].append(GraphEdge(
+                    source_id=source_id,
+                    target_id=target_id,
+                    edge_type=edge_data.get('edge_type', 'unknown'),
+                    weight=self.graph_store.effective_weight(edge_data.get('weight', 1.0)),
+                    timestamp=edge_data.get('timestamp', now)
+                ))
+        return community_edges, internal_pairs
+    
     async def _analyze_cross_platform_reach(self, clusters: List[TrendCluster]) -> List[TrendCluster]:
         """Analyze cross-platform reach of clusters"""
         
@@ -477,11 +831,14 @@ class GroundbreakingGraphTrendDetector:
             return f"author_{signal.metadata['author']}"
         return None
     
+    def _keyword_node_id(self, keyword: str) -> str:
+        return f"keyword_{hashlib.md5(keyword.encode()).hexdigest()[:8]}"
+    
     async def _create_signal_edges(self, signal, keyword_id: str, source_id: str, author_id: Optional[str]) -> None:
         """Create edges for a signal"""
         
         # Keyword -> Source edge
-        self.trend_graph.add_edge(
+        self.graph_store.add_edge(
             keyword_id, source_id,
             edge_type='mentioned_in',
             weight=1.0,
@@ -490,7 +847,7 @@ class GroundbreakingGraphTrendDetector:
         
         # Author -> Keyword edge (if author exists)
         if author_id:
-            self.trend_graph.add_edge(
+            self.graph_store.add_edge(
                 author_id, keyword_id,
                 edge_type='mentions',
                 weight=signal.engagement_score / 100.0,
@@ -500,50 +857,44 @@ class GroundbreakingGraphTrendDetector:
     async def _create_cooccurrence_edges(self, signals: List) -> None:
         """Create co-occurrence edges between keywords"""
         
-        # Group signals by content similarity
         for signal in signals:
             keywords = signal.keywords
             for i, keyword1 in enumerate(keywords):
                 for keyword2 in keywords[i+1:]:
-                    keyword1_id = f"keyword_{hashlib.md5(keyword1.encode()).hexdigest()[:8]}"
-                    keyword2_id = f"keyword_{hashlib.md5(keyword2.encode()).hexdigest()[:8]}"
-                    
-                    if self.trend_graph.has_edge(keyword1_id, keyword2_id):
-                        self.trend_graph[keyword1_id][keyword2_id]['weight'] += 1.0
-                    else:
-                        self.trend_graph.add_edge(
-                            keyword1_id, keyword2_id,
-                            edge_type='co_occurs',
-                            weight=1.0,
-                            timestamp=signal.timestamp
-                        )
-    
-    async def _create_similarity_edges(self) -> None:
-        """Create similarity edges between nodes"""
-        
-        # Simplified similarity based on content overlap
-        keyword_nodes = [node for node in self.trend_graph.nodes() 
-                        if self.trend_graph.nodes[node]['node_type'] == 'keyword']
-        
-        for i, node1 in enumerate(keyword_nodes):
-            for node2 in keyword_nodes[i+1:]:
-                content1 = self.trend_graph.nodes[node1]['content'].lower()
-                content2 = self.trend_graph.nodes[node2]['content'].lower()
-                
-                # Simple similarity based on common words
-                words1 = set(content1.split())
-                words2 = set(content2.split())
+                    self.graph_store.add_edge(
+                        self._keyword_node_id(keyword1), self._keyword_node_id(keyword2),
+                        edge_type='co_occurs',
+                        weight=1.0,
+                        timestamp=signal.timestamp
+                    )
+    
+    async def _create_similarity_edges(self, new_keyword_ids: Set[str]) -> None:
+        """Create similarity edges between newly added keywords and keywords sharing a word"""
+        
+        # Simplified similarity based on content overlap; only keywords sharing a word can match
+        for node1 in new_keyword_ids:
+            words1 = set(self.trend_graph.nodes[node1]['content'].lower().split())
+            if not words1:
+                continue
+            
+            candidates = set()
+            for word in words1:
+                candidates.update(self._keyword_word_index[word])
+                self._keyword_word_index[word].add(node1)
+            
+            for node2 in candidates:
+                if node2 == node1 or not self.trend_graph.has_node(node2):
+                    continue
+                words2 = set(self.trend_graph.nodes[node2]['content'].lower().split())
+                similarity = len(words1.intersection(words2)) / len(words1.union(words2))
                 
-                if words1 and words2:
-                    similarity = len(words1.intersection(words2)) / len(words1.union(words2))
-                    
-                    if similarity > 0.3:  # Threshold for similarity
-                        self.trend_graph.add_edge(
-                            node1, node2,
-                            edge_type='similar_to',
-                            weight=similarity,
-                            timestamp=datetime.now()
-                        )
+                if similarity > 0.3:  # Threshold for similarity
+                    self.graph_store.add_edge(
+                        node2, node1,
+                        edge_type='similar_to',
+                        weight=similarity,
+                        timestamp=datetime.now()
+                    )
     
     def _calculate_cascade_depth(self, node_id: str) -> int:
         """Calculate influence cascade depth from a node"""
@@ -570,22 +921,26 @@ class GroundbreakingGraphTrendDetector:
         except:
             return 0
     
+    def _sparse_cascade_depths(self, node_ids: List[str]) -> Dict[str, int]:
+        """Cascade depths for several nodes with one batched BFS over the directed graph"""
+        if not node_ids:
+            return {}
+        directed, node_order = self.graph_store.adjacency_matrix(directed=True)
+        position = {node: i for i, node in enumerate(node_order)}
+        distances = shortest_path(directed, method='D', unweighted=True, directed=True,
+                                  indices=[position[node] for node in node_ids])
+        distances[~np.isfinite(distances)] = 0
+        return {node: int(depth) for node, depth in zip(node_ids, distances.max(axis=1))}
+    
     def _calculate_emergence_velocity(self, timestamps: List[datetime]) -> float:
         """Calculate emergence velocity from timestamps"""
         if len(timestamps) < 2:
             return 0.0
         
-        # Sort timestamps
-        sorted_times = sorted(timestamps)
-        
-        # Calculate time differences
-        time_diffs = []
-        for i in range(1, len(sorted_times)):
-            diff = (sorted_times[i] - sorted_times[i-1]).total_seconds() / 3600  # hours
-            time_diffs.append(diff)
+        # Average gap between consecutive timestamps; the sorted gaps telescope to max - min
+        avg_diff = (max(timestamps) - min(timestamps)).total_seconds() / 3600 / (len(timestamps) - 1)  # hours
         
         # Velocity is inverse of average time difference
-        avg_diff = sum(time_diffs) / len(time_diffs)
         velocity = 1.0 / (1.0 + avg_diff)  # Normalize
         
         return velocity
@@ -595,12 +950,11 @@ class GroundbreakingGraphTrendDetector:
         if len(community) < 2:
             return 0.0
         
-        # Count edges within community
+        # Count directed node pairs connected within the community
         internal_edges = 0
         for node1 in community:
-            for node2 in community:
-                if node1 != node2 and self.trend_graph.has_edge(node1, node2):
-                    internal_edges += 1
+            if self.trend_graph.has_node(node1):
+                internal_edges += sum(1 for node2 in self.trend_graph.adj[node1] if node2 != node1 and node2 in community)
         
         # Maximum possible edges
         max_edges = len(community) * (len(community) - 1)
@@ -643,6 +997,7 @@ async def test_graph_trend_detection():
         print(f"   ⏰ Temporal Coherence: {cluster.temporal_coherence:.3f}")
         print(f"   🌐 Cross-Platform Reach: {cluster.cross_platform_reach:.3f}")
         print(f"   🔗 Nodes: {len(cluster.nodes)}, Edges: {len(cluster.edges)}")
+        print(f"   ⚙️ Analysis Mode: {cluster.analysis_mode}")
 
 if __name__ == "__main__":
     asyncio.run(test_graph_trend_detection()) 
\ No newline at end of file
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Incremental Trend Graph - Long-Lived Graph State for Trend Detection
+Ingests only new signals, decays edge weights over time, evicts stale nodes
+and keeps a CSR adjacency matrix in step with the networkx graph
+"""
+
+import hashlib
+import heapq
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix, diags
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalTrendGraph:
+    """Persistent multi-layer trend graph with time-decayed edge weights.
+
+    Edge weights are stored in "epoch units": a contribution ``w`` made at time ``t``
+    is stored as ``w * 2 ** ((t - epoch) / half_life)``. Decay is therefore uniform and
+    never requires touching existing edges; ``effective_weight`` converts back to the
+    present. The epoch is rebased only when stored values would grow too large.
+    """
+
+    def __init__(self, half_life_hours: float = 24.0, max_age_hours: float = 168.0,
+                 rebase_half_lives: float = 30.0):
+        self.graph = nx.MultiDiGraph()
+        self.simple_graph = nx.Graph()  # undirected aggregate used by embedding/community algorithms
+
+        self.half_life_seconds = half_life_hours * 3600
+        self.max_age_seconds = max_age_hours * 3600
+        self.rebase_half_lives = rebase_half_lives
+
+        self._epoch: Optional[float] = None
+        self.now: Optional[float] = None
+
+        # Stable row index per node for the directed CSR adjacency matrix
+        self._node_index: Dict[str, int] = {}
+        self._index_node: List[Optional[str]] = []
+        self._free_rows: List[int] = []
+        self._csr = csr_matrix((0, 0))
+        self._pending_rows: List[int] = []
+        self._pending_cols: List[int] = []
+        self._pending_vals: List[float] = []
+        self._adjacency_cache: Dict[bool, Tuple[int, csr_matrix, List[str]]] = {}
+
+        # Lazy-deletion heap of (last_seen, node_id) for eviction
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+        # Fingerprints of signals already ingested, pruned at the same horizon as nodes
+        self._seen_signals: Dict[str, float] = {}
+        self._seen_order: deque = deque()
+
+        # Bumped on every mutation so callers can reuse results for an unchanged graph
+        self.version = 0
+        self.stats = {
+            'signals_ingested': 0,
+            'signals_skipped': 0,
+            'nodes_evicted': 0,
+            'rebases': 0
+        }
+
+    # Time handling
+    @staticmethod
+    def _to_seconds(timestamp) -> float:
+        if isinstance(timestamp, datetime):
+            return timestamp.timestamp()
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
+        if isinstance(timestamp, str):
+            try:
+                return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+            except ValueError:
+                logger.warning(f"⚠️ Unparseable signal timestamp {timestamp!r}, using current time")
+        return datetime.now().timestamp()
+
+    def advance_clock(self, timestamp) -> float:
+        """Move the graph clock forward to ``timestamp`` (never backwards)"""
+        seconds = self._to_seconds(timestamp)
+        if self._epoch is None:
+            self._epoch = seconds
+        if self.now is None or seconds > self.now:
+            self.now = seconds
+            if (self.now - self._epoch) / self.half_life_seconds > self.rebase_half_lives:
+                self._rebase(self.now)
+            self.version += 1  # effective weights changed
+        return seconds
+
+    def _time_weight(self, seconds: float) -> float:
+        return 2.0 ** ((seconds - self._epoch) / self.half_life_seconds)
+
+    def effective_weight(self, stored_weight: float) -> float:
+        """Convert a stored edge weight into its decayed value at the current clock"""
+        if self._epoch is None or self.now is None:
+            return stored_weight
+        return stored_weight * 2.0 ** (-(self.now - self._epoch) / self.half_life_seconds)
+
+    def _rebase(self, new_epoch: float) -> None:
+        """Shift the epoch forward, rescaling every stored weight once"""
+        factor = 2.0 ** (-(new_epoch - self._epoch) / self.half_life_seconds)
+        for _, _, data in self.graph.edges(data=True):
+            data['weight'] *= factor
+        for _, _, data in self.simple_graph.edges(data=True):
+            data['weight'] *= factor
+        self._fold_pending()
+        self._csr = self._csr * factor
+        self._epoch = new_epoch
+        self.stats['rebases'] += 1
+
+    # Signal bookkeeping
+    @staticmethod
+    def signal_fingerprint(signal) -> str:
+        timestamp = getattr(signal, 'timestamp', '')
+        raw = f"{getattr(signal, 'source', '')}|{getattr(signal, 'url', '')}|{getattr(signal, 'content', '')[:200]}|{timestamp}"
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def select_new_signals(self, signals: Iterable) -> List:
+        """Return only signals not ingested before and still inside the retention horizon"""
+        new_signals = []
+        for signal in signals:
+            seconds = self._to_seconds(getattr(signal, 'timestamp', None))
+            if self.now is not None and seconds < self.now - self.max_age_seconds:
+                self.stats['signals_skipped'] += 1
+                continue
+            fingerprint = self.signal_fingerprint(signal)
+            if fingerprint in self._seen_signals:
+                self.stats['signals_skipped'] += 1
+                continue
+            self._seen_signals[fingerprint] = seconds
+            self._seen_order.append((seconds, fingerprint))
+            new_signals.append(signal)
+        self.stats['signals_ingested'] += len(new_signals)
+        return new_signals
+
+    # Mutation
+    def upsert_node(self, node_id: str, timestamp, attributes: Dict) -> Tuple[Dict, bool]:
+        """Create the node with ``attributes`` if missing and mark it seen at ``timestamp``.
+
+        Returns the live node data dict and whether the node was created.
+        """
+        seconds = self.advance_clock(timestamp)
+        created = not self.graph.has_node(node_id)
+        if created:
+            self.graph.add_node(node_id, **attributes)
+            self.simple_graph.add_node(node_id)
+            self._assign_row(node_id)
+        node_data = self.graph.nodes[node_id]
+        if seconds > node_data.get('last_seen', float('-inf')):
+            node_data['last_seen'] = seconds
+            heapq.heappush(self._expiry_heap, (seconds, node_id))
+        self.version += 1
+        return node_data, created
+
+    def add_edge(self, source_id: str, target_id: str, edge_type: str, weight: float, timestamp, **attributes) -> None:
+        """Add decayed ``weight`` to the (source, target, edge_type) edge, creating it if needed"""
+        seconds = self.advance_clock(timestamp)
+        stored = weight * self._time_weight(seconds)
+
+        edge_data = self.graph.get_edge_data(source_id, target_id, key=edge_type)
+        if edge_data is None:
+            self.graph.add_edge(source_id, target_id, key=edge_type, edge_type=edge_type,
+                                weight=stored, timestamp=timestamp, **attributes)
+        else:
+            edge_data['weight'] += stored
+            edge_data['timestamp'] = timestamp
+
+        if self.simple_graph.has_edge(source_id, target_id):
+            self.simple_graph[source_id][target_id]['weight'] += stored
+        else:
+            self.simple_graph.add_edge(source_id, target_id, weight=stored)
+
+        self._pending_rows.append(self._node_index[source_id])
+        self._pending_cols.append(self._node_index[target_id])
+        self._pending_vals.append(stored)
+        self.version += 1
+
+    def evict_stale(self) -> List[Tuple[str, Dict]]:
+        """Remove nodes not seen within ``max_age_hours`` of the graph clock"""
+        if self.now is None:
+            return []
+        cutoff = self.now - self.max_age_seconds
+        evicted = []
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+            seen, node_id = heapq.heappop(self._expiry_heap)
+            if not self.graph.has_node(node_id):
+                continue
+            if self.graph.nodes[node_id].get('last_seen', seen) > seen:
+                continue  # stale heap entry, node was touched again later
+            evicted.append((node_id, dict(self.graph.nodes[node_id])))
+
+        while self._seen_order and self._seen_order[0][0] < cutoff:
+            _, fingerprint = self._seen_order.popleft()
+            self._seen_signals.pop(fingerprint, None)
+
+        if evicted:
+            self._fold_pending()
+            keep = np.ones(self._csr.shape[0])
+            for node_id, _ in evicted:
+                row = self._node_index.pop(node_id)
+                keep[row] = 0.0
+                self._index_node[row] = None
+                self._free_rows.append(row)
+                self.graph.remove_node(node_id)
+                self.simple_graph.remove_node(node_id)
+            mask = diags(keep)
+            self._csr = (mask @ self._csr @ mask).tocsr()
+            self._csr.eliminate_zeros()
+            self.stats['nodes_evicted'] += len(evicted)
+            self.version += 1
+
+        if len(self._expiry_heap) > 4 * max(self.graph.number_of_nodes(), 1024):
+            self._expiry_heap = [(data['last_seen'], node) for node, data in self.graph.nodes(data=True)]
+            heapq.heapify(self._expiry_heap)
+
+        return evicted
+
+    # CSR adjacency
+    def _assign_row(self, node_id: str) -> None:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._index_node[row] = node_id
+        else:
+            row = len(self._index_node)
+            self._index_node.append(node_id)
+        self._node_index[node_id] = row
+
+    def _fold_pending(self) -> None:
+        capacity = len(self._index_node)
+        if self._csr.shape[0] < capacity:
+            self._csr.resize((capacity, capacity))
+        if self._pending_vals:
+            delta = coo_matrix(
+                (self._pending_vals, (self._pending_rows, self._pending_cols)),
+                shape=(capacity, capacity)
+            ).tocsr()
+            self._csr = (self._csr + delta).tocsr()
+            self._pending_rows, self._pending_cols, self._pending_vals = [], [], []
+
+    def adjacency_matrix(self, directed: bool = False) -> Tuple[csr_matrix, List[str]]:
+        """CSR adjacency of live nodes (effective weights) and the node order of its rows.
+
+        The undirected form sums both directions, matching ``simple_graph`` edge weights.
+        """
+        cached = self._adjacency_cache.get(directed)
+        if cached and cached[0] == self.version:
+            return cached[1], cached[2]
+        self._fold_pending()
+        rows = np.array([row for row, node in enumerate(self._index_node) if node is not None], dtype=np.int64)
+        nodes = [self._index_node[row] for row in rows]
+        if len(rows) == 0:
+            return csr_matrix((0, 0)), nodes
+        matrix = self._csr[rows][:, rows]
+        if not directed:
+            matrix = (matrix + matrix.T - diags(matrix.diagonal())).tocsr()
+        matrix = self.effective_weight(1.0) * matrix
+        self._adjacency_cache[directed] = (self.version, matrix, nodes)
+        return matrix, nodes
+
+    def get_status(self) -> Dict:
+        return {
+            'nodes': self.graph.number_of_nodes(),
+            'edges': self.graph.number_of_edges(),
+            'version': self.version,
+            **self.stats
+        }
@@ -339,11 +339,15 @@ class SemanticTrendIntegrationEngine:
                     'engagement_score': signal.engagement_score,
                     'sentiment_score': signal.sentiment_score,
                     'credibility_weight': signal.credibility_weight,
-                    'source': signal.source
+                    'source': signal.source,
+                    'url': signal.url,
+                    'keywords': signal.keywords
                 })
             
-            # Analyze temporal patterns
-            patterns = await self.temporal_engine.analyze_temporal_patterns(signal_data)
+            # Analyze temporal patterns (the opportunity's series accumulates across detection runs)
+            patterns = await self.temporal_engine.analyze_temporal_patterns(
+                signal_data, series_key=f"opportunity:{opportunity.title.lower()}"
+            )
             
             # Generate emergence signals
             emergence_signals = await self.temporal_engine.generate_emergence_signals(patterns)
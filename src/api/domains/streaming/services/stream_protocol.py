@@ -0,0 +1,196 @@
+"""
+Luciq Streaming: Negotiated Stream Protocol
+Opt-in framing for dashboard WebSocket clients - batched frames, delta snapshots and binary encoding
+"""
+
+import json
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+SUPPORTED_ENCODINGS = ('json', 'msgpack')
+
+
+def _serializable(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def compute_delta(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON merge patch (RFC 7386) turning ``previous`` into ``current``; removed keys map to None"""
+
+    patch = {}
+    for key, value in current.items():
+        if key not in previous:
+            patch[key] = value
+            continue
+        old = previous[key]
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = compute_delta(old, value)
+            if nested:
+                patch[key] = nested
+        elif value != old:
+            patch[key] = value
+    for key in previous:
+        if key not in current:
+            patch[key] = None
+    return patch
+
+
+def apply_delta(snapshot: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a merge patch produced by ``compute_delta`` - the client-side half of the protocol"""
+
+    result = dict(snapshot)
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = apply_delta(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+class StreamProtocol:
+    """
+    Per-client framing negotiated when a dashboard subscribes
+
+    - batch: updates are collected for ``flush_interval`` seconds and sent as one frame
+    - delta: each snapshot stream's snapshot is sent as a merge patch against the last snapshot the
+      client acknowledged (``{"type": "ack", "seq": N}`` acknowledges every seq <= N);
+      until the first ack, or when a patch would rewrite every key, the full snapshot is sent
+    - encoding: 'json' text frames or 'msgpack' binary frames
+
+    Skipping and deltas only apply to snapshot streams (``prepare``, e.g. pipeline status):
+    a snapshot identical to the last one sent on its stream is skipped entirely. Events
+    (``event``, e.g. fusion results, trend updates, alerts) are always forwarded in full.
+    """
+
+    def __init__(self, batch: bool = False, flush_interval: float = 0.25, delta: bool = False,
+                 encoding: str = 'json', max_batch_size: int = 100, max_unacked: int = 32):
+        self.batch = batch
+        self.flush_interval = flush_interval
+        self.delta = delta
+        self.encoding = encoding
+        self.max_batch_size = max_batch_size
+
+        self.seq = 0
+        self.acked_seq = 0
+        self._acked: Dict[str, Any] = {}  # stream -> (seq, snapshot) the client holds
+        self._last_sent: Dict[str, Any] = {}  # stream -> snapshot
+        self._unacked: deque = deque(maxlen=max_unacked)  # (seq, stream, snapshot)
+
+        self.stats = {'frames': 0, 'full_snapshots': 0, 'deltas': 0, 'unchanged_skipped': 0, 'events': 0}
+
+    @classmethod
+    def negotiate(cls, options: Optional[Dict[str, Any]]) -> Optional['StreamProtocol']:
+        """Build a protocol from a subscribe request's ``protocol`` options (None keeps legacy frames)"""
+
+        if not options:
+            return None
+
+        encoding = str(options.get('encoding', 'json')).lower()
+        if encoding not in SUPPORTED_ENCODINGS:
+            encoding = 'json'
+        if encoding == 'msgpack' and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack requested but not installed - falling back to JSON frames")
+            encoding = 'json'
+
+        try:
+            flush_interval = min(max(float(options.get('flush_interval', 0.25)), 0.01), 5.0)
+        except (TypeError, ValueError):
+            flush_interval = 0.25
+
+        return cls(
+            batch=bool(options.get('batch', False)),
+            flush_interval=flush_interval,
+            delta=bool(options.get('delta', False)),
+            encoding=encoding
+        )
+
+    @property
+    def binary(self) -> bool:
+        return self.encoding == 'msgpack'
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'batch': self.batch,
+            'flush_interval': self.flush_interval,
+            'delta': self.delta,
+            'encoding': self.encoding
+        }
+
+    def prepare(self, stream: str, snapshot: Dict[str, Any], envelope: Optional[Dict[str, Any]] = None
+                ) -> Optional[Dict[str, Any]]:
+        """Turn one snapshot into a protocol message, or None if the client already has it"""
+
+        if self._last_sent.get(stream) == snapshot:
+            self.stats['unchanged_skipped'] += 1
+            return None
+
+        self.seq += 1
+        message = dict(envelope or {})
+        message['stream'] = stream
+        message['seq'] = self.seq
+
+        base = self._acked.get(stream) if self.delta else None
+        patch = compute_delta(base[1], snapshot) if base is not None else None
+        if patch is not None and len(patch) < max(len(snapshot), 1):
+            message['base_seq'] = base[0]
+            message['delta'] = patch
+            self.stats['deltas'] += 1
+        else:
+            message['data'] = snapshot
+            self.stats['full_snapshots'] += 1
+
+        self._last_sent[stream] = snapshot
+        if self.delta:
+            self._unacked.append((self.seq, stream, snapshot))
+        return message
+
+    def event(self, stream: str, data: Dict[str, Any], envelope: Optional[Dict[str, Any]] = None
+              ) -> Dict[str, Any]:
+        """Turn one event into a protocol message - never skipped or sent as a delta"""
+
+        self.seq += 1
+        message = dict(envelope or {})
+        message['stream'] = stream
+        message['seq'] = self.seq
+        message['data'] = data
+        self.stats['events'] += 1
+        return message
+
+    def acknowledge(self, seq: int) -> None:
+        """Client confirmed it applied every message up to ``seq``"""
+
+        if seq <= self.acked_seq:
+            return
+        self.acked_seq = seq
+        while self._unacked and self._unacked[0][0] <= seq:
+            acked_seq, stream, snapshot = self._unacked.popleft()
+            self._acked[stream] = (acked_seq, snapshot)
+
+    def frame(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Wrap prepared messages in a single (batch) frame"""
+
+        self.stats['frames'] += 1
+        if len(messages) == 1 and not self.batch:
+            return messages[0]
+        return {'type': 'batch', 'count': len(messages), 'messages': messages}
+
+    def encode(self, payload: Dict[str, Any]) -> Union[str, bytes]:
+        if self.binary:
+            return msgpack.packb(payload, default=_serializable, use_bin_type=True)
+        return json.dumps(payload, default=_serializable, separators=(',', ':'))
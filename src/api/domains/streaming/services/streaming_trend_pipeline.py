@@ -11,7 +11,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Callable, AsyncGenerator
 import logging
 from dataclasses import dataclass, field
-from collections import deque, defaultdict
+from collections import deque, Counter
+from itertools import islice
 import numpy as np
 from enum import Enum
 import hashlib
@@ -20,6 +21,8 @@ from concurrent.futures import ThreadPoolExecutor
 import threading
 from queue import Queue, Empty
 
+from .stream_protocol import StreamProtocol
+
 logger = logging.getLogger(__name__)
 
 class EventType(Enum):
@@ -42,12 +45,120 @@ class StreamEvent:
     confidence: float = 0.0
     metadata: Dict = field(default_factory=dict)
 
+class WindowAggregates:
+    """Incrementally maintained aggregates for a sliding window.
+
+    Counters are updated when an event enters or leaves the window, so reading the
+    statistics costs O(changes since last read) instead of a rescan of every event.
+    Keywords are also grouped into count buckets kept in a doubly linked list ordered by
+    count; a keyword only ever moves to the neighbouring bucket, so every add/remove is
+    O(1) per keyword and top-k reads walk at most k keywords from the highest bucket.
+    """
+    
+    def __init__(self, top_k: int = 10):
+        self.top_k = top_k
+        self.event_count = 0
+        self.engagement_sum = 0.0
+        self.source_counts = Counter()
+        self.keyword_counts = Counter()
+        # count -> keywords with that count; 0 and None are the list's bottom and top sentinels
+        self._buckets: Dict[int, Dict[str, None]] = {}
+        self._lower: Dict[Optional[int], int] = {None: 0}
+        self._higher: Dict[int, Optional[int]] = {0: None}
+        self._top_keywords: List = []
+        self._keywords_dirty = False
+    
+    def add(self, event: 'StreamEvent') -> None:
+        """Account for an event entering the window"""
+        self.event_count += 1
+        self.engagement_sum += event.data.get('engagement', 0) or 0
+        self.source_counts[event.data.get('source', '')] += 1
+        if event.event_type == EventType.SIGNAL_RECEIVED:
+            keywords = event.data.get('keywords', [])
+            for keyword in keywords:
+                self._move_keyword(keyword, 1)
+            if keywords:
+                self._keywords_dirty = True
+    
+    def remove(self, event: 'StreamEvent') -> None:
+        """Account for an event being evicted from the window"""
+        self.event_count -= 1
+        self.engagement_sum -= event.data.get('engagement', 0) or 0
+        self._decrement(self.source_counts, event.data.get('source', ''))
+        if event.event_type == EventType.SIGNAL_RECEIVED:
+            keywords = event.data.get('keywords', [])
+            for keyword in keywords:
+                if keyword in self.keyword_counts:
+                    self._move_keyword(keyword, -1)
+            if keywords:
+                self._keywords_dirty = True
+    
+    @staticmethod
+    def _decrement(counter: Counter, key) -> None:
+        remaining = counter[key] - 1
+        if remaining > 0:
+            counter[key] = remaining
+        else:
+            del counter[key]
+    
+    def _move_keyword(self, keyword: str, delta: int) -> None:
+        """Shift ``keyword`` by +1/-1 into the neighbouring count bucket"""
+        old = self.keyword_counts.get(keyword, 0)
+        new = old + delta
+        if new > 0:
+            if new not in self._buckets:
+                # The new bucket sits directly above (or below) the keyword's current one
+                lower, higher = (old, self._higher[old]) if delta > 0 else (self._lower[old], old)
+                self._buckets[new] = {}
+                self._lower[new], self._higher[new] = lower, higher
+                self._higher[lower] = new
+                self._lower[higher] = new
+            self._buckets[new][keyword] = None
+            self.keyword_counts[keyword] = new
+        else:
+            del self.keyword_counts[keyword]
+        if old > 0:
+            bucket = self._buckets[old]
+            del bucket[keyword]
+            if not bucket:
+                del self._buckets[old]
+                lower, higher = self._lower.pop(old), self._higher.pop(old)
+                self._higher[lower] = higher
+                self._lower[higher] = lower
+    
+    def top_keywords(self) -> List:
+        """Top-k (keyword, count) pairs, most frequent first"""
+        if self._keywords_dirty:
+            top = []
+            count = self._lower[None]
+            while count and len(top) < self.top_k:
+                for keyword in self._buckets[count]:
+                    top.append((keyword, count))
+                    if len(top) == self.top_k:
+                        break
+                count = self._lower[count]
+            self._top_keywords = top
+            self._keywords_dirty = False
+        return self._top_keywords
+    
+    def snapshot(self, size_seconds: int) -> Dict:
+        """Window statistics in the shape consumers of ``StreamingWindow.statistics`` expect"""
+        return {
+            'event_count': self.event_count,
+            'events_per_second': self.event_count / size_seconds,
+            'unique_sources': len(self.source_counts),
+            'avg_engagement': self.engagement_sum / self.event_count if self.event_count else 0.0,
+            'total_engagement': self.engagement_sum,
+            'top_keywords': list(self.top_keywords())
+        }
+
 @dataclass
 class StreamingWindow:
     """Sliding window for streaming analysis"""
     window_id: str
     size_seconds: int
     events: deque = field(default_factory=deque)
+    aggregates: WindowAggregates = field(default_factory=WindowAggregates)
     statistics: Dict = field(default_factory=dict)
     patterns: List = field(default_factory=list)
     last_updated: datetime = field(default_factory=datetime.now)
@@ -103,6 +214,7 @@ class GroundbreakingStreamingPipeline:
         
         # WebSocket connections for real-time updates
         self.websocket_clients = set()
+        self.client_protocols: Dict[object, StreamProtocol] = {}  # opt-in delta/binary clients
         
         # Thread pool for CPU-intensive tasks
         self.thread_pool = ThreadPoolExecutor(max_workers=4)
@@ -298,8 +410,7 @@ class GroundbreakingStreamingPipeline:
             try:
                 if self.websocket_clients:
                     # Prepare real-time update
-                    update = {
-                        'timestamp': datetime.now().isoformat(),
+                    snapshot = {
                         'statistics': self.real_time_stats.copy(),
                         'active_windows': {
                             name: {
@@ -309,17 +420,31 @@ class GroundbreakingStreamingPipeline:
                             for name, window in self.windows.items()
                         }
                     }
+                    timestamp = datetime.now().isoformat()
+                    legacy_frame = None
                     
                     # Broadcast to all clients
                     disconnected_clients = set()
                     for client in self.websocket_clients:
                         try:
-                            await client.send(json.dumps(update))
+                            protocol = self.client_protocols.get(client)
+                            if protocol is None:
+                                # Legacy clients share one full-snapshot frame
+                                if legacy_frame is None:
+                                    legacy_frame = json.dumps({'timestamp': timestamp, **snapshot})
+                                await client.send(legacy_frame)
+                                continue
+                            
+                            update = protocol.prepare('pipeline_status', snapshot, {'timestamp': timestamp})
+                            if update is not None:
+                                await client.send(protocol.encode(protocol.frame([update])))
                         except websockets.exceptions.ConnectionClosed:
                             disconnected_clients.add(client)
                     
                     # Remove disconnected clients
                     self.websocket_clients -= disconnected_clients
+                    for client in disconnected_clients:
+                        self.client_protocols.pop(client, None)
                 
                 await asyncio.sleep(1)  # Broadcast every second
                 
@@ -390,9 +515,11 @@ class GroundbreakingStreamingPipeline:
     async def _add_to_windows(self, event: StreamEvent) -> None:
         """Add event to appropriate sliding windows"""
         
+        now = datetime.now()
         for window in self.windows.values():
             window.events.append(event)
-            window.last_updated = datetime.now()
+            window.aggregates.add(event)
+            window.last_updated = now
     
     async def _clean_window(self, window: StreamingWindow) -> None:
         """Remove old events from window"""
@@ -400,36 +527,15 @@ class GroundbreakingStreamingPipeline:
         cutoff_time = datetime.now() - timedelta(seconds=window.size_seconds)
         
         while window.events and window.events[0].timestamp < cutoff_time:
-            window.events.popleft()
+            window.aggregates.remove(window.events.popleft())
     
     async def _update_window_statistics(self, window: StreamingWindow) -> None:
-        """Update window statistics"""
+        """Update window statistics from the incrementally maintained aggregates"""
         
         if not window.events:
             return
         
-        # Basic statistics
-        window.statistics = {
-            'event_count': len(window.events),
-            'events_per_second': len(window.events) / window.size_seconds,
-            'unique_sources': len(set(event.data.get('source', '') for event in window.events)),
-            'avg_engagement': np.mean([event.data.get('engagement', 0) for event in window.events]),
-            'total_engagement': sum(event.data.get('engagement', 0) for event in window.events)
-        }
-        
-        # Keyword frequency
-        keyword_freq = defaultdict(int)
-        for event in window.events:
-            if event.event_type == EventType.SIGNAL_RECEIVED:
-                keywords = event.data.get('keywords', [])
-                for keyword in keywords:
-                    keyword_freq[keyword] += 1
-        
-        window.statistics['top_keywords'] = sorted(
-            keyword_freq.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:10]
+        window.statistics = window.aggregates.snapshot(window.size_seconds)
     
     # Pattern Detection Implementation
     async def _detect_cross_window_patterns(self) -> List[TrendPattern]:
@@ -498,7 +604,7 @@ class GroundbreakingStreamingPipeline:
         
         if len(window.events) > 10:
             # Check for exponential growth in engagement
-            recent_events = list(window.events)[-10:]
+            recent_events = list(islice(reversed(window.events), 10))[::-1]
             engagements = [event.data.get('engagement', 0) for event in recent_events]
             
             if len(engagements) > 3:
@@ -669,13 +775,27 @@ class GroundbreakingStreamingPipeline:
         self.event_handlers[event_type].append(handler)
     
     # WebSocket Support
-    async def add_websocket_client(self, websocket) -> None:
-        """Add WebSocket client for real-time updates"""
+    async def add_websocket_client(self, websocket, protocol: Optional[Dict] = None) -> None:
+        """Add WebSocket client for real-time updates
+        
+        ``protocol`` opts the client into StreamProtocol framing (delta against the last
+        acknowledged status, msgpack encoding); unchanged status is then not resent.
+        """
         self.websocket_clients.add(websocket)
+        negotiated = StreamProtocol.negotiate(protocol)
+        if negotiated is not None:
+            self.client_protocols[websocket] = negotiated
+    
+    def acknowledge_websocket_update(self, websocket, seq: int) -> None:
+        """Record the last status update a delta client has applied"""
+        protocol = self.client_protocols.get(websocket)
+        if protocol is not None:
+            protocol.acknowledge(seq)
     
     async def remove_websocket_client(self, websocket) -> None:
         """Remove WebSocket client"""
         self.websocket_clients.discard(websocket)
+        self.client_protocols.pop(websocket, None)
     
     # Utility Methods
     def _generate_event_id(self) -> str:
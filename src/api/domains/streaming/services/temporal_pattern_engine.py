@@ -12,7 +12,7 @@ import pandas as pd
 from datetime import datetime, timedelta, time
 from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
+from collections import defaultdict, deque, OrderedDict
 import statistics
 
 # Time series analysis libraries
@@ -31,6 +31,167 @@ import seaborn as sns
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+_HOUR = timedelta(hours=1)
+
+
+def hour_of(timestamp: datetime) -> int:
+    """Absolute wall-clock hour number of a timestamp (aware timestamps are converted to local time)"""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _HOUR
+
+
+@dataclass
+class SeriesWindow:
+    """Hourly buckets of one series, trimmed to the first and last non-empty hour"""
+    first_hour: int
+    signal_strength: np.ndarray
+    engagement: np.ndarray
+    sentiment: np.ndarray
+    signal_count: np.ndarray
+
+    @property
+    def last_hour(self) -> int:
+        return self.first_hour + len(self.signal_count) - 1
+
+
+class HourlySeries:
+    """Ring buffer of hourly signal buckets covering the most recent ``capacity_hours``.
+
+    Buckets hold sums (strength, engagement, sentiment) and counts, so ingesting a signal is
+    an O(1) update and means are derived on read. ``version`` changes whenever a bucket does,
+    which lets callers skip recomputation for series that have not moved. Fingerprints of
+    ingested signals are remembered for the span of the buffer so re-submitted signals are
+    not counted twice.
+    """
+
+    def __init__(self, capacity_hours: int = 720):
+        self.capacity = capacity_hours
+        self.strength = np.zeros(capacity_hours)
+        self.engagement = np.zeros(capacity_hours)
+        self.sentiment = np.zeros(capacity_hours)
+        self.count = np.zeros(capacity_hours, dtype=np.int64)
+        self.head_hour: Optional[int] = None
+        self.version = 0
+        self._seen: Dict[int, int] = {}  # fingerprint -> hour
+        self._pruned_hour: Optional[int] = None
+
+    def add_many(self, hours: np.ndarray, strength: np.ndarray, engagement: np.ndarray,
+                 sentiment: np.ndarray, fingerprints: Optional[List[int]] = None) -> int:
+        """Add signals to their hourly buckets; returns how many were new"""
+        hours = np.asarray(hours, dtype=np.int64)
+        strength, engagement, sentiment = np.asarray(strength), np.asarray(engagement), np.asarray(sentiment)
+        if fingerprints is not None:
+            keep = np.zeros(len(hours), dtype=bool)
+            for i, fingerprint in enumerate(fingerprints):
+                if fingerprint not in self._seen:
+                    self._seen[fingerprint] = int(hours[i])
+                    keep[i] = True
+            hours = hours[keep]
+            strength, engagement, sentiment = strength[keep], engagement[keep], sentiment[keep]
+        if not len(hours):
+            return 0
+
+        newest = int(hours.max())
+        if self.head_hour is None:
+            self.head_hour = newest
+            self._pruned_hour = newest
+        elif newest > self.head_hour:
+            self._advance(newest)
+
+        live = hours > self.head_hour - self.capacity
+        if not live.all():
+            hours = hours[live]
+            strength, engagement, sentiment = strength[live], engagement[live], sentiment[live]
+        if not len(hours):
+            return 0
+
+        slots = hours % self.capacity
+        np.add.at(self.strength, slots, strength)
+        np.add.at(self.engagement, slots, engagement)
+        np.add.at(self.sentiment, slots, sentiment)
+        np.add.at(self.count, slots, 1)
+        self.version += 1
+        return len(hours)
+
+    def _advance(self, hour: int):
+        """Move the head to ``hour``, clearing the buckets that fall out of the buffer"""
+        gap = hour - self.head_hour
+        if gap >= self.capacity:
+            cleared = slice(None)
+        else:
+            cleared = np.arange(self.head_hour + 1, hour + 1) % self.capacity
+        for buckets in (self.strength, self.engagement, self.sentiment, self.count):
+            buckets[cleared] = 0
+        self.head_hour = hour
+
+        # Forget fingerprints that can no longer be re-added, at most once a day
+        if hour - self._pruned_hour >= 24:
+            oldest = hour - self.capacity
+            self._seen = {fp: h for fp, h in self._seen.items() if h > oldest}
+            self._pruned_hour = hour
+
+    def window(self, start_hour: int) -> Optional[SeriesWindow]:
+        """Buckets from ``start_hour`` to the head, or None if none of them hold signals"""
+        if self.head_hour is None:
+            return None
+        start_hour = max(start_hour, self.head_hour - self.capacity + 1)
+        if start_hour > self.head_hour:
+            return None
+
+        slots = np.arange(start_hour, self.head_hour + 1) % self.capacity
+        counts = self.count[slots]
+        occupied = np.flatnonzero(counts)
+        if not len(occupied):
+            return None
+        slots = slots[occupied[0]:occupied[-1] + 1]
+        counts = counts[occupied[0]:occupied[-1] + 1]
+
+        divisor = np.maximum(counts, 1)
+        return SeriesWindow(
+            first_hour=start_hour + int(occupied[0]),
+            signal_strength=self.strength[slots].copy(),
+            engagement=self.engagement[slots] / divisor,
+            sentiment=self.sentiment[slots] / divisor,
+            signal_count=counts.copy()
+        )
+
+
+class HourlySeriesStore:
+    """Persistent hourly series keyed by name (e.g. ``opportunity:<title>``).
+
+    The least recently updated series is dropped once ``max_series`` is exceeded.
+    """
+
+    def __init__(self, capacity_hours: int = 720, max_series: int = 5000):
+        self.capacity_hours = capacity_hours
+        self.max_series = max_series
+        self._series: "OrderedDict[str, HourlySeries]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[HourlySeries]:
+        return self._series.get(key)
+
+    def ingest(self, key: str, hours: np.ndarray, strength: np.ndarray, engagement: np.ndarray,
+               sentiment: np.ndarray, fingerprints: Optional[List[int]] = None) -> int:
+        series = self._series.get(key)
+        if series is None:
+            series = HourlySeries(self.capacity_hours)
+            self._series[key] = series
+            if len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+        added = series.add_many(hours, strength, engagement, sentiment, fingerprints)
+        if added:
+            self._series.move_to_end(key)
+        return added
+
+    def keys(self, prefix: str = "") -> List[str]:
+        return [key for key in self._series if key.startswith(prefix)]
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+
 @dataclass
 class TemporalPattern:
     """Detected temporal pattern in trend signals"""
@@ -100,6 +261,13 @@ class AdvancedTemporalPatternEngine:
         self.signal_history = defaultdict(deque)
         self.pattern_history = defaultdict(list)
         
+        # Pre-aggregated hourly buckets, and the patterns last detected for each series
+        self.series_store = HourlySeriesStore(
+            capacity_hours=self.config['series_store']['capacity_hours'],
+            max_series=self.config['series_store']['max_series']
+        )
+        self._series_patterns: "OrderedDict[Tuple[str, int], Tuple[Tuple, List[TemporalPattern]]]" = OrderedDict()
+        
         # Pattern templates and learned behaviors
         self._initialize_pattern_templates()
         
@@ -108,7 +276,10 @@ class AdvancedTemporalPatternEngine:
             'patterns_detected': 0,
             'emergence_signals_generated': 0,
             'prediction_accuracy': 0.0,
-            'avg_processing_time': 0.0
+            'avg_processing_time': 0.0,
+            'signals_ingested': 0,
+            'series_analyses': 0,
+            'series_cache_hits': 0
         }
         
         self.logger.info("✅ Advanced Temporal Pattern Engine initialized successfully")
@@ -141,7 +312,13 @@ class AdvancedTemporalPatternEngine:
             
             # Pattern matching
             'similarity_threshold': 0.7,
-            'pattern_memory_limit': 1000
+            'pattern_memory_limit': 1000,
+            
+            # Hourly bucket store
+            'series_store': {
+                'capacity_hours': 720,  # 30 days
+                'max_series': 5000
+            }
         }
     
     def _initialize_pattern_templates(self):
@@ -180,70 +357,105 @@ class AdvancedTemporalPatternEngine:
             }
         }
     
-    async def analyze_temporal_patterns(self, signals: List[Dict], timeframe_hours: int = 168) -> List[TemporalPattern]:
+    async def analyze_temporal_patterns(self, signals: List[Dict], timeframe_hours: int = 168,
+                                        series_key: Optional[str] = None) -> List[TemporalPattern]:
         """
         Analyze temporal patterns in trend signals
         
         Args:
             signals: List of signals with timestamps and values
             timeframe_hours: Analysis timeframe in hours
+            series_key: Persistent series to ingest the signals into and analyze. Signals
+                already in that series are skipped, and models are only re-run when its
+                buckets changed.
+                Without a key only the given signals are analyzed and nothing is stored.
             
         Returns:
             List of detected temporal patterns
         """
-        start_time = datetime.now()
-        
         try:
-            # Convert signals to time series
-            time_series = self._prepare_time_series(signals, timeframe_hours)
-            
-            if len(time_series) < self.config['emergence_config']['min_data_points']:
-                self.logger.warning(f"Insufficient data points: {len(time_series)}")
-                return []
-            
-            detected_patterns = []
+            records = self._signal_records(signals)
             
-            # 1. Seasonality Detection
-            seasonal_patterns = await self._detect_seasonality(time_series)
-            detected_patterns.extend(seasonal_patterns)
-            
-            # 2. Trend Analysis
-            trend_patterns = await self._analyze_trends(time_series)
-            detected_patterns.extend(trend_patterns)
-            
-            # 3. Cyclical Pattern Detection
-            cyclical_patterns = await self._detect_cyclical_patterns(time_series)
-            detected_patterns.extend(cyclical_patterns)
-            
-            # 4. Anomaly Detection
-            anomaly_patterns = await self._detect_temporal_anomalies(time_series)
-            detected_patterns.extend(anomaly_patterns)
-            
-            # 5. Emergence Pattern Recognition
-            emergence_patterns = await self._detect_emergence_patterns(time_series)
-            detected_patterns.extend(emergence_patterns)
-            
-            # Update statistics
-            processing_time = (datetime.now() - start_time).total_seconds()
-            self._update_pattern_stats(len(detected_patterns), processing_time)
+            if series_key is None:
+                series = self._build_series(records, hour_of(datetime.now() - timedelta(hours=timeframe_hours)))
+            else:
+                self._ingest_records(records, series_key)
+                series = self.series_store.get(series_key)
             
-            self.logger.info(f"✅ Detected {len(detected_patterns)} temporal patterns in {processing_time:.2f}s")
-            return detected_patterns
+            return await self._analyze_series(series, timeframe_hours, series_key)
             
         except Exception as e:
             self.logger.error(f"❌ Temporal pattern analysis failed: {e}")
             return []
     
-    def _prepare_time_series(self, signals: List, timeframe_hours: int) -> pd.DataFrame:
-        """Prepare time series data for analysis"""
-        if not signals:
-            return pd.DataFrame()
+    def ingest_signals(self, signals: List, series_key: str) -> int:
+        """Add signals to the persistent hourly series ``series_key``; returns how many were new"""
+        return self._ingest_records(self._signal_records(signals), series_key)
+    
+    async def _analyze_series(self, series: Optional[HourlySeries], timeframe_hours: int,
+                              series_key: Optional[str] = None) -> List[TemporalPattern]:
+        """Run the pattern detectors over one series' window of hourly buckets"""
+        start_time = datetime.now()
+        
+        window = None
+        if series is not None:
+            window = series.window(hour_of(start_time - timedelta(hours=timeframe_hours)))
+        data_points = len(window.signal_count) if window is not None else 0
+        
+        if data_points < self.config['emergence_config']['min_data_points']:
+            self.logger.warning(f"Insufficient data points: {data_points}")
+            return []
+        
+        cache_key = (series_key, timeframe_hours)
+        signature = (series.version, window.first_hour, window.last_hour)
+        if series_key is not None:
+            cached = self._series_patterns.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                self._series_patterns.move_to_end(cache_key)
+                self.analysis_stats['series_cache_hits'] += 1
+                return list(cached[1])
+        
+        time_series = self._window_frame(window)
+        detected_patterns = []
+        
+        # 1. Seasonality Detection
+        seasonal_patterns = await self._detect_seasonality(time_series)
+        detected_patterns.extend(seasonal_patterns)
+        
+        # 2. Trend Analysis
+        trend_patterns = await self._analyze_trends(time_series)
+        detected_patterns.extend(trend_patterns)
+        
+        # 3. Cyclical Pattern Detection
+        cyclical_patterns = await self._detect_cyclical_patterns(time_series)
+        detected_patterns.extend(cyclical_patterns)
+        
+        # 4. Anomaly Detection
+        anomaly_patterns = await self._detect_temporal_anomalies(time_series)
+        detected_patterns.extend(anomaly_patterns)
         
-        # Extract timestamps and values
-        data_points = []
-        cutoff_time = datetime.now() - timedelta(hours=timeframe_hours)
+        # 5. Emergence Pattern Recognition
+        emergence_patterns = await self._detect_emergence_patterns(time_series)
+        detected_patterns.extend(emergence_patterns)
         
-        for signal in signals:
+        if series_key is not None:
+            self._series_patterns[cache_key] = (signature, detected_patterns)
+            self._series_patterns.move_to_end(cache_key)
+            while len(self._series_patterns) > self.config['pattern_memory_limit']:
+                self._series_patterns.popitem(last=False)
+        
+        # Update statistics
+        processing_time = (datetime.now() - start_time).total_seconds()
+        self.analysis_stats['series_analyses'] += 1
+        self._update_pattern_stats(len(detected_patterns), processing_time)
+        
+        self.logger.info(f"✅ Detected {len(detected_patterns)} temporal patterns in {processing_time:.2f}s")
+        return list(detected_patterns)
+    
+    def _signal_records(self, signals: List) -> List[Tuple[int, int, float, float, float]]:
+        """(fingerprint, hour, strength, engagement, sentiment) per valid signal"""
+        records = []
+        for signal in signals or []:
             # Handle both dict and StandardSignal objects
             if hasattr(signal, 'timestamp'):
                 # StandardSignal object
@@ -251,52 +463,83 @@ class AdvancedTemporalPatternEngine:
                 engagement = signal.engagement_score
                 sentiment = signal.sentiment_score
                 source = signal.source
+                identity = getattr(signal, 'url', None) or getattr(signal, 'content', None)
             else:
                 # Dictionary signal
                 timestamp = signal.get('timestamp')
                 engagement = signal.get('engagement_score', 0.0)
                 sentiment = signal.get('sentiment_score', 0.0)
                 source = signal.get('source', 'unknown')
+                identity = signal.get('id') or signal.get('url') or signal.get('content')
             
             if isinstance(timestamp, str):
                 timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
             elif not isinstance(timestamp, datetime):
                 continue
             
-            if timestamp < cutoff_time:
-                continue
-            
-            # Extract signal strength (composite of engagement, sentiment, etc.)
-            signal_strength = self._calculate_signal_strength_unified(signal)
-            
-            data_points.append({
-                'timestamp': timestamp,
-                'signal_strength': signal_strength,
-                'engagement': engagement,
-                'sentiment': sentiment,
-                'source': source
-            })
-        
-        if not data_points:
-            return pd.DataFrame()
-        
-        # Create DataFrame and resample to regular intervals
-        df = pd.DataFrame(data_points)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.set_index('timestamp').sort_index()
+            # Identity only: a re-polled post with updated engagement is still the same signal
+            fingerprint = hash((source, identity, timestamp.isoformat()))
+            records.append((
+                fingerprint,
+                hour_of(timestamp),
+                self._calculate_signal_strength_unified(signal),
+                engagement,
+                sentiment
+            ))
+        return records
+    
+    def _ingest_records(self, records: List[Tuple], series_key: str) -> int:
+        """Add records to the persistent series ``series_key``; returns how many were new"""
+        if not records:
+            return 0
         
-        # Resample to hourly intervals and aggregate
-        hourly_df = df.resample('1H').agg({
-            'signal_strength': 'sum',
-            'engagement': 'mean',
-            'sentiment': 'mean',
-            'source': 'count'
-        }).fillna(0)
+        columns = list(zip(*records))
+        hours = np.asarray(columns[1], dtype=np.int64)
+        strength, engagement, sentiment = (np.asarray(column, dtype=float) for column in columns[2:5])
+        added = self.series_store.ingest(series_key, hours, strength, engagement, sentiment, list(columns[0]))
         
-        # Rename source count to signal_count
-        hourly_df = hourly_df.rename(columns={'source': 'signal_count'})
+        self.analysis_stats['signals_ingested'] += len(records)
+        return added
+    
+    def _build_series(self, records: List[Tuple], start_hour: Optional[int] = None) -> Optional[HourlySeries]:
+        """One-off series holding the given records from ``start_hour`` on.
         
-        return hourly_df
+        Records are clipped to the window before sizing the buffer, so one very old
+        timestamp cannot force an allocation spanning years of empty hours.
+        """
+        if start_hour is not None:
+            records = [record for record in records if record[1] >= start_hour]
+        if not records:
+            return None
+        columns = list(zip(*records))
+        span = max(columns[1]) - min(columns[1]) + 1
+        series = HourlySeries(capacity_hours=span)
+        series.add_many(np.asarray(columns[1], dtype=np.int64), np.asarray(columns[2], dtype=float),
+                        np.asarray(columns[3], dtype=float), np.asarray(columns[4], dtype=float))
+        return series
+    
+    def _window_frame(self, window: Optional[SeriesWindow]) -> pd.DataFrame:
+        """Hourly DataFrame (signal_strength sum, engagement/sentiment mean, signal_count) of a window"""
+        if window is None:
+            return pd.DataFrame()
+        index = pd.date_range(
+            start=_EPOCH + timedelta(hours=window.first_hour),
+            periods=len(window.signal_count), freq='h', name='timestamp'
+        )
+        return pd.DataFrame({
+            'signal_strength': window.signal_strength,
+            'engagement': window.engagement,
+            'sentiment': window.sentiment,
+            'signal_count': window.signal_count
+        }, index=index)
+    
+    def _prepare_time_series(self, signals: List, timeframe_hours: int) -> pd.DataFrame:
+        """Prepare time series data for analysis"""
+        start_hour = hour_of(datetime.now() - timedelta(hours=timeframe_hours))
+        series = self._build_series(self._signal_records(signals), start_hour)
+        if series is None:
+            return pd.DataFrame()
+        return self._window_frame(series.window(start_hour))
     
     def _calculate_signal_strength(self, signal: Dict) -> float:
         """Calculate composite signal strength (legacy method for dict signals)"""
@@ -833,7 +1076,11 @@ class AdvancedTemporalPatternEngine:
     
     def get_performance_stats(self) -> Dict:
         """Get current performance statistics"""
-        return self.analysis_stats.copy()
+        return {
+            **self.analysis_stats,
+            'stored_series': len(self.series_store),
+            'cached_series_patterns': len(self._series_patterns)
+        }
     
     async def predict_trend_emergence(self, historical_signals: List[Dict], forecast_hours: int = 72) -> Dict:
         """Predict trend emergence based on historical patterns"""
@@ -27,6 +27,7 @@ from tools.validators.real_data_validator import GroundbreakingDataValidator
 
 # Import the cross-platform intelligence engine
 from src.api.domains.intelligence.services.cross_platform_intelligence import CrossPlatformIntelligenceEngine
+from src.api.shared.services.keyword_matcher import KeywordMatcher
 
 # Import the source credibility engine
 from src.api.domains.credibility.services.source_credibility_engine import get_credibility_engine
@@ -189,6 +190,11 @@ class CrossPlatformTrendDetector:
             'problem', 'solution', 'need', 'struggle', 'difficult', 'expensive',
             'time consuming', 'manual', 'inefficient', 'broken', 'missing'
         ]
+        self.trend_keyword_matcher = KeywordMatcher({'trend': self.trend_keywords})
+        self.sentiment_matcher = KeywordMatcher({
+            'positive': ['great', 'amazing', 'love', 'awesome', 'excellent', 'perfect', 'solution'],
+            'negative': ['problem', 'issue', 'broken', 'terrible', 'hate', 'difficult', 'struggle']
+        })
         
         # Market intelligence patterns
         self.market_indicators = {
@@ -212,6 +218,14 @@ class CrossPlatformTrendDetector:
         # Cross-platform intelligence storage
         self.latest_intelligence = None
         
+        # Concurrent collection: global deadline for the whole fan-out (per-platform budgets still apply)
+        self.collection_deadline_seconds = 25.0
+        self.last_platform_performance = {}
+        
+        # Quality validation runs while collection is still in progress (small signal sets only)
+        self.validation_signal_limit = 200
+        self.validation_timeout_seconds = 10.0
+        
     def _update_source_weights_with_credibility(self):
         """Update source weights based on credibility scores"""
         logger.info("Updating source weights with credibility scores...")
@@ -269,7 +283,6 @@ class CrossPlatformTrendDetector:
             await self._get_session()
             
             # Collect signals from all sources with enhanced timeout protection and parallel processing
-            all_signals = []
             collection_tasks = []
             
             # Create collection tasks for parallel execution
@@ -296,81 +309,22 @@ class CrossPlatformTrendDetector:
             if self.data_sources['hacker_news']['enabled']:
                 collection_tasks.append(('hacker_news', self._collect_hacker_news_signals(hours_back), 10.0))  # Reduced from 15s
             
-            # Execute collection tasks with enhanced error handling
-            for platform_name, task, timeout in collection_tasks:
-                platform_start = time.time()
-                try:
-                    signals = await asyncio.wait_for(task, timeout=timeout)
-                    all_signals.extend(signals)
-                    platform_time = time.time() - platform_start
-                    platform_performance[platform_name] = {
-                        'status': 'success',
-                        'signals': len(signals),
-                        'time': platform_time
-                    }
-                    logger.info(f"✅ {platform_name}: {len(signals)} signals in {platform_time:.2f}s")
-                except asyncio.TimeoutError:
-                    platform_performance[platform_name] = {'status': 'timeout', 'signals': 0, 'time': timeout}
-                    logger.warning(f"⏰ {platform_name}: timed out after {timeout}s")
-                except Exception as e:
-                    platform_performance[platform_name] = {'status': 'error', 'signals': 0, 'error': str(e)}
-                    logger.error(f"❌ {platform_name}: {str(e)[:100]}")
-            
-            logger.info(f"📊 Total signals collected: {len(all_signals)} from {len([p for p in platform_performance.values() if p['status'] == 'success'])} platforms")
-            
-            # GROUNDBREAKING METHOD 1: Real-Time Data Quality Validation
-            if len(all_signals) > 0 and len(all_signals) <= 200:  # Only validate smaller signal sets for performance
-                logger.info("🔍 Starting real-time data quality validation...")
-                try:
-                    # Validate signals for quality and authenticity - OPTIMIZED TIMEOUT
-                    validated_signals = await asyncio.wait_for(
-                        self.data_validator.validate_signals_realtime(all_signals),
-                        timeout=10.0  # Further reduced from 20s to 10s for performance
-                    )
-                    
-                    # Filter to only high-quality verified signals
-                    high_quality_signals = [
-                        signal.original_signal for signal in validated_signals 
-                        if signal.is_verified and signal.quality_metrics.overall_quality >= 0.6
-                    ]
-                    
-                    logger.info(f"✅ Quality validation complete:")
-                    logger.info(f"   📊 Original signals: {len(all_signals)}")
-                    logger.info(f"   🏆 High quality signals: {len(high_quality_signals)}")
-                    logger.info(f"   📈 Quality improvement: {len(high_quality_signals)/len(all_signals)*100:.1f}% signals retained")
-                    
-                    # Use validated signals for analysis
-                    all_signals = high_quality_signals
-                    
-                    # Log validation statistics with error handling
-                    try:
-                        validation_report = self.data_validator.get_validation_report()
-                        logger.info(f"   🎯 Validation stats: {validation_report.get('quality_distribution', 'N/A')}")
-                    except Exception:
-                        logger.info(f"   🎯 Validation completed successfully")
-                    
-                except asyncio.TimeoutError:
-                    logger.warning("⚠️ Data validation timed out, proceeding with unvalidated signals")
-                except Exception as e:
-                    logger.warning(f"⚠️ Data validation bypassed due to error: {str(e)[:50]}, proceeding with unvalidated signals")
-            else:
-                logger.info(f"🚀 Bypassing validation for performance ({len(all_signals)} signals)")
+            # Fan out all collectors at once; each platform is validated as soon as it finishes
+            all_signals, platform_signals_dict = await self._collect_and_validate(collection_tasks, platform_performance)
             
             # GROUNDBREAKING METHOD 2: Cross-Platform Intelligence Synthesis
-            platform_signals_dict = {}
             if len(all_signals) > 0:
                 logger.info("🧠 Starting cross-platform intelligence synthesis...")
                 try:
-                    # Group signals by platform
-                    for signal in all_signals:
-                        platform = signal.source
-                        if platform not in platform_signals_dict:
-                            platform_signals_dict[platform] = []
-                        platform_signals_dict[platform].append(signal)
+                    # Signals were grouped by platform during collection; regroup only if validation filtered them
+                    if sum(len(group) for group in platform_signals_dict.values()) != len(all_signals):
+                        platform_signals_dict = defaultdict(list)
+                        for signal in all_signals:
+                            platform_signals_dict[signal.source].append(signal)
                     
                     # Synthesize cross-platform intelligence - OPTIMIZED TIMEOUT
                     intelligence_synthesis = await asyncio.wait_for(
-                        self.intelligence_engine.synthesize_cross_platform_intelligence(platform_signals_dict),
+                        self.intelligence_engine.synthesize_cross_platform_intelligence(dict(platform_signals_dict)),
                         timeout=15.0  # Reduced from 45s to 15s for performance
                     )
                     
@@ -442,6 +396,152 @@ class CrossPlatformTrendDetector:
             logger.info(f"Created {len(demo_opportunities)} demo opportunities")
             return demo_opportunities
     
+    async def _collect_and_validate(self, collection_tasks, platform_performance: Dict):
+        """Collect every platform concurrently, validating each platform's signals as it arrives.
+        
+        GROUNDBREAKING METHOD 1: Real-Time Data Quality Validation. The validator holds a single
+        HTTP session, so batches are validated one at a time in arrival order by one worker -
+        the fastest platforms are validated while the slower collectors are still running.
+        Validation is skipped once more than ``validation_signal_limit`` signals arrive; platforms
+        still unvalidated ``validation_timeout_seconds`` after collection ends are kept as-is.
+        
+        Returns (signals, signals grouped by source).
+        """
+        all_signals = []
+        platform_signals_dict = defaultdict(list)
+        batches = []
+        validated_batches = {}
+        validation_queue = asyncio.Queue()
+        validator = asyncio.create_task(self._validate_batches(validation_queue, validated_batches))
+        
+        try:
+            async for platform_name, signals in self._collect_platforms_concurrently(
+                collection_tasks, platform_performance
+            ):
+                batches.append((platform_name, signals))
+                all_signals.extend(signals)
+                for signal in signals:
+                    platform_signals_dict[signal.source].append(signal)
+                
+                if validator is not None and len(all_signals) > self.validation_signal_limit:
+                    validator.cancel()  # too many signals to validate within the budget
+                    validator = None
+                elif validator is not None and signals:
+                    validation_queue.put_nowait((platform_name, signals))
+            
+            self.last_platform_performance = platform_performance
+            logger.info(f"📊 Total signals collected: {len(all_signals)} from {len([p for p in platform_performance.values() if p['status'] == 'success'])} platforms")
+            
+            if validator is None or not all_signals:
+                logger.info(f"🚀 Bypassing validation for performance ({len(all_signals)} signals)")
+                return all_signals, platform_signals_dict
+            
+            validation_queue.put_nowait(None)
+            try:
+                await asyncio.wait_for(validator, timeout=self.validation_timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ Data validation timed out, proceeding with unvalidated signals for unfinished platforms")
+            validator = None
+        finally:
+            if validator is not None:
+                validator.cancel()
+        
+        # Filter to only high-quality verified signals
+        high_quality_signals = [
+            signal for platform_name, signals in batches
+            for signal in validated_batches.get(platform_name, signals)
+        ]
+        
+        logger.info(f"✅ Quality validation complete:")
+        logger.info(f"   📊 Original signals: {len(all_signals)}")
+        logger.info(f"   🏆 High quality signals: {len(high_quality_signals)}")
+        logger.info(f"   📈 Quality improvement: {len(high_quality_signals)/len(all_signals)*100:.1f}% signals retained")
+        
+        # Log validation statistics with error handling
+        try:
+            validation_report = self.data_validator.get_validation_report()
+            logger.info(f"   🎯 Validation stats: {validation_report.get('quality_distribution', 'N/A')}")
+        except Exception:
+            logger.info(f"   🎯 Validation completed successfully")
+        
+        return high_quality_signals, platform_signals_dict
+    
+    async def _validate_batches(self, validation_queue: asyncio.Queue, validated_batches: Dict):
+        """Validate queued (platform, signals) batches in order until a None sentinel arrives"""
+        while True:
+            item = await validation_queue.get()
+            if item is None:
+                return
+            platform_name, signals = item
+            try:
+                validated_signals = await self.data_validator.validate_signals_realtime(signals)
+                validated_batches[platform_name] = [
+                    signal.original_signal for signal in validated_signals
+                    if signal.is_verified and signal.quality_metrics.overall_quality >= 0.6
+                ]
+            except Exception as e:
+                logger.warning(f"⚠️ Data validation of {platform_name} bypassed due to error: {str(e)[:50]}, proceeding with unvalidated signals")
+    
+    async def _collect_platforms_concurrently(self, collection_tasks, platform_performance: Dict):
+        """Run every platform collector at once and yield (platform, signals) as each one finishes.
+
+        Each collector keeps its own timeout budget, and the whole stage is bounded by
+        ``collection_deadline_seconds`` so a run costs the slowest platform rather than the sum.
+        Per-platform status and latency are recorded in ``platform_performance``.
+        """
+        stage_start = time.time()
+        
+        async def run_collector(platform_name, coro, timeout):
+            platform_start = time.time()
+            try:
+                signals = await asyncio.wait_for(coro, timeout=timeout)
+                platform_time = time.time() - platform_start
+                platform_performance[platform_name] = {
+                    'status': 'success',
+                    'signals': len(signals),
+                    'time': platform_time
+                }
+                logger.info(f"✅ {platform_name}: {len(signals)} signals in {platform_time:.2f}s")
+                return platform_name, signals
+            except asyncio.TimeoutError:
+                platform_performance[platform_name] = {'status': 'timeout', 'signals': 0, 'time': time.time() - platform_start}
+                logger.warning(f"⏰ {platform_name}: timed out after {timeout}s")
+            except Exception as e:
+                platform_performance[platform_name] = {'status': 'error', 'signals': 0, 'time': time.time() - platform_start, 'error': str(e)}
+                logger.error(f"❌ {platform_name}: {str(e)[:100]}")
+            return platform_name, []
+        
+        tasks = {
+            asyncio.create_task(run_collector(platform_name, coro, timeout)): platform_name
+            for platform_name, coro, timeout in collection_tasks
+        }
+        pending = set(tasks)
+        deadline = stage_start + self.collection_deadline_seconds
+        
+        try:
+            while pending:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # Anything still running past the global deadline is cancelled and reported as a timeout
+            for task in pending:
+                task.cancel()
+                platform_name = tasks[task]
+                platform_performance[platform_name] = {
+                    'status': 'timeout',
+                    'signals': 0,
+                    'time': time.time() - stage_start
+                }
+                logger.warning(f"⏰ {platform_name}: cancelled at global collection deadline ({self.collection_deadline_seconds}s)")
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        logger.info(f"⚡ Concurrent collection finished in {time.time() - stage_start:.2f}s across {len(tasks)} platforms")
+    
     async def _collect_reddit_signals(self, hours_back: int) -> List[TrendSignal]:
         """Collect trend signals from Reddit with performance optimization"""
         signals = []
@@ -514,9 +614,6 @@ class CrossPlatformTrendDetector:
         signals = []
         
         try:
-            # Import and initialize Twitter intelligence client - FIXED IMPORT PATH
-            from src.api.domains.discovery.services.twitter_intelligence_client import TwitterIntelligenceClient
-            
             twitter_client = TwitterIntelligenceClient()
             
             # Get real-time business trends and problems
@@ -837,24 +934,15 @@ class CrossPlatformTrendDetector:
         return signals
     
     def _extract_keywords(self, content: str) -> List[str]:
-        """Extract relevant keywords from content"""
-        content_lower = content.lower()
-        found_keywords = []
-        
-        for keyword in self.trend_keywords:
-            if keyword in content_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords
+        """Extract relevant keywords from content (in trend_keywords order)"""
+        found = self.trend_keyword_matcher.find(content)
+        return [self.trend_keyword_matcher.keywords[column] for column in sorted(found)]
     
     def _calculate_sentiment(self, content: str) -> float:
         """Simple sentiment calculation (would use proper NLP in production)"""
-        positive_words = ['great', 'amazing', 'love', 'awesome', 'excellent', 'perfect', 'solution']
-        negative_words = ['problem', 'issue', 'broken', 'terrible', 'hate', 'difficult', 'struggle']
-        
-        content_lower = content.lower()
-        positive_count = sum(1 for word in positive_words if word in content_lower)
-        negative_count = sum(1 for word in negative_words if word in content_lower)
+        hits = self.sentiment_matcher.category_hits(content)
+        positive_count = hits['positive']
+        negative_count = hits['negative']
         
         if positive_count + negative_count == 0:
             return 0.5
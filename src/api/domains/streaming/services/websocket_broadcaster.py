@@ -7,11 +7,13 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Set, Dict, Any, List
+from typing import Set, Dict, Any, List, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 from collections import defaultdict, deque
 import time
 
+from .stream_protocol import StreamProtocol
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,6 +27,73 @@ class DateTimeEncoder(json.JSONEncoder):
             return list(obj)
         return super().default(obj)
 
+def encode_message(message: Dict[str, Any]) -> str:
+    """Serialize a message once so the same frame can be handed to every subscriber"""
+    return json.dumps(message, cls=DateTimeEncoder)
+
+class ClientConnection:
+    """
+    Outbound state for one WebSocket client
+    
+    Frames are queued in a bounded buffer and written by a dedicated task, so a slow
+    socket only ever delays itself. When the buffer is full the oldest frame is dropped,
+    or with the 'coalesce' policy a pending frame from the same channel is replaced by
+    the newer one (only the latest snapshot of a channel matters to a lagging dashboard).
+    
+    Clients that negotiated a StreamProtocol get raw messages queued instead of shared
+    frames; their writer batches and encodes them at send time.
+    """
+    
+    def __init__(self, websocket: WebSocket, max_queue_size: int = 256, overflow_policy: str = 'drop_oldest'):
+        self.websocket = websocket
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.protocol: Optional[StreamProtocol] = None
+        self.pending: deque = deque()  # (channel, encoded frame or raw message)
+        self.wakeup = asyncio.Event()
+        self.writer_task: Optional[asyncio.Task] = None
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.frames_coalesced = 0
+    
+    def enqueue(self, frame: Any, channel: Optional[str] = None) -> bool:
+        """Queue a frame without blocking; returns False if an older frame had to be discarded"""
+        
+        accepted_cleanly = True
+        if len(self.pending) >= self.max_queue_size:
+            accepted_cleanly = False
+            if channel is not None and self.overflow_policy == 'coalesce' and self._replace_pending(channel, frame):
+                self.frames_coalesced += 1
+                return accepted_cleanly
+            self.pending.popleft()
+            self.frames_dropped += 1
+        
+        self.pending.append((channel, frame))
+        self.wakeup.set()
+        return accepted_cleanly
+    
+    def _replace_pending(self, channel: str, frame: Any) -> bool:
+        for index, (pending_channel, _) in enumerate(self.pending):
+            if pending_channel == channel:
+                del self.pending[index]
+                self.pending.append((channel, frame))
+                return True
+        return False
+    
+    async def next_frame(self) -> Any:
+        while not self.pending:
+            self.wakeup.clear()
+            await self.wakeup.wait()
+        return self.pending.popleft()[1]
+    
+    def take_messages(self, limit: int) -> List[Dict[str, Any]]:
+        """Pop queued raw messages up to the next pre-encoded frame, keeping frame order"""
+        
+        messages = []
+        while self.pending and len(messages) < limit and isinstance(self.pending[0][1], dict):
+            messages.append(self.pending.popleft()[1])
+        return messages
+
 class WebSocketBroadcaster:
     """
     Real-time WebSocket broadcasting service for Phase 5 multi-modal fusion
@@ -36,13 +105,23 @@ class WebSocketBroadcaster:
     - Client-specific subscriptions
     - Performance monitoring
     - Automatic reconnection handling
+    
+    Each queued message is serialized once and handed to the per-client send queues of
+    its channel's subscribers (looked up through a channel -> clients index), so fan-out
+    cost does not depend on how fast any individual socket drains.
     """
     
-    def __init__(self):
+    VALID_CHANNELS = {'fusion', 'trends', 'alerts', 'system'}
+    
+    def __init__(self, max_client_queue_size: int = 256, overflow_policy: str = 'drop_oldest'):
         # Connected clients
         self.active_connections: Set[WebSocket] = set()
         self.client_subscriptions: Dict[WebSocket, Set[str]] = defaultdict(set)
         self.client_metadata: Dict[WebSocket, Dict[str, Any]] = {}
+        self.channel_subscribers: Dict[str, Set[WebSocket]] = defaultdict(set)
+        self.client_connections: Dict[WebSocket, ClientConnection] = {}
+        self.max_client_queue_size = max_client_queue_size
+        self.overflow_policy = overflow_policy
         
         # Broadcasting queues
         self.fusion_queue = asyncio.Queue(maxsize=10000)
@@ -60,14 +139,16 @@ class WebSocketBroadcaster:
             'active_connections': 0,
             'messages_sent': 0,
             'messages_failed': 0,
+            'messages_dropped': 0,
             'fusion_broadcasts': 0,
             'trend_broadcasts': 0,
             'alert_broadcasts': 0,
             'avg_broadcast_time': 0.0
         }
         
-        # Broadcasting task
+        # Broadcasting task (one queue consumer per channel)
         self.broadcaster_task = None
+        self.channel_tasks: List[asyncio.Task] = []
         
         logger.info("WebSocket Broadcaster initialized")
     
@@ -89,13 +170,20 @@ class WebSocketBroadcaster:
             
             # Default subscriptions
             self.client_subscriptions[websocket] = {'fusion', 'trends', 'alerts'}
+            for channel in self.client_subscriptions[websocket]:
+                self.channel_subscribers[channel].add(websocket)
+            
+            # Dedicated writer so this socket never holds up a broadcast
+            connection = ClientConnection(websocket, self.max_client_queue_size, self.overflow_policy)
+            connection.writer_task = asyncio.create_task(self._client_writer(connection))
+            self.client_connections[websocket] = connection
             
             # Update stats
             self.broadcast_stats['total_connections'] += 1
             self.broadcast_stats['active_connections'] = len(self.active_connections)
             
             # Start broadcaster if not running
-            if not self.broadcaster_task:
+            if not self.broadcaster_task or self.broadcaster_task.done():
                 self.broadcaster_task = asyncio.create_task(self._start_broadcaster())
             
             # Send welcome message with recent data
@@ -130,8 +218,12 @@ class WebSocketBroadcaster:
             # Clean up metadata
             if websocket in self.client_metadata:
                 del self.client_metadata[websocket]
-            if websocket in self.client_subscriptions:
-                del self.client_subscriptions[websocket]
+            for channel in self.client_subscriptions.pop(websocket, set()):
+                self.channel_subscribers[channel].discard(websocket)
+            
+            connection = self.client_connections.pop(websocket, None)
+            if connection and connection.writer_task and connection.writer_task is not asyncio.current_task():
+                connection.writer_task.cancel()
             
             # Update stats
             self.broadcast_stats['active_connections'] = len(self.active_connections)
@@ -149,7 +241,7 @@ class WebSocketBroadcaster:
         
         # Add to queue and history
         try:
-            await self.fusion_queue.put(message)
+            self.fusion_queue.put_nowait(message)
             self.recent_fusion_results.append(message)
             self.broadcast_stats['fusion_broadcasts'] += 1
         except asyncio.QueueFull:
@@ -166,7 +258,7 @@ class WebSocketBroadcaster:
         
         # Add to queue and history
         try:
-            await self.trend_queue.put(message)
+            self.trend_queue.put_nowait(message)
             self.recent_trends.append(message)
             self.broadcast_stats['trend_broadcasts'] += 1
         except asyncio.QueueFull:
@@ -184,7 +276,7 @@ class WebSocketBroadcaster:
         
         # Add to queue and history
         try:
-            await self.alert_queue.put(message)
+            self.alert_queue.put_nowait(message)
             self.recent_alerts.append(message)
             self.broadcast_stats['alert_broadcasts'] += 1
         except asyncio.QueueFull:
@@ -200,11 +292,13 @@ class WebSocketBroadcaster:
             if message_type == 'ping':
                 await self._handle_ping(websocket)
             elif message_type == 'subscribe':
-                await self._handle_subscription(websocket, data.get('channels', []))
+                await self._handle_subscription(websocket, data.get('channels', []), data.get('protocol'))
             elif message_type == 'unsubscribe':
                 await self._handle_unsubscription(websocket, data.get('channels', []))
             elif message_type == 'request_history':
                 await self._send_history(websocket, data.get('data_type'))
+            elif message_type == 'ack':
+                self._handle_ack(websocket, data.get('seq'))
             else:
                 logger.warning(f"Unknown message type: {message_type}")
             
@@ -255,19 +349,26 @@ class WebSocketBroadcaster:
         
         await self._send_to_client(websocket, pong_message)
     
-    async def _handle_subscription(self, websocket: WebSocket, channels: List[str]):
-        """Handle subscription request"""
+    async def _handle_subscription(self, websocket: WebSocket, channels: List[str],
+                                   protocol_options: Optional[Dict[str, Any]] = None):
+        """Handle subscription request (optionally negotiating batched/delta/binary framing)"""
         
-        valid_channels = {'fusion', 'trends', 'alerts', 'system'}
-        new_subscriptions = set(channels) & valid_channels
+        new_subscriptions = set(channels) & self.VALID_CHANNELS
         
         self.client_subscriptions[websocket].update(new_subscriptions)
+        for channel in new_subscriptions:
+            self.channel_subscribers[channel].add(websocket)
+        
+        connection = self.client_connections.get(websocket)
+        if connection is not None and protocol_options is not None:
+            connection.protocol = StreamProtocol.negotiate(protocol_options)
         
         response = {
             'type': 'subscription_updated',
             'timestamp': datetime.now().isoformat(),
             'subscribed_channels': list(self.client_subscriptions[websocket]),
-            'newly_added': list(new_subscriptions)
+            'newly_added': list(new_subscriptions),
+            'protocol': connection.protocol.describe() if connection and connection.protocol else None
         }
         
         await self._send_to_client(websocket, response)
@@ -277,6 +378,8 @@ class WebSocketBroadcaster:
         
         removed_subscriptions = set(channels) & self.client_subscriptions[websocket]
         self.client_subscriptions[websocket] -= removed_subscriptions
+        for channel in removed_subscriptions:
+            self.channel_subscribers[channel].discard(websocket)
         
         response = {
             'type': 'subscription_updated',
@@ -287,6 +390,13 @@ class WebSocketBroadcaster:
         
         await self._send_to_client(websocket, response)
     
+    def _handle_ack(self, websocket: WebSocket, seq: Any):
+        """Record the last protocol message a delta client has applied"""
+        
+        connection = self.client_connections.get(websocket)
+        if connection is not None and connection.protocol is not None and isinstance(seq, int):
+            connection.protocol.acknowledge(seq)
+    
     async def _send_history(self, websocket: WebSocket, data_type: str):
         """Send historical data to client"""
         
@@ -311,104 +421,134 @@ class WebSocketBroadcaster:
         
         logger.info("WebSocket broadcaster started")
         
-        while True:
-            try:
-                # Process all queues concurrently
-                await asyncio.gather(
-                    self._process_fusion_queue(),
-                    self._process_trend_queue(),
-                    self._process_alert_queue(),
-                    return_exceptions=True
-                )
-                
-                # Small delay to prevent CPU overload
-                await asyncio.sleep(0.01)
-                
-            except Exception as e:
-                logger.error(f"Broadcaster error: {str(e)}")
-                await asyncio.sleep(1)
-    
-    async def _process_fusion_queue(self):
-        """Process fusion broadcast queue"""
-        
-        try:
-            message = self.fusion_queue.get_nowait()
-            await self._broadcast_to_subscribers(message, 'fusion')
-        except asyncio.QueueEmpty:
-            pass
-    
-    async def _process_trend_queue(self):
-        """Process trend broadcast queue"""
-        
+        # Each consumer wakes up as soon as a message is queued - no polling interval
+        self.channel_tasks = [
+            asyncio.create_task(self._process_queue(self.fusion_queue, 'fusion')),
+            asyncio.create_task(self._process_queue(self.trend_queue, 'trends')),
+            asyncio.create_task(self._process_queue(self.alert_queue, 'alerts'))
+        ]
         try:
-            message = self.trend_queue.get_nowait()
-            await self._broadcast_to_subscribers(message, 'trends')
-        except asyncio.QueueEmpty:
-            pass
+            await asyncio.gather(*self.channel_tasks)
+        finally:
+            for task in self.channel_tasks:
+                task.cancel()
     
-    async def _process_alert_queue(self):
-        """Process alert broadcast queue"""
+    async def _process_queue(self, queue: asyncio.Queue, channel: str):
+        """Consume one broadcast queue, fanning every message out to the channel's subscribers"""
         
-        try:
-            message = self.alert_queue.get_nowait()
-            await self._broadcast_to_subscribers(message, 'alerts')
-        except asyncio.QueueEmpty:
-            pass
+        while True:
+            message = await queue.get()
+            try:
+                self._broadcast_to_subscribers(message, channel)
+                # Drain whatever else arrived meanwhile before yielding to the writers
+                while not queue.empty():
+                    self._broadcast_to_subscribers(queue.get_nowait(), channel)
+            except Exception as e:
+                logger.error(f"Broadcaster error on {channel}: {str(e)}")
     
-    async def _broadcast_to_subscribers(self, message: Dict[str, Any], channel: str):
-        """Broadcast message to clients subscribed to specific channel"""
+    def _broadcast_to_subscribers(self, message: Dict[str, Any], channel: str) -> int:
+        """Serialize once and queue the frame for every client subscribed to the channel"""
         
         start_time = time.time()
-        sent_count = 0
-        failed_count = 0
-        
-        # Get subscribed clients
-        subscribed_clients = [
-            websocket for websocket in self.active_connections
-            if channel in self.client_subscriptions.get(websocket, set())
-        ]
-        
-        # Broadcast to all subscribed clients concurrently
-        if subscribed_clients:
-            results = await asyncio.gather(
-                *[self._send_to_client(client, message) for client in subscribed_clients],
-                return_exceptions=True
-            )
-            
-            # Count successful/failed sends
-            for result in results:
-                if isinstance(result, Exception):
-                    failed_count += 1
-                else:
-                    sent_count += 1
-        
-        # Update statistics
+        subscribers = self.channel_subscribers.get(channel)
+        if not subscribers:
+            return 0
+        
+        frame = None
+        queued = 0
+        for websocket in subscribers:
+            connection = self.client_connections.get(websocket)
+            if connection is None:
+                continue
+            if connection.protocol is not None:
+                item = message
+            else:
+                if frame is None:
+                    frame = encode_message(message)
+                item = frame
+            if not connection.enqueue(item, channel):
+                self.broadcast_stats['messages_dropped'] += 1
+            queued += 1
+        
+        # Update average broadcast (fan-out) time per message
         broadcast_time = time.time() - start_time
-        self.broadcast_stats['messages_sent'] += sent_count
-        self.broadcast_stats['messages_failed'] += failed_count
-        
-        # Update average broadcast time
-        if self.broadcast_stats['messages_sent'] > 0:
-            current_avg = self.broadcast_stats['avg_broadcast_time']
-            total_messages = self.broadcast_stats['messages_sent']
-            self.broadcast_stats['avg_broadcast_time'] = (
-                (current_avg * (total_messages - sent_count) + broadcast_time * sent_count) / total_messages
-            )
-        
-        if sent_count > 0:
-            logger.debug(f"Broadcasted {channel} message to {sent_count} clients in {broadcast_time:.3f}s")
+        total_broadcasts = (self.broadcast_stats['fusion_broadcasts'] + self.broadcast_stats['trend_broadcasts'] +
+                            self.broadcast_stats['alert_broadcasts'])
+        current_avg = self.broadcast_stats['avg_broadcast_time']
+        self.broadcast_stats['avg_broadcast_time'] = current_avg + (broadcast_time - current_avg) / max(total_broadcasts, 1)
+        
+        logger.debug(f"Queued {channel} message for {queued} clients in {broadcast_time:.4f}s")
+        return queued
     
-    async def _send_to_client(self, websocket: WebSocket, message: Dict[str, Any]):
-        """Send message to specific client"""
+    async def _client_writer(self, connection: ClientConnection):
+        """Drain one client's send queue onto its socket"""
         
+        websocket = connection.websocket
         try:
-            await websocket.send_text(json.dumps(message, cls=DateTimeEncoder))
+            while True:
+                item = await connection.next_frame()
+                if isinstance(item, dict):
+                    await self._send_protocol_frame(connection, item)
+                else:
+                    await websocket.send_text(item)
+                connection.frames_sent += 1
+                self.broadcast_stats['messages_sent'] += 1
+        except asyncio.CancelledError:
+            raise
         except WebSocketDisconnect:
             await self.disconnect(websocket)
         except Exception as e:
+            self.broadcast_stats['messages_failed'] += 1
             logger.error(f"Failed to send message to client: {str(e)}")
             await self.disconnect(websocket)
-            raise e
+    
+    async def _send_protocol_frame(self, connection: ClientConnection, first_message: Dict[str, Any]):
+        """Batch and encode raw event messages for a client that negotiated a StreamProtocol"""
+        
+        protocol = connection.protocol
+        if protocol is None:
+            # Client renegotiated back to legacy frames while messages were queued
+            await connection.websocket.send_text(encode_message(first_message))
+            return
+        
+        messages = [first_message]
+        if protocol.batch:
+            await asyncio.sleep(protocol.flush_interval)
+            messages.extend(connection.take_messages(protocol.max_batch_size - 1))
+        
+        prepared = []
+        for message in messages:
+            envelope = {key: value for key, value in message.items() if key != 'data'}
+            data = message.get('data')
+            if not isinstance(data, dict):
+                data = {'value': data}
+            prepared.append(protocol.event(message.get('type', 'message'), data, envelope))
+        
+        payload = protocol.encode(protocol.frame(prepared))
+        if protocol.binary:
+            await connection.websocket.send_bytes(payload)
+        else:
+            await connection.websocket.send_text(payload)
+    
+    async def _send_to_client(self, websocket: WebSocket, message: Dict[str, Any]):
+        """Send message to specific client (through its send queue, preserving frame order)"""
+        
+        connection = self.client_connections.get(websocket)
+        if connection is not None:
+            connection.enqueue(encode_message(message))
+    
+    async def close(self):
+        """Stop the broadcaster and every client writer"""
+        
+        tasks = list(self.channel_tasks)
+        if self.broadcaster_task:
+            tasks.append(self.broadcaster_task)
+        tasks.extend(c.writer_task for c in self.client_connections.values() if c.writer_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.broadcaster_task = None
+        self.channel_tasks = []
     
     def get_broadcaster_stats(self) -> Dict[str, Any]:
         """Get comprehensive broadcaster statistics"""
@@ -421,6 +561,7 @@ class WebSocketBroadcaster:
             'message_stats': {
                 'sent': self.broadcast_stats['messages_sent'],
                 'failed': self.broadcast_stats['messages_failed'],
+                'dropped': self.broadcast_stats['messages_dropped'],
                 'success_rate': (
                     self.broadcast_stats['messages_sent'] / 
                     max(self.broadcast_stats['messages_sent'] + self.broadcast_stats['messages_failed'], 1)
@@ -437,14 +578,25 @@ class WebSocketBroadcaster:
                     'fusion': self.fusion_queue.qsize(),
                     'trends': self.trend_queue.qsize(),
                     'alerts': self.alert_queue.qsize()
-                }
+                },
+                'client_queue_sizes': {
+                    metadata['client_id']: len(self.client_connections[websocket].pending)
+                    for websocket, metadata in self.client_metadata.items()
+                    if websocket in self.client_connections
+                },
+                'overflow_policy': self.overflow_policy
             },
             'client_details': {
                 websocket: {
                     'client_id': metadata['client_id'],
                     'connected_duration': (datetime.now() - metadata['connected_at']).total_seconds(),
                     'messages_received': metadata['messages_received'],
-                    'subscriptions': list(self.client_subscriptions.get(websocket, set()))
+                    'subscriptions': list(self.client_subscriptions.get(websocket, set())),
+                    'protocol': (
+                        self.client_connections[websocket].protocol.describe()
+                        if websocket in self.client_connections and self.client_connections[websocket].protocol
+                        else None
+                    )
                 }
                 for websocket, metadata in self.client_metadata.items()
             }
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Analysis Context - One semantic/fusion pass per content within a request
+Per-request memo of in-flight analyses, backed by the shared content-hash result cache
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .result_cache import ContentResultCache, get_result_cache
+
+
+class AnalysisContext:
+    """Per-request memo threaded through the phase engines.
+
+    Each semantic/fusion analysis runs at most once per (content, parameters) within a
+    request; concurrent callers await the same in-flight task and each receives its own
+    deep copy, so one phase mutating its result cannot leak into another. Across requests,
+    semantic results are cached by the semantic engine itself and fusion results by the
+    shared ``fusion_content`` ContentResultCache, which also hands out private copies.
+    """
+
+    # Bump whenever fusion scoring changes so cached results from older logic are not reused
+    FUSION_CACHE_VERSION = "fusion_content_v1"
+
+    def __init__(self, fusion_cache: Optional[ContentResultCache] = None):
+        self.fusion_cache = fusion_cache
+        self._results: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def cache_key(kind: str, content: str, *params) -> str:
+        """In-flight key for this request only; the shared cache uses its own versioned make_key"""
+        raw = json.dumps([kind, content, params], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8', 'replace')).hexdigest()
+
+    async def get_or_compute(self, kind: str, content: str, compute: Callable[[], Awaitable[Any]], *params,
+                             shared_cache: Optional[ContentResultCache] = None) -> Any:
+        key = self.cache_key(kind, content, *params)
+        task = self._results.get(key)
+        if task is None:
+            # Versioned key, so bumping the engine version also misses rows on the disk tier
+            shared_key = shared_cache.make_key(content, kind, *params) if shared_cache is not None else None
+            task = asyncio.ensure_future(self._compute(shared_key, compute, shared_cache))
+            self._results[key] = task
+        return copy.deepcopy(await task)
+
+    @staticmethod
+    async def _compute(shared_key: Optional[str], compute: Callable[[], Awaitable[Any]],
+                       shared_cache: Optional[ContentResultCache]) -> Any:
+        if shared_cache is not None:
+            cached = await shared_cache.aget(shared_key)
+            if cached is not None:
+                return cached
+        result = await compute()
+        if shared_cache is not None:
+            shared_cache.put(shared_key, result)
+        return result
+
+    async def semantic(self, semantic_engine, content: str, context: Dict = None):
+        return await self.get_or_compute(
+            'semantic', content, lambda: semantic_engine.analyze_semantic_content(content, context), context
+        )
+
+    async def fusion(self, fusion_engine, content: str, platform: str = "unknown"):
+        # Resolved per call so the cache picks up configure_result_caches() settings
+        shared_cache = self.fusion_cache or get_result_cache("fusion_content", self.FUSION_CACHE_VERSION)
+        return await self.get_or_compute(
+            'fusion', content, lambda: fusion_engine.analyze_content(content, platform), platform,
+            shared_cache=shared_cache
+        )
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Coalescing Cache - Single-flight async result cache
+Bounded (entries and bytes) LRU with TTL, stale-while-revalidate and in-flight request coalescing
+"""
+
+import asyncio
+import logging
+import pickle
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingResultCache:
+    """Async result cache where concurrent identical requests share one computation.
+
+    A miss starts the computation as a task; every other caller asking for the same key
+    while it runs awaits that task instead of starting its own. Results are fresh for
+    ``ttl_seconds``; for a further ``stale_ttl_seconds`` the stale value is served
+    immediately while a single background refresh replaces it. The least recently used
+    entries are evicted once ``max_entries`` or ``max_bytes`` (pickled size) is exceeded.
+    Failed computations are never cached - their exception goes to every waiting caller.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float = 300, stale_ttl_seconds: float = 300,
+                 max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._bytes = 0
+
+        self.stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'revalidations': 0,
+            'expired': 0,
+            'evictions': 0,
+            'failures': 0
+        }
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry[2]
+            if age < self.ttl_seconds + self.stale_ttl_seconds:
+                self._entries.move_to_end(key)
+                self.stats['stale_hits'] += 1
+                if key not in self._inflight:
+                    self.stats['revalidations'] += 1
+                    self._start(key, compute)
+                return entry[2]
+            self._discard(key)
+            self.stats['expired'] += 1
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats['coalesced'] += 1
+        else:
+            self.stats['misses'] += 1
+            task = self._start(key, compute)
+        # Shielded so one caller giving up does not cancel the work the others are waiting on
+        return await asyncio.shield(task)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Fresh cached value for ``key`` without starting a computation"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl_seconds:
+            return default
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        return entry[2]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value produced outside ``get_or_compute`` (e.g. assembled from a stream)"""
+        self._store(key, value)
+
+    def _start(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = asyncio.ensure_future(self._run(key, compute))
+        self._inflight[key] = task
+        task.add_done_callback(self._log_failure)
+        return task
+
+    async def _run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await compute()
+            self._store(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _log_failure(self, task: asyncio.Task) -> None:
+        # Retrieving the exception here also keeps unawaited refreshes from warning at shutdown
+        if task.cancelled() or task.exception() is None:
+            return
+        self.stats['failures'] += 1
+        logger.warning(f"⚠️ Cache '{self.name}' computation failed: {task.exception()}")
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        size = self._size_of(value)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._discard(key)
+        self._entries[key] = (time.monotonic(), size, value)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            self._discard(next(iter(self._entries)))
+            self.stats['evictions'] += 1
+
+    def _discard(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    @staticmethod
+    def _size_of(value: Any) -> int:
+        try:
+            return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return sys.getsizeof(value)
+
+    def clear(self) -> None:
+        """Drop cached values; computations already in flight still complete for their waiters"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        served = self.stats['hits'] + self.stats['stale_hits'] + self.stats['coalesced']
+        lookups = served + self.stats['misses']
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'ttl_seconds': self.ttl_seconds,
+            'stale_ttl_seconds': self.stale_ttl_seconds,
+            'in_flight': len(self._inflight),
+            'hit_rate': served / lookups if lookups else 0.0,
+            **self.stats
+        }
@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+Master Discovery Service - Reddit pain point discovery for the master API
+Fetches subreddit posts, filters business content and scores posts for SaaS pain points
+
+``reddit_client`` is the master API's MasterRedditClient, or anything providing its
+``get_subreddit_posts()`` and ``filter_business_posts()`` methods.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from src.api.shared.services.master_database import MasterDatabaseService
+
+logger = logging.getLogger(__name__)
+
+
+class MasterDiscoveryService:
+    """Crown jewel discovery service with 999+ lines of sophisticated business intelligence"""
+
+    def __init__(self, db_service: MasterDatabaseService, reddit_client: Any):
+        self.db_service = db_service
+        self.reddit_client = reddit_client
+
+        # Target subreddits for SaaS discovery
+        self.target_subreddits = [
+            'startups', 'Entrepreneur', 'SaaS', 'freelance', 'smallbusiness',
+            'indiehackers', 'entrepreneur', 'business', 'marketing', 'webdev',
+            'productivity', 'consulting', 'remotework', 'devtools'
+        ]
+
+        # Enhanced pain point indicators
+        self.pain_indicators = {
+            'high_intensity': ['hate', 'terrible', 'nightmare', 'impossible', 'broken', 'awful', 'disaster'],
+            'workflow_friction': ['wasting time', 'manual', 'tedious', 'repetitive', 'inefficient', 'slow', 'clunky'],
+            'solution_seeking': ['need help', 'looking for', 'wish there was', 'no solution', "can't find", 'how do i'],
+            'problem_patterns': ['problem with', 'issue with', 'struggling with', 'difficulty with', 'challenge with'],
+            'urgency': ['urgent', 'asap', 'immediately', 'deadline', 'critical', 'emergency', 'desperate']
+        }
+
+        # Fan-out discovery limits
+        self.max_concurrent_fetches = 6
+        self.analysis_workers = 8
+
+        logger.info("Master Discovery Service initialized")
+
+    async def discover_pain_points(self, subreddit: str = 'startups', limit: int = 5) -> Dict:
+        """Main discovery method - analyze Reddit posts for business pain points"""
+        session_id = f"session_{uuid.uuid4().hex}"
+
+        logger.info(f"Starting pain point discovery for r/{subreddit} (limit: {limit})")
+
+        try:
+            # Fetch posts from Reddit
+            posts = await self.reddit_client.get_subreddit_posts(
+                subreddit=subreddit,
+                sort='new',
+                limit=limit * 3,  # Fetch more to account for filtering
+                time_filter='day'
+            )
+
+            if not posts:
+                logger.warning(f"No posts retrieved from r/{subreddit}")
+                return {
+                    'success': False,
+                    'error': 'No posts retrieved from Reddit',
+                    'session_id': session_id
+                }
+
+            # Process posts for pain points (spam and business-context filters run over the whole batch)
+            pain_points = []
+            posts_analyzed = 0
+
+            for post, business_context in self.reddit_client.filter_business_posts(posts):
+                posts_analyzed += 1
+
+                # Analyze for pain points
+                pain_analysis = await self._analyze_post_for_pain_points(post)
+                if pain_analysis and pain_analysis['has_pain_point']:
+                    pain_points.append(pain_analysis)
+
+                if len(pain_points) >= limit:
+                    break
+
+            # Save session and its pain points to database in one transaction
+            await self.db_service.save_discovery_session(
+                session_id=session_id,
+                user_id=1,  # Default user for now
+                subreddit=subreddit,
+                posts_analyzed=posts_analyzed,
+                pain_points_found=len(pain_points),
+                pain_points=pain_points
+            )
+
+            logger.info(f"Discovery complete: {posts_analyzed} posts analyzed, {len(pain_points)} pain points found")
+
+            return {
+                'success': True,
+                'subreddit': subreddit,
+                'posts_analyzed': posts_analyzed,
+                'pain_points_found': len(pain_points),
+                'pain_points': pain_points,
+                'session_id': session_id,
+                'timestamp': datetime.now().isoformat()
+            }
+
+        except Exception as e:
+            logger.error(f"Error in pain point discovery: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'session_id': session_id
+            }
+
+    async def stream_pain_points(self, subreddits: Optional[List[str]] = None, limit_per_subreddit: int = 5,
+                                 incremental: bool = False) -> AsyncIterator[Dict]:
+        """Fan-out discovery across subreddits, yielding events as they happen
+
+        All subreddits are fetched concurrently; posts seen in more than one subreddit are analyzed
+        once (credited to the first subreddit that returned them). Surviving posts go through a
+        bounded pool of analysis workers, and every pain point is yielded as soon as it is found.
+        With ``incremental=True`` (repeated scans such as the overnight cycle) each subreddit's
+        ``new`` listing is only read up to the newest post the previous incremental scan saw:
+
+        - ``{'event': 'subreddit_fetched', 'subreddit', 'posts_fetched', 'duplicates', 'candidates'}``
+        - ``{'event': 'pain_point', 'subreddit', 'pain_point'}``
+        - ``{'event': 'complete', ...}`` with the same summary ``discover_all_subreddits`` returns
+        """
+        session_id = f"session_{uuid.uuid4().hex}"
+        # Reddit names are case-insensitive ('Entrepreneur' and 'entrepreneur' are one subreddit)
+        unique = {}
+        for subreddit in subreddits or self.target_subreddits:
+            unique.setdefault(subreddit.lower(), subreddit)
+        subreddits = list(unique.values())
+
+        started = time.time()
+        events: asyncio.Queue = asyncio.Queue()
+        work: asyncio.Queue = asyncio.Queue()
+        fetch_semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+        seen_post_ids: Set[str] = set()
+        results = {
+            subreddit: {'posts_fetched': 0, 'duplicates': 0, 'posts_analyzed': 0, 'pain_points': []}
+            for subreddit in subreddits
+        }
+
+        async def fetch(subreddit: str):
+            async with fetch_semaphore:
+                posts = await self.reddit_client.get_subreddit_posts(
+                    subreddit=subreddit,
+                    sort='new',
+                    limit=limit_per_subreddit * 3,  # Fetch more to account for filtering
+                    time_filter='day',
+                    incremental=incremental
+                )
+
+            result = results[subreddit]
+            result['posts_fetched'] = len(posts)
+            fresh = []
+            for post in posts:
+                post_id = post.get('id')
+                if post_id in seen_post_ids:
+                    result['duplicates'] += 1
+                    continue
+                if post_id:
+                    seen_post_ids.add(post_id)
+                fresh.append(post)
+
+            candidates = self.reddit_client.filter_business_posts(fresh)
+            for post, _ in candidates:
+                work.put_nowait((subreddit, post))
+            await events.put({
+                'event': 'subreddit_fetched',
+                'subreddit': subreddit,
+                'posts_fetched': len(posts),
+                'duplicates': result['duplicates'],
+                'candidates': len(candidates)
+            })
+
+        async def analyze():
+            while True:
+                item = await work.get()
+                if item is None:
+                    return
+                subreddit, post = item
+                result = results[subreddit]
+                if len(result['pain_points']) >= limit_per_subreddit:
+                    continue
+
+                result['posts_analyzed'] += 1
+                try:
+                    pain_analysis = await self._analyze_post_for_pain_points(post)
+                except Exception as e:
+                    logger.error(f"Error analyzing post {post.get('id')} from r/{subreddit}: {e}")
+                    continue
+
+                if pain_analysis and pain_analysis['has_pain_point'] and len(result['pain_points']) < limit_per_subreddit:
+                    pain_analysis['subreddit'] = subreddit
+                    result['pain_points'].append(pain_analysis)
+                    await events.put({'event': 'pain_point', 'subreddit': subreddit, 'pain_point': pain_analysis})
+                await asyncio.sleep(0)  # let fetches and the consumer interleave with CPU-bound analysis
+
+        async def run():
+            workers = [asyncio.create_task(analyze()) for _ in range(self.analysis_workers)]
+            try:
+                fetched = await asyncio.gather(*(fetch(subreddit) for subreddit in subreddits), return_exceptions=True)
+                for subreddit, outcome in zip(subreddits, fetched):
+                    if isinstance(outcome, Exception):
+                        logger.error(f"Error fetching r/{subreddit}: {outcome}")
+                for _ in workers:
+                    work.put_nowait(None)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                events.put_nowait(None)
+
+        logger.info(f"Starting fan-out discovery across {len(subreddits)} subreddits (limit: {limit_per_subreddit} each)")
+        runner = asyncio.create_task(run())
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            await runner
+
+            # Persist one session per subreddit that returned posts
+            await asyncio.gather(*(
+                self.db_service.save_discovery_session(
+                    session_id=f"{session_id}_{subreddit.lower()}",
+                    user_id=1,  # Default user for now
+                    subreddit=subreddit,
+                    posts_analyzed=result['posts_analyzed'],
+                    pain_points_found=len(result['pain_points']),
+                    pain_points=result['pain_points']
+                )
+                for subreddit, result in results.items() if result['posts_fetched']
+            ))
+
+            pain_points = [pain_point for result in results.values() for pain_point in result['pain_points']]
+            logger.info(f"Fan-out discovery complete: {len(pain_points)} pain points from {len(subreddits)} subreddits "
+                        f"in {time.time() - started:.1f}s")
+            yield {
+                'event': 'complete',
+                'success': True,
+                'subreddits': {
+                    subreddit: {key: value for key, value in result.items() if key != 'pain_points'}
+                    for subreddit, result in results.items()
+                },
+                'posts_fetched': sum(result['posts_fetched'] for result in results.values()),
+                'duplicates': sum(result['duplicates'] for result in results.values()),
+                'posts_analyzed': sum(result['posts_analyzed'] for result in results.values()),
+                'pain_points_found': len(pain_points),
+                'pain_points': pain_points,
+                'session_id': session_id,
+                'duration_seconds': time.time() - started,
+                'timestamp': datetime.now().isoformat()
+            }
+        finally:
+            if not runner.done():
+                runner.cancel()
+
+    async def discover_all_subreddits(self, subreddits: Optional[List[str]] = None, limit_per_subreddit: int = 5,
+                                      incremental: bool = False) -> Dict:
+        """Run ``stream_pain_points`` to completion and return its summary"""
+        try:
+            summary = {}
+            async for event in self.stream_pain_points(subreddits, limit_per_subreddit, incremental):
+                if event['event'] == 'complete':
+                    summary = event
+            summary.pop('event', None)
+            return summary
+        except Exception as e:
+            logger.error(f"Error in fan-out discovery: {e}")
+            return {'success': False, 'error': str(e)}
+
+    async def _analyze_post_for_pain_points(self, post: Dict) -> Optional[Dict]:
+        """Analyze individual post for pain points using rule-based approach"""
+        title = post.get('title', '')
+        body = post.get('selftext', '')
+        text = f"{title} {body}".lower()
+
+        # Check if post contains pain indicators
+        if not self._has_pain_indicators(text):
+            return None
+
+        # Perform rule-based pain analysis
+        pain_analysis = self._rule_based_pain_analysis(post, text)
+
+        if pain_analysis['opportunity_score'] < 15:  # Minimum threshold
+            return None
+
+        return pain_analysis
+
+    def _has_pain_indicators(self, text: str) -> bool:
+        """Check if text contains pain point indicators"""
+        for category, indicators in self.pain_indicators.items():
+            for indicator in indicators:
+                if indicator in text:
+                    return True
+        return False
+
+    def _rule_based_pain_analysis(self, post: Dict, text: str) -> Dict:
+        """Rule-based pain point analysis"""
+
+        # Score components
+        market_size_score = self._score_market_size(text)
+        urgency_score = self._score_urgency(text)
+        solution_gap_score = self._score_solution_gap(text)
+        monetization_score = self._score_monetization(text)
+
+        total_score = market_size_score + urgency_score + solution_gap_score + monetization_score
+        confidence = self._calculate_confidence(post, text, total_score)
+
+        # Extract pain point description
+        pain_description = self._extract_pain_point_description(text)
+
+        # Classify business domain
+        domain = self._classify_domain(text)
+
+        # Generate opportunity description
+        opportunity_description = self._generate_opportunity_description(pain_description, domain)
+
+        # Determine target market
+        target_market = self._determine_target_market(text, domain)
+
+        # Extract validation signals
+        validation_signals = self._extract_validation_signals(post, text)
+
+        return {
+            'has_pain_point': True,
+            'post_id': post.get('id'),
+            'title': post.get('title'),
+            'url': f"https://reddit.com{post.get('permalink', '')}",
+            'score': post.get('score', 0),
+            'num_comments': post.get('num_comments', 0),
+            'description': pain_description,
+            'opportunity_description': opportunity_description,
+            'opportunity_score': total_score,
+            'total_score': total_score,  # Add for consistency
+            'market_size_score': market_size_score,
+            'urgency_score': urgency_score,
+            'solution_gap_score': solution_gap_score,
+            'monetization_score': monetization_score,
+            'confidence': confidence,
+            'business_domain': domain,
+            'target_market': target_market,
+            'validation_signals': validation_signals,
+            'created_at': datetime.now().isoformat()
+        }
+
+    def _score_market_size(self, text: str) -> int:
+        """Score market size indicators"""
+        large_market_indicators = [
+            'everyone', 'all businesses', 'every company', 'millions', 'thousands',
+            'small business', 'enterprise', 'startup', 'freelancer', 'agency'
+        ]
+
+        score = 0
+        for indicator in large_market_indicators:
+            if indicator in text:
+                score += 5
+
+        return min(score, 25)  # Cap at 25
+
+    def _score_urgency(self, text: str) -> int:
+        """Score urgency indicators"""
+        urgency_words = [
+            'urgent', 'asap', 'immediately', 'deadline', 'critical', 'emergency',
+            'desperate', 'quickly', 'fast', 'now', 'today', 'this week'
+        ]
+
+        score = 0
+        for word in urgency_words:
+            if word in text:
+                score += 8
+
+        return min(score, 25)  # Cap at 25
+
+    def _score_solution_gap(self, text: str) -> int:
+        """Score solution gap indicators"""
+        gap_indicators = [
+            'no solution', "can't find", 'nothing works', 'no tool', 'no software',
+            'manually', 'spreadsheet', 'email', 'paper', 'phone calls',
+            'wish there was', 'need something', 'looking for'
+        ]
+
+        score = 0
+        for indicator in gap_indicators:
+            if indicator in text:
+                score += 6
+
+        return min(score, 25)  # Cap at 25
+
+    def _score_monetization(self, text: str) -> int:
+        """Score monetization potential"""
+        money_indicators = [
+            'money', 'revenue', 'profit', 'cost', 'expensive', 'budget',
+            'price', 'subscription', 'business', 'company', 'client',
+            'customer', 'sales', 'billing', 'invoice'
+        ]
+
+        score = 0
+        for indicator in money_indicators:
+            if indicator in text:
+                score += 4
+
+        return min(score, 25)  # Cap at 25
+
+    def _calculate_confidence(self, post: Dict, text: str, total_score: int) -> float:
+        """Calculate confidence score"""
+        confidence = 0.0
+
+        # Base confidence from score
+        confidence += min(total_score / 100.0, 0.4)
+
+        # Reddit engagement signals
+        score = post.get('score', 0)
+        comments = post.get('num_comments', 0)
+
+        if score > 10:
+            confidence += 0.1
+        if score > 50:
+            confidence += 0.1
+        if comments > 5:
+            confidence += 0.1
+        if comments > 20:
+            confidence += 0.1
+
+        # Content quality signals
+        if len(text) > 200:
+            confidence += 0.1
+        if len(text) > 500:
+            confidence += 0.1
+
+        return min(confidence, 1.0)
+
+    def _extract_pain_point_description(self, text: str) -> str:
+        """Extract pain point description from text"""
+        # Find sentences containing pain indicators
+        sentences = text.split('.')
+        pain_sentences = []
+
+        for sentence in sentences:
+            for category, indicators in self.pain_indicators.items():
+                for indicator in indicators:
+                    if indicator in sentence:
+                        pain_sentences.append(sentence.strip())
+                        break
+
+        if pain_sentences:
+            return '. '.join(pain_sentences[:2])  # Return first 2 sentences
+
+        return text[:200] + "..." if len(text) > 200 else text
+
+    def _classify_domain(self, text: str) -> str:
+        """Classify business domain"""
+        domain_patterns = {
+            'software': ['software', 'app', 'platform', 'code', 'api', 'saas', 'tech'],
+            'marketing': ['marketing', 'advertising', 'social media', 'seo', 'content'],
+            'finance': ['finance', 'accounting', 'money', 'payment', 'fintech'],
+            'healthcare': ['health', 'medical', 'doctor', 'patient', 'clinic'],
+            'ecommerce': ['ecommerce', 'online store', 'shopify', 'selling'],
+            'productivity': ['productivity', 'workflow', 'automation', 'efficiency'],
+            'education': ['education', 'learning', 'course', 'training', 'teach']
+        }
+
+        for domain, keywords in domain_patterns.items():
+            for keyword in keywords:
+                if keyword in text:
+                    return domain
+
+        return 'general'
+
+    def _generate_opportunity_description(self, pain_point: str, domain: str) -> str:
+        """Generate opportunity description"""
+        domain_solutions = {
+            'software': 'Build a SaaS tool that',
+            'marketing': 'Create a marketing platform that',
+            'finance': 'Develop a fintech solution that',
+            'healthcare': 'Build a healthcare app that',
+            'ecommerce': 'Create an ecommerce tool that',
+            'productivity': 'Develop a productivity app that',
+            'education': 'Build an educational platform that'
+        }
+
+        prefix = domain_solutions.get(domain, 'Create a solution that')
+        return f"{prefix} addresses: {pain_point[:100]}..."
+
+    def _determine_target_market(self, text: str, domain: str) -> str:
+        """Determine target market"""
+        market_indicators = {
+            'small business': ['small business', 'small company', 'startup'],
+            'enterprise': ['enterprise', 'large company', 'corporation'],
+            'freelancers': ['freelancer', 'consultant', 'independent'],
+            'agencies': ['agency', 'marketing agency', 'design agency'],
+            'developers': ['developer', 'programmer', 'coder'],
+            'entrepreneurs': ['entrepreneur', 'founder', 'business owner']
+        }
+
+        for market, keywords in market_indicators.items():
+            for keyword in keywords:
+                if keyword in text:
+                    return market
+
+        return 'general business'
+
+    def _extract_validation_signals(self, post: Dict, text: str) -> List[str]:
+        """Extract validation signals"""
+        signals = []
+
+        # Reddit engagement
+        score = post.get('score', 0)
+        comments = post.get('num_comments', 0)
+
+        if score > 10:
+            signals.append(f"High Reddit engagement ({score} upvotes)")
+        if comments > 5:
+            signals.append(f"Active discussion ({comments} comments)")
+
+        # Text analysis
+        if 'everyone has this problem' in text:
+            signals.append("Widespread problem indication")
+        if 'paying for' in text or 'would pay' in text:
+            signals.append("Willingness to pay mentioned")
+        if 'tried everything' in text:
+            signals.append("Existing solutions inadequate")
+
+        return signals
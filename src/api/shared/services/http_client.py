@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client - Pooled aiohttp session with per-host pacing
+Keep-alive connection reuse, DNS caching, rate-limit header awareness and conditional GETs
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPResult:
+    """Outcome of a JSON request"""
+    status: int
+    data: Any = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    not_modified: bool = False  # served from the conditional-request cache after a 304
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200
+
+
+class HostPacer:
+    """Adaptive request pacing for one host driven by ``X-Ratelimit-*`` response headers.
+
+    With ``remaining`` requests left in a window that resets in ``reset`` seconds, requests are
+    spread evenly over what is left of the window instead of bursting into a 429. A 429 pauses
+    the host for ``Retry-After`` (or the reset time).
+    """
+
+    def __init__(self, min_interval: float = 0.0):
+        self.min_interval = min_interval
+        self.interval = min_interval
+        self.next_request_at = 0.0
+        self.remaining: Optional[float] = None
+        self.reset_seconds: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> float:
+        """Wait for this host's next slot; returns the seconds waited"""
+        async with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self.next_request_at - now)
+            if delay:
+                await asyncio.sleep(delay)
+            self.next_request_at = max(now, self.next_request_at) + self.interval
+            return delay
+
+    def update(self, status: int, headers) -> None:
+        now = time.monotonic()
+        remaining = _float_header(headers, 'X-Ratelimit-Remaining')
+        reset = _float_header(headers, 'X-Ratelimit-Reset')
+        if remaining is not None and reset is not None:
+            self.remaining, self.reset_seconds = remaining, reset
+            if remaining < 1:
+                self.interval = self.min_interval
+                self.next_request_at = max(self.next_request_at, now + reset)
+            else:
+                self.interval = max(self.min_interval, reset / remaining)
+
+        if status == 429:
+            retry_after = _float_header(headers, 'Retry-After') or reset or 60.0
+            self.next_request_at = max(self.next_request_at, now + retry_after)
+
+
+def _float_header(headers, name: str) -> Optional[float]:
+    value = headers.get(name) if headers is not None else None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class SharedHTTPClient:
+    """Lifecycle-managed aiohttp session shared by every caller of one upstream API.
+
+    The session is created lazily on the running event loop (and recreated if the loop changes),
+    so a module-level instance is safe to import anywhere. Connections are pooled with keep-alive,
+    capped per host, and DNS lookups are cached. GETs made with ``conditional=True`` send
+    ``If-None-Match``/``If-Modified-Since`` from the previous response and return the cached body
+    on ``304 Not Modified``.
+    """
+
+    def __init__(self, name: str, limit: int = 100, limit_per_host: int = 8, ttl_dns_cache: int = 300,
+                 keepalive_timeout: float = 30.0, total_timeout: float = 30.0, min_host_interval: float = 0.0,
+                 headers: Optional[Dict[str, str]] = None, max_conditional_entries: int = 512):
+        self.name = name
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout)
+        self.min_host_interval = min_host_interval
+        self.headers = headers or {}
+        self.max_conditional_entries = max_conditional_entries
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pacers: Dict[str, HostPacer] = {}
+        # request key -> (validators, body)
+        self._conditional: "OrderedDict[str, Tuple[Dict[str, str], Any]]" = OrderedDict()
+
+        self.stats = {
+            'requests': 0,
+            'errors': 0,
+            'not_modified': 0,
+            'rate_limited': 0,
+            'paced_seconds': 0.0,
+            'sessions_created': 0
+        }
+
+    async def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # A session left over from another (finished) loop cannot be awaited from here; replace it
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout, headers=self.headers)
+            self._loop = loop
+            self._pacers.clear()  # pacer locks are bound to the old loop
+            self.stats['sessions_created'] += 1
+            logger.info(f"🔌 HTTP client '{self.name}' session created")
+        return self._session
+
+    def pacer(self, url: str) -> HostPacer:
+        host = urlparse(url).netloc
+        pacer = self._pacers.get(host)
+        if pacer is None:
+            pacer = self._pacers[host] = HostPacer(self.min_host_interval)
+        return pacer
+
+    async def request_json(self, method: str, url: str, *, params: Optional[Dict[str, Any]] = None,
+                           headers: Optional[Dict[str, str]] = None, data: Any = None,
+                           auth: Optional[aiohttp.BasicAuth] = None, conditional: bool = False) -> HTTPResult:
+        """Send a request and decode a JSON body; network errors are returned as status 0"""
+        session = await self.session()
+        pacer = self.pacer(url)
+        self.stats['paced_seconds'] += await pacer.wait()
+
+        request_headers = dict(headers or {})
+        cache_key = None
+        if conditional and method.upper() == 'GET':
+            cache_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+            cached = self._conditional.get(cache_key)
+            if cached is not None:
+                request_headers.update(cached[0])
+
+        self.stats['requests'] += 1
+        try:
+            async with session.request(method, url, params=params, headers=request_headers,
+                                       data=data, auth=auth) as response:
+                pacer.update(response.status, response.headers)
+                response_headers = dict(response.headers)
+
+                if response.status == 304 and cache_key in self._conditional:
+                    self._conditional.move_to_end(cache_key)
+                    self.stats['not_modified'] += 1
+                    return HTTPResult(200, self._conditional[cache_key][1], response_headers, not_modified=True)
+                if response.status == 429:
+                    self.stats['rate_limited'] += 1
+                    logger.warning(f"⚠️ {self.name}: rate limited by {urlparse(url).netloc}")
+                if response.status != 200:
+                    return HTTPResult(response.status, None, response_headers)
+
+                body = await response.json(content_type=None)
+                if cache_key is not None:
+                    self._remember(cache_key, response.headers, body)
+                return HTTPResult(200, body, response_headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self.stats['errors'] += 1
+            logger.error(f"❌ {self.name}: {method} {url} failed: {e}")
+            return HTTPResult(0)
+
+    def _remember(self, cache_key: str, headers, body: Any) -> None:
+        validators = {}
+        if headers.get('ETag'):
+            validators['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = headers['Last-Modified']
+        if not validators:
+            return
+        self._conditional[cache_key] = (validators, body)
+        self._conditional.move_to_end(cache_key)
+        while len(self._conditional) > self.max_conditional_entries:
+            self._conditional.popitem(last=False)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'open': self._session is not None and not self._session.closed,
+            'conditional_entries': len(self._conditional),
+            'hosts': {
+                host: {'interval': pacer.interval, 'remaining': pacer.remaining, 'reset_seconds': pacer.reset_seconds}
+                for host, pacer in self._pacers.items()
+            },
+            **self.stats
+        }
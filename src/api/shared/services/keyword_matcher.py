@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher - Compiled multi-pattern keyword matching
+Finds every keyword of a categorized vocabulary in a text or a whole batch of texts,
+switching from per-keyword substring search to a trie-shaped regex for large vocabularies.
+
+Only vocabularies of TRIE_THRESHOLD (250) keywords or more get the single-pass trie. The
+per-text detectors (trend, sentiment, spam/business, context relevance, pain point and
+domain vocabularies, roughly 7-120 keywords each) stay on substring search: at those sizes
+``keyword in text`` beats every compiled alternative in CPython (about 12 us vs 45 us for
+the trie at 30 keywords over 500 chars). For them the matcher only builds each vocabulary
+once instead of per call; batch callers still gain from presence_matrix.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Set
+
+import numpy as np
+
+
+def trie_regex(keywords: Iterable[str]) -> str:
+    """Regex source matching any of ``keywords``, shaped as a prefix trie.
+
+    Keywords sharing a prefix share one branch (``["tool", "tools", "time"]`` becomes
+    ``t(?:ime|ools?)``), so at any position the engine only follows the branch that matches
+    the next character instead of trying every keyword. Optional suffixes are greedy, so the
+    longest keyword starting at a position wins.
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict) -> str:
+        branches, leaves = [], []
+        for char in sorted(key for key in node if key):
+            rest = build(node[char])
+            if rest:
+                branches.append(re.escape(char) + rest)
+            else:
+                leaves.append(re.escape(char))
+        if leaves:
+            branches.append(leaves[0] if len(leaves) == 1 else f"[{''.join(leaves)}]")
+        if not branches:
+            return ''
+        terminal = '' in node
+        # A lone branch needs no group unless a whole multi-character branch is made optional
+        single_atom = len(branches) == 1 and len(leaves) == len(node) - terminal
+        if len(branches) == 1 and (not terminal or single_atom):
+            body = branches[0]
+        else:
+            body = f"(?:{'|'.join(branches)})"
+        return f"{body}?" if terminal else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Matcher for a categorized keyword vocabulary with ``keyword in text`` semantics.
+
+    Below ``trie_threshold`` keywords each keyword is looked up with ``str`` substring search,
+    which runs in C and beats any per-position regex scan for small vocabularies. At or above
+    it, every keyword is compiled into one trie-shaped regex inside a lookahead: ``finditer``
+    reports the longest keyword starting at each position after following a single trie branch,
+    so the scan cost grows with text length and keyword length but not with vocabulary size.
+    Shorter keywords starting at the same position are prefixes of that match and are added
+    from a precomputed table. Both strategies return exactly the keywords ``in`` the text;
+    ``tools/benchmarks/benchmark_keyword_matcher.py`` measures them against plain loops.
+
+    With ``word_boundary=True`` keywords only match as whole words/phrases.
+    """
+
+    SEPARATOR = '\x00'  # joins batch texts; never part of a keyword and never a word character
+    TRIE_THRESHOLD = 250  # crossover measured by benchmark_keyword_matcher.py
+
+    def __init__(self, vocabularies: Dict[str, Iterable[str]], word_boundary: bool = False,
+                 trie_threshold: int = TRIE_THRESHOLD):
+        self.word_boundary = word_boundary
+        self.categories: List[str] = list(vocabularies)
+
+        self.keywords: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._category_columns: Dict[str, np.ndarray] = {}
+        for category, keywords in vocabularies.items():
+            columns = []
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                if keyword not in self._index:
+                    self._index[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                columns.append(self._index[keyword])
+            self._category_columns[category] = np.array(sorted(set(columns)), dtype=np.int64)
+
+        self.strategy = 'trie' if len(self.keywords) >= trie_threshold else 'substring'
+        self._pattern = None
+        self._boundary_patterns: List[re.Pattern] = []
+        if self.strategy == 'trie':
+            self._prefixes: List[List[int]] = [self._matching_prefixes(keyword) for keyword in self.keywords]
+            alternation = trie_regex(self.keywords)
+            boundary = r'\b' if word_boundary else ''
+            self._pattern = re.compile(rf'(?={boundary}({alternation}){boundary})')
+        elif word_boundary:
+            self._boundary_patterns = [re.compile(rf'\b{re.escape(keyword)}\b') for keyword in self.keywords]
+
+    def _matching_prefixes(self, keyword: str) -> List[int]:
+        """Other keywords that necessarily match wherever ``keyword`` matches"""
+        prefixes = []
+        for end in range(1, len(keyword)):
+            column = self._index.get(keyword[:end])
+            if column is None:
+                continue
+            if self.word_boundary and _is_word_char(keyword[end - 1]) == _is_word_char(keyword[end]):
+                continue  # the prefix would have to end on a word boundary inside ``keyword``
+            prefixes.append(column)
+        return prefixes
+
+    # Single text
+    def find(self, text: str) -> Set[int]:
+        """Column indexes of every keyword present in ``text``"""
+        if not self.keywords or not text:
+            return set()
+        lowered = text.lower()
+        if self._pattern is not None:
+            found = set()
+            for match in self._pattern.finditer(lowered):
+                column = self._index[match.group(1)]
+                found.add(column)
+                found.update(self._prefixes[column])
+            return found
+        if self.word_boundary:
+            return {
+                column for column, keyword in enumerate(self.keywords)
+                if keyword in lowered and self._boundary_patterns[column].search(lowered)
+            }
+        return {column for column, keyword in enumerate(self.keywords) if keyword in lowered}
+
+    def present(self, text: str) -> Set[str]:
+        return {self.keywords[column] for column in self.find(text)}
+
+    def category_hits(self, text: str) -> Dict[str, int]:
+        """Number of distinct keywords of each category present in ``text``"""
+        found = self.find(text)
+        return {
+            category: sum(1 for column in columns if column in found)
+            for category, columns in self._category_columns.items()
+        }
+
+    # Batches
+    def presence_matrix(self, texts: List[str]) -> np.ndarray:
+        """Boolean (len(texts), len(keywords)) matrix of which keywords each text contains"""
+        matrix = np.zeros((len(texts), len(self.keywords)), dtype=bool)
+        if not self.keywords or not texts:
+            return matrix
+        lowered = [text.lower() for text in texts]  # lowercasing can change length, so offsets use lowered text
+        starts = np.cumsum([0] + [len(text) + 1 for text in lowered[:-1]]).tolist()
+        joined = self.SEPARATOR.join(lowered)
+
+        rows, columns = [], []
+        if self._pattern is not None:
+            for match in self._pattern.finditer(joined):
+                column = self._index[match.group(1)]
+                for matched in [column] + self._prefixes[column]:
+                    rows.append(match.start())
+                    columns.append(matched)
+        else:
+            # One search per (keyword, containing text): after a hit, skip to the next text
+            for column, keyword in enumerate(self.keywords):
+                search = self._boundary_patterns[column].search if self.word_boundary else None
+                position = 0
+                while True:
+                    if search is None:
+                        position = joined.find(keyword, position)
+                        if position < 0:
+                            break
+                    else:
+                        match = search(joined, position)
+                        if match is None:
+                            break
+                        position = match.start()
+                    rows.append(position)
+                    columns.append(column)
+                    doc = bisect_right(starts, position)
+                    if doc >= len(starts):
+                        break
+                    position = starts[doc]
+
+        if rows:
+            doc_rows = np.searchsorted(starts, np.array(rows), side='right') - 1
+            matrix[doc_rows, np.array(columns)] = True
+        return matrix
+
+    def category_counts(self, presence: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-category distinct keyword counts for every row of a presence matrix"""
+        return {
+            category: presence[:, columns].sum(axis=1) if len(columns) else np.zeros(len(presence), dtype=np.int64)
+            for category, columns in self._category_columns.items()
+        }
+
+    def category_size(self, category: str) -> int:
+        return len(self._category_columns[category])
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
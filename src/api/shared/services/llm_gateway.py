@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+LLM Gateway - Async access to the Anthropic Messages API
+Non-blocking requests with a concurrency limit and bounded wait queue, coalesced and
+TTL-cached responses, a reusable (prompt-cached) system prefix and token streaming
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
+
+from .coalescing_cache import CoalescingResultCache
+from .http_client import SharedHTTPClient
+
+logger = logging.getLogger(__name__)
+
+
+class LLMGatewayError(Exception):
+    """The LLM provider could not produce a response"""
+
+
+class LLMGatewayBusy(LLMGatewayError):
+    """Every slot is taken and the wait queue is full"""
+
+
+@dataclass
+class LLMCompletion:
+    """A finished completion"""
+    text: str
+    model: str
+    usage: Dict[str, Any] = field(default_factory=dict)
+    cached: bool = False  # served from the response cache
+
+
+class LLMGateway:
+    """Shared async client for one Anthropic model and system prompt.
+
+    At most ``max_concurrent`` generations run at once; up to ``max_queue`` further callers
+    wait for a slot and anything beyond that fails fast with ``LLMGatewayBusy`` so callers
+    can fall back instead of piling up. Identical prompts are coalesced while in flight and
+    served from a TTL cache afterwards (streamed responses are cached once complete). The
+    system prompt is sent as a stable prefix block marked for provider-side prompt caching.
+    """
+
+    API_VERSION = '2023-06-01'
+
+    def __init__(self, api_key: str, system_prompt: str, model: str = 'claude-3-5-sonnet-20241022',
+                 base_url: str = 'https://api.anthropic.com', max_tokens: int = 1000, temperature: float = 0.7,
+                 max_concurrent: int = 8, max_queue: int = 64, cache_ttl_seconds: float = 600,
+                 request_timeout: float = 120.0, http_client: Optional[SharedHTTPClient] = None):
+        self.model = model
+        self.url = f"{base_url.rstrip('/')}/v1/messages"
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+
+        self.http_client = http_client or SharedHTTPClient(
+            'llm', limit=max_concurrent * 2, limit_per_host=max_concurrent, total_timeout=request_timeout
+        )
+        self.headers = {
+            'x-api-key': api_key,
+            'anthropic-version': self.API_VERSION,
+            'content-type': 'application/json'
+        }
+        # Built once and sent verbatim on every request so the provider can reuse the cached prefix
+        self.system_blocks = [{'type': 'text', 'text': system_prompt, 'cache_control': {'type': 'ephemeral'}}]
+        self._system_digest = hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()
+
+        self.cache = CoalescingResultCache(
+            'llm', ttl_seconds=cache_ttl_seconds, stale_ttl_seconds=0, max_entries=1024, max_bytes=16 * 1024 * 1024
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+        self._running = 0
+
+        self.stats = {
+            'requests': 0,
+            'streams': 0,
+            'cache_hits': 0,
+            'rejected': 0,
+            'errors': 0,
+            'input_tokens': 0,
+            'output_tokens': 0,
+            'cache_read_input_tokens': 0
+        }
+
+    def cache_key(self, user_content: str) -> str:
+        material = json.dumps([self.model, self.max_tokens, self.temperature, self._system_digest, user_content])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _payload(self, user_content: str, stream: bool = False) -> Dict[str, Any]:
+        payload = {
+            'model': self.model,
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature,
+            'system': self.system_blocks,
+            'messages': [{'role': 'user', 'content': user_content}]
+        }
+        if stream:
+            payload['stream'] = True
+        return payload
+
+    @asynccontextmanager
+    async def _slot(self):
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            self.stats['rejected'] += 1
+            raise LLMGatewayBusy(f"LLM gateway busy ({self.max_concurrent} running, {self._waiting} queued)")
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._running += 1
+        try:
+            yield
+        finally:
+            self._running -= 1
+            self._semaphore.release()
+
+    def _record_usage(self, usage: Dict[str, Any]) -> None:
+        for name in ('input_tokens', 'output_tokens', 'cache_read_input_tokens'):
+            self.stats[name] += usage.get(name) or 0
+
+    async def complete(self, user_content: str) -> LLMCompletion:
+        """Generate (or reuse) a full response"""
+        computed = False
+
+        async def generate() -> LLMCompletion:
+            nonlocal computed
+            computed = True
+            return await self._request(user_content)
+
+        completion = await self.cache.get_or_compute(self.cache_key(user_content), generate)
+        if computed:
+            return completion
+        self.stats['cache_hits'] += 1
+        return replace(completion, cached=True)
+
+    async def _request(self, user_content: str) -> LLMCompletion:
+        async with self._slot():
+            self.stats['requests'] += 1
+            result = await self.http_client.request_json(
+                'POST', self.url, headers=self.headers, data=json.dumps(self._payload(user_content))
+            )
+        if not result.ok or not isinstance(result.data, dict):
+            self.stats['errors'] += 1
+            raise LLMGatewayError(f"Messages API returned status {result.status}")
+
+        usage = result.data.get('usage') or {}
+        self._record_usage(usage)
+        text = ''.join(block.get('text', '') for block in result.data.get('content', []) if block.get('type') == 'text')
+        return LLMCompletion(text=text, model=result.data.get('model', self.model), usage=usage)
+
+    async def stream(self, user_content: str) -> AsyncIterator[str]:
+        """Yield response text as it is generated; cached responses arrive as a single chunk"""
+        key = self.cache_key(user_content)
+        cached = self.cache.peek(key)
+        if cached is not None:
+            self.stats['cache_hits'] += 1
+            yield cached.text
+            return
+
+        parts = []
+        usage: Dict[str, Any] = {}
+        model = self.model
+        async with self._slot():
+            self.stats['streams'] += 1
+            session = await self.http_client.session()
+            try:
+                async with session.post(self.url, headers=self.headers,
+                                        data=json.dumps(self._payload(user_content, stream=True))) as response:
+                    if response.status != 200:
+                        raise LLMGatewayError(f"Messages API returned status {response.status}")
+
+                    async for event, data in _server_sent_events(response.content):
+                        if event == 'content_block_delta' and data.get('delta', {}).get('type') == 'text_delta':
+                            text = data['delta'].get('text', '')
+                            parts.append(text)
+                            yield text
+                        elif event == 'message_start':
+                            message = data.get('message', {})
+                            model = message.get('model', model)
+                            usage.update(message.get('usage') or {})
+                        elif event == 'message_delta':
+                            usage.update(data.get('usage') or {})
+                        elif event == 'error':
+                            raise LLMGatewayError(data.get('error', {}).get('message', 'stream error'))
+                        elif event == 'message_stop':
+                            break
+            except LLMGatewayError:
+                self.stats['errors'] += 1
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.stats['errors'] += 1
+                raise LLMGatewayError(f"Messages API stream failed: {e}") from e
+
+        self._record_usage(usage)
+        self.cache.put(key, LLMCompletion(text=''.join(parts), model=model, usage=usage))
+
+    async def close(self) -> None:
+        await self.http_client.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'model': self.model,
+            'max_concurrent': self.max_concurrent,
+            'running': self._running,
+            'queued': self._waiting,
+            'cache': self.cache.get_stats(),
+            **self.stats
+        }
+
+
+async def _server_sent_events(content) -> AsyncIterator:
+    """Parse an SSE byte stream into (event, decoded JSON data) pairs"""
+    event, data_lines = None, []
+    async for raw_line in content:
+        line = raw_line.decode('utf-8').rstrip('\r\n')
+        if not line:
+            if data_lines:
+                try:
+                    yield event, json.loads('\n'.join(data_lines))
+                except ValueError:
+                    logger.warning(f"⚠️ Skipping undecodable LLM stream event: {event}")
+            event, data_lines = None, []
+        elif line.startswith('event:'):
+            event = line[6:].strip()
+        elif line.startswith('data:'):
+            data_lines.append(line[5:].lstrip())
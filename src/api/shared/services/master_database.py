@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Master Database Service - Pooled aiosqlite access to the master API database
+Long-lived WAL connections shared by users, discovery sessions and their pain points
+"""
+
+import asyncio
+import logging
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSQLitePool:
+    """Long-lived pool of aiosqlite connections tuned for a write-heavy WAL database
+
+    Connections are opened lazily on first use and reused afterwards, so each call pays
+    for a statement rather than for a connect/close. Every connection keeps its own
+    prepared-statement cache, which the constant SQL strings below hit on reuse.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",  # fsync at checkpoints only; safe with WAL
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-16000",  # 16 MB page cache per connection
+        "PRAGMA busy_timeout=5000"
+    )
+
+    def __init__(self, db_path: str, size: int = 4, cached_statements: int = 256):
+        self.db_path = db_path
+        self.size = size
+        self.cached_statements = cached_statements
+        self._idle: Optional[asyncio.Queue] = None
+        self._connections: List[aiosqlite.Connection] = []
+        self._loop = None
+        self._open_lock: Optional[asyncio.Lock] = None
+
+    async def _ensure_open(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queues and locks belong to one event loop; start over on a new one
+            await self._close_connections()
+            self._loop = loop
+            self._idle = asyncio.Queue()
+            self._open_lock = asyncio.Lock()
+        if self._connections:
+            return
+        async with self._open_lock:
+            if self._connections:
+                return
+            for _ in range(self.size):
+                db = await aiosqlite.connect(self.db_path, cached_statements=self.cached_statements)
+                for pragma in self.PRAGMAS:
+                    await db.execute(pragma)
+                db.row_factory = aiosqlite.Row
+                self._connections.append(db)
+                self._idle.put_nowait(db)
+            logger.info(f"SQLite pool opened: {self.size} connections to {self.db_path}")
+
+    @asynccontextmanager
+    async def connection(self):
+        """Borrow a connection; it is rolled back if the caller leaves a transaction open"""
+        await self._ensure_open()
+        db = await self._idle.get()
+        try:
+            yield db
+        finally:
+            if db.in_transaction:
+                await db.rollback()
+            self._idle.put_nowait(db)
+
+    async def close(self):
+        await self._close_connections()
+        self._loop = None
+
+    async def _close_connections(self):
+        # close() queues on the connection's own worker thread, so it works from any loop
+        # (and on aiosqlite releases without Connection.stop())
+        connections, self._connections = self._connections, []
+        for db in connections:
+            try:
+                await db.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to close pooled SQLite connection: {e}")
+
+
+class MasterDatabaseService:
+    """Unified database service handling all data operations"""
+
+    INSERT_PAIN_POINT = """INSERT INTO pain_points (session_id, post_id, title, description, opportunity_score,
+                       market_size_score, urgency_score, solution_gap_score, monetization_score,
+                       confidence, business_domain, target_market)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+    INSERT_DISCOVERY_SESSION = "INSERT INTO discovery_sessions (session_id, user_id, subreddit, posts_analyzed, pain_points_found) VALUES (?, ?, ?, ?, ?)"
+
+    def __init__(self, db_path: str = "luciq_master.db", pool_size: int = 4):
+        self.db_path = db_path
+        self.init_database()
+        self.pool = AsyncSQLitePool(db_path, size=pool_size)
+
+    def init_database(self):
+        """Initialize all database tables"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+
+            # WAL is a property of the database file, so this persists for every connection
+            cursor.execute("PRAGMA journal_mode=WAL")
+
+            # Users table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS users (
+                    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT UNIQUE NOT NULL,
+                    email TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    email_verified BOOLEAN DEFAULT FALSE,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_login TIMESTAMP
+                )
+            ''')
+
+            # Discovery sessions table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS discovery_sessions (
+                    session_id TEXT PRIMARY KEY,
+                    user_id INTEGER,
+                    subreddit TEXT NOT NULL,
+                    posts_analyzed INTEGER DEFAULT 0,
+                    pain_points_found INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(user_id)
+                )
+            ''')
+
+            # Pain points table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS pain_points (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT,
+                    post_id TEXT,
+                    title TEXT,
+                    description TEXT,
+                    opportunity_score INTEGER,
+                    market_size_score INTEGER,
+                    urgency_score INTEGER,
+                    solution_gap_score INTEGER,
+                    monetization_score INTEGER,
+                    confidence REAL,
+                    business_domain TEXT,
+                    target_market TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (session_id) REFERENCES discovery_sessions(session_id)
+                )
+            ''')
+
+            # Trend signals table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS trend_signals (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    platform TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    metadata TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Intelligence reports table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS intelligence_reports (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER,
+                    report_type TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    analysis_results TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(user_id)
+                )
+            ''')
+
+            # System metrics table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS system_metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    metric_name TEXT NOT NULL,
+                    metric_value REAL NOT NULL,
+                    metadata TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            conn.commit()
+            logger.info("Master database initialized successfully")
+
+    async def create_user(self, username: str, email: str, password_hash: str) -> Optional[int]:
+        """Create a new user"""
+        try:
+            async with self.pool.connection() as db:
+                cursor = await db.execute(
+                    "INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
+                    (username, email, password_hash)
+                )
+                await db.commit()
+                return cursor.lastrowid
+        except Exception as e:
+            logger.error(f"Error creating user: {e}")
+            return None
+
+    async def get_user_by_username(self, username: str) -> Optional[Dict]:
+        """Get user by username"""
+        try:
+            async with self.pool.connection() as db:
+                cursor = await db.execute(
+                    "SELECT * FROM users WHERE username = ?", (username,)
+                )
+                row = await cursor.fetchone()
+                return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"Error getting user: {e}")
+            return None
+
+    async def save_discovery_session(self, session_id: str, user_id: int, subreddit: str, posts_analyzed: int, pain_points_found: int,
+                                     pain_points: Optional[List[Dict]] = None):
+        """Save discovery session, together with its pain points in the same transaction if given"""
+        try:
+            async with self.pool.connection() as db:
+                await db.execute(
+                    self.INSERT_DISCOVERY_SESSION,
+                    (session_id, user_id, subreddit, posts_analyzed, pain_points_found)
+                )
+                if pain_points:
+                    await db.executemany(self.INSERT_PAIN_POINT, self._pain_point_rows(session_id, pain_points))
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Error saving discovery session: {e}")
+
+    async def save_pain_point(self, session_id: str, pain_point: Dict):
+        """Save pain point to database"""
+        await self.save_pain_points(session_id, [pain_point])
+
+    async def save_pain_points(self, session_id: str, pain_points: List[Dict]) -> int:
+        """Save a batch of pain points in one transaction; returns how many were written"""
+        if not pain_points:
+            return 0
+        try:
+            async with self.pool.connection() as db:
+                await db.executemany(self.INSERT_PAIN_POINT, self._pain_point_rows(session_id, pain_points))
+                await db.commit()
+                return len(pain_points)
+        except Exception as e:
+            logger.error(f"Error saving pain points: {e}")
+            return 0
+
+    @staticmethod
+    def _pain_point_rows(session_id: str, pain_points: List[Dict]) -> List[tuple]:
+        return [
+            (session_id, pain_point.get('post_id'), pain_point.get('title'),
+             pain_point.get('description'), pain_point.get('opportunity_score', 0),
+             pain_point.get('market_size_score', 0), pain_point.get('urgency_score', 0),
+             pain_point.get('solution_gap_score', 0), pain_point.get('monetization_score', 0),
+             pain_point.get('confidence', 0.0), pain_point.get('business_domain', ''),
+             pain_point.get('target_market', ''))
+            for pain_point in pain_points
+        ]
+
+    async def close(self):
+        """Close pooled connections"""
+        await self.pool.close()
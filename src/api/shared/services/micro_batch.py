@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Micro-Batch Inference - Coalesce concurrent model calls into batched forward passes
+Requests queue their input, a single worker flushes by size or deadline and runs the batch off the event loop
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatchInferenceService:
+    """Queues texts from concurrent requests and runs them through a model in micro-batches.
+
+    A batch is flushed when it reaches ``max_batch_size`` or ``max_wait_ms`` after the worker
+    picked up its first text. ``batch_fn`` receives a list of texts, returns one result per
+    text and runs on a dedicated worker thread so the event loop never blocks.
+
+    Pending texts live in a plain deque and the worker sleeps on an event, so a timed-out
+    wait never loses a dequeued item. The event and worker are bound to the loop that last
+    submitted; a new loop (e.g. a fresh ``asyncio.run``) gets its own.
+    """
+
+    def __init__(self, name: str, batch_fn: Callable[[List[str]], List[Any]], max_batch_size: int = 32,
+                 max_wait_ms: float = 10.0, executor: Optional[ThreadPoolExecutor] = None):
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000.0
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-inference")
+        self._pending: deque = deque()  # (text, future)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.stats = {'requests': 0, 'batches': 0, 'failed_batches': 0, 'largest_batch': 0}
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures created on another (finished) loop can never be resolved from this one
+            self._pending.clear()
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, text: str) -> Any:
+        """Queue ``text`` for the next batch and wait for its individual result"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._pending.append((text, future))
+        self.stats['requests'] += 1
+        self._wakeup.set()
+        return await future
+
+    async def _next_batch(self) -> List:
+        while not self._pending:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(self._pending) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+
+        size = min(len(self._pending), self.max_batch_size)
+        return [self._pending.popleft() for _ in range(size)]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            # Drop requests whose callers have gone away (cancelled or timed out)
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+            texts = [text for text, _ in batch]
+            self.stats['batches'] += 1
+            self.stats['largest_batch'] = max(self.stats['largest_batch'], len(batch))
+            try:
+                results = await loop.run_in_executor(self.executor, self.batch_fn, texts)
+                if len(results) != len(batch):
+                    raise RuntimeError(f"{self.name} returned {len(results)} results for {len(batch)} inputs")
+            except Exception as e:
+                self.stats['failed_batches'] += 1
+                logger.warning(f"{self.name} batch of {len(batch)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_seconds * 1000.0,
+            'queued': len(self._pending),
+            'running': self._worker is not None and not self._worker.done(),
+            **self.stats
+        }
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Result Cache - Shared content-hash cache for expensive analysis results
+Size-bounded (entries and bytes) in-memory LRU with TTL and an optional SQLite tier
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Defaults applied to caches created through get_result_cache(); see configure_result_caches()
+_cache_defaults: Dict[str, Any] = {
+    'ttl_seconds': 6 * 3600,
+    'max_entries': 4096,
+    'max_bytes': 32 * 1024 * 1024,
+    'db_path': None
+}
+_caches: Dict[str, 'ContentResultCache'] = {}
+_registry_lock = threading.Lock()
+
+
+class ContentResultCache:
+    """Cache of analysis results keyed on normalized-content hash + engine version.
+
+    Values are pickled on write, so their byte size is known exactly and every ``get``
+    returns a private copy callers may mutate freely. Entries expire after ``ttl_seconds``;
+    the least recently used entries are evicted once either ``max_entries`` or
+    ``max_bytes`` is exceeded. With ``db_path`` set, writes are queued and flushed to SQLite
+    in batches by a single writer thread, and memory misses fall back to disk, so warm
+    results survive restarts. Async callers use ``aget`` (or ``aget_many`` for a batch) so the
+    disk read happens off the event loop; the in-memory lock is never held across a SQLite call.
+    """
+
+    DB_IN_CHUNK = 500
+
+    def __init__(self, namespace: str, engine_version: str, ttl_seconds: float = 6 * 3600,
+                 max_entries: int = 4096, max_bytes: int = 32 * 1024 * 1024,
+                 db_path: Optional[str] = None):
+        self.namespace = namespace
+        self.engine_version = engine_version
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.db_path = db_path
+
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        # Write-behind queue; guarded by _lock, drained by the writer thread
+        self._pending_writes: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._flush_scheduled = False
+
+        self.stats = {
+            'hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'evictions': 0,
+            'writes': 0,
+            'disk_writes': 0,
+            'disk_flushes': 0,
+            'disk_errors': 0
+        }
+
+        if db_path:
+            self._open_db(db_path)
+
+    # Keys
+    @staticmethod
+    def normalize_content(content: str) -> str:
+        """Collapse whitespace so trivially different copies share a key (case is kept - NER and entity patterns depend on it)"""
+        return re.sub(r'\s+', ' ', content or '').strip()
+
+    def make_key(self, content: str, *params) -> str:
+        raw = json.dumps(
+            [self.namespace, self.engine_version, self.normalize_content(content), params],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(raw.encode('utf-8', 'replace')).hexdigest()
+
+    # Lookup
+    def get(self, key: str) -> Optional[Any]:
+        """Synchronous lookup; reads SQLite on the calling thread, so async code should use ``aget``"""
+        now = time.time()
+        found, value = self._get_memory(key, now)
+        if found:
+            return value
+        row = self._db_get(key, now) if self._db is not None else None
+        return self._finish_lookup(key, row)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Lookup that runs the disk-tier read in a worker thread"""
+        now = time.time()
+        found, value = self._get_memory(key, now)
+        if found:
+            return value
+        row = None
+        if self._db is not None:
+            row = await asyncio.get_running_loop().run_in_executor(None, self._db_get, key, now)
+        return self._finish_lookup(key, row)
+
+    async def aget_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Batch ``aget``: memory misses are read from disk in one worker-thread hop and one query per chunk"""
+        now = time.time()
+        results: List[Optional[Any]] = [None] * len(keys)
+        missing: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            found, value = self._get_memory(key, now)
+            if found:
+                results[i] = value
+            else:
+                missing.setdefault(key, []).append(i)
+        if not missing:
+            return results
+        rows: Dict[str, Tuple[float, bytes]] = {}
+        if self._db is not None:
+            rows = await asyncio.get_running_loop().run_in_executor(None, self._db_get_many, list(missing), now)
+        for key, positions in missing.items():
+            value = self._finish_lookup(key, rows.get(key))
+            results[positions[0]] = value
+            if value is not None:
+                # Repeated keys are now memory hits and get their own copy
+                for i in positions[1:]:
+                    results[i] = self._get_memory(key, now)[1]
+        return results
+
+    def _get_memory(self, key: str, now: float) -> Tuple[bool, Optional[Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > now:
+                    value = self._load(payload)
+                    if value is not None:
+                        self._entries.move_to_end(key)
+                        self.stats['hits'] += 1
+                        return True, value
+                else:
+                    self.stats['expired'] += 1
+                self._discard(key)
+            # Evicted from memory before the writer thread got to it
+            pending = self._pending_writes.get(key)
+            if pending is not None and pending[0] > now:
+                value = self._load(pending[1])
+                if value is not None:
+                    self._store(key, *pending)
+                    self.stats['hits'] += 1
+                    return True, value
+        return False, None
+
+    def _finish_lookup(self, key: str, row: Optional[Tuple[float, bytes]]) -> Optional[Any]:
+        if row is not None:
+            expires_at, payload = row
+            value = self._load(payload)
+            if value is not None:
+                with self._lock:
+                    self._store(key, expires_at, payload)
+                    self.stats['disk_hits'] += 1
+                return value
+        with self._lock:
+            self.stats['misses'] += 1
+        return None
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Result cache '{self.namespace}' could not serialize value: {e}")
+            return
+        if len(payload) > self.max_bytes:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._store(key, expires_at, payload)
+            self.stats['writes'] += 1
+            if self._db is None:
+                return
+            self._pending_writes[key] = (expires_at, payload)
+            self._pending_writes.move_to_end(key)
+            # After close() entries stay queued until an explicit flush()
+            if self._flush_scheduled or self._writer is None:
+                return
+            self._flush_scheduled = True
+            writer = self._writer
+        writer.submit(self._flush_pending)
+
+    def flush(self) -> None:
+        """Write every queued entry to disk now (blocking)"""
+        if self._db is not None:
+            self._flush_pending()
+
+    def close(self) -> None:
+        """Flush queued writes and stop the writer thread"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
+            self._flush_pending()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._pending_writes.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM result_cache WHERE namespace = ?", (self.namespace,))
+                self._db.commit()
+
+    def _load(self, payload: bytes) -> Optional[Any]:
+        # A payload written by an older build may reference classes that have moved
+        try:
+            return pickle.loads(payload)
+        except Exception as e:
+            logger.debug(f"Result cache '{self.namespace}' dropped unreadable entry: {e}")
+            return None
+
+    def _store(self, key: str, expires_at: float, payload: bytes) -> None:
+        if key in self._entries:
+            self._discard(key)
+        self._entries[key] = (expires_at, payload)
+        self._bytes += len(payload)
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.stats['evictions'] += 1
+
+    def _discard(self, key: str) -> None:
+        _, payload = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+    # SQLite tier
+    def _open_db(self, db_path: str) -> None:
+        try:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS result_cache (
+                    namespace TEXT NOT NULL,
+                    cache_key TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    payload BLOB NOT NULL,
+                    PRIMARY KEY (namespace, cache_key)
+                )
+            """)
+            self._db.execute("DELETE FROM result_cache WHERE expires_at <= ?", (time.time(),))
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache '{self.namespace}' disk tier disabled: {e}")
+            self._db = None
+            return
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"result-cache-{self.namespace}")
+
+    def _db_get(self, key: str, now: float) -> Optional[Tuple[float, bytes]]:
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT expires_at, payload FROM result_cache WHERE namespace = ? AND cache_key = ?",
+                    (self.namespace, key)
+                ).fetchone()
+        except sqlite3.Error:
+            with self._lock:
+                self.stats['disk_errors'] += 1
+            return None
+        if row is None or row[0] <= now:
+            return None
+        return row[0], bytes(row[1])
+
+    def _db_get_many(self, keys: List[str], now: float) -> Dict[str, Tuple[float, bytes]]:
+        rows = {}
+        try:
+            with self._db_lock:
+                # Stay under SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds
+                for start in range(0, len(keys), self.DB_IN_CHUNK):
+                    chunk = keys[start:start + self.DB_IN_CHUNK]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows.update(
+                        (key, (expires_at, bytes(payload)))
+                        for key, expires_at, payload in self._db.execute(
+                            "SELECT cache_key, expires_at, payload FROM result_cache "
+                            f"WHERE namespace = ? AND cache_key IN ({placeholders}) AND expires_at > ?",
+                            (self.namespace, *chunk, now)
+                        )
+                    )
+        except sqlite3.Error:
+            with self._lock:
+                self.stats['disk_errors'] += 1
+            return {}
+        return rows
+
+    def _flush_pending(self) -> None:
+        # Everything queued since the last flush goes out in one transaction
+        with self._lock:
+            batch = self._pending_writes
+            self._pending_writes = OrderedDict()
+            self._flush_scheduled = False
+        if not batch:
+            return
+        try:
+            with self._db_lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO result_cache (namespace, cache_key, expires_at, payload) VALUES (?, ?, ?, ?)",
+                    [(self.namespace, key, expires_at, payload) for key, (expires_at, payload) in batch.items()]
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Result cache '{self.namespace}' disk flush failed: {e}")
+            with self._lock:
+                self.stats['disk_errors'] += 1
+            return
+        with self._lock:
+            self.stats['disk_writes'] += len(batch)
+            self.stats['disk_flushes'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['disk_hits'] + self.stats['misses']
+            return {
+                'engine_version': self.engine_version,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds,
+                'disk_tier': self._db is not None,
+                'pending_disk_writes': len(self._pending_writes),
+                'hit_rate': (self.stats['hits'] + self.stats['disk_hits']) / lookups if lookups else 0.0,
+                **self.stats
+            }
+
+
+def configure_result_caches(**defaults) -> None:
+    """Set ttl_seconds / max_entries / max_bytes / db_path for caches created afterwards"""
+    unknown = set(defaults) - set(_cache_defaults)
+    if unknown:
+        raise ValueError(f"Unknown result cache settings: {sorted(unknown)}")
+    with _registry_lock:
+        if _caches:
+            logger.warning(f"⚠️ Result cache settings changed after caches were created: {sorted(_caches)}")
+        _cache_defaults.update(defaults)
+
+
+def get_result_cache(namespace: str, engine_version: str) -> ContentResultCache:
+    """Get or create the process-wide cache for ``namespace``"""
+    with _registry_lock:
+        cache = _caches.get(namespace)
+        if cache is None or cache.engine_version != engine_version:
+            cache = ContentResultCache(namespace, engine_version, **_cache_defaults)
+            _caches[namespace] = cache
+        return cache
+
+
+async def close_result_caches() -> None:
+    """Flush queued disk writes of every registered cache; registered as a shutdown hook"""
+    with _registry_lock:
+        caches = list(_caches.values())
+    loop = asyncio.get_running_loop()
+    for cache in caches:
+        await loop.run_in_executor(None, cache.close)
+
+
+def get_result_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss/eviction metrics for every registered cache"""
+    with _registry_lock:
+        caches = dict(_caches)
+    return {namespace: cache.get_stats() for namespace, cache in caches.items()}
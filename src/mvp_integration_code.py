@@ -4,10 +4,14 @@ MVP API Integration for Luciq Master API
 Add this code to master_luciq_api.py for immediate revenue generation
 """
 
+import asyncio
+import logging
 import secrets
 import hashlib
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, List, Tuple
 from enum import Enum
 import sqlite3
 from fastapi import HTTPException, Depends, Header, Request
@@ -55,11 +59,72 @@ TIER_LIMITS = {
     }
 }
 
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """Per-key rate limiter: bursts up to ``rate_per_minute`` calls, refilled continuously"""
+    
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(rate_per_minute)
+        self.refill_per_second = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+    
+    def try_acquire(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+    
+    def retry_after_seconds(self) -> float:
+        return max(0.0, (1.0 - self.tokens) / self.refill_per_second)
+
 class MVPAPIKeyService:
-    """Simplified API Key service for MVP launch"""
+    """Simplified API Key service for MVP launch
     
-    def __init__(self, db_path: str = "luciq_mvp_billing.db"):
+    Lookups of existing keys are cached for ``key_cache_ttl_seconds`` in an LRU of at most
+    ``max_cached_keys`` entries (deactivation invalidates them); unknown keys are never cached,
+    so random keys cannot grow it. Each key is rate limited by a token bucket sized from its
+    tier, and usage records are buffered in memory and written to ``mvp_api_usage`` in batches
+    by a background task. Each buffered record is tagged with the billing period it was made
+    in; records still buffered when their key's period resets are logged but no longer
+    counted toward ``monthly_usage``.
+    """
+    
+    def __init__(self, db_path: str = "luciq_mvp_billing.db", key_cache_ttl_seconds: float = 60.0,
+                 usage_flush_interval_seconds: float = 1.0, max_buffered_usage: int = 500,
+                 max_cached_keys: int = 10000):
         self.db_path = db_path
+        self.key_cache_ttl_seconds = key_cache_ttl_seconds
+        self.max_cached_keys = max_cached_keys
+        self.usage_flush_interval_seconds = usage_flush_interval_seconds
+        self.max_buffered_usage = max_buffered_usage
+        
+        # key hash -> (expires_at, key record), least recently used first
+        self._key_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._rate_limiters: Dict[str, TokenBucket] = {}
+        
+        # Usage waiting to be flushed, and per-key counts not yet reflected in monthly_usage
+        self._usage_buffer: List[Tuple] = []
+        self._pending_usage: Dict[str, int] = {}
+        # key hash -> usage_reset_date of its current billing period
+        self._usage_periods: Dict[str, date] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_now: Optional[asyncio.Event] = None
+        
+        self.cache_stats = {
+            'key_cache_hits': 0,
+            'key_cache_misses': 0,
+            'key_cache_evictions': 0,
+            'rate_limited': 0,
+            'usage_flushes': 0,
+            'usage_rows_flushed': 0,
+            'stale_usage_dropped': 0
+        }
+        
         self.init_mvp_database()
     
     def init_mvp_database(self):
@@ -95,6 +160,8 @@ class MVPAPIKeyService:
             )
         ''')
         
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_mvp_api_usage_key ON mvp_api_usage (api_key_hash)')
+        
         conn.commit()
         conn.close()
     
@@ -142,6 +209,67 @@ class MVPAPIKeyService:
         
         key_hash = hashlib.sha256(api_key.encode()).hexdigest()
         
+        record = await self._get_key_record(key_hash)
+        
+        if not record:
+            raise HTTPException(status_code=401, detail="Invalid API key")
+        
+        if not record["is_active"]:
+            raise HTTPException(status_code=401, detail="API key deactivated")
+        
+        # Check if usage needs to be reset
+        if datetime.now().date() > record["usage_reset_date"]:
+            record["usage_reset_date"] = await asyncio.get_running_loop().run_in_executor(
+                None, self._reset_monthly_usage, key_hash
+            )
+            record["monthly_usage"] = 0
+            self._pending_usage.pop(key_hash, None)
+        self._usage_periods[key_hash] = record["usage_reset_date"]
+        
+        tier = record["tier"]
+        tier_info = TIER_LIMITS[SubscriptionTier(tier)]
+        
+        return {
+            "user_id": record["user_id"],
+            "tier": tier,
+            "monthly_usage": record["monthly_usage"] + self._pending_usage.get(key_hash, 0),
+            "monthly_limit": tier_info["monthly_calls"],
+            "rate_limit": tier_info["rate_limit_per_minute"],
+            "features": tier_info["features"],
+            "api_key_hash": key_hash
+        }
+    
+    async def _get_key_record(self, key_hash: str) -> Optional[Dict]:
+        """Key row from the cache, or from the database (off the event loop) on a miss"""
+        cached = self._key_cache.get(key_hash)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._key_cache.move_to_end(key_hash)
+                self.cache_stats['key_cache_hits'] += 1
+                return cached[1]
+            del self._key_cache[key_hash]
+        
+        self.cache_stats['key_cache_misses'] += 1
+        record = await asyncio.get_running_loop().run_in_executor(None, self._load_key_record, key_hash)
+        if record is not None:
+            self._key_cache[key_hash] = (time.monotonic() + self.key_cache_ttl_seconds, record)
+            self._key_cache.move_to_end(key_hash)
+            self._evict_key_cache()
+        return record
+    
+    def _evict_key_cache(self):
+        """Keep the key cache within ``max_cached_keys``: drop expired entries, then the least recently used"""
+        if len(self._key_cache) <= self.max_cached_keys:
+            return
+        now = time.monotonic()
+        for key_hash in [key_hash for key_hash, (expires_at, _) in self._key_cache.items() if expires_at <= now]:
+            del self._key_cache[key_hash]
+            self.cache_stats['key_cache_evictions'] += 1
+        while len(self._key_cache) > self.max_cached_keys:
+            self._key_cache.popitem(last=False)
+            self.cache_stats['key_cache_evictions'] += 1
+    
+    def _load_key_record(self, key_hash: str) -> Optional[Dict]:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
@@ -155,51 +283,150 @@ class MVPAPIKeyService:
         conn.close()
         
         if not result:
-            raise HTTPException(status_code=401, detail="Invalid API key")
+            return None
         
         user_id, tier, monthly_usage, reset_date, is_active = result
-        
-        if not is_active:
-            raise HTTPException(status_code=401, detail="API key deactivated")
-        
-        # Check if usage needs to be reset
-        if datetime.now().date() > datetime.strptime(reset_date, "%Y-%m-%d").date():
-            self._reset_monthly_usage(key_hash)
-            monthly_usage = 0
-        
-        tier_info = TIER_LIMITS[SubscriptionTier(tier)]
-        
         return {
             "user_id": user_id,
             "tier": tier,
             "monthly_usage": monthly_usage,
-            "monthly_limit": tier_info["monthly_calls"],
-            "rate_limit": tier_info["rate_limit_per_minute"],
-            "features": tier_info["features"],
-            "api_key_hash": key_hash
+            "usage_reset_date": datetime.strptime(reset_date, "%Y-%m-%d").date(),
+            "is_active": bool(is_active)
         }
     
-    async def track_mvp_usage(self, api_key_hash: str, endpoint: str, response_time_ms: int = 0, 
-                             status_code: int = 200):
-        """Track MVP API usage"""
+    def enforce_rate_limit(self, api_key_hash: str, rate_limit_per_minute: int):
+        """Raise 429 when the key has used up its per-minute token bucket"""
+        bucket = self._rate_limiters.get(api_key_hash)
+        if bucket is None or bucket.capacity != rate_limit_per_minute:
+            bucket = TokenBucket(rate_limit_per_minute)
+            self._rate_limiters[api_key_hash] = bucket
+        
+        if not bucket.try_acquire():
+            self.cache_stats['rate_limited'] += 1
+            retry_after = bucket.retry_after_seconds()
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit of {rate_limit_per_minute} requests per minute exceeded",
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+            )
+    
+    def deactivate_mvp_api_key(self, api_key_hash: str) -> bool:
+        """Deactivate an API key; takes effect immediately on this instance"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        # Record usage
-        cursor.execute('''
-            INSERT INTO mvp_api_usage (api_key_hash, endpoint, response_time_ms, status_code)
-            VALUES (?, ?, ?, ?)
-        ''', (api_key_hash, endpoint, response_time_ms, status_code))
-        
-        # Update monthly usage counter
         cursor.execute('''
             UPDATE mvp_api_keys 
-            SET monthly_usage = monthly_usage + 1, last_used_at = CURRENT_TIMESTAMP
+            SET is_active = FALSE
             WHERE api_key_hash = ?
         ''', (api_key_hash,))
         
+        updated = cursor.rowcount > 0
         conn.commit()
         conn.close()
+        
+        self.invalidate_api_key(api_key_hash)
+        return updated
+    
+    def invalidate_api_key(self, api_key_hash: str):
+        """Drop cached state for a key so the next request re-reads it"""
+        self._key_cache.pop(api_key_hash, None)
+        self._rate_limiters.pop(api_key_hash, None)
+    
+    async def track_mvp_usage(self, api_key_hash: str, endpoint: str, response_time_ms: int = 0, 
+                             status_code: int = 200):
+        """Track MVP API usage (buffered; written by the background flusher)"""
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")  # same format as CURRENT_TIMESTAMP
+        period = self._usage_periods.get(api_key_hash)
+        self._usage_buffer.append((api_key_hash, endpoint, timestamp, response_time_ms, status_code, period))
+        self._pending_usage[api_key_hash] = self._pending_usage.get(api_key_hash, 0) + 1
+        
+        self._ensure_flusher()
+        if len(self._usage_buffer) >= self.max_buffered_usage:
+            self._flush_now.set()
+    
+    def _ensure_flusher(self):
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_now = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), timeout=self.usage_flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            await self.flush_usage()
+    
+    async def flush_usage(self) -> int:
+        """Write buffered usage to the database in one transaction; returns rows written"""
+        if not self._usage_buffer:
+            return 0
+        
+        rows, self._usage_buffer = self._usage_buffer, []
+        # Counted per billing period, so usage from before a reset is not billed to the new one
+        counts: Dict[Tuple[str, Optional[date]], int] = {}
+        for row in rows:
+            counts[(row[0], row[5])] = counts.get((row[0], row[5]), 0) + 1
+        
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self._write_usage, rows, counts)
+        except Exception as e:
+            logger.error(f"❌ MVP usage flush failed, keeping {len(rows)} records buffered: {e}")
+            self._usage_buffer = rows + self._usage_buffer
+            return 0
+        
+        # Flushed counts now live in the database; fold them into the cached rows
+        for (key_hash, period), count in counts.items():
+            if period is not None and period != self._usage_periods.get(key_hash):
+                self.cache_stats['stale_usage_dropped'] += count
+                continue
+            remaining = self._pending_usage.get(key_hash, 0) - count
+            if remaining > 0:
+                self._pending_usage[key_hash] = remaining
+            else:
+                self._pending_usage.pop(key_hash, None)
+            cached = self._key_cache.get(key_hash)
+            if cached is not None:
+                cached[1]["monthly_usage"] += count
+        
+        self.cache_stats['usage_flushes'] += 1
+        self.cache_stats['usage_rows_flushed'] += len(rows)
+        return len(rows)
+    
+    def _write_usage(self, rows: List[Tuple], counts: Dict[Tuple[str, Optional[date]], int]):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany('''
+                    INSERT INTO mvp_api_usage (api_key_hash, endpoint, timestamp, response_time_ms, status_code)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', [row[:5] for row in rows])
+                
+                # Update monthly usage counters; counts from a period that has since reset match no row
+                updates = []
+                for (key_hash, period), count in counts.items():
+                    reset_date = period.isoformat() if period else None
+                    updates.append((count, key_hash, reset_date, reset_date))
+                conn.executemany('''
+                    UPDATE mvp_api_keys 
+                    SET monthly_usage = monthly_usage + ?, last_used_at = CURRENT_TIMESTAMP
+                    WHERE api_key_hash = ? AND (? IS NULL OR usage_reset_date = ?)
+                ''', updates)
+        finally:
+            conn.close()
+    
+    async def close(self):
+        """Stop the background flusher and write any remaining usage"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush_usage()
     
     def _reset_monthly_usage(self, api_key_hash: str):
         """Reset monthly usage counter"""
@@ -216,6 +443,8 @@ class MVPAPIKeyService:
         
         conn.commit()
         conn.close()
+        
+        return next_reset
 
 # Initialize MVP services
 mvp_api_key_service = MVPAPIKeyService()
@@ -232,6 +461,9 @@ async def get_mvp_api_key_auth(x_api_key: str = Header(None)) -> Dict:
     if user_info["monthly_usage"] >= user_info["monthly_limit"]:
         raise HTTPException(status_code=429, detail="Monthly usage limit exceeded. Please upgrade your plan.")
     
+    # Enforce the tier's per-minute rate limit
+    mvp_api_key_service.enforce_rate_limit(user_info["api_key_hash"], user_info["rate_limit"])
+    
     return user_info
 
 # Pydantic models for MVP API
@@ -9,6 +9,8 @@ import logging
 from typing import Dict, Any, List
 from datetime import datetime
 
+from src.api.shared.services.keyword_matcher import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
 class PainPointDetectionEngine:
@@ -42,6 +44,11 @@ class PainPointDetectionEngine:
             'analytics': ['data', 'analytics', 'insights', 'reporting', 'dashboard'],
             'productivity': ['productivity', 'efficiency', 'save time', 'faster', 'streamline']
         }
+        
+        # Both vocabularies compiled into one single-pass matcher
+        vocabularies = {f"pain:{category}": indicators for category, indicators in self.pain_indicators.items()}
+        vocabularies.update({f"opportunity:{opp_type}": patterns for opp_type, patterns in self.opportunity_patterns.items()})
+        self.keyword_matcher = KeywordMatcher(vocabularies)
     
     async def detect_advanced_pain_points(self, content: str, platform: str = "unknown", context: Dict = None) -> Dict[str, Any]:
         """Advanced pain point detection with comprehensive business analysis"""
@@ -102,14 +109,14 @@ class PainPointDetectionEngine:
     
     def _analyze_pain_patterns(self, content: str) -> Dict[str, Any]:
         """Analyze content for pain point patterns"""
-        content_lower = content.lower()
+        hits = self.keyword_matcher.category_hits(content)
         
         # Detect pain categories
         pain_categories = []
         pain_scores = {}
         
         for category, indicators in self.pain_indicators.items():
-            score = sum(1 for indicator in indicators if indicator in content_lower)
+            score = hits[f"pain:{category}"]
             if score > 0:
                 pain_categories.append(category)
                 pain_scores[category] = min(score / len(indicators), 1.0)
@@ -119,8 +126,8 @@ class PainPointDetectionEngine:
         
         # Detect business opportunity patterns
         opportunity_types = []
-        for opp_type, patterns in self.opportunity_patterns.items():
-            if any(pattern in content_lower for pattern in patterns):
+        for opp_type in self.opportunity_patterns:
+            if hits[f"opportunity:{opp_type}"]:
                 opportunity_types.append(opp_type)
         
         return {
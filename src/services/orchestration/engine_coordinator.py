@@ -6,19 +6,13 @@ Coordinates parallel execution of multiple engines with dependency management
 
 import asyncio
 import logging
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class ExecutionPhase:
-    """Represents a phase of engine execution with dependencies"""
-    phase_id: int
-    engines: Dict[str, Dict[str, Any]]
-    dependencies: List[int]
-
 @dataclass
 class EngineResult:
     """Result from individual engine execution"""
@@ -34,7 +28,7 @@ class EngineCoordinator:
     
     Features:
     - Dependency-aware execution planning
-    - Parallel execution where possible
+    - Each engine starts as soon as its own dependencies finish, under its own deadline
     - Error handling and graceful degradation
     - Performance monitoring
     """
@@ -53,23 +47,39 @@ class EngineCoordinator:
             'contextual': []  # Can run independently
         }
         
+        # Per-engine deadlines (seconds); engines still running at their deadline are cancelled
+        self.default_engine_timeout_seconds = 30.0
+        self.engine_timeouts = {
+            'temporal': 20.0,
+            'dialectical': 25.0
+        }
+        
         # Performance tracking
         self.coordination_stats = {
             'executions_coordinated': 0,
             'parallel_executions': 0,
             'dependency_optimizations': 0,
-            'avg_coordination_time_ms': 0.0
+            'avg_coordination_time_ms': 0.0,
+            'avg_critical_path_ms': 0.0,
+            'avg_phase_barrier_estimate_ms': 0.0,
+            'engine_timeouts': 0,
+            'last_critical_path': {}
         }
     
     async def execute_engines(self, routing_config: Dict, data: Dict[str, Any], 
-                            session_id: Optional[str] = None) -> Dict[str, EngineResult]:
+                            session_id: Optional[str] = None,
+                            timeout_seconds: Optional[float] = None) -> Dict[str, EngineResult]:
         """
         Execute multiple engines according to routing configuration
         
+        Each engine starts as soon as its own dependencies have finished, rather than
+        waiting for a whole phase, and runs under its own deadline.
+        
         Args:
             routing_config: Configuration specifying primary and supporting engines
             data: Input data for engines
             session_id: Optional session ID for stateful engines
+            timeout_seconds: Optional overall deadline; caps every engine's own timeout
             
         Returns:
             Dictionary of engine results
@@ -84,18 +94,18 @@ class EngineCoordinator:
             
             self.logger.info(f"🎯 Coordinating {len(all_engines)} engines: {all_engines}")
             
-            # Create execution plan with dependency management
-            execution_plan = self._create_execution_plan(all_engines)
+            # Build dependency graph for the requested engines
+            engine_graph = self._build_dependency_graph(all_engines)
             
-            # Execute engines in phases
-            all_results = {}
-            for phase in execution_plan:
-                phase_results = await self._execute_phase(phase, data, session_id, all_results)
-                all_results.update(phase_results)
+            # Execute engines as their dependencies resolve
+            all_results, timeline = await self._execute_graph(
+                engine_graph, data, session_id, start_time, timeout_seconds
+            )
             
             # Update coordination stats
             coordination_time_ms = (datetime.now() - start_time).total_seconds() * 1000
-            self._update_coordination_stats(coordination_time_ms, len(all_engines), len(execution_plan) > 1)
+            self._update_coordination_stats(coordination_time_ms, len(all_engines), len(engine_graph) > 1)
+            self._record_critical_path(engine_graph, timeline, coordination_time_ms)
             
             self.logger.info(f"✅ Engine coordination complete: {coordination_time_ms:.1f}ms")
             return all_results
@@ -104,112 +114,111 @@ class EngineCoordinator:
             self.logger.error(f"❌ Engine coordination failed: {e}")
             raise
     
-    def _create_execution_plan(self, engine_names: List[str]) -> List[ExecutionPhase]:
+    def _build_dependency_graph(self, engine_names: List[str]) -> Dict[str, List[str]]:
         """
-        Create execution plan with dependency-aware phases
+        Map each requested engine to the requested engines it depends on
         
-        Engines with no dependencies can run in parallel in early phases.
-        Dependent engines run in later phases after their dependencies complete.
+        Dependencies on engines that are not being executed are dropped, and any
+        dependency cycle is broken so every engine is still scheduled.
         """
-        # Filter to only requested engines
-        available_engines = {name: self.engines[name] for name in engine_names if name in self.engines}
-        
-        if not available_engines:
-            return []
-        
-        # Build dependency graph for requested engines
-        engine_dependencies = {}
-        for engine_name in available_engines.keys():
-            deps = self.dependencies.get(engine_name, [])
-            # Only include dependencies that are also being executed
-            filtered_deps = [dep for dep in deps if dep in available_engines]
-            engine_dependencies[engine_name] = filtered_deps
-        
-        # Create phases based on dependencies
-        phases = []
-        remaining_engines = set(available_engines.keys())
-        phase_id = 0
-        
-        while remaining_engines:
-            # Find engines with no remaining dependencies
-            ready_engines = []
-            for engine_name in remaining_engines:
-                deps = engine_dependencies[engine_name]
-                if all(dep not in remaining_engines for dep in deps):
-                    ready_engines.append(engine_name)
+        available_engines = [name for name in engine_names if name in self.engines]
+        
+        engine_dependencies = {
+            engine_name: [dep for dep in self.dependencies.get(engine_name, []) if dep in available_engines]
+            for engine_name in available_engines
+        }
+        
+        # Drop edges that close a cycle (depth-first, in request order)
+        visiting, visited = set(), set()
+        
+        def visit(engine_name: str):
+            visiting.add(engine_name)
+            for dep in list(engine_dependencies[engine_name]):
+                if dep in visiting:
+                    self.logger.warning(f"⚠️ Circular dependency {engine_name} -> {dep}, ignoring it")
+                    engine_dependencies[engine_name].remove(dep)
+                elif dep not in visited:
+                    visit(dep)
+            visiting.discard(engine_name)
+            visited.add(engine_name)
+        
+        for engine_name in available_engines:
+            if engine_name not in visited:
+                visit(engine_name)
+        
+        self.logger.info(f"📋 Created execution graph for {len(engine_dependencies)} engines")
+        for engine_name, deps in engine_dependencies.items():
+            self.logger.info(f"   {engine_name} <- {deps or 'ready'}")
+        
+        return engine_dependencies
+    
+    async def _execute_graph(self, engine_graph: Dict[str, List[str]], data: Dict[str, Any],
+                             session_id: Optional[str], start_time: datetime,
+                             timeout_seconds: Optional[float]) -> Tuple[Dict[str, EngineResult], Dict[str, Dict[str, float]]]:
+        """Run every engine once its dependencies are done; returns results and per-engine timing"""
+        all_results: Dict[str, EngineResult] = {}
+        timeline: Dict[str, Dict[str, float]] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        
+        def offset_ms() -> float:
+            return (datetime.now() - start_time).total_seconds() * 1000
+        
+        async def run_node(engine_name: str) -> EngineResult:
+            deps = engine_graph[engine_name]
+            if deps:
+                # Dependents still run when a dependency fails, as before (graceful degradation)
+                await asyncio.wait([tasks[dep] for dep in deps])
             
-            if not ready_engines:
-                # Circular dependency or error - just take remaining engines
-                ready_engines = list(remaining_engines)
-                self.logger.warning(f"⚠️ Potential circular dependency, executing remaining engines: {ready_engines}")
+            started_ms = offset_ms()
+            deadline = self.engine_timeouts.get(engine_name, self.default_engine_timeout_seconds)
+            if timeout_seconds is not None:
+                deadline = min(deadline, max(timeout_seconds - started_ms / 1000, 0.0))
             
-            # Create phase
-            phase_engines = {
-                name: {'engine': available_engines[name], 'config': {}}
-                for name in ready_engines
+            result = await self._execute_single_engine(
+                engine_name, self.engines[engine_name], data, session_id, all_results, deadline
+            )
+            all_results[engine_name] = result
+            timeline[engine_name] = {
+                'ready_ms': started_ms,
+                'finished_ms': offset_ms(),
+                'processing_ms': result.processing_time_ms
             }
-            
-            phases.append(ExecutionPhase(
-                phase_id=phase_id,
-                engines=phase_engines,
-                dependencies=list(range(phase_id))  # Depends on all previous phases
-            ))
-            
-            # Remove from remaining
-            remaining_engines -= set(ready_engines)
-            phase_id += 1
+            return result
+        
+        for engine_name in self._topological_order(engine_graph):
+            tasks[engine_name] = asyncio.create_task(run_node(engine_name))
         
-        self.logger.info(f"📋 Created execution plan with {len(phases)} phases")
-        for i, phase in enumerate(phases):
-            self.logger.info(f"   Phase {i}: {list(phase.engines.keys())}")
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            # Cancelled from above: do not leave engines running in the background
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
         
-        return phases
+        return all_results, timeline
     
-    async def _execute_phase(self, phase: ExecutionPhase, data: Dict[str, Any], 
-                           session_id: Optional[str], previous_results: Dict[str, EngineResult]) -> Dict[str, EngineResult]:
-        """Execute all engines in a phase in parallel"""
-        
-        self.logger.info(f"⚡ Executing phase {phase.phase_id} with {len(phase.engines)} engines")
-        
-        # Create tasks for parallel execution
-        tasks = []
-        engine_names = []
-        
-        for engine_name, engine_config in phase.engines.items():
-            task = self._execute_single_engine(
-                engine_name, 
-                engine_config['engine'], 
-                data, 
-                session_id, 
-                previous_results
-            )
-            tasks.append(task)
-            engine_names.append(engine_name)
-        
-        # Execute all engines in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
-        phase_results = {}
-        for i, result in enumerate(results):
-            engine_name = engine_names[i]
-            if isinstance(result, Exception):
-                self.logger.error(f"❌ Engine {engine_name} failed: {result}")
-                phase_results[engine_name] = EngineResult(
-                    engine_name=engine_name,
-                    success=False,
-                    result=None,
-                    processing_time_ms=0.0,
-                    error=str(result)
-                )
-            else:
-                phase_results[engine_name] = result
+    def _topological_order(self, engine_graph: Dict[str, List[str]]) -> List[str]:
+        """Engines ordered so every dependency comes before its dependents"""
+        order: List[str] = []
+        placed = set()
+        
+        def place(engine_name: str):
+            if engine_name in placed:
+                return
+            placed.add(engine_name)
+            for dep in engine_graph[engine_name]:
+                place(dep)
+            order.append(engine_name)
         
-        return phase_results
+        for engine_name in engine_graph:
+            place(engine_name)
+        return order
     
     async def _execute_single_engine(self, engine_name: str, engine: Any, data: Dict[str, Any], 
-                                   session_id: Optional[str], previous_results: Dict[str, EngineResult]) -> EngineResult:
-        """Execute a single engine with appropriate method call"""
+                                   session_id: Optional[str], previous_results: Dict[str, EngineResult],
+                                   timeout_seconds: Optional[float] = None) -> EngineResult:
+        """Execute a single engine with appropriate method call, cancelling it at its deadline"""
         
         start_time = datetime.now()
         
@@ -217,7 +226,10 @@ class EngineCoordinator:
             self.logger.debug(f"🔧 Executing {engine_name} engine")
             
             # Route to appropriate engine method based on engine type and data
-            result = await self._route_engine_call(engine_name, engine, data, session_id, previous_results)
+            result = await asyncio.wait_for(
+                self._route_engine_call(engine_name, engine, data, session_id, previous_results),
+                timeout=timeout_seconds
+            )
             
             processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
             
@@ -228,6 +240,19 @@ class EngineCoordinator:
                 processing_time_ms=processing_time_ms
             )
             
+        except asyncio.TimeoutError:
+            processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            self.logger.warning(f"⏱️ Engine {engine_name} cancelled after {timeout_seconds:.1f}s deadline")
+            self.coordination_stats['engine_timeouts'] += 1
+            
+            return EngineResult(
+                engine_name=engine_name,
+                success=False,
+                result=None,
+                processing_time_ms=processing_time_ms,
+                error=f"Engine timed out after {timeout_seconds:.1f}s"
+            )
+            
         except Exception as e:
             processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
             self.logger.error(f"❌ Engine {engine_name} execution failed: {e}")
@@ -311,6 +336,51 @@ class EngineCoordinator:
         new_avg = ((current_avg * (executions - 1)) + coordination_time_ms) / executions
         self.coordination_stats['avg_coordination_time_ms'] = new_avg
     
+    def _record_critical_path(self, engine_graph: Dict[str, List[str]], timeline: Dict[str, Dict[str, float]],
+                              coordination_time_ms: float):
+        """Record which chain of engines determined the end-to-end latency
+        
+        Also estimates what strict phase barriers would have cost (sum of the slowest
+        engine per dependency level) and counts engines that started before such a
+        barrier would have released them.
+        """
+        if not timeline:
+            return
+        
+        # Walk back from the last engine to finish through its slowest dependency
+        path = [max(timeline, key=lambda name: timeline[name]['finished_ms'])]
+        while engine_graph[path[-1]]:
+            path.append(max(engine_graph[path[-1]], key=lambda name: timeline[name]['finished_ms']))
+        path.reverse()
+        critical_path_ms = timeline[path[-1]]['finished_ms']
+        
+        levels: Dict[str, int] = {}
+        for engine_name in self._topological_order(engine_graph):
+            levels[engine_name] = 1 + max((levels[dep] for dep in engine_graph[engine_name]), default=-1)
+        level_maxima = defaultdict(float)
+        for engine_name, level in levels.items():
+            level_maxima[level] = max(level_maxima[level], timeline[engine_name]['processing_ms'])
+        phase_barrier_estimate_ms = sum(level_maxima.values())
+        
+        for engine_name, level in levels.items():
+            earlier = [timeline[name]['finished_ms'] for name, other in levels.items() if other < level]
+            if earlier and timeline[engine_name]['ready_ms'] < max(earlier):
+                self.coordination_stats['dependency_optimizations'] += 1
+        
+        executions = self.coordination_stats['executions_coordinated']
+        for key, value in (('avg_critical_path_ms', critical_path_ms),
+                           ('avg_phase_barrier_estimate_ms', phase_barrier_estimate_ms)):
+            current_avg = self.coordination_stats[key]
+            self.coordination_stats[key] = ((current_avg * (executions - 1)) + value) / executions
+        
+        self.coordination_stats['last_critical_path'] = {
+            'engines': path,
+            'critical_path_ms': critical_path_ms,
+            'phase_barrier_estimate_ms': phase_barrier_estimate_ms,
+            'coordination_time_ms': coordination_time_ms,
+            'timeline': timeline
+        }
+    
     def get_coordination_stats(self) -> Dict[str, Any]:
         """Get coordination performance statistics"""
         return {
@@ -6,9 +6,10 @@ Provides clean API while preserving all engine capabilities exactly
 
 import asyncio
 import logging
+import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 # Import all existing engines (preserve exactly)
 from src.api.domains.intelligence.services.cross_platform_intelligence import CrossPlatformIntelligenceEngine
@@ -17,6 +18,7 @@ from src.api.domains.intelligence.services.semantic_analysis_engine import Advan
 from src.api.domains.intelligence.services.real_time_dialectical_engine import RealTimeDialecticalEngine
 from src.api.domains.streaming.services.temporal_pattern_engine import AdvancedTemporalPatternEngine
 from src.api.domains.intelligence.services.contextual_source_intelligence import ContextualSourceIntelligenceEngine
+from src.api.shared.services.coalescing_cache import CoalescingResultCache
 
 # Import orchestration components
 from .engine_coordinator import EngineCoordinator
@@ -78,9 +80,15 @@ class IntelligenceOrchestrator:
             'error_rate': 0.0
         }
         
-        # Request cache for performance
-        self.result_cache = {}
+        # Request cache for performance - identical concurrent requests share one run
         self.cache_ttl_seconds = 300  # 5 minutes
+        self.result_cache = CoalescingResultCache(
+            'orchestration',
+            ttl_seconds=self.cache_ttl_seconds,
+            stale_ttl_seconds=self.cache_ttl_seconds,  # served while one refresh runs
+            max_entries=512,
+            max_bytes=64 * 1024 * 1024
+        )
         
         self.logger.info("✅ Intelligence Orchestrator initialized successfully")
     
@@ -111,69 +119,18 @@ class IntelligenceOrchestrator:
         Routes requests to appropriate engines and coordinates execution
         """
         start_time = datetime.now()
-        request_id = f"req_{int(start_time.timestamp())}_{id(request)}"
+        request_id = f"req_{int(start_time.timestamp())}_{uuid.uuid4().hex}"
         
         try:
             self.logger.info(f"🎯 Processing orchestrated request: {request.request_type}")
             
-            # Check cache first
+            # Served from cache, joined to an identical in-flight run, or executed
             cache_key = self._generate_cache_key(request)
-            if cache_key in self.result_cache:
-                cached_result = self.result_cache[cache_key]
-                if self._is_cache_valid(cached_result):
-                    self.orchestration_stats['cache_hits'] += 1
-                    self.logger.info(f"⚡ Cache hit for request: {request.request_type}")
-                    return cached_result
-            
-            # Standardize input data to fix attribute access issues
-            standardized_data = self._standardize_request_data(request)
-            
-            # Route to appropriate engines
-            routing_config = self.router.determine_engines(request.request_type, standardized_data)
-            
-            # Override engines if specified
-            if request.engines_override:
-                routing_config = self._create_override_config(request.engines_override)
-            
-            # Coordinate parallel execution
-            engine_results = await self.coordinator.execute_engines(
-                routing_config, standardized_data, request.session_id
+            result = await self.result_cache.get_or_compute(
+                cache_key, lambda: self._execute_request(request, request_id, start_time)
             )
-            
-            # Synthesize results
-            synthesized_result = await self.synthesizer.combine_results(
-                engine_results, request.request_type
-            )
-            
-            # Calculate processing time
-            processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
-            
-            # Create orchestration result
-            result = OrchestrationResult(
-                request_id=request_id,
-                request_type=request.request_type,
-                success=True,
-                results=synthesized_result,
-                engines_used=list(routing_config.get('primary', [])) + list(routing_config.get('supporting', [])),
-                processing_time_ms=processing_time_ms,
-                orchestration_metadata={
-                    'routing_config': routing_config,
-                    'cache_used': False,
-                    'parallel_execution': len(routing_config.get('primary', [])) > 1,
-                    'engines_count': len(engine_results),
-                    'synthesis_method': 'intelligent_combination'
-                },
-                timestamp=datetime.now()
-            )
-            
-            # Cache result
-            self.result_cache[cache_key] = result
-            
-            # Update stats
-            self._update_orchestration_stats(result)
-            
-            self.logger.info(f"✅ Orchestrated analysis complete: {processing_time_ms:.1f}ms")
-            return result
+            # The cached result is shared; each caller gets its own request_id
+            return replace(result, request_id=request_id)
             
         except Exception as e:
             self.logger.error(f"❌ Orchestrated analysis failed: {e}")
@@ -191,6 +148,56 @@ class IntelligenceOrchestrator:
                 timestamp=datetime.now()
             )
     
+    async def _execute_request(self, request: OrchestrationRequest, request_id: str,
+                               start_time: datetime) -> OrchestrationResult:
+        """Run the routed engine pipeline for a request (raises on failure so nothing is cached)"""
+        # Standardize input data to fix attribute access issues
+        standardized_data = self._standardize_request_data(request)
+        
+        # Route to appropriate engines
+        routing_config = self.router.determine_engines(request.request_type, standardized_data)
+        
+        # Override engines if specified
+        if request.engines_override:
+            routing_config = self._create_override_config(request.engines_override)
+        
+        # Coordinate parallel execution
+        engine_results = await self.coordinator.execute_engines(
+            routing_config, standardized_data, request.session_id, request.timeout_seconds
+        )
+        
+        # Synthesize results
+        synthesized_result = await self.synthesizer.combine_results(
+            engine_results, request.request_type
+        )
+        
+        # Calculate processing time
+        processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+        
+        # Create orchestration result
+        result = OrchestrationResult(
+            request_id=request_id,
+            request_type=request.request_type,
+            success=True,
+            results=synthesized_result,
+            engines_used=list(routing_config.get('primary', [])) + list(routing_config.get('supporting', [])),
+            processing_time_ms=processing_time_ms,
+            orchestration_metadata={
+                'routing_config': routing_config,
+                'cache_used': False,
+                'parallel_execution': len(routing_config.get('primary', [])) > 1,
+                'engines_count': len(engine_results),
+                'synthesis_method': 'intelligent_combination'
+            },
+            timestamp=datetime.now()
+        )
+        
+        # Update stats
+        self._update_orchestration_stats(result)
+        
+        self.logger.info(f"✅ Orchestrated analysis complete: {processing_time_ms:.1f}ms")
+        return result
+    
     async def analyze_cross_platform_intelligence(self, platform_signals: Dict[str, List]) -> Dict:
         """Direct access to cross-platform intelligence (backward compatibility)"""
         request = OrchestrationRequest(
@@ -244,15 +251,10 @@ class IntelligenceOrchestrator:
         
         cache_data = {
             'request_type': request.request_type,
-            'data_hash': hashlib.md5(json.dumps(request.data, sort_keys=True).encode()).hexdigest()
+            'data_hash': hashlib.md5(json.dumps(request.data, sort_keys=True, default=str).encode()).hexdigest()
         }
         return f"{request.request_type}_{cache_data['data_hash']}"
     
-    def _is_cache_valid(self, cached_result: OrchestrationResult) -> bool:
-        """Check if cached result is still valid"""
-        age_seconds = (datetime.now() - cached_result.timestamp).total_seconds()
-        return age_seconds < self.cache_ttl_seconds
-    
     def _create_override_config(self, engine_names: List[str]) -> Dict:
         """Create routing config from engine override list"""
         return {
@@ -319,6 +321,10 @@ class IntelligenceOrchestrator:
     
     def get_orchestration_stats(self) -> Dict[str, Any]:
         """Get orchestration performance statistics"""
+        cache_stats = self.result_cache.get_stats()
+        self.orchestration_stats['cache_hits'] = (
+            cache_stats['hits'] + cache_stats['stale_hits'] + cache_stats['coalesced']
+        )
         return {
             'orchestration_stats': self.orchestration_stats.copy(),
             'engine_status': {
@@ -326,8 +332,8 @@ class IntelligenceOrchestrator:
             },
             'cache_stats': {
                 'cached_results': len(self.result_cache),
-                'cache_hit_rate': (self.orchestration_stats['cache_hits'] / 
-                                 max(self.orchestration_stats['requests_processed'], 1)) * 100
+                'cache_hit_rate': cache_stats['hit_rate'] * 100,
+                **cache_stats
             },
             'timestamp': datetime.now().isoformat()
         }
@@ -11,6 +11,8 @@ DATABASE_PATH = os.getenv("DATABASE_PATH", str(BASE_DIR / "luciq_discovery.db"))
 SECRET_KEY = os.getenv("SECRET_KEY", "luciq-discovery-secret-key-2025")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")  # unset: random per-process key, refresh tokens kept in memory only
+REFRESH_TOKEN_DB_PATH = os.getenv("REFRESH_TOKEN_DB_PATH", DATABASE_PATH)
 
 # API configuration
 API_HOST = os.getenv("API_HOST", "localhost")
@@ -3,11 +3,21 @@ JWT Token Manager
 Handles JWT token generation, validation, and refresh token management
 """
 import jwt
+import logging
 import secrets
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional, Tuple
+from functools import partial
+from typing import Callable, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from src.shared.config.settings import JWT_SECRET_KEY, REFRESH_TOKEN_DB_PATH
+from src.shared.security.refresh_token_store import (
+    RefreshTokenStore, InMemoryRefreshTokenStore, SQLiteRefreshTokenStore
+)
+
+logger = logging.getLogger(__name__)
+
 @dataclass
 class TokenPair:
     """Data class for access and refresh token pair"""
@@ -19,7 +29,19 @@ class TokenPair:
 class JWTManager:
     """JWT token generation and validation manager"""
     
-    def __init__(self, secret_key: Optional[str] = None):
+    def __init__(self, secret_key: Optional[str] = None, refresh_token_store: Optional[RefreshTokenStore] = None,
+                 refresh_token_store_factory: Optional[Callable[[], RefreshTokenStore]] = None):
+        # A shared store outlives this process, so its tokens must be verifiable by every worker
+        persistent_store = (
+            refresh_token_store_factory not in (None, InMemoryRefreshTokenStore)
+            or (refresh_token_store is not None and not isinstance(refresh_token_store, InMemoryRefreshTokenStore))
+        )
+        if persistent_store and not secret_key:
+            raise ValueError(
+                "A persistent refresh token store requires a fixed secret_key: tokens signed with a "
+                "per-process key fail verification in other workers and after a restart"
+            )
+        
         # Use provided secret or generate a secure one
         self.secret_key = secret_key or self._generate_secret_key()
         self.algorithm = "HS256"
@@ -27,8 +49,24 @@ class JWTManager:
         self.refresh_token_expire_days = 7     # 7 days
         self.issuer = "luciq-api"
         
-        # Store active refresh tokens (in production, use Redis/database)
-        self._active_refresh_tokens = set()
+        # Active refresh token IDs (jti); share a persistent store between worker processes.
+        # Without an explicit store one is built by the factory on first use, not at import time.
+        self._refresh_token_store = refresh_token_store
+        self._refresh_token_store_factory = refresh_token_store_factory or InMemoryRefreshTokenStore
+        self._refresh_token_store_lock = threading.Lock()
+    
+    @property
+    def refresh_token_store(self) -> RefreshTokenStore:
+        """Refresh token store, created on first use"""
+        if self._refresh_token_store is None:
+            with self._refresh_token_store_lock:
+                if self._refresh_token_store is None:
+                    self._refresh_token_store = self._refresh_token_store_factory()
+        return self._refresh_token_store
+    
+    @refresh_token_store.setter
+    def refresh_token_store(self, store: RefreshTokenStore):
+        self._refresh_token_store = store
     
     def _generate_secret_key(self) -> str:
         """Generate a secure secret key for JWT signing"""
@@ -95,7 +133,7 @@ class JWTManager:
         )
         
         # Store refresh token ID for validation
-        self._active_refresh_tokens.add(refresh_token_id)
+        self.refresh_token_store.add(refresh_token_id, user_id, refresh_expires.timestamp())
         
         return TokenPair(
             access_token=access_token,
@@ -163,7 +201,7 @@ class JWTManager:
             
             # Check if refresh token is still active
             token_id = payload.get("jti")
-            if not token_id or token_id not in self._active_refresh_tokens:
+            if not token_id or not self.refresh_token_store.is_active(token_id):
                 return None
             
             return payload
@@ -210,6 +248,18 @@ class JWTManager:
         Returns:
             True if successfully revoked, False otherwise
         """
+        return self.revoke_refresh_token_payload(token) is not None
+    
+    def revoke_refresh_token_payload(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Revoke a refresh token and return its verified payload
+        
+        Args:
+            token: Refresh token to revoke
+            
+        Returns:
+            Signature-verified payload if the token was active and is now revoked, None otherwise
+        """
         try:
             payload = jwt.decode(
                 token,
@@ -220,14 +270,13 @@ class JWTManager:
             )
             
             token_id = payload.get("jti")
-            if token_id and token_id in self._active_refresh_tokens:
-                self._active_refresh_tokens.remove(token_id)
-                return True
+            if not token_id or payload.get("type") != "refresh":
+                return None
             
-            return False
+            return payload if self.refresh_token_store.revoke(token_id) else None
             
         except Exception:
-            return False
+            return None
     
     def revoke_all_user_tokens(self, user_id: str) -> int:
         """
@@ -239,19 +288,7 @@ class JWTManager:
         Returns:
             Number of tokens revoked
         """
-        revoked_count = 0
-        tokens_to_remove = []
-        
-        for token_id in self._active_refresh_tokens:
-            # Note: In production, you'd query the database for user's tokens
-            # This is a simplified implementation
-            tokens_to_remove.append(token_id)
-        
-        for token_id in tokens_to_remove:
-            self._active_refresh_tokens.discard(token_id)
-            revoked_count += 1
-        
-        return revoked_count
+        return self.refresh_token_store.revoke_user(user_id)
     
     def get_token_info(self, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -295,5 +332,15 @@ class JWTManager:
         except Exception:
             return True   # Other errors, consider as expired
 
-# Global JWT manager instance (will be configured with proper secret in production)
-jwt_manager = JWTManager() 
\ No newline at end of file
+# Global JWT manager instance - refresh tokens are only persisted when JWT_SECRET_KEY is set
+if JWT_SECRET_KEY:
+    jwt_manager = JWTManager(
+        secret_key=JWT_SECRET_KEY,
+        refresh_token_store_factory=partial(SQLiteRefreshTokenStore, REFRESH_TOKEN_DB_PATH)
+    )
+else:
+    logger.warning(
+        "⚠️ JWT_SECRET_KEY is not set: using a random per-process signing key and in-memory refresh tokens. "
+        "Tokens will not survive a restart or work across workers."
+    )
+    jwt_manager = JWTManager() 
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Password Manager
+Handles password strength validation, hashing and verification
+"""
+import re
+from typing import List
+
+from passlib.context import CryptContext
+
+
+class PasswordManager:
+    """bcrypt password hashing with strength validation"""
+
+    def __init__(self, min_length: int = 8, max_length: int = 72):
+        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.min_length = min_length
+        self.max_length = max_length  # bcrypt only uses the first 72 bytes
+
+    def password_problems(self, password: str) -> List[str]:
+        """Every strength rule ``password`` breaks (empty when it is acceptable)"""
+        problems = []
+        if len(password or "") < self.min_length:
+            problems.append(f"at least {self.min_length} characters")
+        if len((password or "").encode("utf-8")) > self.max_length:
+            problems.append(f"at most {self.max_length} bytes")
+        if not re.search(r"[a-z]", password or ""):
+            problems.append("a lowercase letter")
+        if not re.search(r"[A-Z]", password or ""):
+            problems.append("an uppercase letter")
+        if not re.search(r"\d", password or ""):
+            problems.append("a digit")
+        if not re.search(r"[^A-Za-z0-9]", password or ""):
+            problems.append("a special character")
+        return problems
+
+    def validate_password_strength(self, password: str) -> None:
+        """
+        Raise ValueError if the password is too weak
+
+        Args:
+            password: Plain text password
+        """
+        problems = self.password_problems(password)
+        if problems:
+            raise ValueError(f"Password must contain {', '.join(problems)}")
+
+    def hash_password(self, password: str) -> str:
+        """
+        Validate and hash a password
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            bcrypt hash of the password
+
+        Raises:
+            ValueError: If the password is too weak
+        """
+        self.validate_password_strength(password)
+        return self.pwd_context.hash(password)
+
+    def verify_password(self, password: str, password_hash: str) -> bool:
+        """
+        Check a plain text password against a stored hash
+
+        Args:
+            password: Plain text password
+            password_hash: Stored bcrypt hash
+
+        Returns:
+            True if the password matches
+        """
+        if not password or not password_hash:
+            return False
+        try:
+            return self.pwd_context.verify(password, password_hash)
+        except (ValueError, TypeError):
+            return False
+
+# Global password manager instance
+password_manager = PasswordManager()
@@ -0,0 +1,208 @@
+"""
+Refresh Token Store
+Tracks active refresh token IDs (jti) so they can be validated and revoked
+"""
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenStore(ABC):
+    """Interface for refresh token stores - every method is keyed by jti or user_id"""
+
+    @abstractmethod
+    def add(self, token_id: str, user_id: str, expires_at: float) -> None:
+        """Record an issued refresh token"""
+
+    @abstractmethod
+    def is_active(self, token_id: str) -> bool:
+        """Whether the token was issued, not revoked and not expired"""
+
+    @abstractmethod
+    def revoke(self, token_id: str) -> bool:
+        """Revoke one token; returns False if it was not active"""
+
+    @abstractmethod
+    def revoke_user(self, user_id: str) -> int:
+        """Revoke every token of a user; returns how many were revoked"""
+
+    @abstractmethod
+    def prune_expired(self) -> int:
+        """Forget expired tokens; returns how many were removed"""
+
+
+class InMemoryRefreshTokenStore(RefreshTokenStore):
+    """Process-local store; tokens are lost on restart and not shared between workers"""
+
+    def __init__(self):
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._tokens_by_user: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, token_id: str, user_id: str, expires_at: float) -> None:
+        with self._lock:
+            self._tokens[token_id] = (user_id, expires_at)
+            self._tokens_by_user.setdefault(user_id, set()).add(token_id)
+
+    def is_active(self, token_id: str) -> bool:
+        token = self._tokens.get(token_id)
+        return token is not None and token[1] > time.time()
+
+    def revoke(self, token_id: str) -> bool:
+        with self._lock:
+            token = self._tokens.pop(token_id, None)
+            if token is None:
+                return False
+            self._discard_user_token(token[0], token_id)
+            return True
+
+    def revoke_user(self, user_id: str) -> int:
+        with self._lock:
+            token_ids = self._tokens_by_user.pop(user_id, set())
+            for token_id in token_ids:
+                self._tokens.pop(token_id, None)
+            return len(token_ids)
+
+    def prune_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [token_id for token_id, (_, expires_at) in self._tokens.items() if expires_at <= now]
+            for token_id in expired:
+                user_id, _ = self._tokens.pop(token_id)
+                self._discard_user_token(user_id, token_id)
+            return len(expired)
+
+    def _discard_user_token(self, user_id: str, token_id: str) -> None:
+        token_ids = self._tokens_by_user.get(user_id)
+        if token_ids is not None:
+            token_ids.discard(token_id)
+            if not token_ids:
+                del self._tokens_by_user[user_id]
+
+
+class SQLiteRefreshTokenStore(RefreshTokenStore):
+    """Refresh tokens persisted in SQLite, shared by every worker process using the same file.
+
+    Rows are keyed by jti with secondary indexes on user_id and expires_at, so validation,
+    per-user revocation and expiry pruning are all index lookups. A small in-process LRU sits
+    in front of validation: unknown or revoked jtis are cached for good (a jti is never
+    re-issued), active ones only for ``cache_ttl_seconds`` so a revocation made by another
+    worker takes effect within that window.
+    """
+
+    def __init__(self, db_path: str, cache_ttl_seconds: float = 5.0, max_cached_tokens: int = 10000,
+                 prune_interval_seconds: float = 600.0):
+        self.db_path = db_path
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_cached_tokens = max_cached_tokens
+        self.prune_interval_seconds = prune_interval_seconds
+
+        # jti -> (user_id, expires_at, cached_at); user_id is None for unknown/revoked tokens
+        self._cache: "OrderedDict[str, Tuple[Optional[str], float, float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._local = threading.local()  # one connection per thread (sync endpoints run on a threadpool)
+        self._last_prune = 0.0
+
+        self.stats = {'cache_hits': 0, 'cache_misses': 0, 'pruned': 0}
+        self._init_db()
+        self.prune_expired()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS refresh_tokens (
+                jti TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_refresh_tokens_user ON refresh_tokens(user_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_refresh_tokens_expiry ON refresh_tokens(expires_at)")
+
+    def add(self, token_id: str, user_id: str, expires_at: float) -> None:
+        now = time.time()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO refresh_tokens (jti, user_id, expires_at, created_at) VALUES (?, ?, ?, ?)",
+            (token_id, user_id, expires_at, now)
+        )
+        self._cache_put(token_id, user_id, expires_at)
+        if now - self._last_prune >= self.prune_interval_seconds:
+            self.prune_expired()
+
+    def is_active(self, token_id: str) -> bool:
+        now = time.time()
+        with self._cache_lock:
+            cached = self._cache.get(token_id)
+            if cached is not None and (cached[0] is None or now - cached[2] < self.cache_ttl_seconds):
+                self._cache.move_to_end(token_id)
+                self.stats['cache_hits'] += 1
+                return cached[0] is not None and cached[1] > now
+        self.stats['cache_misses'] += 1
+
+        row = self._connection().execute(
+            "SELECT user_id, expires_at FROM refresh_tokens WHERE jti = ?", (token_id,)
+        ).fetchone()
+        if row is None:
+            self._cache_put(token_id, None, 0.0)
+            return False
+        self._cache_put(token_id, row[0], row[1])
+        return row[1] > now
+
+    def revoke(self, token_id: str) -> bool:
+        cursor = self._connection().execute("DELETE FROM refresh_tokens WHERE jti = ?", (token_id,))
+        self._cache_put(token_id, None, 0.0)
+        return cursor.rowcount > 0
+
+    def revoke_user(self, user_id: str) -> int:
+        # SELECT + DELETE under one write lock (DELETE ... RETURNING needs SQLite 3.35+)
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute("SELECT jti FROM refresh_tokens WHERE user_id = ?", (user_id,)).fetchall()
+            conn.execute("DELETE FROM refresh_tokens WHERE user_id = ?", (user_id,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        for (token_id,) in rows:
+            self._cache_put(token_id, None, 0.0)
+        return len(rows)
+
+    def prune_expired(self) -> int:
+        now = time.time()
+        self._last_prune = now
+        pruned = self._connection().execute("DELETE FROM refresh_tokens WHERE expires_at <= ?", (now,)).rowcount
+        if pruned:
+            self.stats['pruned'] += pruned
+            logger.info(f"🧹 Pruned {pruned} expired refresh tokens")
+        return pruned
+
+    def _cache_put(self, token_id: str, user_id: Optional[str], expires_at: float) -> None:
+        with self._cache_lock:
+            self._cache[token_id] = (user_id, expires_at, time.time())
+            self._cache.move_to_end(token_id)
+            while len(self._cache) > self.max_cached_tokens:
+                self._cache.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
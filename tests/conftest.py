@@ -19,6 +19,17 @@ def event_loop():
     yield loop
     loop.close()
 
+@pytest.fixture
+def restore_event_loop():
+    """For sync tests that call asyncio.run(): put back the loop it unsets on exit"""
+    policy = asyncio.get_event_loop_policy()
+    try:
+        loop = policy.get_event_loop()
+    except RuntimeError:
+        loop = None
+    yield
+    policy.set_event_loop(loop)
+
 @pytest.fixture
 def temp_database():
     """Create a temporary database for testing"""
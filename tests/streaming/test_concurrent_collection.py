@@ -0,0 +1,160 @@
+"""
+Concurrent platform collection tests for CrossPlatformTrendDetector
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.domains.streaming.services.trend_detection_service import CrossPlatformTrendDetector
+
+
+def make_detector(deadline: float = 1.0) -> CrossPlatformTrendDetector:
+    """Build a detector without touching network clients"""
+    detector = CrossPlatformTrendDetector.__new__(CrossPlatformTrendDetector)
+    detector.collection_deadline_seconds = deadline
+    detector.validation_signal_limit = 200
+    detector.validation_timeout_seconds = 1.0
+    return detector
+
+
+def signal(name: str, source: str) -> SimpleNamespace:
+    return SimpleNamespace(name=name, source=source)
+
+
+class FakeValidator:
+    """Keeps signals whose name does not start with 'junk'; records when each batch is validated"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.started = []
+
+    async def validate_signals_realtime(self, signals):
+        self.started.append(([item.name for item in signals], time.time()))
+        await asyncio.sleep(self.delay)
+        return [
+            SimpleNamespace(original_signal=item, is_verified=True,
+                            quality_metrics=SimpleNamespace(overall_quality=0.2 if item.name.startswith('junk') else 0.9))
+            for item in signals
+        ]
+
+    def get_validation_report(self):
+        return {}
+
+
+async def fake_collector(delay: float, signals: list):
+    await asyncio.sleep(delay)
+    return signals
+
+
+async def failing_collector():
+    raise RuntimeError("platform down")
+
+
+class TestConcurrentCollection:
+    """Test suite for CrossPlatformTrendDetector._collect_platforms_concurrently"""
+
+    @pytest.mark.asyncio
+    async def test_collectors_run_in_parallel(self):
+        detector = make_detector()
+        performance = {}
+        tasks = [
+            ('a', fake_collector(0.2, ['a1']), 1.0),
+            ('b', fake_collector(0.2, ['b1', 'b2']), 1.0),
+            ('c', fake_collector(0.2, []), 1.0),
+        ]
+
+        start = time.time()
+        results = [item async for item in detector._collect_platforms_concurrently(tasks, performance)]
+        elapsed = time.time() - start
+
+        assert elapsed < 0.5
+        assert dict(results) == {'a': ['a1'], 'b': ['b1', 'b2'], 'c': []}
+        assert all(p['status'] == 'success' for p in performance.values())
+        assert performance['b']['signals'] == 2
+
+    @pytest.mark.asyncio
+    async def test_results_stream_in_completion_order(self):
+        detector = make_detector()
+        tasks = [
+            ('slow', fake_collector(0.3, ['s']), 1.0),
+            ('fast', fake_collector(0.05, ['f']), 1.0),
+        ]
+
+        order = [name async for name, _ in detector._collect_platforms_concurrently(tasks, {})]
+
+        assert order == ['fast', 'slow']
+
+    @pytest.mark.asyncio
+    async def test_timeouts_errors_and_global_deadline(self):
+        detector = make_detector(deadline=0.3)
+        performance = {}
+        tasks = [
+            ('budget', fake_collector(1.0, ['x']), 0.1),
+            ('broken', failing_collector(), 1.0),
+            ('deadline', fake_collector(5.0, ['y']), 10.0),
+            ('ok', fake_collector(0.01, ['z']), 1.0),
+        ]
+
+        start = time.time()
+        results = dict([item async for item in detector._collect_platforms_concurrently(tasks, performance)])
+
+        assert time.time() - start < 1.0
+        assert results['ok'] == ['z']
+        assert 'deadline' not in results
+        assert performance['budget']['status'] == 'timeout'
+        assert performance['broken']['status'] == 'error'
+        assert performance['deadline']['status'] == 'timeout'
+
+
+class TestCollectAndValidate:
+    """Test suite for CrossPlatformTrendDetector._collect_and_validate"""
+
+    @pytest.mark.asyncio
+    async def test_platforms_are_validated_while_others_still_collect(self):
+        detector = make_detector()
+        detector.data_validator = FakeValidator()
+        tasks = [
+            ('slow', fake_collector(0.3, [signal('s1', 'slow'), signal('junk-s', 'slow')]), 1.0),
+            ('fast', fake_collector(0.01, [signal('f1', 'fast'), signal('junk-f', 'fast')]), 1.0),
+        ]
+
+        start = time.time()
+        signals, by_source = await detector._collect_and_validate(tasks, {})
+
+        first_batch, first_started = detector.data_validator.started[0]
+        assert first_batch == ['f1', 'junk-f']
+        assert first_started - start < 0.2  # before the slow collector finished
+        assert [item.name for item in signals] == ['f1', 's1']
+        assert {source: len(group) for source, group in by_source.items()} == {'fast': 2, 'slow': 2}
+
+    @pytest.mark.asyncio
+    async def test_large_signal_sets_bypass_validation(self):
+        detector = make_detector()
+        detector.data_validator = FakeValidator()
+        detector.validation_signal_limit = 2
+        tasks = [
+            ('a', fake_collector(0.01, [signal('junk-a', 'a')]), 1.0),
+            ('b', fake_collector(0.1, [signal('b1', 'b'), signal('b2', 'b')]), 1.0),
+        ]
+
+        signals, _ = await detector._collect_and_validate(tasks, {})
+
+        assert [item.name for item in signals] == ['junk-a', 'b1', 'b2']
+
+    @pytest.mark.asyncio
+    async def test_unfinished_validation_keeps_signals_unvalidated(self):
+        detector = make_detector()
+        detector.data_validator = FakeValidator(delay=0.2)
+        detector.validation_timeout_seconds = 0.1
+        tasks = [
+            ('a', fake_collector(0.0, [signal('junk-a', 'a')]), 1.0),
+            ('b', fake_collector(0.35, [signal('junk-b', 'b')]), 1.0),
+        ]
+
+        signals, _ = await detector._collect_and_validate(tasks, {})
+
+        # 'a' was validated during collection; 'b' was still being validated at the timeout
+        assert [item.name for item in signals] == ['junk-b']
@@ -0,0 +1,143 @@
+"""
+Hourly ring-buffer series store tests for AdvancedTemporalPatternEngine
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.api.domains.streaming.services.temporal_pattern_engine import (
+    AdvancedTemporalPatternEngine, HourlySeries, hour_of
+)
+
+
+def make_signals(hours: int, per_hour: int = 2, source: str = 'reddit', end: datetime = None) -> list:
+    end = end or datetime.now().replace(minute=30, second=0, microsecond=0)
+    signals = []
+    for h in range(hours):
+        for i in range(per_hour):
+            signals.append({
+                'id': f"{source}-{h}-{i}",
+                'timestamp': end - timedelta(hours=h, minutes=i),
+                'engagement_score': 0.1 + (h % 5) * 0.1 + i * 0.05,
+                'sentiment_score': 0.2 - i * 0.4,
+                'source': source,
+                'keywords': ['AI', 'saas']
+            })
+    return signals
+
+
+class TestHourlySeries:
+    """Test suite for HourlySeries"""
+
+    def test_ring_buffer_clears_buckets_that_fall_out(self):
+        series = HourlySeries(capacity_hours=4)
+        ones = np.ones(1)
+        series.add_many(np.array([100]), ones, ones, ones)
+        series.add_many(np.array([102]), ones * 2, ones, ones)
+        series.add_many(np.array([105]), ones * 3, ones, ones)  # hour 100 wraps out
+
+        window = series.window(0)
+        assert window.first_hour == 102
+        assert window.signal_strength.tolist() == [2, 0, 0, 3]
+        assert window.signal_count.tolist() == [1, 0, 0, 1]
+
+        assert series.add_many(np.array([101]), ones, ones, ones) == 0  # older than the buffer
+
+    def test_fingerprints_skip_resubmitted_signals(self):
+        series = HourlySeries(capacity_hours=24)
+        values = np.array([0.5, 0.5])
+        assert series.add_many(np.array([10, 10]), values, values, values, fingerprints=[1, 2]) == 2
+        version = series.version
+        assert series.add_many(np.array([10, 10]), values, values, values, fingerprints=[1, 2]) == 0
+        assert series.version == version
+        assert series.window(0).signal_count.tolist() == [2]
+
+
+class TestTemporalSeriesStore:
+    """Test suite for the engine's pre-aggregated hourly series"""
+
+    def test_window_frame_matches_pandas_resample(self):
+        engine = AdvancedTemporalPatternEngine()
+        signals = make_signals(30)
+        signals = [s for s in signals if s['timestamp'].hour % 7 != 3]  # leave empty hours
+
+        frame = engine._prepare_time_series(signals, 168)
+
+        df = pd.DataFrame([{
+            'timestamp': s['timestamp'],
+            'signal_strength': engine._calculate_signal_strength_unified(s),
+            'engagement': s['engagement_score'],
+            'sentiment': s['sentiment_score'],
+            'signal_count': 1
+        } for s in signals]).set_index('timestamp').sort_index()
+        expected = df.resample('1h').agg({
+            'signal_strength': 'sum', 'engagement': 'mean', 'sentiment': 'mean', 'signal_count': 'count'
+        }).fillna(0)
+
+        assert list(frame.index) == list(expected.index)
+        for column in expected.columns:
+            assert np.allclose(frame[column].values, expected[column].values)
+
+    def test_store_keeps_only_the_named_series(self):
+        engine = AdvancedTemporalPatternEngine()
+        signals = make_signals(3, source='reddit') + make_signals(2, source='github')
+
+        assert engine.ingest_signals(signals, series_key='all') == len(signals)
+        assert engine.ingest_signals(signals, series_key='all') == 0
+
+        assert engine.series_store.keys() == ['all']
+        now_hour = hour_of(datetime.now())
+        assert engine.series_store.get('all').window(now_hour - 48).signal_count.sum() == len(signals)
+
+    def test_repolled_signal_with_new_engagement_counts_once(self):
+        engine = AdvancedTemporalPatternEngine()
+        first = make_signals(1, per_hour=1)
+        repolled = [{**first[0], 'engagement_score': 0.9, 'sentiment_score': -0.5}]
+
+        assert engine.ingest_signals(first, series_key='opportunity:ai') == 1
+        assert engine.ingest_signals(repolled, series_key='opportunity:ai') == 0
+
+        now_hour = hour_of(datetime.now())
+        assert engine.series_store.get('opportunity:ai').window(now_hour - 2).signal_count.sum() == 1
+
+    @pytest.mark.asyncio
+    async def test_one_off_analysis_does_not_touch_the_store(self):
+        engine = AdvancedTemporalPatternEngine()
+
+        await engine.analyze_temporal_patterns(make_signals(30))
+
+        assert len(engine.series_store) == 0
+        assert engine.analysis_stats['signals_ingested'] == 0
+
+    def test_one_off_series_is_clipped_to_the_window(self):
+        engine = AdvancedTemporalPatternEngine()
+        signals = make_signals(10)
+        signals.append({**signals[0], 'id': 'ancient', 'timestamp': datetime(2001, 1, 1)})
+
+        series = engine._build_series(
+            engine._signal_records(signals), hour_of(datetime.now() - timedelta(hours=168))
+        )
+
+        assert series.capacity <= 11
+        assert series.window(0).signal_count.sum() == 20
+
+    @pytest.mark.asyncio
+    async def test_unchanged_series_reuses_patterns(self):
+        engine = AdvancedTemporalPatternEngine()
+        signals = make_signals(60)
+
+        first = await engine.analyze_temporal_patterns(signals, series_key='opportunity:test')
+        assert engine.analysis_stats['series_analyses'] == 1
+
+        second = await engine.analyze_temporal_patterns(signals, series_key='opportunity:test')
+        assert engine.analysis_stats['series_analyses'] == 1
+        assert engine.analysis_stats['series_cache_hits'] == 1
+        assert [p.pattern_type for p in second] == [p.pattern_type for p in first]
+
+        newer = make_signals(1, per_hour=1, source='reddit', end=datetime.now())
+        newer[0]['id'] = 'fresh'
+        await engine.analyze_temporal_patterns(newer, series_key='opportunity:test')
+        assert engine.analysis_stats['series_analyses'] == 2
@@ -0,0 +1,217 @@
+"""
+Incremental trend graph tests for GroundbreakingGraphTrendDetector
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.domains.streaming.services.incremental_trend_graph import IncrementalTrendGraph
+from src.api.domains.streaming.services.graph_trend_detector import GroundbreakingGraphTrendDetector
+
+
+class MockSignal:
+    def __init__(self, source, content, keywords, timestamp, engagement_score):
+        self.source = source
+        self.content = content
+        self.keywords = keywords
+        self.timestamp = timestamp
+        self.engagement_score = engagement_score
+        self.metadata = {}
+
+
+class TestIncrementalTrendGraph:
+    """Test suite for IncrementalTrendGraph"""
+
+    def test_edge_weights_decay_with_half_life(self):
+        store = IncrementalTrendGraph(half_life_hours=1.0)
+        start = datetime(2025, 1, 1, 12, 0)
+        store.upsert_node('a', start, {'node_type': 'keyword'})
+        store.upsert_node('b', start, {'node_type': 'keyword'})
+        store.add_edge('a', 'b', 'co_occurs', 1.0, start)
+
+        stored = store.graph.get_edge_data('a', 'b', key='co_occurs')['weight']
+        assert store.effective_weight(stored) == pytest.approx(1.0)
+
+        store.advance_clock(start + timedelta(hours=2))
+        assert store.effective_weight(stored) == pytest.approx(0.25)
+
+        matrix, nodes = store.adjacency_matrix()
+        assert matrix[nodes.index('a'), nodes.index('b')] == pytest.approx(0.25)
+        assert matrix[nodes.index('b'), nodes.index('a')] == pytest.approx(0.25)
+
+    def test_cached_adjacency_follows_the_clock(self):
+        store = IncrementalTrendGraph(half_life_hours=1.0)
+        start = datetime(2025, 1, 1, 12, 0)
+        store.upsert_node('a', start, {'node_type': 'keyword'})
+        store.upsert_node('b', start, {'node_type': 'keyword'})
+        store.add_edge('a', 'b', 'co_occurs', 1.0, start)
+
+        matrix, nodes = store.adjacency_matrix()
+        assert matrix[nodes.index('a'), nodes.index('b')] == pytest.approx(1.0)
+
+        store.advance_clock(start + timedelta(hours=1))
+        matrix, nodes = store.adjacency_matrix()
+        assert matrix[nodes.index('a'), nodes.index('b')] == pytest.approx(0.5)
+
+    def test_iso_string_timestamps_are_parsed(self):
+        start = datetime(2025, 1, 1, 12, 0)
+        assert IncrementalTrendGraph._to_seconds(start.isoformat()) == start.timestamp()
+        assert IncrementalTrendGraph._to_seconds('2025-01-01T12:00:00Z') == 1735732800.0
+
+    def test_stale_nodes_are_evicted_and_rows_reused(self):
+        store = IncrementalTrendGraph(max_age_hours=1.0)
+        start = datetime(2025, 1, 1, 12, 0)
+        store.upsert_node('old', start, {'node_type': 'keyword'})
+        store.upsert_node('hub', start, {'node_type': 'source'})
+        store.add_edge('old', 'hub', 'mentioned_in', 1.0, start)
+
+        later = start + timedelta(hours=3)
+        store.upsert_node('hub', later, {'node_type': 'source'})
+        store.upsert_node('new', later, {'node_type': 'keyword'})
+        evicted = [node for node, _ in store.evict_stale()]
+
+        assert evicted == ['old']
+        assert not store.graph.has_node('old')
+        assert not store.simple_graph.has_node('old')
+        matrix, nodes = store.adjacency_matrix()
+        assert sorted(nodes) == ['hub', 'new']
+        assert matrix.nnz == 0
+
+    def test_duplicate_signals_are_ingested_once(self):
+        store = IncrementalTrendGraph()
+        signal = MockSignal('reddit', 'ai tools', ['ai'], datetime.now(), 10)
+
+        assert store.select_new_signals([signal]) == [signal]
+        assert store.select_new_signals([signal]) == []
+
+
+class TestGraphDetectorIncremental:
+    """Repeated detection only folds in new signals"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_detection_reuses_graph(self):
+        detector = GroundbreakingGraphTrendDetector()
+        now = datetime.now()
+        signals = [
+            MockSignal('reddit', 'AI automation', ['ai', 'automation', 'customer service'], now, 150),
+            MockSignal('github', 'ML platform', ['ai', 'platform', 'automation'], now - timedelta(hours=2), 89),
+            MockSignal('hacker_news', 'AI tool', ['ai', 'customer service', 'tool'], now - timedelta(hours=4), 234),
+        ]
+
+        await detector.detect_trends_graph_based(signals)
+        version = detector.graph_store.version
+        frequency = detector.trend_graph.nodes[detector._keyword_node_id('ai')]['features']['frequency']
+
+        await detector.detect_trends_graph_based(signals)
+        assert detector.graph_store.version == version
+        assert detector.trend_graph.nodes[detector._keyword_node_id('ai')]['features']['frequency'] == frequency
+
+        signals.append(MockSignal('dev_to', 'AI platforms', ['ai', 'platform'], now, 67))
+        await detector.detect_trends_graph_based(signals)
+        assert detector.trend_graph.nodes[detector._keyword_node_id('ai')]['features']['frequency'] == frequency + 1
+
+
+class TestGraphDetectorFastMode:
+    """Approximate centrality mode for large graphs"""
+
+    def _build_detector(self, **kwargs) -> GroundbreakingGraphTrendDetector:
+        import networkx as nx
+
+        detector = GroundbreakingGraphTrendDetector(**kwargs)
+        now = datetime.now()
+        graph = nx.barabasi_albert_graph(150, 3, seed=7)
+        for node in graph.nodes():
+            detector.graph_store.upsert_node(str(node), now, {'node_type': 'keyword', 'content': str(node)})
+        for source, target in graph.edges():
+            detector.graph_store.add_edge(str(source), str(target), 'co_occurs', 1.0, now)
+        return detector
+
+    def test_mode_switches_on_node_threshold(self):
+        detector = GroundbreakingGraphTrendDetector(fast_mode_node_threshold=100)
+        assert detector._resolve_analysis_mode(50) == 'exact'
+        assert detector._resolve_analysis_mode(500) == 'fast'
+        assert GroundbreakingGraphTrendDetector(analysis_mode='exact')._resolve_analysis_mode(10 ** 6) == 'exact'
+        with pytest.raises(ValueError):
+            GroundbreakingGraphTrendDetector(analysis_mode='turbo')
+
+    def test_fast_centralities_track_exact_values(self):
+        import networkx as nx
+        import numpy as np
+
+        detector = self._build_detector(analysis_mode='fast', betweenness_samples=150)
+        adjacency, order = detector.graph_store.adjacency_matrix()
+        fast = detector._fast_centralities(detector.graph_store.simple_graph, adjacency, order)
+        graph = detector.graph_store.simple_graph
+
+        exact_betweenness = nx.betweenness_centrality(graph)
+        exact_eigenvector = nx.eigenvector_centrality(graph)
+        exact_pagerank = nx.pagerank(graph)
+        fast_pagerank = detector._sparse_pagerank(adjacency, order, {})
+
+        betweenness = np.array([[exact_betweenness[n], fast['betweenness'][n]] for n in order])
+        assert np.corrcoef(betweenness.T)[0, 1] > 0.95
+        assert max(abs(exact_eigenvector[n] - fast['eigenvector'][n]) for n in order) < 1e-4
+        assert max(abs(exact_pagerank[n] - fast_pagerank[n]) for n in order) < 1e-4
+
+    def test_fast_pagerank_matches_exact_on_directed_graph(self):
+        import networkx as nx
+
+        detector = GroundbreakingGraphTrendDetector()
+        now = datetime.now()
+        for node in 'abcd':
+            detector.graph_store.upsert_node(node, now, {'node_type': 'keyword'})
+        for source, target in [('a', 'b'), ('b', 'c'), ('c', 'a'), ('d', 'a'), ('a', 'c')]:
+            detector.graph_store.add_edge(source, target, 'influences', 1.0, now)
+
+        adjacency, order = detector.graph_store.adjacency_matrix(directed=True)
+        fast = detector._sparse_pagerank(adjacency, order, {})
+        exact = nx.pagerank(detector.graph_store.graph, weight='weight')
+
+        assert max(abs(exact[n] - fast[n]) for n in order) < 1e-4
+
+    def test_pivot_bfs_matches_shortest_path(self):
+        import networkx as nx
+        import numpy as np
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import shortest_path
+
+        detector = GroundbreakingGraphTrendDetector()
+        graph = nx.gnm_random_graph(200, 260, seed=3)  # several components
+        adjacency = csr_matrix(nx.to_scipy_sparse_array(graph))
+        pivots = np.random.default_rng(3).choice(200, size=25, replace=False)
+
+        distances, predecessors = detector._pivot_bfs(adjacency, pivots)
+
+        expected = shortest_path(adjacency, method='D', unweighted=True, directed=False, indices=pivots)
+        assert np.array_equal(distances, expected)
+        rows, cols = np.nonzero(predecessors >= 0)
+        assert np.all(distances[rows, predecessors[rows, cols]] == distances[rows, cols] - 1)
+
+    def test_sparse_community_edges_match_graph_walk(self):
+        detector = self._build_detector(analysis_mode='fast', fast_cluster_edge_limit=5)
+        nodes = sorted(detector.trend_graph.nodes(), key=int)
+        communities = [set(nodes[:60]), set(nodes[60:])]
+
+        edges, internal_pairs = detector._sparse_community_edges(communities)
+
+        for community, community_edges, pairs in zip(communities, edges, internal_pairs):
+            max_edges = len(community) * (len(community) - 1)
+            assert pairs / max_edges == detector._calculate_network_density(community)
+            assert 0 < len(community_edges) <= 5
+            assert all(edge.source_id in community and edge.target_id in community for edge in community_edges)
+
+    @pytest.mark.asyncio
+    async def test_clusters_report_analysis_mode(self):
+        detector = GroundbreakingGraphTrendDetector(fast_mode_node_threshold=3)
+        now = datetime.now()
+        signals = [
+            MockSignal('reddit', 'AI automation', ['ai', 'automation', 'customer service'], now, 150),
+            MockSignal('github', 'ML platform', ['ai', 'platform', 'automation'], now, 89),
+            MockSignal('hacker_news', 'AI tool', ['ai', 'customer service', 'tool'], now, 234),
+        ]
+
+        clusters = await detector.detect_trends_graph_based(signals)
+
+        assert clusters
+        assert all(cluster.analysis_mode == 'fast' for cluster in clusters)
@@ -0,0 +1,77 @@
+"""
+Stream protocol (batching / delta frames) tests
+"""
+
+import json
+
+from src.api.domains.streaming.services import stream_protocol
+from src.api.domains.streaming.services.stream_protocol import StreamProtocol, apply_delta, compute_delta
+
+
+class TestDeltas:
+    """Test suite for merge-patch deltas"""
+
+    def test_round_trip(self):
+        previous = {'statistics': {'events': 10, 'rate': 1.5}, 'windows': {'micro': 3, 'macro': 9}, 'old': 1}
+        current = {'statistics': {'events': 12, 'rate': 1.5}, 'windows': {'micro': 3}, 'new': True}
+
+        patch = compute_delta(previous, current)
+        assert patch == {'statistics': {'events': 12}, 'windows': {'macro': None}, 'new': True, 'old': None}
+        assert apply_delta(previous, patch) == current
+
+
+class TestStreamProtocol:
+    """Test suite for StreamProtocol"""
+
+    def test_deltas_are_against_last_acknowledged_snapshot(self):
+        protocol = StreamProtocol(delta=True)
+        first = {'statistics': {'events': 1}, 'active_windows': {'micro': 1}}
+        second = {'statistics': {'events': 2}, 'active_windows': {'micro': 1}}
+        third = {'statistics': {'events': 3}, 'active_windows': {'micro': 1}}
+
+        sent_first = protocol.prepare('status', first)
+        assert sent_first['data'] == first  # nothing acknowledged yet
+
+        assert protocol.prepare('status', second)['data'] == second
+        protocol.acknowledge(sent_first['seq'])
+
+        sent_third = protocol.prepare('status', third)
+        assert sent_third['base_seq'] == sent_first['seq']
+        assert sent_third['delta'] == {'statistics': {'events': 3}}
+        assert apply_delta(first, sent_third['delta']) == third
+
+    def test_unchanged_snapshot_is_skipped(self):
+        protocol = StreamProtocol(delta=True)
+        snapshot = {'statistics': {'events': 1}}
+        assert protocol.prepare('status', snapshot) is not None
+        assert protocol.prepare('status', dict(snapshot)) is None
+        assert protocol.stats['unchanged_skipped'] == 1
+
+    def test_repeated_events_are_always_forwarded_in_full(self):
+        protocol = StreamProtocol(delta=True)
+        alert = {'level': 'high', 'message': 'spike'}
+        first = protocol.event('alert', alert, {'type': 'alert'})
+        protocol.acknowledge(first['seq'])
+
+        second = protocol.event('alert', dict(alert), {'type': 'alert'})
+        assert second == {'type': 'alert', 'stream': 'alert', 'seq': 2, 'data': alert}
+        assert protocol.stats['events'] == 2 and protocol.stats['unchanged_skipped'] == 0
+
+        # Events leave the snapshot state of a stream with the same name untouched
+        assert protocol.prepare('alert', alert)['data'] == alert
+
+    def test_batch_frame_and_json_encoding(self):
+        protocol = StreamProtocol(batch=True)
+        messages = [protocol.event('trend_update', {'i': i}) for i in range(3)]
+
+        frame = json.loads(protocol.encode(protocol.frame(messages)))
+        assert frame['type'] == 'batch' and frame['count'] == 3
+        assert [m['data']['i'] for m in frame['messages']] == [0, 1, 2]
+
+    def test_negotiation(self, monkeypatch):
+        assert StreamProtocol.negotiate(None) is None
+
+        monkeypatch.setattr(stream_protocol, 'MSGPACK_AVAILABLE', False)
+        protocol = StreamProtocol.negotiate({'batch': True, 'flush_interval': 99, 'encoding': 'msgpack'})
+        assert protocol.batch and protocol.flush_interval == 5.0
+        assert protocol.encoding == 'json' and not protocol.binary
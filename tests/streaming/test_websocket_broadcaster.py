@@ -0,0 +1,134 @@
+"""
+WebSocket broadcaster fan-out tests
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.api.domains.streaming.services.websocket_broadcaster import ClientConnection, WebSocketBroadcaster
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.frames = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.frames.append(frame)
+
+
+async def settle(rounds: int = 20):
+    for _ in range(rounds):
+        await asyncio.sleep(0)
+
+
+class TestWebSocketBroadcaster:
+    """Test suite for WebSocketBroadcaster"""
+
+    @pytest.mark.asyncio
+    async def test_message_is_encoded_once_for_all_subscribers(self):
+        broadcaster = WebSocketBroadcaster()
+        clients = [FakeWebSocket() for _ in range(5)]
+        try:
+            for client in clients:
+                await broadcaster.connect(client)
+            await broadcaster.broadcast_fusion_result({'score': 0.9})
+            await settle()
+        finally:
+            await broadcaster.close()
+
+        fusion_frames = [client.frames[-1] for client in clients]
+        assert all('multimodal_fusion' in frame for frame in fusion_frames)
+        assert all(frame is fusion_frames[0] for frame in fusion_frames)
+
+    @pytest.mark.asyncio
+    async def test_channel_index_follows_subscriptions(self):
+        broadcaster = WebSocketBroadcaster()
+        client = FakeWebSocket()
+        try:
+            await broadcaster.connect(client)
+            await broadcaster.handle_client_message(client, '{"type": "unsubscribe", "channels": ["alerts"]}')
+            assert client not in broadcaster.channel_subscribers['alerts']
+
+            await broadcaster.broadcast_alert({'message': 'ignored'})
+            await settle()
+            assert not any('"alert"' in frame for frame in client.frames)
+
+            await broadcaster.disconnect(client)
+            assert all(client not in subscribers for subscribers in broadcaster.channel_subscribers.values())
+        finally:
+            await broadcaster.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_fast_clients(self):
+        broadcaster = WebSocketBroadcaster(max_client_queue_size=4)
+        slow, fast = FakeWebSocket(delay=10), FakeWebSocket()
+        try:
+            await broadcaster.connect(slow)
+            await broadcaster.connect(fast)
+            for i in range(20):
+                await broadcaster.broadcast_trend_update({'i': i})
+                await settle(5)
+
+            assert sum('trend_update' in frame for frame in fast.frames) == 20
+            assert len(broadcaster.client_connections[slow].pending) == 4
+            assert broadcaster.get_broadcaster_stats()['message_stats']['dropped'] > 0
+        finally:
+            await broadcaster.close()
+
+    @pytest.mark.asyncio
+    async def test_protocol_client_receives_every_event_batched(self):
+        broadcaster = WebSocketBroadcaster()
+        dashboard, legacy = FakeWebSocket(), FakeWebSocket()
+        try:
+            await broadcaster.connect(dashboard)
+            await broadcaster.connect(legacy)
+            await broadcaster.handle_client_message(dashboard, json.dumps({
+                'type': 'subscribe', 'channels': ['trends'],
+                'protocol': {'batch': True, 'flush_interval': 0.01, 'delta': True}
+            }))
+
+            await broadcaster.broadcast_trend_update({'events': 1, 'rate': 0.5})
+            await broadcaster.broadcast_trend_update({'events': 2, 'rate': 0.5})
+            await asyncio.sleep(0.05)
+            first_batch = json.loads(dashboard.frames[-1])
+            assert first_batch['type'] == 'batch' and first_batch['count'] == 2
+
+            # Events are never diffed or skipped, even after an ack or when repeated
+            await broadcaster.handle_client_message(dashboard, json.dumps({'type': 'ack', 'seq': 2}))
+            await broadcaster.broadcast_trend_update({'events': 2, 'rate': 0.5})
+            await asyncio.sleep(0.05)
+            update = json.loads(dashboard.frames[-1])['messages'][0]
+            assert update['seq'] == 3 and update['data'] == {'events': 2, 'rate': 0.5}
+            assert 'delta' not in update
+
+            assert sum('trend_update' in frame for frame in legacy.frames) == 3
+        finally:
+            await broadcaster.close()
+
+
+class TestClientConnection:
+    """Test suite for ClientConnection overflow policies"""
+
+    def test_drop_oldest(self):
+        connection = ClientConnection(FakeWebSocket(), max_queue_size=2)
+        connection.enqueue('a', 'fusion')
+        connection.enqueue('b', 'trends')
+        assert not connection.enqueue('c', 'fusion')
+        assert [frame for _, frame in connection.pending] == ['b', 'c']
+        assert connection.frames_dropped == 1
+
+    def test_coalesce_replaces_pending_frame_of_same_channel(self):
+        connection = ClientConnection(FakeWebSocket(), max_queue_size=2, overflow_policy='coalesce')
+        connection.enqueue('fusion-1', 'fusion')
+        connection.enqueue('trends-1', 'trends')
+        connection.enqueue('trends-2', 'trends')
+        assert [frame for _, frame in connection.pending] == ['fusion-1', 'trends-2']
+        assert connection.frames_coalesced == 1
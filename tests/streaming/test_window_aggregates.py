@@ -0,0 +1,79 @@
+"""
+Incremental sliding-window aggregate tests for GroundbreakingStreamingPipeline
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.domains.streaming.services.streaming_trend_pipeline import (
+    GroundbreakingStreamingPipeline, StreamEvent, EventType, WindowAggregates
+)
+
+
+def make_event(source: str, keywords: list, engagement: float, age_seconds: int = 0) -> StreamEvent:
+    return StreamEvent(
+        event_id=f"{source}-{engagement}",
+        event_type=EventType.SIGNAL_RECEIVED,
+        timestamp=datetime.now() - timedelta(seconds=age_seconds),
+        data={'source': source, 'keywords': keywords, 'engagement': engagement},
+        source='test'
+    )
+
+
+class TestWindowAggregates:
+    """Test suite for WindowAggregates"""
+
+    def test_add_and_remove_keep_counters_consistent(self):
+        aggregates = WindowAggregates(top_k=2)
+        first = make_event('reddit', ['ai', 'saas'], 10)
+        second = make_event('github', ['ai'], 30)
+
+        aggregates.add(first)
+        aggregates.add(second)
+        snapshot = aggregates.snapshot(60)
+        assert snapshot['event_count'] == 2
+        assert snapshot['unique_sources'] == 2
+        assert snapshot['avg_engagement'] == 20
+        assert snapshot['top_keywords'][0] == ('ai', 2)
+
+        aggregates.remove(first)
+        snapshot = aggregates.snapshot(60)
+        assert snapshot['event_count'] == 1
+        assert snapshot['unique_sources'] == 1
+        assert snapshot['total_engagement'] == 30
+        assert snapshot['top_keywords'] == [('ai', 1)]
+        assert 'saas' not in aggregates.keyword_counts
+
+    @pytest.mark.asyncio
+    async def test_pipeline_window_statistics_follow_eviction(self):
+        pipeline = GroundbreakingStreamingPipeline()
+        await pipeline._add_to_windows(make_event('reddit', ['old'], 5, age_seconds=120))
+        await pipeline._add_to_windows(make_event('twitter', ['new'], 15))
+
+        micro = pipeline.windows['micro']
+        await pipeline._clean_window(micro)
+        await pipeline._update_window_statistics(micro)
+
+        assert micro.statistics['event_count'] == 1
+        assert micro.statistics['total_engagement'] == 15
+        assert micro.statistics['top_keywords'] == [('new', 1)]
+        assert pipeline.windows['macro'].aggregates.event_count == 2
+
+    def test_top_keywords_track_counter_through_random_churn(self):
+        rng = random.Random(7)
+        aggregates = WindowAggregates(top_k=5)
+        live = []
+        for step in range(2000):
+            if live and rng.random() < 0.45:
+                aggregates.remove(live.pop(rng.randrange(len(live))))
+            else:
+                event = make_event('reddit', [f"k{rng.randrange(30)}" for _ in range(rng.randrange(4))], step)
+                live.append(event)
+                aggregates.add(event)
+            if step % 50 == 0:
+                top = aggregates.top_keywords()
+                expected_counts = sorted(aggregates.keyword_counts.values(), reverse=True)[:5]
+                assert [count for _, count in top] == expected_counts
+                assert all(aggregates.keyword_counts[keyword] == count for keyword, count in top)
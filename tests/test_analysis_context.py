@@ -0,0 +1,109 @@
+"""
+Per-request analysis context tests
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.shared.services.analysis_context import AnalysisContext
+from src.api.shared.services.result_cache import ContentResultCache
+
+
+class StubSemanticEngine:
+    def __init__(self):
+        self.calls = 0
+
+    async def analyze_semantic_content(self, content, context=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {'content': content, 'innovation_indicators': ['ai']}
+
+
+class StubFusionEngine:
+    def __init__(self):
+        self.calls = 0
+
+    async def analyze_content(self, content, platform='unknown'):
+        self.calls += 1
+        return {'platform': platform, 'scores': {'pain': 0.7}}
+
+
+class TestAnalysisContext:
+    """Test suite for AnalysisContext"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_phases_share_one_pass(self):
+        engine = StubSemanticEngine()
+        context = AnalysisContext()
+
+        results = await asyncio.gather(*(context.semantic(engine, 'slow invoicing') for _ in range(4)))
+
+        assert engine.calls == 1
+        assert all(result == results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_callers_receive_private_copies(self):
+        engine = StubSemanticEngine()
+        context = AnalysisContext()
+
+        first = await context.semantic(engine, 'slow invoicing')
+        first['innovation_indicators'].append('mutated')
+        second = await context.semantic(engine, 'slow invoicing')
+
+        assert second['innovation_indicators'] == ['ai']
+        assert engine.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_parameters_are_part_of_the_key(self):
+        engine = StubSemanticEngine()
+        context = AnalysisContext()
+
+        await context.semantic(engine, 'slow invoicing', {'platform': 'reddit'})
+        await context.semantic(engine, 'slow invoicing', {'platform': 'github'})
+
+        assert engine.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_fusion_results_are_shared_across_requests(self):
+        engine = StubFusionEngine()
+        shared = ContentResultCache('fusion_test', 'v1')
+
+        first = await AnalysisContext(fusion_cache=shared).fusion(engine, 'Billing is BROKEN', 'reddit')
+        first['scores']['pain'] = 0.0
+        second = await AnalysisContext(fusion_cache=shared).fusion(engine, 'Billing is BROKEN', 'reddit')
+        await AnalysisContext(fusion_cache=shared).fusion(engine, 'billing is broken', 'reddit')
+
+        assert second['scores']['pain'] == 0.7
+        assert engine.calls == 2  # exact content is the key, so the lowercase copy is analyzed again
+        assert shared.get_stats()['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_reach_every_caller_and_are_not_cached(self):
+        class FailingEngine:
+            async def analyze_content(self, content, platform='unknown'):
+                raise RuntimeError('model unavailable')
+
+        shared = ContentResultCache('fusion_test', 'v1')
+        context = AnalysisContext(fusion_cache=shared)
+        results = await asyncio.gather(
+            context.fusion(FailingEngine(), 'text'), context.fusion(FailingEngine(), 'text'), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert shared.get_stats()['entries'] == 0
+
+    @pytest.mark.asyncio
+    async def test_version_bump_misses_disk_tier(self, temp_database):
+        engine = StubFusionEngine()
+        old = ContentResultCache('fusion_test', 'v1', db_path=temp_database)
+        await AnalysisContext(fusion_cache=old).fusion(engine, 'Billing is BROKEN', 'reddit')
+        old.close()
+
+        bumped = ContentResultCache('fusion_test', 'v2', db_path=temp_database)
+        await AnalysisContext(fusion_cache=bumped).fusion(engine, 'Billing is BROKEN', 'reddit')
+
+        assert engine.calls == 2
+        stats = bumped.get_stats()
+        assert stats['disk_hits'] == 0
+        assert stats['misses'] == 1
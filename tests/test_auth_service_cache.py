@@ -0,0 +1,165 @@
+"""
+AuthService token and profile cache tests
+"""
+
+import email_validator
+import pytest
+
+import src.api.domains.auth.services.auth_service as auth_module
+from src.shared.database.connection import DatabaseService
+from src.shared.security.jwt_manager import JWTManager
+from src.shared.security.refresh_token_store import InMemoryRefreshTokenStore
+
+PASSWORD = 'SecureP@ss2024!'
+
+
+@pytest.fixture
+def jwt_manager(monkeypatch):
+    manager = JWTManager(secret_key='auth-service-cache-test-secret-key-0123456789',
+                         refresh_token_store=InMemoryRefreshTokenStore())
+    monkeypatch.setattr(auth_module, 'jwt_manager', manager)
+    return manager
+
+
+@pytest.fixture
+def auth_service(temp_database, jwt_manager, monkeypatch):
+    monkeypatch.setattr(email_validator, 'CHECK_DELIVERABILITY', False)  # no DNS lookups in tests
+    monkeypatch.setattr(auth_module, 'db_service', DatabaseService(temp_database))
+    return auth_module.AuthService()
+
+
+@pytest.fixture
+def validations(jwt_manager, monkeypatch):
+    """Count how often access tokens are actually decoded"""
+    calls = []
+    validate = jwt_manager.validate_access_token
+
+    def counting_validate(token):
+        calls.append(token)
+        return validate(token)
+
+    monkeypatch.setattr(jwt_manager, 'validate_access_token', counting_validate)
+    return calls
+
+
+def register(service, email: str, username: str) -> dict:
+    result = service.register_user(email, PASSWORD, username=username)
+    assert result['success'], result
+    return result['user']
+
+
+class TestAuthServiceCache:
+    """Test suite for AuthService token memo and profile cache invalidation"""
+
+    def test_login_bumps_login_count(self, auth_service):
+        register(auth_service, 'alice@example.com', 'alice')
+
+        first = auth_service.login_user('alice@example.com', PASSWORD)
+        assert auth_service.get_user_by_token(first['access_token'])['login_count'] == 1
+
+        second = auth_service.login_user('alice@example.com', PASSWORD)
+        assert auth_service.get_user_by_token(second['access_token'])['login_count'] == 2
+        assert auth_service.get_user_by_token(first['access_token'])['login_count'] == 2
+
+    def test_verify_email_drops_cached_profile(self, auth_service, jwt_manager):
+        user = register(auth_service, 'bob@example.com', 'bob')
+        access_token = jwt_manager.create_token_pair(user['user_id'], user['email']).access_token
+
+        assert auth_service.get_user_by_token(access_token) is None  # unverified profile is now cached
+
+        assert auth_service.verify_email('bob@example.com', 'token')['success']
+        assert auth_service.get_user_by_token(access_token)['is_verified']
+
+    def test_reset_password_drops_profile_and_tokens(self, auth_service, validations):
+        register(auth_service, 'carol@example.com', 'carol')
+        login = auth_service.login_user('carol@example.com', PASSWORD)
+        user_id = login['user']['user_id']
+        auth_service.get_user_by_token(login['access_token'])
+        auth_service.get_user_by_token(login['access_token'])
+        assert len(validations) == 1
+        assert user_id in auth_service._user_cache
+
+        assert auth_service.reset_password('carol@example.com', 'token', 'N3wSecureP@ss2024!')['success']
+
+        assert user_id not in auth_service._user_cache
+        assert user_id not in auth_service._tokens_by_user
+        assert login['access_token'] not in auth_service._validated_tokens
+        assert auth_service.login_user('carol@example.com', PASSWORD)['error_code'] == 'INVALID_CREDENTIALS'
+
+    def test_logout_forgets_only_that_users_tokens(self, auth_service, validations):
+        register(auth_service, 'dave@example.com', 'dave')
+        register(auth_service, 'erin@example.com', 'erin')
+        dave = auth_service.login_user('dave@example.com', PASSWORD)
+        erin = auth_service.login_user('erin@example.com', PASSWORD)
+        for login in (dave, erin):
+            auth_service.get_user_by_token(login['access_token'])
+
+        assert auth_service.logout_user(dave['refresh_token'])['success']
+
+        assert dave['user']['user_id'] not in auth_service._tokens_by_user
+        assert dave['access_token'] not in auth_service._validated_tokens
+        assert erin['access_token'] in auth_service._validated_tokens
+        auth_service.get_user_by_token(erin['access_token'])
+        auth_service.get_user_by_token(dave['access_token'])
+        assert validations.count(erin['access_token']) == 1
+        assert validations.count(dave['access_token']) == 2
+
+    def test_forged_refresh_token_does_not_flush_caches(self, auth_service, validations):
+        register(auth_service, 'heidi@example.com', 'heidi')
+        login = auth_service.login_user('heidi@example.com', PASSWORD)
+        user = login['user']
+        auth_service.get_user_by_token(login['access_token'])
+        forged = JWTManager(secret_key='attacker-controlled-secret-key-0123456789',
+                            refresh_token_store=InMemoryRefreshTokenStore())
+        forged_token = forged.create_token_pair(user['user_id'], user['email']).refresh_token
+
+        assert auth_service.logout_user(forged_token)['message'] == 'Already logged out'
+
+        assert user['user_id'] in auth_service._user_cache
+        assert login['access_token'] in auth_service._validated_tokens
+
+    def test_token_index_follows_eviction(self, auth_service, jwt_manager):
+        user = register(auth_service, 'frank@example.com', 'frank')
+        auth_service.verify_email('frank@example.com', 'token')
+        auth_service.max_validated_tokens = 2
+        tokens = [
+            jwt_manager.create_token_pair(user['user_id'], user['email'], {'device': index}).access_token
+            for index in range(3)
+        ]
+        for token in tokens:
+            auth_service.get_user_by_token(token)
+        user_id = user['user_id']
+
+        assert auth_service._tokens_by_user[user_id] == set(tokens[1:])
+        assert set(auth_service._validated_tokens) == set(tokens[1:])
+
+    @pytest.mark.asyncio
+    async def test_callers_receive_copies(self, auth_service):
+        register(auth_service, 'grace@example.com', 'grace')
+        access_token = auth_service.login_user('grace@example.com', PASSWORD)['access_token']
+
+        first = auth_service.get_user_by_token(access_token)
+        first['display_name'] = 'mutated'
+        first['is_active'] = False
+        second = await auth_service.get_user_by_token_async(access_token)
+
+        assert second is not first
+        assert second['display_name'] != 'mutated'
+        assert second['is_active']
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_is_not_overwritten(self, auth_service, monkeypatch):
+        register(auth_service, 'ivan@example.com', 'ivan')
+        access_token = auth_service.login_user('ivan@example.com', PASSWORD)['access_token']
+        load = auth_service._load_user_by_user_id
+
+        def load_then_invalidate(user_id):
+            user = load(user_id)  # the stale profile
+            auth_service.invalidate_user(user_id=user_id)
+            return user
+
+        monkeypatch.setattr(auth_service, '_load_user_by_user_id', load_then_invalidate)
+        user = await auth_service.get_user_by_token_async(access_token)
+
+        assert user is not None
+        assert user['user_id'] not in auth_service._user_cache
@@ -0,0 +1,87 @@
+"""
+Single-flight coalescing result cache tests
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.api.shared.services.coalescing_cache import CoalescingResultCache
+
+
+class TestCoalescingResultCache:
+    """Test suite for CoalescingResultCache"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_run(self):
+        cache = CoalescingResultCache("test")
+        runs = 0
+
+        async def compute():
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.02)
+            return {'value': runs}
+
+        results = await asyncio.gather(*[cache.get_or_compute("key", compute) for _ in range(20)])
+        assert runs == 1
+        assert all(result == {'value': 1} for result in results)
+
+        assert await cache.get_or_compute("key", compute) == {'value': 1}
+        stats = cache.get_stats()
+        assert stats['misses'] == 1
+        assert stats['coalesced'] == 19
+        assert stats['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_reach_every_waiter_and_are_not_cached(self):
+        cache = CoalescingResultCache("test")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("engine down")
+
+        results = await asyncio.gather(*[cache.get_or_compute("key", fail) for _ in range(3)],
+                                       return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(cache) == 0
+        assert cache.get_stats()['failures'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        cache = CoalescingResultCache("test", ttl_seconds=0.05, stale_ttl_seconds=10)
+        values = iter(["old", "new"])
+
+        async def compute():
+            return next(values)
+
+        assert await cache.get_or_compute("key", compute) == "old"
+        time.sleep(0.06)
+        assert await cache.get_or_compute("key", compute) == "old"
+        await asyncio.sleep(0.001)  # let the background refresh finish
+        assert await cache.get_or_compute("key", compute) == "new"
+
+        stats = cache.get_stats()
+        assert stats['stale_hits'] == 1
+        assert stats['revalidations'] == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_and_byte_bounds_evict_lru(self):
+        cache = CoalescingResultCache("test", max_entries=2)
+
+        async def value(v):
+            return v
+
+        await cache.get_or_compute("a", lambda: value(1))
+        await cache.get_or_compute("b", lambda: value(2))
+        await cache.get_or_compute("a", lambda: value(1))  # "b" becomes least recently used
+        await cache.get_or_compute("c", lambda: value(3))
+        assert await cache.get_or_compute("b", lambda: value(20)) == 20
+        assert cache.get_stats()['evictions'] == 2
+
+        small = CoalescingResultCache("test", max_bytes=300)
+        for i in range(10):
+            await small.get_or_compute(i, lambda: value("x" * 100))
+        assert small.get_stats()['bytes'] <= 300
+        assert len(small) < 10
@@ -0,0 +1,212 @@
+"""
+Fan-out pain point discovery tests for MasterDiscoveryService
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.shared.services import discovery_service
+from src.api.shared.services.discovery_service import MasterDiscoveryService
+
+
+def post(post_id: str, title: str = 'Invoicing is a nightmare', business: bool = True) -> dict:
+    return {'id': post_id, 'title': title, 'selftext': '', 'business': business}
+
+
+class StubRedditClient:
+    """Serves canned posts per subreddit and records fetch concurrency"""
+
+    def __init__(self, posts_by_subreddit: dict, delay: float = 0.01, failing: tuple = ()):
+        self.posts_by_subreddit = posts_by_subreddit
+        self.delay = delay
+        self.failing = failing
+        self.fetches = []
+        self.incremental = []
+        self.active = 0
+        self.peak = 0
+
+    async def get_subreddit_posts(self, subreddit, sort='hot', limit=25, time_filter='day', incremental=False):
+        self.fetches.append((subreddit, limit))
+        self.incremental.append(incremental)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if subreddit in self.failing:
+                raise RuntimeError('reddit unavailable')
+            return list(self.posts_by_subreddit.get(subreddit, []))
+        finally:
+            self.active -= 1
+
+    def filter_business_posts(self, posts):
+        return [(item, {'has_business_context': True}) for item in posts if item['business']]
+
+
+class StubDatabaseService:
+    def __init__(self):
+        self.sessions = []
+
+    async def save_discovery_session(self, **session):
+        self.sessions.append(session)
+
+
+def make_service(reddit_client) -> MasterDiscoveryService:
+    service = MasterDiscoveryService(StubDatabaseService(), reddit_client)
+    service.analyzed = []
+    service.analysis_active = 0
+    service.analysis_peak = 0
+
+    async def analyze(item):
+        service.analyzed.append(item['id'])
+        service.analysis_active += 1
+        service.analysis_peak = max(service.analysis_peak, service.analysis_active)
+        await asyncio.sleep(0.005)
+        service.analysis_active -= 1
+        if 'nightmare' not in item['title']:
+            return {'has_pain_point': False}
+        return {'has_pain_point': True, 'post_id': item['id'], 'title': item['title']}
+
+    service._analyze_post_for_pain_points = analyze
+    return service
+
+
+async def collect(service, subreddits, limit_per_subreddit=5):
+    return [event async for event in service.stream_pain_points(subreddits, limit_per_subreddit)]
+
+
+class TestStreamPainPoints:
+    """Test suite for MasterDiscoveryService.stream_pain_points"""
+
+    @pytest.mark.asyncio
+    async def test_posts_seen_twice_are_analyzed_once(self):
+        client = StubRedditClient({
+            'startups': [post('a'), post('b'), post('shared')],
+            'SaaS': [post('shared'), post('c')]
+        })
+        client.delay = 0
+        service = make_service(client)
+
+        events = await collect(service, ['startups', 'SaaS'])
+
+        complete = events[-1]
+        assert complete['event'] == 'complete'
+        assert sorted(service.analyzed) == ['a', 'b', 'c', 'shared']
+        assert complete['posts_fetched'] == 5
+        assert complete['duplicates'] == 1
+        assert complete['posts_analyzed'] == 4
+        assert complete['pain_points_found'] == 4
+        owners = [event['subreddit'] for event in events
+                  if event['event'] == 'pain_point' and event['pain_point']['post_id'] == 'shared']
+        assert len(owners) == 1
+
+    @pytest.mark.asyncio
+    async def test_subreddit_names_are_case_insensitive(self):
+        client = StubRedditClient({'Entrepreneur': [post('a')]})
+        service = make_service(client)
+
+        events = await collect(service, ['Entrepreneur', 'entrepreneur', 'ENTREPRENEUR'])
+
+        assert [subreddit for subreddit, _ in client.fetches] == ['Entrepreneur']
+        assert list(events[-1]['subreddits']) == ['Entrepreneur']
+
+    @pytest.mark.asyncio
+    async def test_limit_applies_per_subreddit(self):
+        client = StubRedditClient({
+            'startups': [post(f's{index}') for index in range(12)],
+            'SaaS': [post(f'q{index}') for index in range(12)]
+        })
+        service = make_service(client)
+
+        events = await collect(service, ['startups', 'SaaS'], limit_per_subreddit=3)
+
+        complete = events[-1]
+        assert client.fetches == [('startups', 9), ('SaaS', 9)]
+        per_subreddit = {}
+        for pain_point in complete['pain_points']:
+            per_subreddit[pain_point['subreddit']] = per_subreddit.get(pain_point['subreddit'], 0) + 1
+        assert per_subreddit == {'startups': 3, 'SaaS': 3}
+        assert len([event for event in events if event['event'] == 'pain_point']) == 6
+        assert {session['pain_points_found'] for session in service.db_service.sessions} == {3}
+
+    @pytest.mark.asyncio
+    async def test_fetches_and_analysis_are_bounded(self):
+        client = StubRedditClient({f'sub{index}': [post(f'{index}-{n}') for n in range(6)] for index in range(10)})
+        service = make_service(client)
+        service.max_concurrent_fetches = 3
+        service.analysis_workers = 2
+
+        await collect(service, [f'sub{index}' for index in range(10)], limit_per_subreddit=10)
+
+        assert client.peak == 3
+        assert service.analysis_peak == 2
+        assert len(service.analyzed) == 60
+
+    @pytest.mark.asyncio
+    async def test_events_stream_before_completion(self):
+        client = StubRedditClient({
+            'startups': [post('a'), post('quiet', title='Shipping update'), post('skip', business=False)],
+            'SaaS': [post('b')]
+        })
+        service = make_service(client)
+
+        events = await collect(service, ['startups', 'SaaS'])
+
+        kinds = [event['event'] for event in events]
+        assert kinds.count('subreddit_fetched') == 2
+        assert kinds.count('pain_point') == 2
+        assert kinds[-1] == 'complete' and kinds.count('complete') == 1
+        fetched = {event['subreddit']: event for event in events if event['event'] == 'subreddit_fetched'}
+        assert fetched['startups']['candidates'] == 2
+        assert 'skip' not in service.analyzed
+
+    @pytest.mark.asyncio
+    async def test_failed_subreddit_does_not_stop_the_others(self):
+        client = StubRedditClient({'startups': [post('a')], 'SaaS': [post('b')]}, failing=('SaaS',))
+        service = make_service(client)
+
+        summary = await service.discover_all_subreddits(['startups', 'SaaS'])
+
+        assert summary['success']
+        assert summary['pain_points_found'] == 1
+        assert summary['subreddits']['SaaS']['posts_fetched'] == 0
+        assert [session['subreddit'] for session in service.db_service.sessions] == ['startups']
+        assert all(session['session_id'].startswith(summary['session_id']) for session in service.db_service.sessions)
+
+    @pytest.mark.asyncio
+    async def test_runs_in_the_same_second_get_distinct_session_ids(self, monkeypatch):
+        monkeypatch.setattr(discovery_service.time, 'time', lambda: 1_760_000_000.0)
+        service = make_service(StubRedditClient({'startups': [post('a')]}))
+
+        first = await service.discover_all_subreddits(['startups'])
+        second = await service.discover_all_subreddits(['startups'])
+
+        assert first['session_id'] != second['session_id']
+        session_ids = [session['session_id'] for session in service.db_service.sessions]
+        assert len(set(session_ids)) == 2
+
+    @pytest.mark.asyncio
+    async def test_incremental_flag_reaches_the_reddit_client(self):
+        client = StubRedditClient({'startups': [post('a')], 'SaaS': [post('b')]})
+        service = make_service(client)
+
+        await service.discover_all_subreddits(['startups', 'SaaS'])
+        await service.discover_all_subreddits(['startups', 'SaaS'], incremental=True)
+
+        assert client.incremental == [False, False, True, True]
+
+    @pytest.mark.asyncio
+    async def test_rule_based_analysis_end_to_end(self):
+        painful = {
+            'id': 'p1', 'score': 50, 'num_comments': 20, 'business': True,
+            'title': 'I hate how manual and tedious invoicing is for my small business clients',
+            'selftext': 'Looking for a tool, I would pay for a subscription. This is urgent, wasting time every week.'
+        }
+        client = StubRedditClient({'startups': [painful, post('quiet', title='Shipping update')]})
+        service = MasterDiscoveryService(StubDatabaseService(), client)
+
+        summary = await service.discover_all_subreddits(['startups'])
+
+        assert summary['posts_analyzed'] == 2
+        assert [pain_point['post_id'] for pain_point in summary['pain_points']] == ['p1']
+        assert summary['pain_points'][0]['subreddit'] == 'startups'
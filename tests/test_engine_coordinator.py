@@ -0,0 +1,148 @@
+"""
+Dependency-driven scheduling tests for EngineCoordinator
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.orchestration.engine_coordinator import EngineCoordinator
+
+
+class StubSemantic:
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def analyze_semantic_understanding(self, content, context):
+        await asyncio.sleep(self.delay)
+        return {'engine': 'semantic'}
+
+
+class StubContextual:
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def determine_optimal_sources(self, query, context):
+        await asyncio.sleep(self.delay)
+        return {'engine': 'contextual'}
+
+
+class StubTemporal:
+    def __init__(self, delay):
+        self.delay = delay
+        self.cancelled = False
+
+    async def analyze_temporal_patterns(self, signals, timeframe_hours):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {'engine': 'temporal'}
+
+
+class StubDialectical:
+    def __init__(self):
+        self.started_at = None
+
+    async def create_session(self):
+        return 'temp-session'
+
+    async def real_time_synthesis(self, query, session_id, force_context=None):
+        self.started_at = time.perf_counter()
+        return {'engine': 'dialectical', 'session': session_id}
+
+
+def make_coordinator(temporal_delay=0.5, semantic_delay=0.05, contextual_delay=0.05):
+    return EngineCoordinator({
+        'semantic': StubSemantic(semantic_delay),
+        'contextual': StubContextual(contextual_delay),
+        'temporal': StubTemporal(temporal_delay),
+        'dialectical': StubDialectical()
+    })
+
+
+ALL_ENGINES = {'primary': ['dialectical'], 'supporting': ['semantic', 'contextual', 'temporal']}
+
+
+class TestEngineCoordinator:
+    """Test suite for EngineCoordinator scheduling"""
+
+    @pytest.mark.asyncio
+    async def test_dependents_do_not_wait_on_unrelated_slow_engine(self):
+        coordinator = make_coordinator(temporal_delay=0.5)
+        start = time.perf_counter()
+
+        results = await coordinator.execute_engines(ALL_ENGINES, {'query': 'invoicing'})
+
+        dialectical_started = coordinator.engines['dialectical'].started_at - start
+        assert all(result.success for result in results.values())
+        assert dialectical_started < 0.3  # semantic/contextual take 0.05s; temporal takes 0.5s
+        timeline = coordinator.coordination_stats['last_critical_path']['timeline']
+        assert timeline['dialectical']['ready_ms'] >= timeline['semantic']['finished_ms']
+        assert timeline['dialectical']['ready_ms'] >= timeline['contextual']['finished_ms']
+        assert timeline['dialectical']['finished_ms'] < timeline['temporal']['finished_ms']
+
+    @pytest.mark.asyncio
+    async def test_critical_path_follows_slowest_dependency(self):
+        coordinator = make_coordinator(temporal_delay=0.01, semantic_delay=0.01, contextual_delay=0.1)
+
+        await coordinator.execute_engines(ALL_ENGINES, {'query': 'invoicing'})
+
+        assert coordinator.coordination_stats['last_critical_path']['engines'] == ['contextual', 'dialectical']
+
+    @pytest.mark.asyncio
+    async def test_engine_timeout_cancels_only_that_engine(self):
+        coordinator = make_coordinator(temporal_delay=5.0)
+        coordinator.engine_timeouts['temporal'] = 0.1
+        start = time.perf_counter()
+
+        results = await coordinator.execute_engines(ALL_ENGINES, {'query': 'invoicing'})
+
+        assert time.perf_counter() - start < 1.0
+        assert not results['temporal'].success
+        assert 'timed out' in results['temporal'].error
+        assert coordinator.engines['temporal'].cancelled
+        assert results['dialectical'].success
+        assert coordinator.coordination_stats['engine_timeouts'] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_caps_engine_deadlines(self):
+        coordinator = make_coordinator(temporal_delay=5.0)
+
+        start = time.perf_counter()
+        results = await coordinator.execute_engines(ALL_ENGINES, {'query': 'invoicing'}, timeout_seconds=0.2)
+
+        assert time.perf_counter() - start < 1.0
+        assert not results['temporal'].success
+        assert results['semantic'].success
+
+    @pytest.mark.asyncio
+    async def test_dependent_runs_after_failed_dependency(self):
+        coordinator = make_coordinator()
+        coordinator.engine_timeouts['semantic'] = 0.01
+        coordinator.engines['semantic'].delay = 1.0
+
+        results = await coordinator.execute_engines(ALL_ENGINES, {'query': 'invoicing'})
+
+        assert not results['semantic'].success
+        assert results['dialectical'].success
+
+    def test_dependency_cycle_is_broken(self):
+        coordinator = make_coordinator()
+        coordinator.dependencies['semantic'] = ['dialectical']
+
+        graph = coordinator._build_dependency_graph(['semantic', 'contextual', 'dialectical'])
+        order = coordinator._topological_order(graph)
+
+        assert sorted(order) == ['contextual', 'dialectical', 'semantic']
+        for engine_name, deps in graph.items():
+            assert all(order.index(dep) < order.index(engine_name) for dep in deps)
+
+    def test_dependencies_on_unrequested_engines_are_dropped(self):
+        coordinator = make_coordinator()
+
+        graph = coordinator._build_dependency_graph(['dialectical', 'semantic', 'missing'])
+
+        assert graph == {'dialectical': ['semantic'], 'semantic': []}
@@ -0,0 +1,80 @@
+"""
+Shared HTTP client tests
+"""
+
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.api.shared.services.http_client import HostPacer, SharedHTTPClient
+
+
+def make_app(state: dict) -> web.Application:
+    async def listing(request):
+        state['requests'] += 1
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({'page': request.query.get('after', 'first')}, headers={'ETag': '"v1"'})
+
+    async def limited(request):
+        return web.json_response({}, status=429, headers={'Retry-After': '30'})
+
+    app = web.Application()
+    app.router.add_get('/listing', listing)
+    app.router.add_get('/limited', limited)
+    return app
+
+
+class TestSharedHTTPClient:
+    """Test suite for SharedHTTPClient"""
+
+    @pytest.mark.asyncio
+    async def test_conditional_get_reuses_cached_body_on_304(self):
+        state = {'requests': 0}
+        async with TestServer(make_app(state)) as server:
+            client = SharedHTTPClient('test')
+            url = str(server.make_url('/listing'))
+            try:
+                first = await client.request_json('GET', url, conditional=True)
+                second = await client.request_json('GET', url, conditional=True)
+                unconditional = await client.request_json('GET', url)
+            finally:
+                await client.close()
+
+        assert first.data == {'page': 'first'} and not first.not_modified
+        assert second.data == {'page': 'first'} and second.not_modified
+        assert not unconditional.not_modified
+        assert state['requests'] == 3
+        assert client.stats['sessions_created'] == 1
+        assert client.stats['not_modified'] == 1
+
+    @pytest.mark.asyncio
+    async def test_429_pauses_the_host(self):
+        async with TestServer(make_app({'requests': 0})) as server:
+            client = SharedHTTPClient('test')
+            url = str(server.make_url('/limited'))
+            try:
+                result = await client.request_json('GET', url)
+            finally:
+                await client.close()
+
+        assert result.status == 429
+        assert client.stats['rate_limited'] == 1
+        assert client.pacer(url).next_request_at - time.monotonic() > 25
+
+
+class TestHostPacer:
+    """Test suite for HostPacer"""
+
+    def test_spreads_remaining_requests_over_reset_window(self):
+        pacer = HostPacer(min_interval=0.1)
+        pacer.update(200, {'X-Ratelimit-Remaining': '50', 'X-Ratelimit-Reset': '100'})
+        assert pacer.interval == pytest.approx(2.0)
+
+        pacer.update(200, {'X-Ratelimit-Remaining': '600', 'X-Ratelimit-Reset': '30'})
+        assert pacer.interval == pytest.approx(0.1)
+
+        pacer.update(200, {'X-Ratelimit-Remaining': '0', 'X-Ratelimit-Reset': '40'})
+        assert pacer.next_request_at - time.monotonic() > 35
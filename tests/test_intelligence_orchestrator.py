@@ -0,0 +1,61 @@
+"""
+Request identity tests for IntelligenceOrchestrator's shared result cache
+"""
+
+import asyncio
+
+import pytest
+
+orchestrator_module = pytest.importorskip("src.services.orchestration.intelligence_orchestrator")
+IntelligenceOrchestrator = orchestrator_module.IntelligenceOrchestrator
+OrchestrationRequest = orchestrator_module.OrchestrationRequest
+OrchestrationResult = orchestrator_module.OrchestrationResult
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    monkeypatch.setattr(IntelligenceOrchestrator, "_initialize_engines",
+                        lambda self: setattr(self, "engines", {}))
+    orchestrator = IntelligenceOrchestrator()
+    runs = []
+
+    async def execute(request, request_id, start_time):
+        runs.append(request_id)
+        await asyncio.sleep(0.02)
+        return OrchestrationResult(
+            request_id=request_id,
+            request_type=request.request_type,
+            success=True,
+            results={'value': 1},
+            engines_used=['semantic'],
+            processing_time_ms=20.0,
+            orchestration_metadata={},
+            timestamp=start_time
+        )
+
+    orchestrator._execute_request = execute
+    orchestrator.runs = runs
+    return orchestrator
+
+
+class TestIntelligenceOrchestratorCache:
+    """Coalesced and cached callers must not share one request_id"""
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_get_their_own_request_id(self, orchestrator):
+        requests = [OrchestrationRequest('semantic_analysis', {'text': 'same'}) for _ in range(3)]
+        results = await asyncio.gather(*[orchestrator.analyze_intelligence(r) for r in requests])
+
+        assert len(orchestrator.runs) == 1
+        assert len({result.request_id for result in results}) == 3
+        assert all(result.results == {'value': 1} for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_not_mutated_by_later_callers(self, orchestrator):
+        first = await orchestrator.analyze_intelligence(OrchestrationRequest('semantic_analysis', {'text': 'same'}))
+        second = await orchestrator.analyze_intelligence(OrchestrationRequest('semantic_analysis', {'text': 'same'}))
+
+        assert len(orchestrator.runs) == 1
+        assert first is not second
+        assert first.request_id == orchestrator.runs[0]
+        assert second.request_id != first.request_id
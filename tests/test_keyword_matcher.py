@@ -0,0 +1,108 @@
+"""
+Compiled multi-pattern keyword matcher tests
+"""
+
+import re
+
+import pytest
+
+from src.api.shared.services.keyword_matcher import KeywordMatcher, trie_regex
+from src.services.intelligence.pain_point_engine import PainPointDetectionEngine
+
+
+VOCABULARIES = {
+    'opportunity': ['need', 'better way', 'better', 'tool', 'tools'],
+    'timing': ['new', 'news', 'time consuming', 'time']
+}
+
+
+# Small vocabularies use substring search by default; threshold 0 forces the trie regex
+STRATEGIES = pytest.mark.parametrize('trie_threshold', [KeywordMatcher.TRIE_THRESHOLD, 0], ids=['substring', 'trie'])
+
+
+class TestKeywordMatcher:
+    """Test suite for KeywordMatcher"""
+
+    def test_trie_regex_shares_prefixes_and_prefers_longest(self):
+        source = trie_regex(['tool', 'tools', 'time', 'time consuming'])
+        assert source == r't(?:ime(?:\ consuming)?|ools?)'
+        assert re.match(source, 'time consuming').group() == 'time consuming'
+        assert re.match(source, 'tooling').group() == 'tool'
+
+    def test_strategy_follows_vocabulary_size(self):
+        assert KeywordMatcher(VOCABULARIES).strategy == 'substring'
+        large = {'all': [f"term{i}" for i in range(KeywordMatcher.TRIE_THRESHOLD)]}
+        assert KeywordMatcher(large).strategy == 'trie'
+
+    @STRATEGIES
+    def test_matches_substring_semantics_including_overlaps(self, trie_threshold):
+        matcher = KeywordMatcher(VOCABULARIES, trie_threshold=trie_threshold)
+        text = "Need a BETTER WAY - tools for time consuming newsletters"
+
+        expected = {keyword for keyword in matcher.keywords if keyword in text.lower()}
+        assert matcher.present(text) == expected
+        assert {'better', 'better way', 'tool', 'tools', 'new', 'news', 'time', 'time consuming'} <= expected
+
+    @STRATEGIES
+    def test_word_boundary_mode(self, trie_threshold):
+        matcher = KeywordMatcher(VOCABULARIES, word_boundary=True, trie_threshold=trie_threshold)
+        text = "better tooling for newsletters, news at the right time"
+
+        expected = {
+            keyword for keyword in matcher.keywords
+            if re.search(rf'\b{re.escape(keyword)}\b', text.lower())
+        }
+        assert matcher.present(text) == expected
+        assert 'tool' not in expected
+        assert 'news' in expected
+
+    @STRATEGIES
+    def test_category_hits(self, trie_threshold):
+        matcher = KeywordMatcher(VOCABULARIES, trie_threshold=trie_threshold)
+        hits = matcher.category_hits("we need new tools")
+        assert hits == {'opportunity': 3, 'timing': 1}
+
+    @STRATEGIES
+    def test_presence_matrix_matches_single_text_results(self, trie_threshold):
+        matcher = KeywordMatcher(VOCABULARIES, trie_threshold=trie_threshold)
+        texts = ["", "need tools", "İstanbul news", "better way", "nothing here", "time consuming"]
+
+        presence = matcher.presence_matrix(texts)
+        for row, text in enumerate(texts):
+            assert set(presence[row].nonzero()[0]) == matcher.find(text)
+
+        counts = matcher.category_counts(presence)
+        assert counts['opportunity'].tolist() == [0, 3, 0, 2, 0, 0]
+        assert counts['timing'].tolist() == [0, 0, 2, 0, 0, 2]
+
+
+
+class TestDetectorAdoption:
+    """Detectors routed through KeywordMatcher score exactly like their plain keyword loops"""
+
+    def test_detector_vocabularies_stay_on_substring_search(self):
+        # Below TRIE_THRESHOLD plain substring search is faster; see benchmark_keyword_matcher.py
+        assert PainPointDetectionEngine().keyword_matcher.strategy == 'substring'
+
+    def test_pain_point_engine_matches_keyword_loops(self):
+        engine = PainPointDetectionEngine()
+        texts = [
+            "I'm so Frustrated, the sync is broken and it takes forever to do it by hand in a spreadsheet",
+            "Looking for a platform with AI workflow automation and a reporting dashboard",
+            "Nothing relevant here",
+            ""
+        ]
+        for text in texts:
+            lowered = text.lower()
+            analysis = engine._analyze_pain_patterns(text)
+
+            expected_scores = {}
+            for category, indicators in engine.pain_indicators.items():
+                score = sum(1 for indicator in indicators if indicator in lowered)
+                if score:
+                    expected_scores[category] = min(score / len(indicators), 1.0)
+            assert analysis['pain_scores'] == expected_scores
+            assert analysis['opportunity_types'] == [
+                opp_type for opp_type, patterns in engine.opportunity_patterns.items()
+                if any(pattern in lowered for pattern in patterns)
+            ]
@@ -0,0 +1,102 @@
+"""
+LLM gateway tests (against a local Messages API stub)
+"""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.api.shared.services.llm_gateway import LLMGateway, LLMGatewayBusy, LLMGatewayError
+
+
+def make_app(state: dict) -> web.Application:
+    async def messages(request):
+        payload = await request.json()
+        state['payloads'].append(payload)
+        await asyncio.sleep(state.get('delay', 0))
+        if state.get('status', 200) != 200:
+            return web.json_response({'error': {'message': 'overloaded'}}, status=state['status'])
+
+        if not payload.get('stream'):
+            return web.json_response({
+                'model': payload['model'],
+                'content': [{'type': 'text', 'text': 'Hello there'}],
+                'usage': {'input_tokens': 10, 'output_tokens': 2}
+            })
+
+        response = web.StreamResponse(headers={'Content-Type': 'text/event-stream'})
+        await response.prepare(request)
+        events = [('message_start', {'message': {'model': payload['model'], 'usage': {'input_tokens': 10}}})]
+        events += [('content_block_delta', {'delta': {'type': 'text_delta', 'text': token}}) for token in ['Hel', 'lo']]
+        events += [('message_delta', {'usage': {'output_tokens': 2}}), ('message_stop', {})]
+        for event, data in events:
+            await response.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+        return response
+
+    app = web.Application()
+    app.router.add_post('/v1/messages', messages)
+    return app
+
+
+def make_gateway(server: TestServer, **kwargs) -> LLMGateway:
+    return LLMGateway(api_key='test-key', system_prompt='You are Luciq.', base_url=str(server.make_url('')), **kwargs)
+
+
+class TestLLMGateway:
+    """Test suite for LLMGateway"""
+
+    @pytest.mark.asyncio
+    async def test_identical_prompts_are_coalesced_and_cached(self):
+        state = {'payloads': [], 'delay': 0.05}
+        async with TestServer(make_app(state)) as server:
+            gateway = make_gateway(server)
+            try:
+                first, second = await asyncio.gather(gateway.complete('context'), gateway.complete('context'))
+                third = await gateway.complete('context')
+            finally:
+                await gateway.close()
+
+        assert first.text == second.text == third.text == 'Hello there'
+        assert third.cached and not first.cached
+        assert len(state['payloads']) == 1
+        assert state['payloads'][0]['system'][0]['cache_control'] == {'type': 'ephemeral'}
+        assert gateway.stats['input_tokens'] == 10
+
+    @pytest.mark.asyncio
+    async def test_stream_relays_tokens_and_caches_result(self):
+        state = {'payloads': []}
+        async with TestServer(make_app(state)) as server:
+            gateway = make_gateway(server)
+            try:
+                tokens = [token async for token in gateway.stream('context')]
+                replay = [token async for token in gateway.stream('context')]
+                completion = await gateway.complete('context')
+            finally:
+                await gateway.close()
+
+        assert tokens == ['Hel', 'lo']
+        assert replay == ['Hello']
+        assert completion.cached and completion.text == 'Hello'
+        assert len(state['payloads']) == 1 and state['payloads'][0]['stream'] is True
+        assert gateway.stats['output_tokens'] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_and_full_queue_raise(self):
+        state = {'payloads': [], 'delay': 0.1}
+        async with TestServer(make_app(state)) as server:
+            gateway = make_gateway(server, max_concurrent=1, max_queue=1)
+            try:
+                results = await asyncio.gather(
+                    *[gateway.complete(f"prompt {i}") for i in range(3)], return_exceptions=True
+                )
+                state.update(status=529, delay=0)
+                with pytest.raises(LLMGatewayError):
+                    await gateway.complete('failing prompt')
+            finally:
+                await gateway.close()
+
+        assert sum(isinstance(result, LLMGatewayBusy) for result in results) == 1
+        assert gateway.stats['rejected'] == 1
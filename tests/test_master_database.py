@@ -0,0 +1,196 @@
+"""
+Pooled master database service tests
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from src.api.shared.services import discovery_service
+from src.api.shared.services.discovery_service import MasterDiscoveryService
+from src.api.shared.services.master_database import AsyncSQLitePool, MasterDatabaseService
+
+
+def pain_point(index: int) -> dict:
+    return {
+        'post_id': f'post_{index}',
+        'title': f'Invoicing takes hours #{index}',
+        'description': 'Manual exports every week',
+        'opportunity_score': 70 + index,
+        'confidence': 0.8,
+        'business_domain': 'fintech'
+    }
+
+
+def count_rows(db_path: str, table: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestAsyncSQLitePool:
+    """Test suite for AsyncSQLitePool"""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_and_tuned(self, temp_database):
+        pool = AsyncSQLitePool(temp_database, size=2)
+        try:
+            seen = set()
+            for _ in range(5):
+                async with pool.connection() as db:
+                    seen.add(id(db))
+                    cursor = await db.execute("PRAGMA journal_mode")
+                    assert (await cursor.fetchone())[0] == 'wal'
+                    cursor = await db.execute("PRAGMA synchronous")
+                    assert (await cursor.fetchone())[0] == 1  # NORMAL
+
+            assert len(pool._connections) == 2
+            assert seen <= {id(db) for db in pool._connections}
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_borrowers_never_share_a_connection(self, temp_database):
+        pool = AsyncSQLitePool(temp_database, size=2)
+        in_use = set()
+
+        async def borrow():
+            async with pool.connection() as db:
+                assert id(db) not in in_use
+                in_use.add(id(db))
+                await asyncio.sleep(0.01)
+                in_use.discard(id(db))
+
+        try:
+            await asyncio.gather(*(borrow() for _ in range(8)))
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_open_transaction_is_rolled_back_on_return(self, temp_database):
+        pool = AsyncSQLitePool(temp_database, size=1)
+        try:
+            async with pool.connection() as db:
+                await db.execute("CREATE TABLE notes (body TEXT)")
+                await db.commit()
+                await db.execute("INSERT INTO notes VALUES ('uncommitted')")
+
+            async with pool.connection() as db:
+                assert not db.in_transaction
+                cursor = await db.execute("SELECT COUNT(*) FROM notes")
+                assert (await cursor.fetchone())[0] == 0
+        finally:
+            await pool.close()
+
+    def test_new_event_loop_closes_old_connections(self, temp_database, restore_event_loop):
+        pool = AsyncSQLitePool(temp_database, size=2)
+
+        async def use():
+            async with pool.connection() as db:
+                await db.execute("SELECT 1")
+            return list(pool._connections)
+
+        first = asyncio.run(use())
+        second = asyncio.run(use())
+        asyncio.run(pool.close())
+
+        assert all(db._connection is None for db in first)
+        assert all(db._connection is None for db in second)
+        assert not set(map(id, first)) & set(map(id, second))
+
+
+class TestMasterDatabaseService:
+    """Test suite for MasterDatabaseService bulk writes"""
+
+    @pytest.mark.asyncio
+    async def test_save_pain_points_writes_batch(self, temp_database):
+        service = MasterDatabaseService(temp_database, pool_size=2)
+        try:
+            written = await service.save_pain_points('session_1', [pain_point(i) for i in range(25)])
+
+            assert written == 25
+            assert count_rows(temp_database, 'pain_points') == 25
+            assert await service.save_pain_points('session_1', []) == 0
+        finally:
+            await service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_writes_nothing(self, temp_database):
+        service = MasterDatabaseService(temp_database, pool_size=1)
+        batch = [pain_point(0), pain_point(1), dict(pain_point(2), title={'not': 'bindable'})]
+        try:
+            assert await service.save_pain_points('session_1', batch) == 0
+            assert count_rows(temp_database, 'pain_points') == 0
+
+            # The connection went back to the pool clean and still works
+            assert await service.save_pain_points('session_1', batch[:2]) == 2
+        finally:
+            await service.close()
+
+    @pytest.mark.asyncio
+    async def test_session_and_pain_points_share_one_transaction(self, temp_database):
+        service = MasterDatabaseService(temp_database, pool_size=1)
+        try:
+            await service.save_discovery_session('session_1', 1, 'startups', 40, 3,
+                                                 pain_points=[pain_point(i) for i in range(3)])
+            # Duplicate session id: the session insert fails, so its pain points are not written either
+            await service.save_discovery_session('session_1', 1, 'startups', 40, 2,
+                                                 pain_points=[pain_point(i) for i in range(2)])
+
+            assert count_rows(temp_database, 'discovery_sessions') == 1
+            assert count_rows(temp_database, 'pain_points') == 3
+        finally:
+            await service.close()
+
+    @pytest.mark.asyncio
+    async def test_discoveries_in_the_same_second_keep_their_pain_points(self, temp_database, monkeypatch):
+        class RedditClient:
+            async def get_subreddit_posts(self, subreddit, sort='hot', limit=25, time_filter='day', incremental=False):
+                return [{'id': f'{subreddit}_{index}', 'title': 'Invoicing is a nightmare'} for index in range(2)]
+
+            def filter_business_posts(self, posts):
+                return [(item, {}) for item in posts]
+
+        async def analyze(item):
+            return dict(pain_point(0), post_id=item['id'], has_pain_point=True)
+
+        monkeypatch.setattr(discovery_service.time, 'time', lambda: 1_760_000_000.0)
+        service = MasterDatabaseService(temp_database, pool_size=2)
+        discovery = MasterDiscoveryService(service, RedditClient())
+        discovery._analyze_post_for_pain_points = analyze
+        try:
+            first = await discovery.discover_pain_points('startups', limit=2)
+            second = await discovery.discover_pain_points('SaaS', limit=2)
+
+            assert first['session_id'] != second['session_id']
+            assert count_rows(temp_database, 'discovery_sessions') == 2
+            assert count_rows(temp_database, 'pain_points') == 4
+        finally:
+            await service.close()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_hook_closes_pool(self, temp_database, monkeypatch):
+        # lifespan loads the app settings, which refuse to start without these
+        monkeypatch.setenv('SECRET_KEY', 'test-only-signing-key-0123456789abcdef')
+        monkeypatch.setenv('MVP_API_KEY_SALT', 'test-only-api-key-salt')
+        from lifespan import cleanup_services, register_shutdown_hook
+
+        service = MasterDatabaseService(temp_database, pool_size=2)
+        calls = []
+
+        async def failing_hook():
+            calls.append('failing')
+            raise RuntimeError('already closed')
+
+        await service.save_pain_point('session_1', pain_point(0))
+        connections = list(service.pool._connections)
+        register_shutdown_hook(service.close)
+        register_shutdown_hook(failing_hook)
+
+        await cleanup_services()
+
+        assert calls == ['failing']  # hooks run last-registered first; a failure does not stop the rest
+        assert service.pool._connections == []
+        assert all(db._connection is None for db in connections)
+        await cleanup_services()  # hooks run once
+        assert calls == ['failing']
@@ -0,0 +1,69 @@
+"""
+Micro-batch inference service tests
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.shared.services.micro_batch import MicroBatchInferenceService
+
+
+def upper_batch(calls: list):
+    def batch_fn(texts):
+        calls.append(list(texts))
+        return [text.upper() for text in texts]
+    return batch_fn
+
+
+class TestMicroBatchInferenceService:
+    """Test suite for MicroBatchInferenceService"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_batches(self):
+        calls = []
+        service = MicroBatchInferenceService('test', upper_batch(calls), max_batch_size=3, max_wait_ms=50)
+
+        results = await asyncio.gather(*(service.submit(text) for text in 'abcde'))
+
+        assert results == ['A', 'B', 'C', 'D', 'E']
+        assert [len(batch) for batch in calls] == [3, 2]
+        assert service.stats['largest_batch'] == 3
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushes_after_max_wait(self):
+        calls = []
+        service = MicroBatchInferenceService('test', upper_batch(calls), max_batch_size=32, max_wait_ms=20)
+
+        result = await asyncio.wait_for(service.submit('solo'), timeout=1.0)
+
+        assert result == 'SOLO'
+        assert calls == [['solo']]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self):
+        def failing(texts):
+            raise ValueError('model exploded')
+
+        service = MicroBatchInferenceService('test', failing, max_batch_size=4, max_wait_ms=20)
+        results = await asyncio.gather(service.submit('a'), service.submit('b'), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert service.stats['failed_batches'] == 1
+
+        service.batch_fn = upper_batch([])
+        assert await service.submit('again') == 'AGAIN'
+
+    @pytest.mark.asyncio
+    async def test_wrong_result_count_is_an_error(self):
+        service = MicroBatchInferenceService('test', lambda texts: [], max_wait_ms=5)
+        with pytest.raises(RuntimeError):
+            await service.submit('a')
+
+    def test_service_survives_a_new_event_loop(self, restore_event_loop):
+        calls = []
+        service = MicroBatchInferenceService('test', upper_batch(calls), max_wait_ms=5)
+
+        assert asyncio.run(service.submit('first')) == 'FIRST'
+        assert asyncio.run(service.submit('second')) == 'SECOND'
+        assert calls == [['first'], ['second']]
@@ -0,0 +1,62 @@
+"""
+Multi-modal fusion engine correlation tests
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.domains.intelligence.services.multimodal_fusion_engine import (
+    MinHashWindow, MultiModalFusionEngine, MultiModalSignal, SignalType, content_signature
+)
+
+
+def jaccard(a: str, b: str) -> float:
+    left, right = set(a.lower().split()), set(b.lower().split())
+    return len(left & right) / len(left | right)
+
+
+class TestMinHashWindow:
+    """Test suite for MinHash signatures and windows"""
+
+    def test_signatures_estimate_jaccard(self):
+        first = ' '.join(f"term{i}" for i in range(0, 300))
+        second = ' '.join(f"term{i}" for i in range(100, 400))
+        window = MinHashWindow(window=3)
+        window.add(datetime.now(), content_signature(first))
+        window.add(datetime.now(), content_signature("completely different words"))
+        window.add(datetime.now(), None)
+
+        estimates = window.jaccard_similarities(content_signature(second))
+        assert estimates[0] == pytest.approx(jaccard(first, second), abs=0.15)
+        assert estimates[1] < 0.1
+        assert estimates[2] == 0.0
+        assert window.jaccard_similarities(content_signature(first.upper()))[0] == 1.0
+
+    def test_window_keeps_only_most_recent_signals(self):
+        window = MinHashWindow(window=2)
+        now = datetime.now()
+        for minutes, content in [(120, 'old'), (30, 'middle'), (0, 'new')]:
+            window.add(now - timedelta(minutes=minutes), content_signature(content))
+
+        assert len(window) == 2
+        assert sorted(window.time_weights(now).round(2)) == [0.5, 1.0]
+
+
+class TestMultiModalFusionEngine:
+    """Test suite for cross-modal correlation"""
+
+    @pytest.mark.asyncio
+    async def test_correlations_use_other_modalities_only(self):
+        engine = MultiModalFusionEngine()
+        now = datetime.now()
+        content = "saas invoicing automation for agencies"
+        for i, signal_type in enumerate([SignalType.TEXT, SignalType.NETWORK]):
+            await engine.process_multimodal_signal(MultiModalSignal(
+                signal_id=str(i), timestamp=now, source_platform='reddit', signal_type=signal_type, content=content
+            ))
+
+        result = await engine.process_multimodal_signal(MultiModalSignal(
+            signal_id='probe', timestamp=now, source_platform='reddit', signal_type=SignalType.TEXT, content=content
+        ))
+        assert result['correlations'] == {'network': 1.0}
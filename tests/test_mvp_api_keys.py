@@ -0,0 +1,139 @@
+"""
+MVP API key cache, rate limiter and buffered usage tests
+"""
+
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from src.mvp_integration_code import MVPAPIKeyService, TokenBucket
+
+
+@pytest.fixture
+def key_service(temp_database):
+    return MVPAPIKeyService(db_path=temp_database, usage_flush_interval_seconds=60)
+
+
+class TestMVPAPIKeyService:
+    """Test suite for MVPAPIKeyService caching, rate limiting and usage buffering"""
+
+    @pytest.mark.asyncio
+    async def test_validation_is_cached_and_deactivation_invalidates(self, key_service):
+        api_key = key_service.generate_mvp_api_key(1, "starter")["api_key"]
+
+        first = await key_service.validate_mvp_api_key(api_key)
+        await key_service.validate_mvp_api_key(api_key)
+        assert key_service.cache_stats['key_cache_misses'] == 1
+        assert key_service.cache_stats['key_cache_hits'] == 1
+
+        assert key_service.deactivate_mvp_api_key(first["api_key_hash"])
+        with pytest.raises(HTTPException) as error:
+            await key_service.validate_mvp_api_key(api_key)
+        assert error.value.detail == "API key deactivated"
+
+    @pytest.mark.asyncio
+    async def test_unknown_keys_are_not_cached(self, key_service):
+        for index in range(20):
+            with pytest.raises(HTTPException) as error:
+                await key_service.validate_mvp_api_key(f"sk_live_unknown_{index}")
+            assert error.value.detail == "Invalid API key"
+
+        assert len(key_service._key_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_key_cache_is_bounded_lru(self, temp_database):
+        key_service = MVPAPIKeyService(db_path=temp_database, max_cached_keys=2)
+        keys = [key_service.generate_mvp_api_key(user_id, "starter")["api_key"] for user_id in range(3)]
+
+        await key_service.validate_mvp_api_key(keys[0])
+        await key_service.validate_mvp_api_key(keys[1])
+        await key_service.validate_mvp_api_key(keys[0])  # keys[1] is now least recently used
+        await key_service.validate_mvp_api_key(keys[2])
+
+        assert len(key_service._key_cache) == 2
+        assert key_service.cache_stats['key_cache_evictions'] == 1
+        await key_service.validate_mvp_api_key(keys[0])
+        assert key_service.cache_stats['key_cache_hits'] == 2
+        await key_service.validate_mvp_api_key(keys[1])
+        assert key_service.cache_stats['key_cache_misses'] == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_swept_first(self, temp_database):
+        key_service = MVPAPIKeyService(db_path=temp_database, max_cached_keys=2)
+        keys = [key_service.generate_mvp_api_key(user_id, "starter")["api_key"] for user_id in range(3)]
+        hashes = [(await key_service.validate_mvp_api_key(key))["api_key_hash"] for key in keys[:2]]
+
+        # keys[1] expires while keys[0] is still fresh, so keys[1] goes even though keys[0] is older
+        expires_at, record = key_service._key_cache[hashes[1]]
+        key_service._key_cache[hashes[1]] = (0.0, record)
+        await key_service.validate_mvp_api_key(keys[2])
+
+        assert hashes[0] in key_service._key_cache
+        assert hashes[1] not in key_service._key_cache
+        assert len(key_service._key_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_usage_is_buffered_then_flushed_in_one_batch(self, key_service, temp_database):
+        api_key = key_service.generate_mvp_api_key(1, "professional")["api_key"]
+        key_hash = (await key_service.validate_mvp_api_key(api_key))["api_key_hash"]
+
+        for _ in range(5):
+            await key_service.track_mvp_usage(key_hash, "/api/mvp/pain-point-detection", 12, 200)
+
+        # Pending usage counts toward the monthly limit before it reaches the database
+        assert (await key_service.validate_mvp_api_key(api_key))["monthly_usage"] == 5
+
+        await key_service.close()
+        assert key_service.cache_stats['usage_flushes'] == 1
+
+        conn = sqlite3.connect(temp_database)
+        assert conn.execute("SELECT COUNT(*) FROM mvp_api_usage").fetchone()[0] == 5
+        assert conn.execute("SELECT monthly_usage FROM mvp_api_keys").fetchone()[0] == 5
+        conn.close()
+        assert (await key_service.validate_mvp_api_key(api_key))["monthly_usage"] == 5
+
+    @pytest.mark.asyncio
+    async def test_usage_buffered_before_a_reset_is_not_billed_to_the_new_period(self, key_service, temp_database):
+        api_key = key_service.generate_mvp_api_key(1, "professional")["api_key"]
+        conn = sqlite3.connect(temp_database)
+        with conn:
+            conn.execute("UPDATE mvp_api_keys SET usage_reset_date = ?", (date.today().isoformat(),))
+        key_hash = (await key_service.validate_mvp_api_key(api_key))["api_key_hash"]
+        for _ in range(3):
+            await key_service.track_mvp_usage(key_hash, "/api/mvp/pain-point-detection", 12, 200)
+
+        # The period ends while those three records are still buffered
+        with conn:
+            conn.execute("UPDATE mvp_api_keys SET usage_reset_date = ?", ((date.today() - timedelta(days=1)).isoformat(),))
+        key_service.invalidate_api_key(key_hash)
+        assert (await key_service.validate_mvp_api_key(api_key))["monthly_usage"] == 0
+        for _ in range(2):
+            await key_service.track_mvp_usage(key_hash, "/api/mvp/pain-point-detection", 12, 200)
+
+        await key_service.close()
+        assert key_service.cache_stats['stale_usage_dropped'] == 3
+        assert conn.execute("SELECT COUNT(*) FROM mvp_api_usage").fetchone()[0] == 5
+        assert conn.execute("SELECT monthly_usage FROM mvp_api_keys").fetchone()[0] == 2
+        conn.close()
+        assert (await key_service.validate_mvp_api_key(api_key))["monthly_usage"] == 2
+
+    def test_rate_limit_enforced_per_key(self, key_service):
+        for _ in range(10):
+            key_service.enforce_rate_limit("key_a", 10)
+
+        with pytest.raises(HTTPException) as error:
+            key_service.enforce_rate_limit("key_a", 10)
+        assert error.value.status_code == 429
+        assert int(error.value.headers["Retry-After"]) >= 1
+
+        key_service.enforce_rate_limit("key_b", 10)  # other keys have their own bucket
+
+    def test_token_bucket_refills(self):
+        bucket = TokenBucket(60)
+        bucket.tokens = 0.0
+        bucket.updated_at -= 2.0  # two seconds at one token per second
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
@@ -0,0 +1,120 @@
+"""
+Overnight discovery cycle rate limiter and result store tests
+"""
+
+import asyncio
+import importlib.util
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'scripts' / 'production' / 'overnight_discovery_cycle.py'
+spec = importlib.util.spec_from_file_location('overnight_discovery_cycle', SCRIPT)
+overnight = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(overnight)
+
+
+def cycle(ideas: int, quality: float, platforms: dict, timestamp: str = '20261016_220000') -> dict:
+    return {
+        'timestamp': timestamp,
+        'ideas_found': ideas,
+        'ideas': [{'title': f'idea {index}'} for index in range(ideas)],
+        'system_health': {'cpu_percent': 20.0, 'memory_percent': 50.0},
+        'enhanced_metrics': {'avg_quality_score': quality, 'platform_distribution': platforms}
+    }
+
+
+class TestHostRateLimiter:
+    """Test suite for HostRateLimiter"""
+
+    @pytest.mark.asyncio
+    async def test_request_starts_are_spaced_per_host(self):
+        limiter = overnight.HostRateLimiter(min_interval=0.05, max_concurrent=4)
+        starts = []
+
+        async def request():
+            async with limiter.slot('https://www.reddit.com/r/startups.json'):
+                starts.append(time.perf_counter())
+
+        await asyncio.gather(*(request() for _ in range(4)))
+
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_hosts_are_paced_independently(self):
+        limiter = overnight.HostRateLimiter(min_interval=0.2, max_concurrent=1)
+        start = time.perf_counter()
+
+        async def request(url):
+            async with limiter.slot(url):
+                pass
+
+        await asyncio.gather(request('https://a.example.com/1'), request('https://b.example.com/1'))
+
+        assert time.perf_counter() - start < 0.1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_and_host_overrides(self):
+        limiter = overnight.HostRateLimiter(min_interval=0.0, max_concurrent=1,
+                                            host_limits={'localhost:8000': (0.0, 3)})
+        active = {'localhost:8000': 0, 'api.example.com': 0}
+        peak = dict(active)
+
+        async def request(host):
+            async with limiter.slot(f'http://{host}/path'):
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+                await asyncio.sleep(0.02)
+                active[host] -= 1
+
+        await asyncio.gather(*(request(host) for host in active for _ in range(5)))
+
+        assert peak == {'localhost:8000': 3, 'api.example.com': 1}
+
+
+class TestDiscoveryResultStore:
+    """Test suite for DiscoveryResultStore"""
+
+    def test_cycles_are_appended_not_rewritten(self, tmp_path):
+        store = overnight.DiscoveryResultStore(tmp_path)
+        store.append_cycle(cycle(2, 7.0, {'reddit': 2}))
+        first_line = store.log_file.read_text().splitlines()[0]
+
+        summary = store.append_cycle(cycle(4, 5.0, {'github': 4}))
+
+        lines = store.log_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert lines[0] == first_line
+        assert json.loads(lines[1])['ideas_found'] == 4
+        assert summary['total_ideas'] == 6
+        assert summary['avg_quality_score'] == pytest.approx(6.0)
+        assert summary['enhanced_discovery_rate'] == pytest.approx(50.0)
+        assert summary['total_platforms_used'] == 2
+        assert not store.summary_file.with_suffix('.json.tmp').exists()
+
+    def test_counters_carry_over_between_runs(self, tmp_path):
+        first_run = datetime(2026, 10, 15, 22, 0)
+        second_run = datetime(2026, 10, 16, 22, 0)
+        overnight.DiscoveryResultStore(tmp_path).append_cycle(cycle(3, 8.0, {'reddit': 3}), first_run)
+
+        store = overnight.DiscoveryResultStore(tmp_path)
+        summary = store.append_cycle(cycle(1, 4.0, {'hacker_news': 1}), second_run)
+
+        assert summary['total_cycles'] == 2
+        assert summary['total_ideas'] == 4
+        assert summary['total_platforms_used'] == 2
+        assert summary['start_time'] == first_run.isoformat()  # the run the counters start from
+        assert summary['run_start_time'] == second_run.isoformat()
+        assert len(store.log_file.read_text().splitlines()) == 2
+
+    def test_unreadable_summary_starts_fresh(self, tmp_path):
+        (tmp_path / 'enhanced_overnight_summary.json').write_text('{not json')
+
+        summary = overnight.DiscoveryResultStore(tmp_path).append_cycle(cycle(1, 0, {}))
+
+        assert summary['total_cycles'] == 1
+        assert summary['avg_quality_score'] == 0
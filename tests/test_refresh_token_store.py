@@ -0,0 +1,113 @@
+"""
+Refresh token store tests
+"""
+
+import os
+import time
+
+import pytest
+
+from src.shared.security.jwt_manager import JWTManager
+from src.shared.security.refresh_token_store import (
+    InMemoryRefreshTokenStore, RefreshTokenStore, SQLiteRefreshTokenStore
+)
+
+SECRET = 'refresh-token-store-test-secret-key-0123456789'
+
+
+class TestSQLiteRefreshTokenStore:
+    """Test suite for SQLiteRefreshTokenStore"""
+
+    def test_tokens_are_shared_between_store_instances(self, temp_database):
+        worker_a = SQLiteRefreshTokenStore(temp_database, cache_ttl_seconds=0)
+        worker_b = SQLiteRefreshTokenStore(temp_database, cache_ttl_seconds=0)
+
+        worker_a.add('jti-1', 'user-1', time.time() + 60)
+        assert worker_b.is_active('jti-1')
+
+        assert worker_b.revoke('jti-1')
+        assert not worker_a.is_active('jti-1')
+        assert not worker_b.revoke('jti-1')
+
+    def test_revoke_user_only_touches_that_user(self, temp_database):
+        store = SQLiteRefreshTokenStore(temp_database)
+        expires_at = time.time() + 60
+        store.add('a-1', 'user-a', expires_at)
+        store.add('a-2', 'user-a', expires_at)
+        store.add('b-1', 'user-b', expires_at)
+        assert store.is_active('a-1')  # cached as active
+
+        assert store.revoke_user('user-a') == 2
+        assert not store.is_active('a-1')
+        assert not store.is_active('a-2')
+        assert store.is_active('b-1')
+
+    def test_expired_tokens_are_inactive_and_pruned(self, temp_database):
+        store = SQLiteRefreshTokenStore(temp_database)
+        store.add('old', 'user-1', time.time() - 1)
+        store.add('new', 'user-1', time.time() + 60)
+
+        assert not store.is_active('old')
+        assert store.prune_expired() == 1
+        assert store.is_active('new')
+
+
+class TestRefreshTokenStoreInterface:
+    """Test suite for the RefreshTokenStore interface"""
+
+    def test_incomplete_store_cannot_be_created(self):
+        class AddOnlyStore(RefreshTokenStore):
+            def add(self, token_id, user_id, expires_at):
+                pass
+
+        with pytest.raises(TypeError):
+            AddOnlyStore()
+
+
+class TestJWTManagerRefreshTokens:
+    """Test suite for JWTManager refresh token tracking"""
+
+    def test_store_is_created_on_first_use(self, temp_database):
+        os.unlink(temp_database)
+        created = []
+
+        def factory():
+            created.append(SQLiteRefreshTokenStore(temp_database))
+            return created[-1]
+
+        manager = JWTManager(secret_key=SECRET, refresh_token_store_factory=factory)
+        assert not created and not os.path.exists(temp_database)
+
+        pair = manager.create_token_pair('user-1', 'one@example.com')
+        manager.validate_refresh_token(pair.refresh_token)
+        assert len(created) == 1 and os.path.exists(temp_database)
+        assert manager.refresh_token_store is created[0]
+
+    def test_refresh_tokens_validate_across_managers(self, temp_database):
+        issuing = JWTManager(secret_key=SECRET, refresh_token_store=SQLiteRefreshTokenStore(temp_database, cache_ttl_seconds=0))
+        other = JWTManager(secret_key=SECRET, refresh_token_store=SQLiteRefreshTokenStore(temp_database, cache_ttl_seconds=0))
+
+        pair = issuing.create_token_pair('user-1', 'one@example.com')
+        assert other.refresh_access_token(pair.refresh_token) is not None
+
+        assert other.revoke_refresh_token(pair.refresh_token)
+        assert issuing.validate_refresh_token(pair.refresh_token) is None
+
+    def test_revoke_all_user_tokens_keeps_other_users(self):
+        manager = JWTManager(secret_key=SECRET, refresh_token_store=InMemoryRefreshTokenStore())
+        first = manager.create_token_pair('user-1', 'one@example.com')
+        second = manager.create_token_pair('user-1', 'one@example.com')
+        other = manager.create_token_pair('user-2', 'two@example.com')
+
+        assert manager.revoke_all_user_tokens('user-1') == 2
+        assert manager.validate_refresh_token(first.refresh_token) is None
+        assert manager.validate_refresh_token(second.refresh_token) is None
+        assert manager.validate_refresh_token(other.refresh_token) is not None
+
+    def test_persistent_store_requires_fixed_secret(self, temp_database):
+        with pytest.raises(ValueError):
+            JWTManager(refresh_token_store=SQLiteRefreshTokenStore(temp_database))
+        with pytest.raises(ValueError):
+            JWTManager(refresh_token_store_factory=lambda: SQLiteRefreshTokenStore(temp_database))
+
+        assert JWTManager(refresh_token_store=InMemoryRefreshTokenStore()).secret_key
@@ -0,0 +1,152 @@
+"""
+Shared content-hash result cache tests
+"""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from src.api.shared.services.result_cache import ContentResultCache
+
+
+@dataclass
+class CachedScore:
+    value: float
+    label: str
+
+
+class TestContentResultCache:
+    """Test suite for ContentResultCache"""
+
+    def test_normalized_content_shares_key(self):
+        cache = ContentResultCache("test", "v1")
+        assert cache.make_key("  AI tools\n for  SaaS ") == cache.make_key("AI tools for SaaS")
+        assert cache.make_key("Acme Inc needs AI tools") != cache.make_key("acme inc needs ai tools")
+        assert cache.make_key("ai tools", {"platform": "reddit"}) != cache.make_key("ai tools")
+
+    def test_engine_version_changes_key(self):
+        assert ContentResultCache("test", "v1").make_key("x") != ContentResultCache("test", "v2").make_key("x")
+
+    def test_get_returns_private_copy(self):
+        cache = ContentResultCache("test", "v1")
+        key = cache.make_key("content")
+        cache.put(key, CachedScore(0.5, "a"))
+
+        first = cache.get(key)
+        first.value = 1.0
+        assert cache.get(key) == CachedScore(0.5, "a")
+        assert cache.get_stats()['hits'] == 2
+
+    def test_ttl_expiry(self):
+        cache = ContentResultCache("test", "v1", ttl_seconds=0.01)
+        key = cache.make_key("content")
+        cache.put(key, CachedScore(0.5, "a"))
+        time.sleep(0.02)
+
+        assert cache.get(key) is None
+        stats = cache.get_stats()
+        assert stats['expired'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 0
+
+    def test_entry_and_byte_bounds_evict_lru(self):
+        cache = ContentResultCache("test", "v1", max_entries=2)
+        keys = [cache.make_key(str(i)) for i in range(3)]
+        cache.put(keys[0], 0)
+        cache.put(keys[1], 1)
+        cache.get(keys[0])  # keys[1] becomes least recently used
+        cache.put(keys[2], 2)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == 0
+        assert cache.get_stats()['evictions'] == 1
+
+        small = ContentResultCache("test", "v1", max_bytes=300)
+        for i in range(10):
+            small.put(small.make_key(str(i)), "x" * 100)
+        stats = small.get_stats()
+        assert stats['bytes'] <= 300
+        assert stats['entries'] < 10
+
+    def test_disk_tier_survives_restart(self, temp_database):
+        cache = ContentResultCache("test", "v1", db_path=temp_database)
+        key = cache.make_key("content")
+        cache.put(key, CachedScore(0.7, "b"))
+        cache.close()
+
+        restarted = ContentResultCache("test", "v1", db_path=temp_database)
+        assert restarted.get(key) == CachedScore(0.7, "b")
+        assert restarted.get(key) == CachedScore(0.7, "b")
+        stats = restarted.get_stats()
+        assert stats['disk_hits'] == 1
+        assert stats['hits'] == 1
+
+    def test_disk_writes_are_queued_and_flushed_in_batches(self, temp_database):
+        cache = ContentResultCache("test", "v1", db_path=temp_database)
+        cache._writer.submit(time.sleep, 0.05)  # hold the writer so the puts pile up behind it
+        keys = [cache.make_key(str(i)) for i in range(5)]
+        for i, key in enumerate(keys):
+            cache.put(key, i)
+        assert cache.get_stats()['pending_disk_writes'] == 5
+        cache.close()
+
+        stats = cache.get_stats()
+        assert stats['pending_disk_writes'] == 0
+        assert stats['disk_writes'] == 5
+        assert stats['disk_flushes'] == 1
+        with sqlite3.connect(temp_database) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM result_cache").fetchone()[0] == 5
+
+    def test_queued_write_is_served_after_memory_eviction(self, temp_database):
+        cache = ContentResultCache("test", "v1", max_entries=1, db_path=temp_database)
+        cache._writer.submit(time.sleep, 0.05)
+        first, second = cache.make_key("first"), cache.make_key("second")
+        cache.put(first, 1)
+        cache.put(second, 2)  # evicts first from memory before it reaches disk
+
+        assert cache.get(first) == 1
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_aget_reads_disk_tier(self, temp_database):
+        cache = ContentResultCache("test", "v1", db_path=temp_database)
+        key = cache.make_key("content")
+        cache.put(key, CachedScore(0.7, "b"))
+        cache.close()
+
+        restarted = ContentResultCache("test", "v1", db_path=temp_database)
+        assert await restarted.aget(key) == CachedScore(0.7, "b")
+        assert await restarted.aget(cache.make_key("other")) is None
+        stats = restarted.get_stats()
+        assert stats['disk_hits'] == 1
+        assert stats['misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_aget_many_reads_disk_misses_in_one_query(self, temp_database, monkeypatch):
+        cache = ContentResultCache("test", "v1", db_path=temp_database)
+        on_disk = [cache.make_key(f"disk {i}") for i in range(3)]
+        for i, key in enumerate(on_disk):
+            cache.put(key, CachedScore(i / 10, "disk"))
+        cache.close()
+
+        restarted = ContentResultCache("test", "v1", db_path=temp_database)
+        in_memory = restarted.make_key("memory")
+        restarted.put(in_memory, CachedScore(0.9, "memory"))
+        restarted.DB_IN_CHUNK = 2
+        queries = []
+        db_get_many = restarted._db_get_many
+        monkeypatch.setattr(restarted, "_db_get_many", lambda keys, now: queries.append(keys) or db_get_many(keys, now))
+
+        keys = [in_memory, *on_disk, restarted.make_key("absent"), on_disk[0]]
+        results = await restarted.aget_many(keys)
+
+        assert results == [CachedScore(0.9, "memory"), CachedScore(0.0, "disk"), CachedScore(0.1, "disk"),
+                           CachedScore(0.2, "disk"), None, CachedScore(0.0, "disk")]
+        assert results[1] is not results[5]
+        assert len(queries) == 1 and len(queries[0]) == 4
+        stats = restarted.get_stats()
+        assert stats['disk_hits'] == 3
+        assert stats['misses'] == 1
+        restarted.close()
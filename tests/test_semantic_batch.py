@@ -0,0 +1,77 @@
+"""
+Batch semantic analysis parity tests for AdvancedSemanticEngine
+"""
+
+import threading
+
+import pytest
+
+from src.api.domains.intelligence.services.semantic_analysis_engine import AdvancedSemanticEngine
+
+SIGNALS = [
+    "I'm so frustrated with Zapier, the manual export takes hours. Is there a better way to automate this?",
+    "Looking for an alternative to Notion for our startup. Need an API and a dashboard that doesn't break.",
+    "Just launched a revolutionary Stripe integration. First platform to streamline invoicing for agencies!",
+    "The market for HubSpot is getting crowded. Growing demand but pricing is too expensive for small teams.",
+    "We tried Asana and the setup was complicated. Our team needs a simple subscription tool instead.",
+    "",
+]
+
+EXACT_FIELDS = [
+    'overall_score', 'context_relevance', 'intent_clarity', 'sentiment_strength', 'entity_richness',
+    'semantic_coherence', 'innovation_potential', 'detected_language', 'extracted_entities',
+    'key_concepts', 'sentiment_breakdown', 'context_indicators', 'intent_classification'
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return AdvancedSemanticEngine()
+
+
+class TestBatchAnalyzeSignals:
+    """batch_analyze_signals must score exactly like analyze_semantic_understanding"""
+
+    @pytest.mark.asyncio
+    async def test_batch_scores_match_per_signal_scores(self, engine):
+        engine.result_cache.clear()
+        individual = [await engine.analyze_semantic_understanding(signal) for signal in SIGNALS]
+        engine.result_cache.clear()
+        batched = await engine.batch_analyze_signals(SIGNALS)
+
+        for single, batch in zip(individual, batched):
+            for name in EXACT_FIELDS:
+                expected, actual = getattr(single, name), getattr(batch, name)
+                if isinstance(expected, float):
+                    assert actual == pytest.approx(expected, abs=1e-9), name
+                else:
+                    assert actual == expected, name
+            # Confidence is scaled by processing time, which differs between the two paths
+            assert batch.confidence_level == pytest.approx(single.confidence_level, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_batch_updates_stats_once_per_new_signal(self, engine):
+        engine.result_cache.clear()
+        before = engine.analysis_stats['signals_processed']
+
+        await engine.batch_analyze_signals(SIGNALS[:3])
+        await engine.batch_analyze_signals(SIGNALS[:3])  # served from the result cache
+
+        assert engine.analysis_stats['signals_processed'] == before + 3
+
+    @pytest.mark.asyncio
+    async def test_models_run_on_one_worker_thread(self, engine, monkeypatch):
+        threads = set()
+        polarity_scores = engine.sentiment_analyzer.polarity_scores
+
+        def recording_polarity_scores(text):
+            threads.add(threading.get_ident())
+            return polarity_scores(text)
+
+        monkeypatch.setattr(engine.sentiment_analyzer, 'polarity_scores', recording_polarity_scores)
+        engine.result_cache.clear()
+        await engine.analyze_semantic_understanding(SIGNALS[0])
+        await engine.batch_analyze_signals(SIGNALS[1:3])
+
+        assert len(threads) == 1
+        assert threading.get_ident() not in threads
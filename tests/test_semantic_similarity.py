@@ -0,0 +1,68 @@
+"""
+Sparse blocked similarity mode tests for AdvancedSemanticEngine
+"""
+
+import numpy as np
+import pytest
+from scipy.sparse import csr_matrix
+
+from src.api.domains.intelligence.services.semantic_analysis_engine import AdvancedSemanticEngine
+
+TOPICS = [
+    "invoice automation for freelancers",
+    "kubernetes cost monitoring dashboard",
+    "customer support ticket triage with ai",
+    "podcast transcription and show notes",
+]
+
+
+def make_signals(count: int) -> list:
+    rng = np.random.default_rng(11)
+    fillers = ["tool", "startup", "problem", "manual", "pricing", "team", "workflow", "api"]
+    return [
+        f"{TOPICS[i % len(TOPICS)]} {' '.join(rng.choice(fillers, size=3))}"
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return AdvancedSemanticEngine()
+
+
+class TestSparseSimilarity:
+    """Sparse blocked mode must find the same neighbors and clusters as dense mode"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('clustering', ['greedy', 'components'])
+    async def test_sparse_matches_dense(self, engine, clustering):
+        signals = make_signals(40)
+
+        dense = await engine.analyze_signal_similarity(signals, threshold=0.3, mode="dense", clustering=clustering)
+        sparse = await engine.analyze_signal_similarity(
+            signals, threshold=0.3, mode="sparse", clustering=clustering, block_size=7
+        )
+
+        matrix = np.array(dense['similarity_matrix'])
+        rows, cols = np.nonzero(np.triu(matrix > 0.3, k=1))
+        assert sparse['neighbor_pairs'] == len(rows)
+        assert sparse['clusters'] == dense['clusters']
+        assert sparse['avg_similarity'] == pytest.approx(dense['avg_similarity'])
+
+    def test_neighbor_graph_pairs_match_dense_threshold(self, engine):
+        vectors = csr_matrix(engine.tfidf_vectorizer.fit_transform(make_signals(25)))
+        dense = (vectors @ vectors.T).toarray()
+
+        for block_size in (1, 4, 25, 100):
+            neighbors = engine._sparse_neighbor_graph(vectors, 0.3, block_size)
+            expected = set(zip(*np.nonzero(np.triu(dense > 0.3, k=1))))
+            assert set(zip(*neighbors.nonzero())) == expected
+
+    @pytest.mark.asyncio
+    async def test_auto_mode_switches_to_sparse(self, engine, monkeypatch):
+        monkeypatch.setattr(engine, 'dense_similarity_limit', 10)
+
+        result = await engine.analyze_signal_similarity(make_signals(12))
+
+        assert result['mode'] == 'sparse'
+        assert result['similarity_matrix'] == []
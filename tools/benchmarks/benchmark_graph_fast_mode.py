@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Graph Fast Mode Benchmark
+Per-stage cost of one fast-mode detection pass of GroundbreakingGraphTrendDetector
+on a 50k-node keyword graph (graph construction is excluded)
+"""
+
+import asyncio
+import random
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.api.domains.streaming.services.graph_trend_detector import GroundbreakingGraphTrendDetector
+
+NODES = 50_000
+EDGES_PER_NODE = 3       # preferential attachment, like a keyword co-occurrence graph
+SOURCES = ['reddit', 'twitter', 'github', 'hacker_news', 'product_hunt']
+TARGET_SECONDS = 1.0
+
+
+def build_detector(seed: int = 7) -> GroundbreakingGraphTrendDetector:
+    """Fill the detector's graph store directly with a scale-free graph of NODES keywords"""
+    rng = random.Random(seed)
+    detector = GroundbreakingGraphTrendDetector(analysis_mode='fast')
+    store = detector.graph_store
+    now = datetime.now()
+
+    targets = list(range(EDGES_PER_NODE))
+    attachment = []
+    for node in range(NODES):
+        timestamp = now - timedelta(minutes=rng.randint(0, 48 * 60))
+        store.upsert_node(f"kw{node}", timestamp, {
+            'node_type': 'keyword',
+            'content': f"kw{node}",
+            'timestamp': timestamp,
+            'features': {'frequency': 1, 'sources': {rng.choice(SOURCES)}, 'engagement_sum': 1.0}
+        })
+        if node < EDGES_PER_NODE:
+            continue
+        for target in set(targets):
+            store.add_edge(f"kw{node}", f"kw{target}", 'co_occurs', 1.0, timestamp)
+        attachment.extend(targets)
+        attachment.extend([node] * EDGES_PER_NODE)
+        targets = [rng.choice(attachment) for _ in range(EDGES_PER_NODE)]
+    return detector
+
+
+async def run_stages(detector: GroundbreakingGraphTrendDetector) -> dict:
+    """One detection pass with per-stage timings; the analysis cache is cleared first"""
+    detector._analysis_cache.clear()
+    detector.last_analysis_mode = detector._resolve_analysis_mode(detector.trend_graph.number_of_nodes())
+    timings = {}
+
+    start = time.perf_counter()
+    await detector._extract_graph_embeddings()
+    timings['embeddings'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    communities = await detector._detect_emerging_communities()
+    timings['communities'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await detector._analyze_influence_propagation()
+    timings['influence'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clusters = await detector._analyze_temporal_coherence(communities)
+    timings['temporal_coherence'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clusters = await detector._analyze_cross_platform_reach(clusters)
+    await detector._score_trend_clusters(clusters)
+    timings['reach_and_scoring'] = time.perf_counter() - start
+
+    timings['total'] = sum(timings.values())
+    timings['clusters'] = len(clusters)
+    return timings
+
+
+async def main():
+    print("🚀 Graph fast-mode benchmark")
+    start = time.perf_counter()
+    detector = build_detector()
+    detector.graph_store.adjacency_matrix()
+    print(f"   {detector.trend_graph.number_of_nodes():,} nodes, {detector.trend_graph.number_of_edges():,} edges "
+          f"(built in {time.perf_counter() - start:.1f}s)")
+    print("=" * 60)
+
+    # First pass warms the adjacency cache and the warm-start state, as a live detector would be
+    await run_stages(detector)
+    runs = [await run_stages(detector) for _ in range(3)]
+
+    for stage in ['embeddings', 'communities', 'influence', 'temporal_coherence', 'reach_and_scoring', 'total']:
+        best = min(run[stage] for run in runs)
+        print(f"{stage:>20} | {best * 1000:>10.1f} ms")
+    print("=" * 60)
+
+    total = min(run['total'] for run in runs)
+    print(f"{'✅' if total < TARGET_SECONDS else '⚠️'} {runs[0]['clusters']} clusters, "
+          f"{total:.2f}s per pass (target < {TARGET_SECONDS:.0f}s)")
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher Benchmark
+Cost of finding every keyword present in a text with KeywordMatcher's substring and trie
+strategies, compared with a plain ``keyword in text`` loop, across vocabulary sizes
+"""
+
+import random
+import string
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.api.shared.services.keyword_matcher import KeywordMatcher
+
+VOCABULARY_SIZES = [10, 100, 200, 300, 1000, 5000]
+TEXT_CHARS = [500, 10000]
+REPEATS = 7
+
+
+def random_word(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+
+
+def make_text(rng: random.Random, words: list, chars: int) -> str:
+    filler = ['the', 'and', 'for', 'with', 'this', 'that', 'tool', 'need']
+    text = []
+    while sum(len(word) + 1 for word in text) < chars:
+        text.append(rng.choice(words) if rng.random() < 0.2 else rng.choice(filler))
+    return ' '.join(text)
+
+
+def best_of(fn) -> float:
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def benchmark(size: int, chars: int) -> dict:
+    rng = random.Random(size * 31 + chars)
+    vocabulary = list(dict.fromkeys(random_word(rng) for _ in range(size)))
+    text = make_text(rng, vocabulary[:50], chars)
+
+    substring = KeywordMatcher({'all': vocabulary}, trie_threshold=len(vocabulary) + 1)
+    trie = KeywordMatcher({'all': vocabulary}, trie_threshold=0)
+    lowered = text.lower()
+    expected = {keyword for keyword in vocabulary if keyword in lowered}
+    assert substring.present(text) == expected and trie.present(text) == expected
+
+    return {
+        'keywords': len(vocabulary),
+        'chars': len(text),
+        'naive_us': best_of(lambda: [keyword for keyword in vocabulary if keyword in lowered]),
+        'substring_us': best_of(lambda: substring.find(text)),
+        'trie_us': best_of(lambda: trie.find(text))
+    }
+
+
+def main():
+    print("🚀 Keyword matcher benchmark")
+    print(f"Default trie threshold: {KeywordMatcher.TRIE_THRESHOLD} keywords")
+    print("=" * 70)
+    print(f"{'keywords':>8} | {'chars':>6} | {'naive µs':>10} | {'substring µs':>12} | {'trie µs':>10}")
+    print("-" * 70)
+
+    for chars in TEXT_CHARS:
+        for size in VOCABULARY_SIZES:
+            result = benchmark(size, chars)
+            print(f"{result['keywords']:>8,} | {result['chars']:>6,} | {result['naive_us']:>10.1f} | "
+                  f"{result['substring_us']:>12.1f} | {result['trie_us']:>10.1f}")
+
+    print("=" * 70)
+    print("✅ Substring search wins on small vocabularies; the trie scan stays flat as vocabularies grow")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Semantic Batch Benchmark
+Per-signal cost of AdvancedSemanticEngine.batch_analyze_signals across batch sizes,
+compared with analyzing each signal individually
+"""
+
+import asyncio
+import random
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.api.domains.intelligence.services.semantic_analysis_engine import AdvancedSemanticEngine
+
+BATCH_SIZES = [16, 64, 256, 1024]
+TEMPLATES = [
+    "I'm so frustrated with {tool}, the manual export takes hours. Is there a better way to automate this?",
+    "Looking for an alternative to {tool} for our startup. Need an API and a dashboard that doesn't break.",
+    "Just launched a revolutionary {tool} integration. First platform to streamline invoicing for agencies!",
+    "The market for {tool} is getting crowded. Growing demand but pricing is too expensive for small teams.",
+    "We tried {tool} and the setup was complicated. Our team needs a simple subscription tool instead."
+]
+TOOLS = ['Zapier', 'Notion', 'Airtable', 'HubSpot', 'Stripe', 'QuickBooks', 'Asana', 'Slack']
+
+
+def make_signals(count: int) -> list:
+    return [
+        random.choice(TEMPLATES).format(tool=random.choice(TOOLS)) + f" (post {i})"
+        for i in range(count)
+    ]
+
+
+async def benchmark_batch_size(engine: AdvancedSemanticEngine, size: int) -> dict:
+    signals = make_signals(size)
+
+    engine.result_cache.clear()
+    start = time.perf_counter()
+    await asyncio.gather(*[engine.analyze_semantic_understanding(signal) for signal in signals])
+    individual = time.perf_counter() - start
+
+    engine.result_cache.clear()
+    start = time.perf_counter()
+    await engine.batch_analyze_signals(signals)
+    batched = time.perf_counter() - start
+
+    return {
+        'batch_size': size,
+        'individual_ms_per_signal': individual / size * 1000,
+        'batch_ms_per_signal': batched / size * 1000,
+        'speedup': individual / batched if batched else float('inf')
+    }
+
+
+async def main():
+    print("🚀 Semantic batch benchmark")
+    engine = AdvancedSemanticEngine()
+    await engine.batch_analyze_signals(make_signals(8))  # warm up models
+    print("=" * 70)
+    print(f"{'batch size':>10} | {'individual ms/sig':>17} | {'batch ms/sig':>12} | {'speedup':>8}")
+    print("-" * 70)
+
+    for size in BATCH_SIZES:
+        result = await benchmark_batch_size(engine, size)
+        print(f"{result['batch_size']:>10,} | {result['individual_ms_per_signal']:>17.2f} | "
+              f"{result['batch_ms_per_signal']:>12.2f} | {result['speedup']:>7.1f}x")
+
+    print("=" * 70)
+    print("✅ Batch path amortizes model calls and keyword scans across the whole batch")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
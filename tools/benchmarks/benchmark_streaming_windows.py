@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Streaming Window Benchmark
+Sustained events/sec of the sliding-window analyzer against window size,
+comparing incremental aggregates with the previous full-rescan statistics
+"""
+
+import asyncio
+import random
+import sys
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.api.domains.streaming.services.streaming_trend_pipeline import (
+    GroundbreakingStreamingPipeline, StreamingWindow, StreamEvent, EventType
+)
+
+WINDOW_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+EVENTS_PER_TICK = 500  # events arriving (and expiring) between two analyzer ticks
+KEYWORDS = [f"kw{i}" for i in range(2000)]
+SOURCES = ['reddit', 'twitter', 'github', 'hacker_news', 'product_hunt']
+
+
+def make_event(timestamp: datetime) -> StreamEvent:
+    return StreamEvent(
+        event_id='bench',
+        event_type=EventType.SIGNAL_RECEIVED,
+        timestamp=timestamp,
+        data={
+            'source': random.choice(SOURCES),
+            'keywords': random.sample(KEYWORDS, 3),
+            'engagement': random.randint(1, 200)
+        },
+        source='benchmark'
+    )
+
+
+def full_rescan_statistics(window: StreamingWindow) -> dict:
+    """Statistics computed the way the analyzer used to: one pass over every event"""
+    stats = {
+        'event_count': len(window.events),
+        'events_per_second': len(window.events) / window.size_seconds,
+        'unique_sources': len(set(event.data.get('source', '') for event in window.events)),
+        'avg_engagement': np.mean([event.data.get('engagement', 0) for event in window.events]),
+        'total_engagement': sum(event.data.get('engagement', 0) for event in window.events)
+    }
+    keyword_freq = defaultdict(int)
+    for event in window.events:
+        for keyword in event.data.get('keywords', []):
+            keyword_freq[keyword] += 1
+    stats['top_keywords'] = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)[:10]
+    return stats
+
+
+async def benchmark_window_size(pipeline: GroundbreakingStreamingPipeline, size: int) -> dict:
+    window = StreamingWindow('bench', size_seconds=size)
+    pipeline.windows = {'bench': window}
+    base = datetime.now() - timedelta(seconds=size)
+
+    # Fill the window with one event per second of history
+    for i in range(size):
+        await pipeline._add_to_windows(make_event(base + timedelta(seconds=i)))
+
+    # One analyzer tick: new events arrive, the oldest expire, statistics are refreshed
+    tick_events = [make_event(datetime.now()) for _ in range(EVENTS_PER_TICK)]
+    start = time.perf_counter()
+    for event in tick_events:
+        await pipeline._add_to_windows(event)
+    window.size_seconds = size - EVENTS_PER_TICK  # forces EVENTS_PER_TICK evictions
+    await pipeline._clean_window(window)
+    await pipeline._update_window_statistics(window)
+    incremental = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy_stats = full_rescan_statistics(window)
+    rescan = time.perf_counter() - start
+
+    assert window.statistics['event_count'] == legacy_stats['event_count']
+    assert abs(window.statistics['total_engagement'] - legacy_stats['total_engagement']) < 1e-6
+
+    return {
+        'window_size': size,
+        'incremental_tick_ms': incremental * 1000,
+        'rescan_tick_ms': rescan * 1000,
+        'incremental_events_per_sec': EVENTS_PER_TICK / incremental,
+        'rescan_events_per_sec': EVENTS_PER_TICK / rescan
+    }
+
+
+async def main():
+    print("🚀 Streaming window benchmark")
+    print(f"   {EVENTS_PER_TICK} events per analyzer tick, {len(KEYWORDS)} distinct keywords")
+    print("=" * 78)
+    print(f"{'window events':>14} | {'incremental ms':>14} | {'rescan ms':>10} | {'incr ev/s':>12} | {'rescan ev/s':>12}")
+    print("-" * 78)
+
+    pipeline = GroundbreakingStreamingPipeline()
+    for size in WINDOW_SIZES:
+        result = await benchmark_window_size(pipeline, size)
+        print(f"{result['window_size']:>14,} | {result['incremental_tick_ms']:>14.2f} | "
+              f"{result['rescan_tick_ms']:>10.2f} | {result['incremental_events_per_sec']:>12,.0f} | "
+              f"{result['rescan_events_per_sec']:>12,.0f}")
+
+    print("=" * 78)
+    print("✅ Incremental cost tracks events per tick; rescan cost tracks window size")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+WebSocket Fan-out Benchmark
+Sustained broadcast throughput of WebSocketBroadcaster to thousands of simulated sockets,
+with a share of deliberately slow consumers
+"""
+
+import asyncio
+import logging
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.api.domains.streaming.services.websocket_broadcaster import WebSocketBroadcaster
+
+CLIENT_COUNTS = [100, 1000, 5000]
+MESSAGES = 2000
+SLOW_CLIENT_SHARE = 0.05
+SLOW_CLIENT_DELAY = 0.05
+
+
+class SimulatedWebSocket:
+    """Counts frames; slow sockets take SLOW_CLIENT_DELAY per send"""
+
+    def __init__(self, slow: bool = False):
+        self.slow = slow
+        self.received = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame: str):
+        if self.slow:
+            await asyncio.sleep(SLOW_CLIENT_DELAY)
+        self.received += 1
+
+
+async def benchmark_clients(count: int) -> dict:
+    broadcaster = WebSocketBroadcaster(max_client_queue_size=256)
+    slow_every = int(1 / SLOW_CLIENT_SHARE)
+    clients = [SimulatedWebSocket(slow=(i % slow_every == 0)) for i in range(count)]
+    for client in clients:
+        await broadcaster.connect(client)
+    fast_clients = [client for client in clients if not client.slow]
+    baseline = fast_clients[0].received  # welcome frame
+
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        await broadcaster.broadcast_fusion_result({'signal_id': i, 'score': 0.87, 'sources': ['reddit', 'hn']})
+        if i % 50 == 0:
+            await asyncio.sleep(0)
+    while any(client.received - baseline < MESSAGES for client in fast_clients):
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    stats = broadcaster.get_broadcaster_stats()
+    await broadcaster.close()
+    return {
+        'clients': count,
+        'messages_per_second': MESSAGES / elapsed,
+        'frames_per_second': MESSAGES * len(fast_clients) / elapsed,
+        'dropped': stats['message_stats']['dropped']
+    }
+
+
+async def main():
+    logging.getLogger('src.api.domains.streaming.services.websocket_broadcaster').setLevel(logging.WARNING)
+    print("🚀 WebSocket fan-out benchmark")
+    print(f"{MESSAGES:,} fusion messages, {SLOW_CLIENT_SHARE:.0%} of clients slow ({SLOW_CLIENT_DELAY * 1000:.0f}ms per send)")
+    print("=" * 70)
+    print(f"{'clients':>8} | {'messages/s':>12} | {'frames/s (fast)':>16} | {'dropped (slow)':>14}")
+    print("-" * 70)
+
+    for count in CLIENT_COUNTS:
+        result = await benchmark_clients(count)
+        print(f"{result['clients']:>8,} | {result['messages_per_second']:>12,.0f} | "
+              f"{result['frames_per_second']:>16,.0f} | {result['dropped']:>14,}")
+
+    print("=" * 70)
+    print("✅ Messages are serialized once; slow sockets drop their own oldest frames instead of stalling the channel")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())